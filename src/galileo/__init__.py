@@ -1,102 +1,223 @@
 """Galileo."""
 
-from galileo.agent_control import AgentControlTarget, AgentControlTargetUnresolvedError, get_agent_control_target
-from galileo.annotation_queues import (
-    AnnotationField,
-    AnnotationQueue,
-    AnnotationQueueRecordSelector,
-    AnnotationQueues,
-    AnnotationQueueUser,
-    add_records_to_annotation_queue,
-    create_annotation_queue,
-    create_annotation_queue_field,
-    delete_annotation_queue,
-    delete_annotation_queue_field,
-    get_annotation_queue,
-    get_annotation_queue_records,
-    list_annotation_queue_fields,
-    list_annotation_queue_users,
-    list_annotation_queues,
-    remove_annotation_queue_user,
-    remove_records_from_annotation_queue,
-    share_annotation_queue,
-    update_annotation_queue,
-    update_annotation_queue_field,
-    update_annotation_queue_user,
-)
-from galileo.collaborator import Collaborator, CollaboratorRole
-from galileo.configuration import Configuration
-from galileo.dataset import Dataset
-from galileo.decorator import GalileoDecorator, galileo_context, log, start_session
-from galileo.exceptions import (
-    AuthenticationError,
-    BadRequestError,
-    ConflictError,
-    ForbiddenError,
-    GalileoAPIError,
-    GalileoLoggerException,
-    NotFoundError,
-    RateLimitError,
-    ServerError,
-)
-from galileo.experiment import Experiment
-from galileo.handlers.agent_control import GalileoAgentControlBridge, setup_agent_control_bridge
-from galileo.integration import Integration
-from galileo.log_stream import LogStream
-from galileo.logger import GalileoLogger
-from galileo.logger.control import ControlAppliesTo, ControlCheckStage, ControlResult, ControlSpan
-from galileo.metric import CodeMetric, GalileoMetric, LlmMetric, LocalMetric, Metric
-from galileo.model import Model
-from galileo.project import Project
-from galileo.prompt import Prompt
-from galileo.protect import ainvoke_protect, invoke_protect
-from galileo.provider import AnthropicProvider, AzureProvider, BedrockProvider, OpenAIProvider, Provider
-from galileo.resources.models.document import Document
-from galileo.schema.message import Message
-from galileo.schema.metrics import GalileoMetrics, GalileoScorers
-from galileo.shared.base import SyncState
-from galileo.shared.exceptions import (
-    APIError,
-    ConfigurationError,
-    GalileoFutureError,
-    ResourceConflictError,
-    ResourceNotFoundError,
-    ValidationError,
-)
-from galileo.stages import (
-    create_protect_stage,
-    get_protect_stage,
-    pause_protect_stage,
-    resume_protect_stage,
-    update_protect_stage,
-)
-from galileo.tracing import get_tracing_headers
-from galileo.types import MetricSpec
-from galileo.utils.log_config import enable_console_logging
-from galileo_core.helpers.api_key import create_api_key, delete_api_key, list_api_keys
-from galileo_core.helpers.dependencies import is_dependency_available
-from galileo_core.schemas.logging.llm import MessageRole, ToolCall, ToolCallFunction
-from galileo_core.schemas.logging.session import Session
-from galileo_core.schemas.logging.span import (
-    AgentSpan,
-    LlmSpan,
-    RetrieverSpan,
-    Span,
-    StepWithChildSpans,
-    ToolSpan,
-    WorkflowSpan,
-)
-from galileo_core.schemas.logging.step import StepType
-from galileo_core.schemas.logging.trace import Trace
-from galileo_core.schemas.protect.execution_status import ExecutionStatus
-from galileo_core.schemas.protect.payload import Payload
-from galileo_core.schemas.protect.request import Request
-from galileo_core.schemas.protect.response import Response
-from galileo_core.schemas.protect.ruleset import Ruleset
-from galileo_core.schemas.protect.stage import StageType
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from galileo.agent_control import AgentControlTarget, AgentControlTargetUnresolvedError, get_agent_control_target
+    from galileo.annotation_queues import (
+        AnnotationField,
+        AnnotationQueue,
+        AnnotationQueueRecordSelector,
+        AnnotationQueues,
+        AnnotationQueueUser,
+        add_records_to_annotation_queue,
+        create_annotation_queue,
+        create_annotation_queue_field,
+        delete_annotation_queue,
+        delete_annotation_queue_field,
+        get_annotation_queue,
+        get_annotation_queue_records,
+        list_annotation_queue_fields,
+        list_annotation_queue_users,
+        list_annotation_queues,
+        remove_annotation_queue_user,
+        remove_records_from_annotation_queue,
+        share_annotation_queue,
+        update_annotation_queue,
+        update_annotation_queue_field,
+        update_annotation_queue_user,
+    )
+    from galileo.collaborator import Collaborator, CollaboratorRole
+    from galileo.configuration import Configuration
+    from galileo.dataset import Dataset
+    from galileo.decorator import GalileoDecorator, galileo_context, log, start_session
+    from galileo.exceptions import (
+        AuthenticationError,
+        BadRequestError,
+        ConflictError,
+        ForbiddenError,
+        GalileoAPIError,
+        GalileoLoggerException,
+        NotFoundError,
+        RateLimitError,
+        ServerError,
+    )
+    from galileo.experiment import Experiment
+    from galileo.handlers.agent_control import GalileoAgentControlBridge, setup_agent_control_bridge
+    from galileo.integration import Integration
+    from galileo.log_stream import LogStream
+    from galileo.logger import GalileoLogger
+    from galileo.logger.control import ControlAppliesTo, ControlCheckStage, ControlResult, ControlSpan
+    from galileo.metric import CodeMetric, GalileoMetric, LlmMetric, LocalMetric, Metric
+    from galileo.model import Model
+    from galileo.project import Project
+    from galileo.prompt import Prompt
+    from galileo.protect import ProtectBatchResult, ProtectClient, ainvoke_protect, invoke_protect
+    from galileo.protect_cache import ProtectCache
+    from galileo.provider import AnthropicProvider, AzureProvider, BedrockProvider, OpenAIProvider, Provider
+    from galileo.resources.models.document import Document
+    from galileo.schema.message import Message
+    from galileo.schema.metrics import GalileoMetrics, GalileoScorers
+    from galileo.shared.base import SyncState
+    from galileo.shared.exceptions import (
+        APIError,
+        ConfigurationError,
+        GalileoFutureError,
+        ResourceConflictError,
+        ResourceNotFoundError,
+        ValidationError,
+    )
+    from galileo.stages import (
+        create_protect_stage,
+        get_protect_stage,
+        pause_protect_stage,
+        resume_protect_stage,
+        update_protect_stage,
+    )
+    from galileo.tracing import get_tracing_headers
+    from galileo.types import MetricSpec
+    from galileo.utils.log_config import enable_console_logging
+    from galileo_core.helpers.api_key import create_api_key, delete_api_key, list_api_keys
+    from galileo_core.helpers.dependencies import is_dependency_available
+    from galileo_core.schemas.logging.llm import MessageRole, ToolCall, ToolCallFunction
+    from galileo_core.schemas.logging.session import Session
+    from galileo_core.schemas.logging.span import (
+        AgentSpan,
+        LlmSpan,
+        RetrieverSpan,
+        Span,
+        StepWithChildSpans,
+        ToolSpan,
+        WorkflowSpan,
+    )
+    from galileo_core.schemas.logging.step import StepType
+    from galileo_core.schemas.logging.trace import Trace
+    from galileo_core.schemas.protect.execution_status import ExecutionStatus
+    from galileo_core.schemas.protect.payload import Payload
+    from galileo_core.schemas.protect.request import Request
+    from galileo_core.schemas.protect.response import Response
+    from galileo_core.schemas.protect.ruleset import Ruleset
+    from galileo_core.schemas.protect.stage import StageType
 
 __version__ = "2.6.0"
 
+# The public API is imported on first access rather than by `import galileo`, so that applications that only use
+# part of it (e.g. the `@log` decorator) do not pay for importing the rest at startup.
+_LAZY_IMPORTS = {
+    "APIError": "galileo.shared.exceptions",
+    "AgentControlTarget": "galileo.agent_control",
+    "AgentControlTargetUnresolvedError": "galileo.agent_control",
+    "AgentSpan": "galileo_core.schemas.logging.span",
+    "AnnotationField": "galileo.annotation_queues",
+    "AnnotationQueue": "galileo.annotation_queues",
+    "AnnotationQueueRecordSelector": "galileo.annotation_queues",
+    "AnnotationQueueUser": "galileo.annotation_queues",
+    "AnnotationQueues": "galileo.annotation_queues",
+    "AnthropicProvider": "galileo.provider",
+    "AuthenticationError": "galileo.exceptions",
+    "AzureProvider": "galileo.provider",
+    "BadRequestError": "galileo.exceptions",
+    "BedrockProvider": "galileo.provider",
+    "CodeMetric": "galileo.metric",
+    "Collaborator": "galileo.collaborator",
+    "CollaboratorRole": "galileo.collaborator",
+    "Configuration": "galileo.configuration",
+    "ConfigurationError": "galileo.shared.exceptions",
+    "ConflictError": "galileo.exceptions",
+    "ControlAppliesTo": "galileo.logger.control",
+    "ControlCheckStage": "galileo.logger.control",
+    "ControlResult": "galileo.logger.control",
+    "ControlSpan": "galileo.logger.control",
+    "Dataset": "galileo.dataset",
+    "Document": "galileo.resources.models.document",
+    "ExecutionStatus": "galileo_core.schemas.protect.execution_status",
+    "Experiment": "galileo.experiment",
+    "ForbiddenError": "galileo.exceptions",
+    "GalileoAPIError": "galileo.exceptions",
+    "GalileoAgentControlBridge": "galileo.handlers.agent_control",
+    "GalileoDecorator": "galileo.decorator",
+    "GalileoFutureError": "galileo.shared.exceptions",
+    "GalileoLogger": "galileo.logger",
+    "GalileoLoggerException": "galileo.exceptions",
+    "GalileoMetric": "galileo.metric",
+    "GalileoMetrics": "galileo.schema.metrics",
+    "GalileoScorers": "galileo.schema.metrics",
+    "Integration": "galileo.integration",
+    "LlmMetric": "galileo.metric",
+    "LlmSpan": "galileo_core.schemas.logging.span",
+    "LocalMetric": "galileo.metric",
+    "LogStream": "galileo.log_stream",
+    "Message": "galileo.schema.message",
+    "MessageRole": "galileo_core.schemas.logging.llm",
+    "Metric": "galileo.metric",
+    "MetricSpec": "galileo.types",
+    "Model": "galileo.model",
+    "NotFoundError": "galileo.exceptions",
+    "OpenAIProvider": "galileo.provider",
+    "Payload": "galileo_core.schemas.protect.payload",
+    "Project": "galileo.project",
+    "Prompt": "galileo.prompt",
+    "ProtectBatchResult": "galileo.protect",
+    "ProtectCache": "galileo.protect_cache",
+    "ProtectClient": "galileo.protect",
+    "Provider": "galileo.provider",
+    "RateLimitError": "galileo.exceptions",
+    "Request": "galileo_core.schemas.protect.request",
+    "ResourceConflictError": "galileo.shared.exceptions",
+    "ResourceNotFoundError": "galileo.shared.exceptions",
+    "Response": "galileo_core.schemas.protect.response",
+    "RetrieverSpan": "galileo_core.schemas.logging.span",
+    "Ruleset": "galileo_core.schemas.protect.ruleset",
+    "ServerError": "galileo.exceptions",
+    "Session": "galileo_core.schemas.logging.session",
+    "Span": "galileo_core.schemas.logging.span",
+    "StageType": "galileo_core.schemas.protect.stage",
+    "StepType": "galileo_core.schemas.logging.step",
+    "StepWithChildSpans": "galileo_core.schemas.logging.span",
+    "SyncState": "galileo.shared.base",
+    "ToolCall": "galileo_core.schemas.logging.llm",
+    "ToolCallFunction": "galileo_core.schemas.logging.llm",
+    "ToolSpan": "galileo_core.schemas.logging.span",
+    "Trace": "galileo_core.schemas.logging.trace",
+    "ValidationError": "galileo.shared.exceptions",
+    "WorkflowSpan": "galileo_core.schemas.logging.span",
+    "add_records_to_annotation_queue": "galileo.annotation_queues",
+    "ainvoke_protect": "galileo.protect",
+    "create_annotation_queue": "galileo.annotation_queues",
+    "create_annotation_queue_field": "galileo.annotation_queues",
+    "create_api_key": "galileo_core.helpers.api_key",
+    "create_protect_stage": "galileo.stages",
+    "delete_annotation_queue": "galileo.annotation_queues",
+    "delete_annotation_queue_field": "galileo.annotation_queues",
+    "delete_api_key": "galileo_core.helpers.api_key",
+    "enable_console_logging": "galileo.utils.log_config",
+    "galileo_context": "galileo.decorator",
+    "get_agent_control_target": "galileo.agent_control",
+    "get_annotation_queue": "galileo.annotation_queues",
+    "get_annotation_queue_records": "galileo.annotation_queues",
+    "get_protect_stage": "galileo.stages",
+    "get_tracing_headers": "galileo.tracing",
+    "invoke_protect": "galileo.protect",
+    "is_dependency_available": "galileo_core.helpers.dependencies",
+    "list_annotation_queue_fields": "galileo.annotation_queues",
+    "list_annotation_queue_users": "galileo.annotation_queues",
+    "list_annotation_queues": "galileo.annotation_queues",
+    "list_api_keys": "galileo_core.helpers.api_key",
+    "log": "galileo.decorator",
+    "pause_protect_stage": "galileo.stages",
+    "remove_annotation_queue_user": "galileo.annotation_queues",
+    "remove_records_from_annotation_queue": "galileo.annotation_queues",
+    "resume_protect_stage": "galileo.stages",
+    "setup_agent_control_bridge": "galileo.handlers.agent_control",
+    "share_annotation_queue": "galileo.annotation_queues",
+    "start_session": "galileo.decorator",
+    "update_annotation_queue": "galileo.annotation_queues",
+    "update_annotation_queue_field": "galileo.annotation_queues",
+    "update_annotation_queue_user": "galileo.annotation_queues",
+    "update_protect_stage": "galileo.stages",
+}
+
 __all__ = [
     "APIError",
     "AgentControlTarget",
@@ -151,6 +272,9 @@ __all__ = [
     "Payload",
     "Project",
     "Prompt",
+    "ProtectBatchResult",
+    "ProtectCache",
+    "ProtectClient",
     "Provider",
     "RateLimitError",
     "Request",
@@ -207,3 +331,16 @@ __all__ = [
     "update_annotation_queue_user",
     "update_protect_stage",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY_IMPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
@@ -7,6 +7,9 @@ from pydantic_core import Url
 
 from galileo.constants import DEFAULT_CONSOLE_URL
 from galileo.shared.exceptions import ConfigurationError
+from galileo.shared.http_pool import PooledApiClient
+from galileo.shared.resolution_cache import resolution_cache
+from galileo_core.helpers.api_client import ApiClient
 from galileo_core.schemas.base_config import GalileoConfig
 
 
@@ -19,8 +22,17 @@ class GalileoPythonConfig(GalileoConfig):
 
     def reset(self) -> None:
         GalileoPythonConfig._instance = None
+        # Lookups made with the previous configuration may not be valid for the next one.
+        resolution_cache.clear()
         super().reset()
 
+    @property
+    def api_client(self) -> ApiClient:
+        # Send requests through the per-event-loop connection pools instead of a client per thread.
+        if self.validated_api_client is not None and not isinstance(self.validated_api_client, PooledApiClient):
+            self.validated_api_client = PooledApiClient.from_api_client(self.validated_api_client)
+        return super().api_client
+
     @classmethod
     def get(cls, **kwargs: Any) -> "GalileoPythonConfig":
         if cls._instance is None:
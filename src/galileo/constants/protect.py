@@ -1 +1,2 @@
 TIMEOUT_SECS = 10
+MAX_CONCURRENCY = 10
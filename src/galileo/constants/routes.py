@@ -26,3 +26,5 @@ class Routes(str, Enum):
 
     ingest_traces = "/ingest/traces/{project_id}"
     ingest_spans = "/ingest/spans/{project_id}"
+
+    protect_invoke = "/protect/invoke"
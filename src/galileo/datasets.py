@@ -1,6 +1,12 @@
 import builtins
+import itertools
+import json
 import mimetypes
+import os
+import queue
+import threading
 import time
+from collections.abc import Callable, Iterable, Iterator
 from typing import Any, overload
 
 from galileo.config import GalileoPythonConfig
@@ -25,6 +31,7 @@ from galileo.resources.models.dataset_append_row import DatasetAppendRow
 from galileo.resources.models.dataset_append_row_values import DatasetAppendRowValues
 from galileo.resources.models.dataset_content import DatasetContent
 from galileo.resources.models.dataset_db import DatasetDB
+from galileo.resources.models.dataset_format import DatasetFormat
 from galileo.resources.models.dataset_name_filter import DatasetNameFilter
 from galileo.resources.models.dataset_name_filter_operator import DatasetNameFilterOperator
 from galileo.resources.models.dataset_updated_at_sort import DatasetUpdatedAtSort
@@ -42,7 +49,13 @@ from galileo.resources.models.update_dataset_content_request import UpdateDatase
 from galileo.resources.models.update_dataset_request import UpdateDatasetRequest
 from galileo.resources.types import UNSET, File, Unset
 from galileo.schema.datasets import DatasetRecord
-from galileo.utils.datasets import normalize_dataset_rows, remap_output_to_ground_truth, validate_dataset_in_project
+from galileo.utils.datasets import (
+    JsonlRowReader,
+    get_next_starting_token,
+    normalize_dataset_row,
+    remap_output_to_ground_truth,
+    validate_dataset_in_project,
+)
 from galileo.utils.exceptions import APIException
 from galileo.utils.log_config import get_logger
 from galileo.utils.projects import resolve_project_id
@@ -50,6 +63,10 @@ from galileo_core.utils.dataset import DatasetType, parse_dataset
 
 logger = get_logger(__name__)
 MAX_DATASET_ROWS = 100000
+DATASET_CONTENT_PAGE_SIZE = 1000
+# Bounds of each PATCH request sent by Dataset.add_rows; larger appends are split into several requests.
+ADD_ROWS_CHUNK_MAX_ROWS = 1000
+ADD_ROWS_CHUNK_MAX_BYTES = 4 * 1024 * 1024
 DEFAULT_EXTEND_MODEL_ALIAS = "GPT-4o mini"
 
 
@@ -58,14 +75,28 @@ class DatasetAPIException(APIException):
 
 
 class Dataset:
-    content: DatasetContent | None = None
     config: GalileoPythonConfig
+    _content: DatasetContent | None = None
+    # Set by add_rows: the local content is refreshed on its next access.
+    _content_stale: bool = False
 
     def __init__(self, dataset_db: DatasetDB) -> None:
         self.dataset = dataset_db
         self.config = GalileoPythonConfig.get()
 
-    def get_content(self, starting_token: int = 0, limit: int = MAX_DATASET_ROWS) -> None | DatasetContent:
+    @property
+    def content(self) -> DatasetContent | None:
+        """The local content of the dataset, refreshed on the first access after ``add_rows()``."""
+        if self._content_stale:
+            self.get_content()
+        return self._content
+
+    @content.setter
+    def content(self, content: DatasetContent | None) -> None:
+        self._content = content
+        self._content_stale = False
+
+    def get_content(self, starting_token: int = 0, limit: int = MAX_DATASET_ROWS) -> DatasetContent | None:
         """
         Gets and returns the content of the dataset.
         Also refreshes the content of the local dataset instance.
@@ -108,20 +139,37 @@ class Dataset:
         if not self.dataset:
             return None
 
+        # The ETag is all we need, so only fetch a single row of content.
         response = get_dataset_content_datasets_dataset_id_content_get.sync_detailed(
-            client=self.config.api_client, dataset_id=self.dataset.id
+            client=self.config.api_client, dataset_id=self.dataset.id, limit=1
         )
 
         return response.headers.get("ETag")
 
-    def add_rows(self, row_data: list[dict[str, Any]]) -> "Dataset":
+    def add_rows(
+        self,
+        row_data: Iterable[dict[str, Any]],
+        *,
+        refresh: bool = True,
+        max_chunk_bytes: int = ADD_ROWS_CHUNK_MAX_BYTES,
+    ) -> "Dataset":
         """
         Adds rows to the dataset.
 
+        Large appends are split into several requests of at most ``ADD_ROWS_CHUNK_MAX_ROWS`` rows and about
+        ``max_chunk_bytes`` of row data each. The ETag returned by each request is used for the next one, so the
+        dataset content is never downloaded while appending. Rows can be given as any iterable, such as a
+        generator, and are only read one chunk at a time.
+
         Parameters
         ----------
-        row_data : List[Dict[str, Any]]
+        row_data : Iterable[Dict[str, Any]]
             The rows to add to the dataset.
+        refresh : bool
+            Whether to refresh the local content of the dataset. The content is not downloaded by ``add_rows``
+            itself but on the next access to ``content``. If False, the local content is left as is. Default is True.
+        max_chunk_bytes : int
+            Approximate maximum size in bytes of the rows sent in one request. Default is 4 MB.
 
         Returns
         -------
@@ -130,28 +178,42 @@ class Dataset:
 
         Raises
         ------
+        DatasetAPIException
+            If a request fails. The rows of the requests sent before it were added.
         errors.UnexpectedStatus
             If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
         httpx.TimeoutException
             If the request takes longer than Client.timeout.
 
         """
-        append_rows: list[DatasetAppendRow] = [
-            DatasetAppendRow(values=DatasetAppendRowValues.from_dict(row)) for row in normalize_dataset_rows(row_data)
-        ]
-        request = UpdateDatasetContentRequest(edits=append_rows)
-        # Use sync_detailed to access status_code and headers from the 204 No Content response
-        response = update_dataset_content_datasets_dataset_id_content_patch.sync_detailed(
-            client=self.config.api_client, dataset_id=self.dataset.id, body=request, if_match=self._get_etag()
-        )
-        # 204 No Content is the expected success response
-        if response.status_code not in (200, 204):
-            raise DatasetAPIException(
-                f"Request to add new rows to dataset failed with status {response.status_code}: {response.content}"
-            )
-
-        # Refresh the content
-        self.get_content()
+        if max_chunk_bytes < 1:
+            raise ValueError("max_chunk_bytes must be a positive integer")
+
+        etag: str | None = None
+        added = 0
+        try:
+            for chunk in _chunk_rows((normalize_dataset_row(row) for row in row_data), max_chunk_bytes):
+                if etag is None:
+                    etag = self._get_etag()
+                request = UpdateDatasetContentRequest(
+                    edits=[DatasetAppendRow(values=DatasetAppendRowValues.from_dict(row)) for row in chunk]
+                )
+                # Use sync_detailed to access status_code and headers from the 204 No Content response
+                response = update_dataset_content_datasets_dataset_id_content_patch.sync_detailed(
+                    client=self.config.api_client, dataset_id=self.dataset.id, body=request, if_match=etag
+                )
+                # 204 No Content is the expected success response
+                if response.status_code not in (200, 204):
+                    raise DatasetAPIException(
+                        f"Request to add new rows to dataset failed with status {response.status_code} after "
+                        f"adding {added} rows: {response.content}"
+                    )
+                added += len(chunk)
+                # The response carries the ETag of the new version; it is only fetched if the server did not send it.
+                etag = response.headers.get("ETag")
+        finally:
+            if refresh and added:
+                self._content_stale = True
 
         return self
 
@@ -428,17 +490,26 @@ class Datasets:
         return delete_dataset_datasets_dataset_id_delete.sync(client=self.config.api_client, dataset_id=dataset.id)
 
     def create(
-        self, name: str, content: DatasetType, *, project_id: str | None = None, project_name: str | None = None
+        self,
+        name: str,
+        content: DatasetType | Iterable[dict[str, Any]],
+        *,
+        project_id: str | None = None,
+        project_name: str | None = None,
     ) -> Dataset:
         """
         Creates a new dataset, optionally associating it with a project.
 
+        Rows given as a list or any other iterable, such as a generator, are encoded to JSONL while the request
+        body is sent, so they are neither copied nor written to a temporary file. A path to a local CSV, JSON,
+        JSONL or Feather file is uploaded from disk.
+
         Parameters
         ----------
         name : str
             The name of the dataset.
-        content : DatasetType
-            The content of the dataset.
+        content : Union[DatasetType, Iterable[Dict[str, Any]]]
+            The content of the dataset: rows, a dictionary of columns, or the path of a file.
         project_id : str, optional
             Associate the dataset with this project by ID. Mutually exclusive with project_name.
         project_name : str, optional
@@ -465,23 +536,30 @@ class Datasets:
             resolved_project_id = resolve_project_id(project_id, project_name)
             assert resolved_project_id is not None  # resolve_project_id raises if both params are none
 
-        # Normalize records to handle ground_truth -> output conversion.
-        # Use targeted key rename instead of routing through DatasetRecord, so that
-        # custom columns (e.g. "category", "difficulty") are preserved rather than silently dropped.
-        if isinstance(content, list) and len(content) > 0:
-            content = normalize_dataset_rows(content)
-
-        if isinstance(content, list | dict) and len(content) == 0:
+        if isinstance(content, Iterable) and not isinstance(content, str | bytes | dict | os.PathLike):
+            rows = iter(content)
+            first_row = next(rows, None)
             # we want to avoid errors: Invalid CSV data: CSV parse error:
             # Empty CSV file or block: cannot infer number of columns
-            content = [{}]
-
-        file_path, dataset_format = parse_dataset(content)
-        file = File(
-            payload=file_path.open("rb"),
-            file_name=name,
-            mime_type=mimetypes.guess_type(file_path)[0] or "application/octet-stream",
-        )
+            rows = itertools.chain([{} if first_row is None else first_row], rows)
+            # Normalize records to handle ground_truth -> output conversion.
+            # Use targeted key rename instead of routing through DatasetRecord, so that
+            # custom columns (e.g. "category", "difficulty") are preserved rather than silently dropped.
+            file = File(
+                payload=JsonlRowReader(normalize_dataset_row(row) for row in rows),
+                file_name=name,
+                mime_type=mimetypes.guess_type(f"{name}.{DatasetFormat.JSONL}")[0] or "application/octet-stream",
+            )
+            dataset_format = DatasetFormat.JSONL
+        else:
+            if isinstance(content, dict) and len(content) == 0:
+                content = [{}]
+            file_path, dataset_format = parse_dataset(content)
+            file = File(
+                payload=file_path.open("rb"),
+                file_name=name,
+                mime_type=mimetypes.guess_type(file_path)[0] or "application/octet-stream",
+            )
 
         body = BodyCreateDatasetDatasetsPost(file=file, name=name, project_id=resolved_project_id)
 
@@ -826,17 +904,23 @@ def delete_dataset(
 
 
 def create_dataset(
-    name: str, content: DatasetType, *, project_id: str | None = None, project_name: str | None = None
+    name: str,
+    content: DatasetType | Iterable[dict[str, Any]],
+    *,
+    project_id: str | None = None,
+    project_name: str | None = None,
 ) -> Dataset:
     """
     Creates a new dataset, optionally associating it with a project.
 
+    Rows can be given as any iterable, such as a generator, and are streamed to the API without being copied.
+
     Parameters
     ----------
     name : str
         The name of the dataset.
-    content : DatasetType
-        The content of the dataset.
+    content : Union[DatasetType, Iterable[Dict[str, Any]]]
+        The content of the dataset: rows, a dictionary of columns, or the path of a file.
     project_id : str, optional
         Associate the dataset with this project by ID. Mutually exclusive with project_name.
     project_name : str, optional
@@ -1036,6 +1120,21 @@ def list_dataset_projects(
     raise ValueError("Either dataset_id or dataset_name must be provided.")
 
 
+def _chunk_rows(rows: Iterable[dict[str, Any]], max_chunk_bytes: int) -> Iterator[list[dict[str, Any]]]:
+    """Split rows into chunks of at most ``ADD_ROWS_CHUNK_MAX_ROWS`` rows and about ``max_chunk_bytes`` bytes."""
+    chunk: list[dict[str, Any]] = []
+    chunk_bytes = 0
+    for row in rows:
+        row_bytes = len(json.dumps(row, default=str))
+        if chunk and (len(chunk) >= ADD_ROWS_CHUNK_MAX_ROWS or chunk_bytes + row_bytes > max_chunk_bytes):
+            yield chunk
+            chunk, chunk_bytes = [], 0
+        chunk.append(row)
+        chunk_bytes += row_bytes
+    if chunk:
+        yield chunk
+
+
 def convert_dataset_row_to_record(dataset_row: DatasetRow) -> DatasetRecord:
     """
     Converts a DatasetRow to a DatasetRecord.
@@ -1077,3 +1176,119 @@ def convert_dataset_row_to_record(dataset_row: DatasetRow) -> DatasetRecord:
         metadata=values_dict.get("metadata", None),
         generated_output=values_dict.get("generated_output", None),
     )
+
+
+_END_OF_CONTENT = object()
+
+
+def iter_dataset_content(
+    dataset: Dataset, *, page_size: int = DATASET_CONTENT_PAGE_SIZE, prefetch: int = 1, starting_token: int = 0
+) -> Iterator[DatasetContent]:
+    """
+    Iterate over the content of a dataset page by page, fetching the next pages in the background.
+
+    While the caller works on one page, up to ``prefetch`` following pages are requested on a background thread, so
+    network time overlaps with processing time. Iteration stops at the last page: an empty one, one without a
+    ``next_starting_token``, or one shorter than ``page_size`` when the server does not hand out tokens.
+
+    Parameters
+    ----------
+    dataset : Dataset
+        The dataset to read.
+    page_size : int
+        The number of rows to request per page. Defaults to 1000.
+    prefetch : int
+        The number of pages to fetch ahead of the caller. ``0`` fetches each page only when it is needed.
+        Defaults to 1.
+    starting_token : int
+        The token of the first page to read. Defaults to 0.
+
+    Returns
+    -------
+    Iterator[DatasetContent]
+        The non-empty pages of the dataset, in order.
+
+    Raises
+    ------
+    errors.UnexpectedStatus
+        If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
+    httpx.TimeoutException
+        If the request takes longer than Client.timeout.
+    """
+    if prefetch < 1:
+        yield from _fetch_dataset_pages(dataset, page_size, starting_token, lambda: False)
+        return
+
+    pages: queue.Queue = queue.Queue(maxsize=prefetch)
+    stopped = threading.Event()
+
+    def put(item: Any) -> bool:
+        # Give up when the caller stops iterating, so an abandoned iterator doesn't leave the thread blocked.
+        while not stopped.is_set():
+            try:
+                pages.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def fetch() -> None:
+        try:
+            for content in _fetch_dataset_pages(dataset, page_size, starting_token, stopped.is_set):
+                if not put(content):
+                    return
+        except Exception as exc:
+            put(exc)
+            return
+        put(_END_OF_CONTENT)
+
+    threading.Thread(target=fetch, name="galileo-dataset-prefetch", daemon=True).start()
+    try:
+        while (item := pages.get()) is not _END_OF_CONTENT:
+            if isinstance(item, Exception):
+                raise item
+            yield item
+    finally:
+        stopped.set()
+
+
+def iter_dataset_records(
+    dataset: Dataset, *, page_size: int = DATASET_CONTENT_PAGE_SIZE, prefetch: int = 1
+) -> Iterator[DatasetRecord]:
+    """
+    Iterate over the rows of a dataset as ``DatasetRecord`` objects without loading the whole dataset.
+
+    Pages are fetched ahead of time as in ``iter_dataset_content`` and rows are only converted when they are reached.
+
+    Parameters
+    ----------
+    dataset : Dataset
+        The dataset to read.
+    page_size : int
+        The number of rows to request per page. Defaults to 1000.
+    prefetch : int
+        The number of pages to fetch ahead of the caller. Defaults to 1.
+
+    Returns
+    -------
+    Iterator[DatasetRecord]
+        The records of the dataset, in order.
+    """
+    for content in iter_dataset_content(dataset, page_size=page_size, prefetch=prefetch):
+        for row in content.rows:
+            yield convert_dataset_row_to_record(row)
+
+
+def _fetch_dataset_pages(
+    dataset: Dataset, page_size: int, starting_token: int, stopped: Callable[[], bool]
+) -> Iterator[DatasetContent]:
+    while not stopped():
+        logger.debug(f"Loading dataset content starting at token {starting_token}")
+        content = dataset.get_content(starting_token=starting_token, limit=page_size)
+        if not content or not content.rows:
+            return
+        yield content
+        next_starting_token = get_next_starting_token(content, page_size, starting_token)
+        if next_starting_token is None:
+            return
+        starting_token = next_starting_token
@@ -1236,6 +1236,10 @@ class Experiment(StateManagementMixin):
 
             for record in results:
                 print(record["id"], record["input"])
+
+            # Stream every page with bounded memory
+            for record in results.iter_all(columns=["id", "input"]):
+                print(record["id"], record["input"])
         """
         if self.id is None:
             raise ValueError("Experiment ID is not set. Cannot query a local-only experiment.")
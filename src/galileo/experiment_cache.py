@@ -0,0 +1,178 @@
+import contextlib
+import hashlib
+import inspect
+import json
+import os
+import sqlite3
+import threading
+import time
+import weakref
+import zlib
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+from galileo.schema.logged import LoggedTrace
+from galileo.utils.log_config import get_logger
+
+_logger = get_logger(__name__)
+
+DEFAULT_CACHE_PATH = "~/.galileo/experiment_cache.sqlite3"
+DEFAULT_CACHE_MAX_SIZE_BYTES = 1024 * 1024 * 1024  # 1 GB
+
+
+class ExperimentCache:
+    """
+    On-disk cache of the traces logged by experiment runner functions.
+
+    Entries are keyed on the identity of the function and the input of the dataset row, so re-running an experiment
+    with the same function over the same rows replays the cached traces instead of calling the function (and the
+    LLMs it calls) again. The function identity is its qualified name and a hash of its source code, so editing the
+    function invalidates its entries. Pass a ``version`` to also invalidate them when behavior changes without a
+    source change, e.g. when a prompt or model the function closes over changes.
+
+    The cache is stored in a SQLite file and is bounded in size: when it grows past ``max_size_bytes``, the least
+    recently used entries are evicted.
+
+    Parameters
+    ----------
+    path : str | os.PathLike
+        Path of the SQLite file. Defaults to ``~/.galileo/experiment_cache.sqlite3``.
+    max_size_bytes : int
+        Maximum total size of the (compressed) cached traces. Defaults to 1 GB.
+    version : Optional[str]
+        Extra component of the function identity. Defaults to None.
+
+    Examples
+    --------
+    >>> cache = ExperimentCache(version="prompt-v2")
+    >>> run_experiment("my-experiment", dataset_name="my-dataset", function=my_function, cache=cache)
+    """
+
+    def __init__(
+        self,
+        path: str | os.PathLike = DEFAULT_CACHE_PATH,
+        max_size_bytes: int = DEFAULT_CACHE_MAX_SIZE_BYTES,
+        version: str | None = None,
+    ) -> None:
+        if max_size_bytes < 1:
+            raise ValueError("max_size_bytes must be a positive integer")
+        self.path = Path(path).expanduser()
+        self.max_size_bytes = max_size_bytes
+        self.version = version
+        self._lock = threading.Lock()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        # Runner functions may run on a thread pool, so the connection is shared between threads under the lock.
+        self._connection = sqlite3.connect(self.path, check_same_thread=False)
+        with self._lock, self._connection:
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS entries ("
+                "key TEXT PRIMARY KEY, value BLOB NOT NULL, size INTEGER NOT NULL, last_used REAL NOT NULL)"
+            )
+            self._connection.execute("CREATE INDEX IF NOT EXISTS entries_last_used ON entries (last_used)")
+            # Triggers keep the total size of the entries in a single row, so that puts do not sum the whole table.
+            # The row is seeded from the entries of cache files created before it existed.
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS total_size (id INTEGER PRIMARY KEY CHECK (id = 0), size INTEGER NOT NULL)"
+            )
+            self._connection.execute(
+                "INSERT OR IGNORE INTO total_size (id, size) SELECT 0, COALESCE(SUM(size), 0) FROM entries"
+            )
+            self._connection.execute(
+                "CREATE TRIGGER IF NOT EXISTS entries_insert AFTER INSERT ON entries "
+                "BEGIN UPDATE total_size SET size = size + NEW.size; END"
+            )
+            self._connection.execute(
+                "CREATE TRIGGER IF NOT EXISTS entries_update AFTER UPDATE OF size ON entries "
+                "BEGIN UPDATE total_size SET size = size + NEW.size - OLD.size; END"
+            )
+            self._connection.execute(
+                "CREATE TRIGGER IF NOT EXISTS entries_delete AFTER DELETE ON entries "
+                "BEGIN UPDATE total_size SET size = size - OLD.size; END"
+            )
+
+    def key(self, func: Callable, input: Any) -> str:
+        """Return the cache key of calling ``func`` on the row input ``input``."""
+        identity = [_function_identity(func), self.version, input]
+        return hashlib.sha256(json.dumps(identity, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+
+    def get(self, func: Callable, input: Any) -> LoggedTrace | None:
+        """Return the cached trace of calling ``func`` on ``input``, or None on a cache miss."""
+        key = self.key(func, input)
+        with self._lock, self._connection:
+            row = self._connection.execute("SELECT value FROM entries WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return None
+            self._connection.execute("UPDATE entries SET last_used = ? WHERE key = ?", (time.time(), key))
+        try:
+            return LoggedTrace.model_validate_json(zlib.decompress(row[0]))
+        except Exception as e:
+            _logger.warning(f"Ignoring unreadable experiment cache entry {key}: {e}")
+            return None
+
+    def put(self, func: Callable, input: Any, trace: LoggedTrace) -> None:
+        """Cache the trace logged by calling ``func`` on ``input``, evicting least recently used entries if needed."""
+        value = self._compress(trace)
+        if len(value) > self.max_size_bytes:
+            _logger.debug(f"Not caching a trace of {len(value)} bytes, larger than the cache")
+            return
+        with self._lock, self._connection:
+            self._connection.execute(
+                # An upsert rather than INSERT OR REPLACE, whose implicit delete does not fire the delete trigger.
+                "INSERT INTO entries (key, value, size, last_used) VALUES (?, ?, ?, ?) ON CONFLICT (key) DO UPDATE "
+                "SET value = excluded.value, size = excluded.size, last_used = excluded.last_used",
+                (self.key(func, input), value, len(value), time.time()),
+            )
+            self._evict()
+
+    def clear(self) -> None:
+        """Remove every entry from the cache."""
+        with self._lock, self._connection:
+            self._connection.execute("DELETE FROM entries")
+
+    def close(self) -> None:
+        """Close the underlying SQLite connection."""
+        with self._lock:
+            self._connection.close()
+
+    @staticmethod
+    def _compress(trace: LoggedTrace) -> bytes:
+        return zlib.compress(trace.model_dump_json().encode("utf-8"))
+
+    def _evict(self) -> None:
+        (total_size,) = self._connection.execute("SELECT size FROM total_size").fetchone()
+        if total_size <= self.max_size_bytes:
+            return
+        evicted = []
+        for key, size in self._connection.execute("SELECT key, size FROM entries ORDER BY last_used"):
+            if total_size <= self.max_size_bytes:
+                break
+            evicted.append((key,))
+            total_size -= size
+        self._connection.executemany("DELETE FROM entries WHERE key = ?", evicted)
+        _logger.debug(f"Evicted {len(evicted)} entries from the experiment cache")
+
+
+# Weakly keyed, so that memoizing an identity does not keep the function or its closure alive.
+_function_identities: "weakref.WeakKeyDictionary[Callable, str]" = weakref.WeakKeyDictionary()
+
+
+def _function_identity(func: Callable) -> str:
+    with contextlib.suppress(KeyError, TypeError):
+        return _function_identities[func]
+    identity = _compute_function_identity(func)
+    # Callables that cannot be hashed or weakly referenced are not memoized.
+    with contextlib.suppress(TypeError):
+        _function_identities[func] = identity
+    return identity
+
+
+def _compute_function_identity(func: Callable) -> str:
+    name = f"{getattr(func, '__module__', None)}.{getattr(func, '__qualname__', type(func).__qualname__)}"
+    try:
+        source = inspect.getsource(func).encode("utf-8")
+    except (OSError, TypeError):
+        # Functions defined interactively have no retrievable source; fall back to their bytecode.
+        code = getattr(func, "__code__", None)
+        source = code.co_code if code is not None else b""
+    return f"{name}:{hashlib.sha256(source).hexdigest()}"
@@ -1,17 +1,28 @@
+import asyncio
 import builtins
+import contextvars
 import datetime
+import inspect
+import json
 import logging
-from collections.abc import Callable
-from sys import getsizeof
-from typing import Any
+import os
+import threading
+from collections import deque
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from itertools import islice
+from pathlib import Path
+from typing import Any, TypeVar
 
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
 from galileo.config import GalileoPythonConfig
-from galileo.datasets import Dataset, convert_dataset_row_to_record
+from galileo.datasets import DATASET_CONTENT_PAGE_SIZE, Dataset, convert_dataset_row_to_record, iter_dataset_content
 from galileo.decorator import galileo_context, galileo_dataset_context, log
+from galileo.experiment_cache import ExperimentCache
 from galileo.experiment_tags import upsert_experiment_tag
+from galileo.logger import GalileoLogger
 from galileo.projects import Project, Projects
 from galileo.prompts import PromptTemplate
 from galileo.resources.api.experiment import (
@@ -22,15 +33,21 @@ from galileo.resources.models import ExperimentResponse, HTTPValidationError, Pr
 from galileo.schema.datasets import DatasetRecord
 from galileo.schema.experiment_group import ExperimentGroupResponse
 from galileo.schema.metrics import GalileoMetrics, LocalMetricConfig, Metric
+from galileo.shared.http_pool import http_pool
 from galileo.utils.datasets import create_rows_from_records, load_dataset
 from galileo.utils.exceptions import _format_http_validation_error
 from galileo.utils.headers_data import get_sdk_header
 from galileo.utils.log_config import get_logger
 from galileo.utils.metrics import create_metric_configs
+from galileo.utils.serialization import serialize_to_str
+from galileo.utils.singleton import GalileoLoggerSingleton
 from galileo_core.constants.request_method import RequestMethod
+from galileo_core.schemas.logging.trace import Trace
 
 _logger = get_logger(__name__)
 
+_T = TypeVar("_T")
+
 EXPERIMENT_TASK_TYPE: TaskType = 16
 
 
@@ -62,7 +79,10 @@ def _default_prompt_settings(model_alias: str = "GPT-4o") -> PromptRunSettings:
 
 MAX_REQUEST_SIZE_BYTES = 10 * 1024 * 1024  # 10 MB
 MAX_INGEST_BATCH_SIZE = 128
-DATASET_CONTENT_PAGE_SIZE = 1000
+# Batches uploaded in the background while the next rows run; submitting past this waits for the oldest one.
+MAX_IN_FLIGHT_FLUSHES = 2
+# Where run_experiment(resume=True) keeps one checkpoint file of ingested row IDs per experiment.
+DEFAULT_EXPERIMENT_CHECKPOINT_DIR = "~/.galileo/experiment_checkpoints"
 # Page size used by both list_experiment_groups() and the group-filter branch of get_experiments().
 # Both call internal APIs with internal pagination; the public helpers return the full list and
 # do not expose pagination tokens to customers.
@@ -230,6 +250,10 @@ class Experiments:
         func: Callable,
         local_metrics: builtins.list[LocalMetricConfig],
         on_error: Callable[[Exception], None] | None = None,
+        max_workers: int | None = None,
+        checkpoint_dir: str | os.PathLike | None = None,
+        cache: ExperimentCache | None = None,
+        row_timeout: float | None = None,
     ) -> dict[str, Any]:
         if dataset_obj is None and records is None:
             raise ValueError("Either dataset_obj or records must be provided")
@@ -239,41 +263,131 @@ class Experiments:
         def logged_process_func(row: DatasetRecord) -> Callable:
             return log(name=experiment_obj.name, dataset_record=row)(func)
 
-        # For static records (list), process once
-        if records is not None:
-            _logger.info(f"Processing {len(records)} rows from dataset")
-            for row in records:
-                results.append(process_row(row, logged_process_func(row)))
-                galileo_context.reset_trace_context()
-                if getsizeof(results) > MAX_REQUEST_SIZE_BYTES or len(results) >= MAX_INGEST_BATCH_SIZE:
-                    _logger.info("Flushing logger due to size limit")
-                    galileo_context.flush(on_error=on_error)
-                    results = []
-        # For dataset object, paginate through content
-        elif dataset_obj is not None:
-            starting_token = 0
-            has_more_data = True
-
-            while has_more_data:
-                _logger.info(f"Loading dataset content starting at token {starting_token}")
-                content = dataset_obj.get_content(starting_token=starting_token, limit=DATASET_CONTENT_PAGE_SIZE)
-
-                if not content or not content.rows:
-                    _logger.info("No more dataset content to process")
-                    has_more_data = False
-                else:
-                    batch_records = [convert_dataset_row_to_record(row) for row in content.rows]
-                    _logger.info(f"Processing {len(batch_records)} rows from dataset")
-
-                    for row in batch_records:
-                        results.append(process_row(row, logged_process_func(row)))
-                        galileo_context.reset_trace_context()
-                        if getsizeof(results) > MAX_REQUEST_SIZE_BYTES or len(results) >= MAX_INGEST_BATCH_SIZE:
-                            _logger.info("Flushing logger due to size limit")
-                            galileo_context.flush(on_error=on_error)
-                            results = []
-
-                    starting_token += len(batch_records)
+        rows = _iter_dataset_records(dataset_obj, records)
+        checkpoint = None
+        if checkpoint_dir is not None:
+            checkpoint = _ExperimentCheckpoint(_checkpoint_path(checkpoint_dir, experiment_obj.id))
+            rows = checkpoint.pending(rows)
+        is_async = inspect.iscoroutinefunction(func)
+        if row_timeout is not None and not is_async:
+            _logger.warning("row_timeout was provided but only applies to async functions; ignoring it.")
+        cached_func = _CachedFunction(cache, func) if cache is not None else None
+        # Full batches are uploaded in the background so the next rows run while the previous batch is ingested.
+        flusher = _BackgroundFlusher(MAX_IN_FLIGHT_FLUSHES, on_ingested=checkpoint.record if checkpoint else None)
+
+        try:
+            if not is_async and (max_workers is None or max_workers <= 1):
+                for row in rows:
+                    output, succeeded = _process_row(row, logged_process_func(row), cached_func)
+                    results.append(output)
+                    galileo_context.reset_trace_context()
+                    if succeeded:
+                        flusher.track(galileo_context.get_logger_instance(), row)
+                    if (
+                        galileo_context.get_logger_instance().buffered_size_bytes > MAX_REQUEST_SIZE_BYTES
+                        or len(results) >= MAX_INGEST_BATCH_SIZE
+                    ):
+                        _logger.info("Flushing logger due to size limit")
+                        flusher.submit(galileo_context.get_logger_instance())
+                        results = []
+            else:
+                # Loggers are cached per thread, so every worker logs its rows to its own logger.
+                worker_loggers: builtins.list[GalileoLogger] = []
+
+                def init_worker() -> None:
+                    worker_loggers.append(
+                        GalileoLoggerSingleton().get(
+                            project=project_obj.name, experiment_id=experiment_obj.id, local_metrics=local_metrics
+                        )
+                    )
+
+                def process_row_in_worker(row: DatasetRecord) -> str:
+                    output, succeeded = _process_row(row, logged_process_func(row), cached_func)
+                    # Only this thread logs to its logger and its rows run one at a time, so no trace is left open.
+                    worker_logger = galileo_context.get_logger_instance()
+                    if succeeded:
+                        flusher.track(worker_logger, row)
+                    if worker_logger.buffered_size_bytes > MAX_REQUEST_SIZE_BYTES:
+                        _logger.info("Flushing worker logger due to size limit")
+                        flusher.submit(worker_logger)
+                    return output
+
+                async def aprocess_row_in_worker(row: DatasetRecord) -> tuple[DatasetRecord, str, bool, Trace | None]:
+                    try:
+                        output, succeeded, trace = await asyncio.wait_for(
+                            _aprocess_row(row, logged_process_func(row), cached_func), row_timeout
+                        )
+                    except asyncio.TimeoutError:
+                        # The trace of the row is left unconcluded, and uploaded with the last batch of the run.
+                        output = f"error during executing: {func.__name__}: timed out after {row_timeout}s"
+                        _logger.error(output)
+                        return row, output, False, None
+                    return row, output, succeeded, trace
+
+                async def aprocess_rows_in_worker() -> builtins.list[str]:
+                    # All rows share the logger of the event loop's thread, so only the traces of the rows that are
+                    # done are uploaded while the other rows keep running.
+                    worker_logger = galileo_context.get_logger_instance()
+                    outputs = []
+                    concluded_traces: builtins.list[Trace] = []
+                    try:
+                        async for row, output, succeeded, trace in _aprocess_rows(
+                            rows, aprocess_row_in_worker, concurrency
+                        ):
+                            outputs.append(output)
+                            if trace is None:
+                                continue
+                            concluded_traces.append(trace)
+                            if succeeded:
+                                flusher.track(worker_logger, row)
+                            if (
+                                worker_logger.buffered_size_bytes > MAX_REQUEST_SIZE_BYTES
+                                or len(concluded_traces) >= MAX_INGEST_BATCH_SIZE
+                            ):
+                                _logger.info(f"Flushing {len(concluded_traces)} concluded traces of the worker logger")
+                                flusher.submit(worker_logger, traces=concluded_traces)
+                                concluded_traces = []
+                    finally:
+                        await http_pool.aclose()
+                    return outputs
+
+                concurrency = max_workers or 1
+                executor = ThreadPoolExecutor(
+                    max_workers=1 if is_async else concurrency,
+                    thread_name_prefix="galileo-experiment",
+                    initializer=init_worker,
+                )
+                try:
+                    if is_async:
+                        # One event loop runs every row, on its own thread so this also works when called from a
+                        # running loop.
+                        results = executor.submit(
+                            contextvars.copy_context().run, asyncio.run, aprocess_rows_in_worker()
+                        ).result()
+                        for worker_logger in worker_loggers:
+                            flusher.submit(worker_logger)
+                    else:
+                        # Rows run in windows of one ingest batch, and the worker loggers are only flushed once every
+                        # row in the window has concluded its trace.
+                        for window in _batched(rows, MAX_INGEST_BATCH_SIZE):
+                            # Each row runs in a copy of this context, so it starts its own trace and span stack.
+                            futures = [
+                                executor.submit(contextvars.copy_context().run, process_row_in_worker, row)
+                                for row in window
+                            ]
+                            results = [future.result() for future in futures]
+                            _logger.info(f"Flushing {len(worker_loggers)} worker loggers")
+                            for worker_logger in worker_loggers:
+                                flusher.submit(worker_logger)
+                finally:
+                    executor.shutdown()
+                    for worker_logger in worker_loggers:
+                        GalileoLoggerSingleton().discard(worker_logger)
+
+            flusher.submit(galileo_context.get_logger_instance())
+        finally:
+            # Also wait when the run fails, so the batches still in flight are ingested and checkpointed.
+            flusher.wait(on_error=on_error)
 
         # flush the logger
         galileo_context.flush(on_error=on_error)
@@ -284,11 +398,220 @@ class Experiments:
         message = f"Experiment {experiment_obj.name} has completed and results are available at {link}"
         _logger.info(message)
 
-        return {"experiment": experiment_obj, "link": link, "message": message}
+        result: dict[str, Any] = {"experiment": experiment_obj, "link": link, "message": message}
+        if cached_func is not None:
+            _logger.info(f"Experiment cache: {cached_func.hits} hits, {cached_func.misses} misses")
+            result["cache_hits"] = cached_func.hits
+            result["cache_misses"] = cached_func.misses
+        return result
+
+
+def _iter_dataset_records(
+    dataset_obj: Dataset | None, records: builtins.list[DatasetRecord] | None
+) -> Iterator[DatasetRecord]:
+    """Yield the rows of an experiment, streaming the dataset content when no static records are given."""
+    # For static records (list), process once
+    if records is not None:
+        _logger.info(f"Processing {len(records)} rows from dataset")
+        yield from records
+        return
+
+    # For dataset object, page through content while the next page is fetched in the background
+    if dataset_obj is None:
+        return
+    for content in iter_dataset_content(dataset_obj, page_size=DATASET_CONTENT_PAGE_SIZE):
+        _logger.info(f"Processing {len(content.rows)} rows from dataset")
+        for row in content.rows:
+            yield convert_dataset_row_to_record(row)
+    _logger.info("No more dataset content to process")
+
+
+class _BackgroundFlusher:
+    """
+    Uploads logger batches in the background, with at most ``max_in_flight`` uploads pending at a time.
+
+    Upload errors are collected and reported by `wait`, which callers use as the barrier at the end of a run. When
+    ``on_ingested`` is given, the IDs of the rows `track`-ed on a logger are passed to it once their batch is ingested.
+    Loggers in distributed mode are flushed synchronously instead, as they have already sent their traces.
+    """
+
+    def __init__(self, max_in_flight: int, on_ingested: Callable[[builtins.list[str]], None] | None = None) -> None:
+        self._max_in_flight = max(max_in_flight, 1)
+        self._on_ingested = on_ingested
+        self._in_flight: deque[tuple[Future, builtins.list[str]]] = deque()
+        self._row_ids: dict[int, builtins.list[str]] = {}
+        self._errors: builtins.list[Exception] = []
+        self._lock = threading.Lock()
+
+    def track(self, logger: GalileoLogger, row: DatasetRecord) -> None:
+        """Note that the trace of ``row`` is buffered by ``logger`` and will be part of its next upload."""
+        if self._on_ingested is None or row.id is None:
+            return
+        with self._lock:
+            self._row_ids.setdefault(id(logger), []).append(row.id)
+
+    def submit(self, logger: GalileoLogger, traces: builtins.list[Trace] | None = None) -> None:
+        """
+        Start uploading the traces buffered by ``logger``, first waiting for the oldest upload if too many are pending.
+
+        When ``traces`` is given, only those traces are uploaded, and every row `track`-ed on ``logger`` must be one
+        of them.
+        """
+        with self._lock:
+            row_ids = self._row_ids.pop(id(logger), [])
+        if logger.mode == "distributed":
+            # Distributed loggers send each trace as it concludes, so there is no batch to upload in the background:
+            # flushing only waits for the pending requests.
+            errors: builtins.list[Exception] = []
+            logger.flush(on_error=errors.append)
+            flushed: Future = Future()
+            if errors:
+                flushed.set_exception(errors[0])
+            else:
+                flushed.set_result(None)
+            self._collect(flushed, row_ids)
+            return
+        future = logger.flush_in_background(traces=traces)
+        if future is None:
+            return
+        with self._lock:
+            self._in_flight.append((future, row_ids))
+            oldest = self._in_flight.popleft() if len(self._in_flight) > self._max_in_flight else None
+        if oldest is not None:
+            self._collect(*oldest)
+
+    def wait(self, on_error: Callable[[Exception], None] | None = None) -> None:
+        """Wait for every pending upload and report each failed one to ``on_error`` (or log it as a warning)."""
+        while True:
+            with self._lock:
+                if not self._in_flight:
+                    break
+                future, row_ids = self._in_flight.popleft()
+            self._collect(future, row_ids)
+
+        with self._lock:
+            errors, self._errors = self._errors, []
+        for error in errors:
+            if on_error is None:
+                _logger.warning(f"Ingestion error in flush: {error}")
+                continue
+            try:
+                on_error(error)
+            except Exception as cb_exc:
+                _logger.warning(f"on_error callback raised: {cb_exc}")
+
+    def _collect(self, future: Future, row_ids: builtins.list[str]) -> None:
+        try:
+            future.result()
+        except Exception as e:
+            with self._lock:
+                self._errors.append(e)
+            return
+        if self._on_ingested is not None and row_ids:
+            self._on_ingested(row_ids)
+
 
+def _checkpoint_path(checkpoint_dir: str | os.PathLike, experiment_id: str) -> Path:
+    """Return the path of the checkpoint file of an experiment in ``checkpoint_dir``."""
+    return Path(checkpoint_dir).expanduser() / f"{experiment_id}.jsonl"
 
-def process_row(row: DatasetRecord, process_func: Callable) -> str:
+
+class _ExperimentCheckpoint:
+    """
+    Local record of the rows of an experiment whose traces were ingested, used to resume an interrupted run.
+
+    The file holds one JSON list of row IDs per ingested batch, so a partially written last line (from a run killed
+    mid-write) only loses that batch. Rows without an ID are keyed by their position in the dataset. Rows whose
+    function raised are not recorded, so they run again when the experiment is resumed.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self.completed: set[str] = set()
+        self._lock = threading.Lock()
+        if path.exists():
+            with path.open(encoding="utf-8") as file:
+                for line in file:
+                    try:
+                        self.completed.update(json.loads(line))
+                    except ValueError:
+                        _logger.warning(f"Ignoring unreadable line in experiment checkpoint {path}")
+
+    def pending(self, rows: Iterable[DatasetRecord]) -> Iterator[DatasetRecord]:
+        """Yield the rows that are not checkpointed yet, giving rows without an ID their positional ID."""
+        skipped = 0
+        for index, row in enumerate(rows):
+            if row.id is None:
+                row = row.model_copy(update={"id": str(index)})
+            if row.id in self.completed:
+                skipped += 1
+                continue
+            yield row
+        if skipped:
+            _logger.info(f"Skipped {skipped} rows already completed according to {self.path}")
+
+    def record(self, row_ids: builtins.list[str]) -> None:
+        """Append the IDs of the rows of an ingested batch to the checkpoint."""
+        with self._lock:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with self.path.open("a", encoding="utf-8") as file:
+                file.write(json.dumps(row_ids) + "\n")
+            self.completed.update(row_ids)
+
+
+class _CachedFunction:
+    """Replays and stores the traces of an experiment function in an `ExperimentCache`, counting hits and misses."""
+
+    def __init__(self, cache: ExperimentCache, func: Callable) -> None:
+        self.cache = cache
+        self.func = func
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    def replay(self, row: DatasetRecord) -> tuple[str, Trace] | None:
+        """
+        Add the cached trace of ``row`` to the current logger and return its output and the added trace, or None on
+        a cache miss.
+        """
+        trace = self.cache.get(self.func, row.deserialized_input)
+        with self._lock:
+            if trace is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+        # The dataset fields come from the current row, so updated ground truth and metadata are picked up.
+        trace = trace.model_copy(
+            update={"dataset_input": row.input, "dataset_output": row.output, "dataset_metadata": row.metadata or {}}
+        )
+        replayed = galileo_context.get_logger_instance().replay_trace(trace)
+        return trace.output if isinstance(trace.output, str) else serialize_to_str(trace.output), replayed
+
+    def store(self, row: DatasetRecord) -> None:
+        """Cache the trace just logged for ``row`` in the current context."""
+        trace = galileo_context.get_current_trace()
+        if trace is not None:
+            self.cache.put(self.func, row.deserialized_input, trace)
+
+
+def _batched(rows: Iterable[DatasetRecord], size: int) -> Iterator[builtins.list[DatasetRecord]]:
+    iterator = iter(rows)
+    while batch := builtins.list(islice(iterator, size)):
+        yield batch
+
+
+def process_row(row: DatasetRecord, process_func: Callable, cache: "_CachedFunction | None" = None) -> str:
+    output, _ = _process_row(row, process_func, cache)
+    return output
+
+
+def _process_row(
+    row: DatasetRecord, process_func: Callable, cache: "_CachedFunction | None" = None
+) -> tuple[str, bool]:
+    """Run ``process_func`` on ``row`` and return its output, and whether it succeeded (as opposed to raising)."""
     _logger.info(f"Processing dataset row: {row}")
+    if cache is not None and (replayed := cache.replay(row)) is not None:
+        return replayed[0], True
     try:
         # Set dataset context for OTEL spans (ground truth for scorers)
         # This ensures OTEL-instrumented frameworks get dataset fields attached to their spans
@@ -299,7 +622,53 @@ def process_row(row: DatasetRecord, process_func: Callable) -> str:
     except Exception as exc:
         output = f"error during executing: {process_func.__name__}: {exc}"
         _logger.error(output)
-    return output
+        return output, False
+    if cache is not None:
+        cache.store(row)
+    return output, True
+
+
+async def _aprocess_row(
+    row: DatasetRecord, process_func: Callable, cache: "_CachedFunction | None" = None
+) -> tuple[str, bool, Trace | None]:
+    """Async counterpart of ``_process_row`` for ``async def`` experiment functions, also returning the row's trace."""
+    _logger.info(f"Processing dataset row: {row}")
+    if cache is not None and (replayed := cache.replay(row)) is not None:
+        cached_output, trace = replayed
+        return cached_output, True, trace
+    try:
+        with galileo_dataset_context(dataset_input=row.input, dataset_output=row.output, dataset_metadata=row.metadata):
+            output = await process_func(row.deserialized_input)
+            log = galileo_context.get_logger_instance()
+            log.conclude(output)
+    except Exception as exc:
+        output = f"error during executing: {process_func.__name__}: {exc}"
+        _logger.error(output)
+        return output, False, galileo_context.get_current_trace()
+    if cache is not None:
+        cache.store(row)
+    return output, True, galileo_context.get_current_trace()
+
+
+async def _aprocess_rows(
+    rows: Iterable[DatasetRecord], process_row_func: Callable[[DatasetRecord], Awaitable[_T]], max_concurrency: int
+) -> AsyncIterator[_T]:
+    """
+    Run ``process_row_func`` over ``rows`` as tasks and yield their results as they complete.
+
+    At most ``max_concurrency`` rows are in flight at a time, and a new row is started as soon as one completes.
+    """
+    iterator = iter(rows)
+    pending: set[asyncio.Task] = set()
+    while True:
+        while len(pending) < max_concurrency and (row := next(iterator, None)) is not None:
+            # Tasks copy the current context, so each row starts its own trace and span stack.
+            pending.add(asyncio.create_task(process_row_func(row)))
+        if not pending:
+            return
+        done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+        for task in done:
+            yield task.result()
 
 
 def run_experiment(
@@ -318,6 +687,11 @@ def run_experiment(
     on_error: Callable[[Exception], None] | None = None,
     experiment_group: str | None = None,
     experiment_group_id: str | None = None,
+    max_workers: int | None = None,
+    resume: bool = False,
+    checkpoint_dir: str | os.PathLike | None = None,
+    cache: ExperimentCache | None = None,
+    row_timeout: float | None = None,
 ) -> Any:
     """
     Run an experiment with the specified parameters.
@@ -372,6 +746,28 @@ def run_experiment(
         API error_code 3520) before the run is created.
         If both ``experiment_group_id`` and ``experiment_group`` are provided, the API
         uses the ID and silently ignores the name.
+    max_workers
+        Optional maximum number of dataset rows to run the function on concurrently. Only applies to the
+        function flow. Rows run on a thread pool, or as asyncio tasks when the function is ``async def``,
+        and each row gets its own trace. Defaults to None, which runs rows one at a time.
+    resume
+        Whether to make the run resumable. Only applies to the function flow. The IDs of the rows whose traces were
+        ingested are recorded in a local checkpoint file for the experiment, and if an experiment named
+        ``experiment_name`` already exists and has a checkpoint file in ``checkpoint_dir``, it is reused and the rows
+        in its checkpoint are skipped, so an interrupted run only processes the remaining rows. An existing
+        experiment without a checkpoint file is not resumed; a new timestamped experiment is created instead. Rows of a list dataset are identified by their ``id``, or by their
+        position when they have none. Defaults to False.
+    checkpoint_dir
+        Directory of the checkpoint files used when ``resume`` is True. Defaults to
+        ``DEFAULT_EXPERIMENT_CHECKPOINT_DIR`` (``~/.galileo/experiment_checkpoints``).
+    cache
+        Optional `ExperimentCache` to memoize the function on. Only applies to the function flow. Rows whose input
+        was already run through the same function replay their cached trace instead of calling the function again,
+        and the result reports the ``cache_hits`` and ``cache_misses`` of the run. Defaults to None.
+    row_timeout
+        Optional number of seconds after which a row of an ``async def`` function is cancelled and recorded as
+        failed. Only applies to the function flow with an async function, as rows running on threads cannot be
+        cancelled. Defaults to None, which lets every row run to completion.
 
     Returns
     -------
@@ -404,6 +800,12 @@ def run_experiment(
     if function and not dataset_obj and not records:
         raise ValueError("A dataset record, id, name, or a list of records must be provided when a function is used")
 
+    if max_workers is not None and max_workers < 1:
+        raise ValueError("max_workers must be a positive integer")
+
+    if row_timeout is not None and row_timeout <= 0:
+        raise ValueError("row_timeout must be positive")
+
     # Get the project from the name or Id
     project_obj = Projects().get_with_env_fallbacks(id=project_id, name=project)
 
@@ -415,8 +817,20 @@ def run_experiment(
 
     # Handle experiment name collision
     existing_experiment = Experiments().get(project_obj.id, experiment_name)
-
-    if existing_experiment:
+    resumed_experiment = None
+    checkpoint_dir = (checkpoint_dir or DEFAULT_EXPERIMENT_CHECKPOINT_DIR) if resume else None
+
+    if existing_experiment and checkpoint_dir is not None and function is not None:
+        # Only resume runs this machine checkpointed, so an unrelated experiment of the same name is never reused.
+        if _checkpoint_path(checkpoint_dir, existing_experiment.id).exists():
+            _logger.info(f"Resuming experiment {existing_experiment.name}")
+            resumed_experiment = existing_experiment
+        else:
+            _logger.warning(
+                f"No checkpoint of experiment {existing_experiment.name} found in {checkpoint_dir}, "
+                "starting a new experiment instead of resuming it"
+            )
+    if existing_experiment and resumed_experiment is None:
         logging.warning(f"Experiment {existing_experiment.name} already exists, adding a timestamp")
         now = datetime.datetime.now(datetime.timezone.utc)
         experiment_name = f"{existing_experiment.name} {now:%Y-%m-%d} at {now:%H:%M:%S}.{now.microsecond // 1000:03d}"
@@ -430,7 +844,9 @@ def run_experiment(
         group_kwargs["experiment_group_name"] = experiment_group
 
     if function is not None:
-        experiment_obj = Experiments().create(project_obj.id, experiment_name, dataset_obj, **group_kwargs)
+        experiment_obj = resumed_experiment or Experiments().create(
+            project_obj.id, experiment_name, dataset_obj, **group_kwargs
+        )
 
         # Set up metrics WITH run_id — custom function flow needs ScorerSettings registered
         local_metrics: list[LocalMetricConfig] = []
@@ -453,6 +869,10 @@ def run_experiment(
             func=function,
             local_metrics=local_metrics,
             on_error=on_error,
+            max_workers=max_workers,
+            checkpoint_dir=checkpoint_dir,
+            cache=cache,
+            row_timeout=row_timeout,
         )
 
     if dataset_obj is None:
@@ -473,6 +893,15 @@ def run_experiment(
             "(no flush occurs on this path). on_error is only used in the function flow."
         )
 
+    if max_workers is not None:
+        _logger.warning("max_workers was provided but is only used in the function flow; ignoring it.")
+    if resume:
+        _logger.warning("resume was provided but is only used in the function flow; ignoring it.")
+    if cache is not None:
+        _logger.warning("cache was provided but is only used in the function flow; ignoring it.")
+    if row_timeout is not None:
+        _logger.warning("row_timeout was provided but is only used in the function flow; ignoring it.")
+
     # Execute a prompt template or generated-output experiment via trigger=True.
     # Single API call: creates experiment + triggers runner job.
     # If prompt_template is None, the API determines the flow based on the dataset contents.
@@ -1,20 +1,160 @@
 import csv
+import gzip
+import itertools
 import json
 import logging
+import os
+import pickle
+import queue
 import sys
-from collections.abc import Iterator
-from typing import Any
+import tempfile
+import threading
+from collections.abc import Callable, Collection, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
 
 from galileo.config import GalileoPythonConfig
 from galileo.log_streams import LogStreams
+from galileo.resources.api.trace.export_records_projects_project_id_export_records_post import (
+    _get_kwargs as export_records_request_kwargs,
+)
 from galileo.resources.api.trace.export_records_projects_project_id_export_records_post import (
     stream_detailed as export_records_stream,
 )
-from galileo.resources.models import LLMExportFormat, LogRecordsExportRequest, LogRecordsSortClause, RootType
+from galileo.resources.models import (
+    LLMExportFormat,
+    LogRecordsDateFilter,
+    LogRecordsDateFilterOperator,
+    LogRecordsExportRequest,
+    LogRecordsSortClause,
+    RootType,
+)
 from galileo.schema.filters import FilterType
+from galileo.shared.columnar import _require, records_to_arrow, records_to_columns
+
+if TYPE_CHECKING:
+    import numpy
+    import pyarrow
 
 logger = logging.getLogger(__name__)
 
+# Decoded records are handed from the shard workers to the caller in batches of this size.
+_SHARD_BATCH_SIZE = 500
+# Batches buffered per shard (ordered) or per worker (unordered) ahead of the caller.
+_SHARD_BUFFERED_BATCHES = 4
+_END_OF_SHARD = object()
+# Size of the raw response chunks written by ``to_file``.
+_FILE_CHUNK_SIZE = 1024 * 1024
+# Records decoded and held in memory per Parquet row group.
+_PARQUET_ROW_GROUP_SIZE = 10_000
+
+
+@dataclass(frozen=True)
+class ExportShard:
+    """A ``created_at`` window of a sharded export, from ``start`` (inclusive) to ``end`` (exclusive)."""
+
+    start: datetime
+    end: datetime
+
+
+class _SpilledBatches:
+    """Record batches of an export shard written to a temporary file, read back in the order they were written."""
+
+    def __init__(self) -> None:
+        self._file = tempfile.TemporaryFile()  # noqa: SIM115  # Closed once read back, or by close
+
+    def append(self, batch: list[dict[str, Any]]) -> None:
+        pickle.dump(batch, self._file)
+
+    def close(self) -> None:
+        self._file.close()
+
+    def __iter__(self) -> Iterator[list[dict[str, Any]]]:
+        with self._file:
+            self._file.seek(0)
+            while True:
+                try:
+                    yield pickle.load(self._file)  # noqa: S301  # Written by this process, see append
+                except EOFError:
+                    return
+
+
+def split_time_range(start: datetime, end: datetime, shard_duration: timedelta) -> list[ExportShard]:
+    """Split ``[start, end)`` into consecutive shards of ``shard_duration`` (the last one may be shorter)."""
+    if end <= start:
+        raise ValueError("end must be after start.")
+    if shard_duration <= timedelta(0):
+        raise ValueError("shard_duration must be positive.")
+    shards = []
+    while start < end:
+        shards.append(ExportShard(start=start, end=min(start + shard_duration, end)))
+        start = shards[-1].end
+    return shards
+
+
+def _export_records_bytes(
+    project_id: str, *, client: Any, body: LogRecordsExportRequest, chunk_size: int
+) -> Iterator[bytes]:
+    """Stream the raw body of an export response, in chunks of up to ``chunk_size`` bytes."""
+    with client.stream_request(**export_records_request_kwargs(project_id=project_id, body=body)) as response:
+        yield from response.iter_bytes(chunk_size)
+
+
+def _batched(records: Iterator[dict[str, Any]], size: int) -> Iterator[list[dict[str, Any]]]:
+    while batch := list(itertools.islice(records, size)):
+        yield batch
+
+
+def _parquet_schema(schemas: list["pyarrow.Schema"]) -> "pyarrow.Schema":
+    """Merge the types inferred for each row group into one schema that every row group fits."""
+    import pyarrow
+
+    decoded = []
+    for schema in schemas:
+        # String columns are dictionary-encoded in some row groups and plain in others; Parquet encodes them anyway.
+        decoded.append(
+            pyarrow.schema(
+                field.with_type(field.type.value_type) if pyarrow.types.is_dictionary(field.type) else field
+                for field in schema
+            )
+        )
+    try:
+        # Columns first seen in a later row group are added, and integers are only widened to floats when another
+        # row group has fractional values in the same column.
+        merged = pyarrow.unify_schemas(decoded, promote_options="permissive")
+    except (pyarrow.ArrowInvalid, pyarrow.ArrowTypeError) as e:
+        raise ValueError(
+            f"Parquet row groups have incompatible column types ({e}). Select the columns with column_ids, or export "
+            "to JSONL instead."
+        ) from e
+    return pyarrow.schema(
+        field.with_type(pyarrow.string()) if pyarrow.types.is_null(field.type) else field for field in merged
+    )
+
+
+def _conform_table(table: "pyarrow.Table", schema: "pyarrow.Schema") -> "pyarrow.Table":
+    """Cast a row group to the merged schema, with null columns for the fields it does not have."""
+    import pyarrow
+
+    arrays = []
+    for field in schema:
+        if field.name in table.column_names:
+            column = table.column(field.name)
+            try:
+                arrays.append(column.cast(field.type))
+            except (pyarrow.ArrowInvalid, pyarrow.ArrowNotImplementedError) as e:
+                # E.g. integers beyond 2**53 in a column that other row groups made fractional.
+                raise ValueError(
+                    f"Column {field.name!r} cannot be written as {field.type} without losing data ({e}). Select the "
+                    "columns with column_ids, or export to JSONL instead."
+                ) from e
+        else:
+            arrays.append(pyarrow.nulls(table.num_rows, field.type))
+    return pyarrow.Table.from_arrays(arrays, schema=schema)
+
 
 class ExportClient:
     config: GalileoPythonConfig
@@ -69,6 +209,372 @@ class ExportClient:
             reader = csv.DictReader(response_iterator)
             yield from reader
 
+    def sharded_records(
+        self,
+        project_id: str,
+        start: datetime,
+        end: datetime,
+        shard_duration: timedelta = timedelta(days=1),
+        max_workers: int = 4,
+        ordered: bool = True,
+        completed_shards: Collection[ExportShard] = (),
+        on_shard_complete: Callable[[ExportShard], None] | None = None,
+        root_type: RootType = RootType.TRACE,
+        filters: list[FilterType] | None = None,
+        sort: LogRecordsSortClause = LogRecordsSortClause(column_id="created_at", ascending=False),
+        export_format: LLMExportFormat = LLMExportFormat.JSONL,
+        log_stream_id: str | None = None,
+        experiment_id: str | None = None,
+        column_ids: list[str] | None = None,
+        redact: bool = True,
+        include_code_metric_metadata: bool = False,
+    ) -> Iterator[dict[str, Any]]:
+        """Export the records created in ``[start, end)`` over several concurrent streaming exports.
+
+        The range is split into ``created_at`` windows of ``shard_duration`` and each window is exported by its own
+        request, with up to ``max_workers`` of them streaming (and decoding their records) at the same time.
+
+        Parameters
+        ----------
+        project_id
+            The unique identifier of the project.
+        start
+            Start of the exported ``created_at`` range (inclusive).
+        end
+            End of the exported ``created_at`` range (exclusive).
+        shard_duration
+            Length of each shard's window. Defaults to one day.
+        max_workers
+            Maximum number of shards exported concurrently. Defaults to 4.
+        ordered
+            Whether to yield the records in the order of ``sort``, which must then be on ``created_at``: the shards
+            are yielded one after the other while the following ones are exported ahead, into temporary files once
+            their in-memory buffer is full. When False, records are
+            yielded as soon as any shard decodes them, for higher throughput. Defaults to True.
+        completed_shards
+            Shards to skip, e.g. the ones reported to ``on_shard_complete`` by an interrupted export to resume.
+        on_shard_complete
+            Called with each shard once all of its records have been yielded.
+        root_type, filters, sort, export_format, log_stream_id, experiment_id, column_ids, redact,
+        include_code_metric_metadata
+            As for ``records``. ``filters`` are applied within every shard.
+
+        Returns
+        -------
+        An iterator that yields each record as a dictionary.
+
+        Raises
+        ------
+        ValueError
+            If the range, ``shard_duration`` or ``max_workers`` is invalid, or ``ordered`` is True and ``sort`` is
+            not on ``created_at``.
+        """
+        if max_workers < 1:
+            raise ValueError("max_workers must be a positive integer.")
+        if ordered and sort.column_id != "created_at":
+            raise ValueError("Ordered sharded exports must be sorted by created_at; pass ordered=False otherwise.")
+
+        shards = [shard for shard in split_time_range(start, end, shard_duration) if shard not in completed_shards]
+        if not sort.ascending:
+            shards.reverse()
+        if not shards:
+            return
+
+        def export_shard(shard: ExportShard) -> Iterator[dict[str, Any]]:
+            return self.records(
+                project_id=project_id,
+                root_type=root_type,
+                filters=[
+                    *(filters or []),
+                    LogRecordsDateFilter(
+                        column_id="created_at", operator=LogRecordsDateFilterOperator.GTE, value=shard.start
+                    ),
+                    LogRecordsDateFilter(
+                        column_id="created_at", operator=LogRecordsDateFilterOperator.LT, value=shard.end
+                    ),
+                ],
+                sort=sort,
+                export_format=export_format,
+                log_stream_id=log_stream_id,
+                experiment_id=experiment_id,
+                column_ids=column_ids,
+                redact=redact,
+                include_code_metric_metadata=include_code_metric_metadata,
+            )
+
+        stopped = threading.Event()
+        # Index of the shard being yielded when ordered.
+        current_shard = 0
+
+        def put(batches: queue.Queue, item: Any) -> bool:
+            # Give up when the caller stops iterating, so an abandoned export doesn't leave workers blocked.
+            while not stopped.is_set():
+                try:
+                    batches.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+
+        def run_shard(shard: ExportShard, batches: queue.Queue, index: int | None = None) -> None:
+            # Records are decoded on this worker thread and handed over in batches. When ordered, a shard ahead of
+            # the one being yielded spills its batches to a temporary file once its queue is full, so that it reads
+            # its response to the end instead of holding it open while blocked.
+            logger.debug(f"ExportClient.sharded_records: exporting shard {shard.start} - {shard.end}")
+            tag = (lambda item: item) if ordered else (lambda item: (shard, item))
+            spilled: _SpilledBatches | None = None
+
+            def emit(batch: list[dict[str, Any]]) -> bool:
+                nonlocal spilled
+                if spilled is None and index is not None and index != current_shard:
+                    try:
+                        batches.put_nowait(batch)
+                        return True
+                    except queue.Full:
+                        spilled = _SpilledBatches()
+                if spilled is not None:
+                    if stopped.is_set():
+                        spilled.close()
+                        return False
+                    spilled.append(batch)
+                    return True
+                return put(batches, tag(batch))
+
+            try:
+                batch: list[dict[str, Any]] = []
+                for record in export_shard(shard):
+                    batch.append(record)
+                    if len(batch) >= _SHARD_BATCH_SIZE:
+                        if not emit(batch):
+                            return
+                        batch = []
+                if batch and not emit(batch):
+                    return
+            except Exception as exc:
+                if spilled is not None:
+                    spilled.close()
+                put(batches, tag(exc))
+                return
+            if spilled is not None and not put(batches, spilled):
+                spilled.close()
+                return
+            put(batches, tag(_END_OF_SHARD))
+
+        executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="galileo-export")
+        try:
+            if ordered:
+                # Shards are submitted in output order, so the shard being yielded is always running or done. A shard
+                # that spilled keeps its worker until it is yielded, so at most max_workers - 1 shards run ahead.
+                shard_batches = [queue.Queue(maxsize=_SHARD_BUFFERED_BATCHES) for _ in shards]
+                for index, (shard, batches) in enumerate(zip(shards, shard_batches, strict=True)):
+                    executor.submit(run_shard, shard, batches, index)
+                for index, (shard, batches) in enumerate(zip(shards, shard_batches, strict=True)):
+                    current_shard = index
+                    while (item := batches.get()) is not _END_OF_SHARD:
+                        if isinstance(item, Exception):
+                            raise item
+                        if isinstance(item, _SpilledBatches):
+                            for batch in item:
+                                yield from batch
+                        else:
+                            yield from item
+                    if on_shard_complete is not None:
+                        on_shard_complete(shard)
+            else:
+                batches = queue.Queue(maxsize=_SHARD_BUFFERED_BATCHES * max_workers)
+                for shard in shards:
+                    executor.submit(run_shard, shard, batches)
+                remaining = len(shards)
+                while remaining:
+                    shard, item = batches.get()
+                    if isinstance(item, Exception):
+                        raise item
+                    if item is _END_OF_SHARD:
+                        remaining -= 1
+                        if on_shard_complete is not None:
+                            on_shard_complete(shard)
+                        continue
+                    yield from item
+        finally:
+            stopped.set()
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def to_columns(
+        self, project_id: str, columns: Collection[str] | None = None, **kwargs: Any
+    ) -> "dict[str, numpy.ndarray]":
+        """Export records into one NumPy array per column.
+
+        The records are streamed from the export and written into typed column buffers as they arrive, so they are
+        never held as a list of dictionaries. See ``records_to_columns`` for the column types.
+
+        Parameters
+        ----------
+        project_id
+            The unique identifier of the project.
+        columns
+            Flattened column names to keep. Defaults to None, which keeps every column.
+        **kwargs
+            Other arguments of ``records``, e.g. ``log_stream_id`` or ``filters``.
+
+        Returns
+        -------
+        The columns, e.g. for ``pandas.DataFrame(columns)``.
+        """
+        return records_to_columns(self.records(project_id=project_id, **kwargs), columns)
+
+    def to_arrow(self, project_id: str, columns: Collection[str] | None = None, **kwargs: Any) -> "pyarrow.Table":
+        """Export records into a PyArrow table, with dictionary-encoded string columns.
+
+        Parameters
+        ----------
+        project_id
+            The unique identifier of the project.
+        columns
+            Flattened column names to keep. Defaults to None, which keeps every column.
+        **kwargs
+            Other arguments of ``records``, e.g. ``log_stream_id`` or ``filters``.
+
+        Returns
+        -------
+        The records as a table.
+        """
+        return records_to_arrow(self.records(project_id=project_id, **kwargs), columns)
+
+    def to_file(
+        self,
+        path: str | os.PathLike,
+        project_id: str,
+        root_type: RootType = RootType.TRACE,
+        filters: list[FilterType] | None = None,
+        sort: LogRecordsSortClause = LogRecordsSortClause(column_id="created_at", ascending=False),
+        export_format: LLMExportFormat = LLMExportFormat.JSONL,
+        log_stream_id: str | None = None,
+        experiment_id: str | None = None,
+        column_ids: list[str] | None = None,
+        redact: bool = True,
+        include_code_metric_metadata: bool = False,
+        compress: bool | None = None,
+        chunk_size: int = _FILE_CHUNK_SIZE,
+        row_group_size: int = _PARQUET_ROW_GROUP_SIZE,
+    ) -> Path:
+        """Export records straight to a file.
+
+        JSONL and CSV exports are not parsed: the raw response bytes are written to the file in chunks as they
+        arrive. A path ending in ``.parquet`` writes a Parquet file instead; its records are decoded and written one
+        row group at a time, so at most ``row_group_size`` records are held in memory. The file is written under a
+        temporary name and only moved to ``path`` once the export completes.
+
+        Parameters
+        ----------
+        path
+            The file to write. The format is Parquet if the name ends in ``.parquet``, else ``export_format``.
+        project_id
+            The unique identifier of the project.
+        compress
+            Gzip-compress a JSONL or CSV file. Defaults to None, which compresses if the name ends in ``.gz``.
+        chunk_size
+            Size in bytes of the chunks written to a JSONL or CSV file.
+        row_group_size
+            Number of records per Parquet row group. The file has the columns of every row group; integer columns
+            are written as floats if any row group has fractional values in them, and empty columns as strings.
+
+        Other parameters are those of ``records``.
+
+        Returns
+        -------
+        The path of the written file.
+        """
+        path = Path(path).expanduser()
+        parquet = path.suffix == ".parquet"
+        if compress is None:
+            compress = path.suffix == ".gz"
+        if parquet and compress:
+            raise ValueError("Parquet files are compressed by their writer and cannot be gzip-compressed.")
+        if chunk_size < 1 or row_group_size < 1:
+            raise ValueError("chunk_size and row_group_size must be positive integers.")
+
+        temp_path = path.with_name(f".{path.name}.part")
+        try:
+            if parquet:
+                records = self.records(
+                    project_id=project_id,
+                    root_type=root_type,
+                    filters=filters,
+                    sort=sort,
+                    export_format=export_format,
+                    log_stream_id=log_stream_id,
+                    experiment_id=experiment_id,
+                    column_ids=column_ids,
+                    redact=redact,
+                    include_code_metric_metadata=include_code_metric_metadata,
+                )
+                self._write_parquet(temp_path, records, row_group_size)
+            else:
+                chunks = _export_records_bytes(
+                    project_id,
+                    client=self.config.api_client,
+                    body=LogRecordsExportRequest(
+                        root_type=root_type,
+                        export_format=export_format,
+                        log_stream_id=log_stream_id,
+                        experiment_id=experiment_id,
+                        filters=filters or [],
+                        column_ids=column_ids,
+                        sort=sort,
+                        redact=redact,
+                        include_code_metric_metadata=include_code_metric_metadata,
+                    ),
+                    chunk_size=chunk_size,
+                )
+                with gzip.open(temp_path, "wb", compresslevel=6) if compress else open(temp_path, "wb") as file:
+                    for chunk in chunks:
+                        file.write(chunk)
+            os.replace(temp_path, path)
+        finally:
+            temp_path.unlink(missing_ok=True)
+        return path
+
+    @staticmethod
+    def _write_parquet(path: Path, records: Iterator[dict[str, Any]], row_group_size: int) -> None:
+        _require("pyarrow")
+        import pyarrow
+        import pyarrow.feather
+        import pyarrow.parquet
+
+        # Row groups are spilled to Arrow files next to the output first, so the file schema can include every column
+        # of every row group while only one row group is held in memory.
+        with tempfile.TemporaryDirectory(prefix=f".{path.name}.", dir=path.parent) as spill_dir:
+            spills: list[tuple[Path, pyarrow.Schema]] = []
+            for index, batch in enumerate(_batched(records, row_group_size)):
+                table = records_to_arrow(batch)
+                spill = Path(spill_dir) / f"{index}.arrow"
+                pyarrow.feather.write_feather(table, spill)
+                spills.append((spill, table.schema))
+            if not spills:
+                pyarrow.parquet.write_table(pyarrow.table({}), path)
+                return
+
+            schema = _parquet_schema([schema for _, schema in spills])
+            with pyarrow.parquet.ParquetWriter(path, schema) as writer:
+                for spill, _ in spills:
+                    writer.write_table(_conform_table(pyarrow.feather.read_table(spill, memory_map=True), schema))
+                    spill.unlink()
+
+
+def _resolve_log_stream_id(project_id: str, log_stream_id: str | None, experiment_id: str | None) -> str | None:
+    """Default to the oldest log stream of the project when neither a log stream nor an experiment is given."""
+    if log_stream_id is None and experiment_id is None:
+        # Use the (cached) index of all pages so we pick the globally oldest
+        # stream, not just the oldest in the first page (default page size is 100).
+        log_streams = LogStreams()._index(project_id=project_id).log_streams
+        if log_streams:
+            sorted_log_streams = sorted(log_streams, key=lambda ls: (ls.created_at, ls.id))
+            log_stream_id = sorted_log_streams[0].id
+
+    if (log_stream_id is None) == (experiment_id is None):
+        raise ValueError("Exactly one of log_stream_id or experiment_id must be provided.")
+    return log_stream_id
+
 
 def export_records(
     project_id: str,
@@ -118,16 +624,7 @@ def export_records(
     if filters is None:
         filters = []
 
-    if log_stream_id is None and experiment_id is None:
-        # Use _list_all to paginate across all pages so we pick the globally oldest
-        # stream, not just the oldest in the first page (default page size is 100).
-        log_streams = LogStreams()._list_all(project_id=project_id)
-        if log_streams:
-            sorted_log_streams = sorted(log_streams, key=lambda ls: (ls.created_at, ls.id))
-            log_stream_id = sorted_log_streams[0].id
-
-    if (log_stream_id is None) == (experiment_id is None):
-        raise ValueError("Exactly one of log_stream_id or experiment_id must be provided.")
+    log_stream_id = _resolve_log_stream_id(project_id, log_stream_id, experiment_id)
 
     return ExportClient().records(
         project_id=project_id,
@@ -141,3 +638,71 @@ def export_records(
         redact=redact,
         include_code_metric_metadata=include_code_metric_metadata,
     )
+
+
+def export_to_file(
+    path: str | os.PathLike,
+    project_id: str,
+    root_type: RootType = RootType.TRACE,
+    filters: list[FilterType] | None = None,
+    sort: LogRecordsSortClause = LogRecordsSortClause(column_id="created_at", ascending=False),
+    export_format: LLMExportFormat = LLMExportFormat.JSONL,
+    log_stream_id: str | None = None,
+    experiment_id: str | None = None,
+    column_ids: list[str] | None = None,
+    redact: bool = True,
+    include_code_metric_metadata: bool = False,
+    compress: bool | None = None,
+    chunk_size: int = _FILE_CHUNK_SIZE,
+    row_group_size: int = _PARQUET_ROW_GROUP_SIZE,
+) -> Path:
+    """Exports records from a Galileo project straight to a JSONL, CSV or Parquet file.
+
+    Unlike ``export_records``, JSONL and CSV exports are not parsed into dictionaries: the response is streamed to
+    the file as raw bytes, optionally gzip-compressed. Parquet files (paths ending in ``.parquet``) are written one
+    row group at a time, so memory use is bounded by ``row_group_size`` rather than the size of the export.
+
+    Defaults to the first logstream if `log_stream_id` and `experiment_id` are not provided.
+
+    Parameters
+    ----------
+    path
+        The file to write. The format is Parquet if the name ends in ``.parquet``, else ``export_format``.
+    project_id
+        The unique identifier of the project.
+    compress
+        Gzip-compress a JSONL or CSV file. Defaults to None, which compresses if the name ends in ``.gz``.
+    chunk_size
+        Size in bytes of the chunks written to a JSONL or CSV file.
+    row_group_size
+        Number of records per Parquet row group.
+
+    Other parameters are those of ``export_records``.
+
+    Returns
+    -------
+    The path of the written file.
+
+    Examples
+    --------
+    >>> export_to_file("traces.jsonl.gz", project_id=project.id, log_stream_id=log_stream.id)
+    >>> export_to_file("traces.parquet", project_id=project.id, log_stream_id=log_stream.id)
+    """
+    log_stream_id = _resolve_log_stream_id(project_id, log_stream_id, experiment_id)
+
+    return ExportClient().to_file(
+        path,
+        project_id=project_id,
+        root_type=root_type,
+        filters=filters,
+        sort=sort,
+        export_format=export_format,
+        log_stream_id=log_stream_id,
+        experiment_id=experiment_id,
+        column_ids=column_ids,
+        redact=redact,
+        include_code_metric_metadata=include_code_metric_metadata,
+        compress=compress,
+        chunk_size=chunk_size,
+        row_group_size=row_group_size,
+    )
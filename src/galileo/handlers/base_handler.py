@@ -101,32 +101,108 @@ class GalileoBaseHandler:
 
     def log_node_tree(self, node: Node) -> None:
         """
-        Log a node and its children recursively.
+        Log a node and all of its descendants.
+
+        The tree is walked depth-first with an explicit stack rather than by recursion, so arbitrarily deep
+        graphs (e.g. long LangGraph runs) cannot hit the interpreter's recursion limit. Metadata conversion is
+        memoized by object identity for the duration of the walk, since nested nodes frequently share the same
+        metadata dict.
 
         Parameters
         ----------
         node : Node
             The node to log.
         """
-        is_span_with_children = False
-        input_ = node.span_params.get("input", "")
-        output = node.span_params.get("output", "")
-        name = node.span_params.get("name")
-        metadata = node.span_params.get("metadata", {})
-        tags = node.span_params.get("tags")
-        created_at = node.span_params.get("created_at")
+        metadata_cache: dict[int, tuple[dict, dict[str, str], int | None]] = {}
+        # Each frame is (node, exiting, last_child). Entering a frame logs the node and schedules its children;
+        # exiting a frame concludes a span that was pushed onto the logger's parent stack.
+        stack: list[tuple[Node, bool, Node | None]] = [(node, False, None)]
+        while stack:
+            current, exiting, last_child = stack.pop()
+            if exiting:
+                output = current.span_params.get("output", "") or (
+                    last_child.span_params.get("output", "") if last_child else ""
+                )
+                self._galileo_logger.conclude(
+                    output=serialize_to_str(output), status_code=current.span_params.get("status_code")
+                )
+                continue
+
+            is_span_with_children = self._log_node(current, metadata_cache)
+
+            children: list[Node] = []
+            for child_id in current.children:
+                child_node = self._nodes.get(child_id)
+                if child_node:
+                    children.append(child_node)
+                else:
+                    _logger.warning(f"Child node {child_id} not found")
+
+            if is_span_with_children:
+                stack.append((current, True, children[-1] if children else None))
+            stack.extend((child, False, None) for child in reversed(children))
+
+    def _convert_node_metadata(
+        self, metadata: dict | None, metadata_cache: dict[int, tuple[dict, dict[str, str], int | None]]
+    ) -> tuple[dict[str, str] | None, int | None]:
+        """
+        Convert node metadata to a string dict and extract the LangGraph step number, memoized by identity.
+
+        Parameters
+        ----------
+        metadata : Optional[dict]
+            The raw metadata from the node's span params.
+        metadata_cache : dict[int, tuple[dict, dict[str, str], Optional[int]]]
+            Cache of already-converted metadata, keyed by ``id(metadata)``. The source dict is kept in the entry so
+            that its id cannot be reused while the cache is alive.
+
+        Returns
+        -------
+        tuple[Optional[dict[str, str]], Optional[int]]
+            The converted metadata and the step number, if any.
+        """
+        if metadata is None:
+            return None, None
 
-        # Convert metadata to a dict[str, str]
-        if metadata is not None:
-            metadata = convert_to_string_dict(metadata)
+        cached = metadata_cache.get(id(metadata))
+        if cached is not None and cached[0] is metadata:
+            return cached[1], cached[2]
 
+        converted = convert_to_string_dict(metadata)
         step_number = None
-        if metadata and (metadata_step_number := metadata.get("langgraph_step")):
+        if converted and (metadata_step_number := converted.get("langgraph_step")):
             try:
                 step_number = int(metadata_step_number)
             except Exception as e:
                 _logger.warning(f"Invalid step number: {metadata_step_number}, exception raised {e}")
 
+        metadata_cache[id(metadata)] = (metadata, converted, step_number)
+        return converted, step_number
+
+    def _log_node(self, node: Node, metadata_cache: dict[int, tuple[dict, dict[str, str], int | None]]) -> bool:
+        """
+        Log a single node as a span, without its children.
+
+        Parameters
+        ----------
+        node : Node
+            The node to log.
+        metadata_cache : dict[int, tuple[dict, dict[str, str], Optional[int]]]
+            Metadata conversion cache shared across one tree walk.
+
+        Returns
+        -------
+        bool
+            Whether the span was pushed onto the logger's parent stack and must be concluded after its children.
+        """
+        is_span_with_children = False
+        input_ = node.span_params.get("input", "")
+        output = node.span_params.get("output", "")
+        name = node.span_params.get("name")
+        tags = node.span_params.get("tags")
+        created_at = node.span_params.get("created_at")
+        metadata, step_number = self._convert_node_metadata(node.span_params.get("metadata", {}), metadata_cache)
+
         # Log the current node based on its type
         if node.node_type == "chain":
             self._galileo_logger.add_workflow_span(
@@ -206,22 +282,7 @@ class GalileoBaseHandler:
         else:
             _logger.warning(f"Unknown node type: {node.node_type}")
 
-        # Process all child nodes
-        last_child = None
-        for child_id in node.children:
-            child_node = self._nodes.get(child_id)
-            if child_node:
-                self.log_node_tree(child_node)
-                last_child = child_node
-            else:
-                _logger.warning(f"Child node {child_id} not found")
-
-        # Conclude parent span. Use the last child's output if necessary
-        if is_span_with_children:
-            output = output or (last_child.span_params.get("output", "") if last_child else "")
-            self._galileo_logger.conclude(
-                output=serialize_to_str(output), status_code=node.span_params.get("status_code")
-            )
+        return is_span_with_children
 
     def start_node(self, node_type: NODE_TYPE, parent_run_id: UUID | None, run_id: UUID, **kwargs: Any) -> Node:
         """
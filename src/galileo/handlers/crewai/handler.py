@@ -1,9 +1,11 @@
 import hashlib
 import json
 import logging
+import threading
+from collections import OrderedDict
 from datetime import datetime
 from typing import Any
-from uuid import UUID
+from uuid import UUID, uuid4
 
 from packaging.version import Version
 
@@ -23,6 +25,11 @@ LITE_LLM_AVAILABLE = False
 litellm = None
 _crewai_imports_resolved = False
 
+_LLM_CALL_STARTED_EVENT_TYPE = "llm_call_started"
+_LLM_CALL_ENDED_EVENT_TYPES = ("llm_call_completed", "llm_call_failed")
+# Upper bound on LLM calls remembered for LiteLLM usage correlation; the callback may never fire for some providers.
+_MAX_TRACKED_LLM_CALLS = 1024
+
 
 def _resolve_crewai_imports() -> None:
     """Import crewai and litellm on first use, populating module-level globals."""
@@ -78,6 +85,16 @@ class CrewAIEventListener:
             integration="crewai",
         )
         self._active_tool_run_id: UUID | None = None
+        # Open LLM calls without a call_id, keyed by agent and event source, used to pair started/ended events
+        # (crewAI < 1.0).
+        self._llm_call_scopes: OrderedDict[str, list[UUID]] = OrderedDict()
+        self._open_scoped_llm_calls = 0
+        # Run IDs of open LLM calls keyed by a cheap messages fingerprint, oldest first, used by the LiteLLM usage
+        # callback. Calls with equal fingerprints (e.g. retries or fan-out agents) queue up instead of replacing each
+        # other.
+        self._llm_run_ids_by_fingerprint: dict[str, list[UUID]] = {}
+        self._llm_call_fingerprints: OrderedDict[UUID, str] = OrderedDict()
+        self._llm_call_lock = threading.Lock()
 
         if CREWAI_AVAILABLE:
             # Register with the event bus directly instead of inheriting from
@@ -289,6 +306,123 @@ class CrewAIEventListener:
         """Hash a string to a deterministic UUID."""
         return UUID(hashlib.md5(value.encode()).hexdigest())
 
+    def _hash_messages(self, messages: Any) -> UUID:
+        """Hash a full messages list to a UUID. Cost grows with the conversation, so only used as a last resort."""
+        return self._hash_to_uuid(json.dumps(messages, default=str))
+
+    @staticmethod
+    def _messages_fingerprint(messages: Any) -> str | None:
+        """
+        Build a cheap fingerprint of a messages list from its length and its first and last messages.
+
+        Unlike hashing the whole conversation, the cost does not grow with the number of turns.
+        """
+        if isinstance(messages, str):
+            return hashlib.md5(messages.encode()).hexdigest()
+        if not isinstance(messages, list | tuple) or not messages:
+            return None
+
+        def _digest(message: Any) -> str:
+            if isinstance(message, dict):
+                role, content = message.get("role"), message.get("content")
+            else:
+                role, content = getattr(message, "role", None), getattr(message, "content", None)
+            return hashlib.md5(f"{role}_{content}".encode()).hexdigest()
+
+        return f"{len(messages)}_{_digest(messages[0])}_{_digest(messages[-1])}"
+
+    def _remember_llm_call(self, messages: Any, run_id: UUID) -> None:
+        """Remember the run ID of an open LLM call so the LiteLLM usage callback can find its node."""
+        fingerprint = self._messages_fingerprint(messages)
+        if fingerprint is None:
+            return
+        with self._llm_call_lock:
+            if run_id in self._llm_call_fingerprints:
+                return
+            self._llm_call_fingerprints[run_id] = fingerprint
+            self._llm_run_ids_by_fingerprint.setdefault(fingerprint, []).append(run_id)
+            while len(self._llm_call_fingerprints) > _MAX_TRACKED_LLM_CALLS:
+                self._forget_llm_call_locked(next(iter(self._llm_call_fingerprints)))
+
+    def _lookup_llm_call(self, messages: Any) -> UUID | None:
+        """Find (and forget) the run ID of the oldest open LLM call with the same messages."""
+        fingerprint = self._messages_fingerprint(messages)
+        if fingerprint is None:
+            return None
+        with self._llm_call_lock:
+            run_ids = self._llm_run_ids_by_fingerprint.get(fingerprint)
+            if not run_ids:
+                return None
+            run_id = run_ids[0]
+            self._forget_llm_call_locked(run_id)
+            return run_id
+
+    def _forget_llm_call(self, run_id: UUID) -> None:
+        """Forget an LLM call once it ended, so that later calls with the same messages are not matched to it."""
+        with self._llm_call_lock:
+            self._forget_llm_call_locked(run_id)
+
+    def _forget_llm_call_locked(self, run_id: UUID) -> None:
+        fingerprint = self._llm_call_fingerprints.pop(run_id, None)
+        if fingerprint is None:
+            return
+        run_ids = self._llm_run_ids_by_fingerprint[fingerprint]
+        run_ids.remove(run_id)
+        if not run_ids:
+            del self._llm_run_ids_by_fingerprint[fingerprint]
+
+    @staticmethod
+    def _llm_call_scope_key(source: Any, event: Any) -> str | None:
+        """
+        Identify the scope of an LLM event by its agent and the LLM that emitted it.
+
+        Returns None when the event carries neither a source fingerprint nor a source, as calls could not be told
+        apart.
+        """
+        source_key = getattr(event, "source_fingerprint", None) or (id(source) if source is not None else None)
+        if not source_key:
+            return None
+        return f"{getattr(event, 'agent_id', '') or ''}_{source_key}"
+
+    def _scoped_llm_run_id(self, source: Any, event: Any) -> UUID | None:
+        """
+        Correlate LLM events that carry no call_id through a stack of open calls per agent and event source.
+
+        A started event opens a new scope with a fresh run ID; the matching completed or failed event closes the
+        most recent open scope for the same agent and source. At most ``_MAX_TRACKED_LLM_CALLS`` calls are kept open,
+        dropping the least recently used ones, as a started event may never be followed by an ended one. Returns None
+        for events that are not LLM events, that have no scope, or when there is no open scope to close.
+        """
+        event_type = getattr(event, "type", None)
+        if event_type != _LLM_CALL_STARTED_EVENT_TYPE and event_type not in _LLM_CALL_ENDED_EVENT_TYPES:
+            return None
+
+        scope_key = self._llm_call_scope_key(source, event)
+        if scope_key is None:
+            return None
+        with self._llm_call_lock:
+            if event_type == _LLM_CALL_STARTED_EVENT_TYPE:
+                run_id = uuid4()
+                self._llm_call_scopes.setdefault(scope_key, []).append(run_id)
+                self._llm_call_scopes.move_to_end(scope_key)
+                self._open_scoped_llm_calls += 1
+                while self._open_scoped_llm_calls > _MAX_TRACKED_LLM_CALLS:
+                    oldest_key, oldest_calls = next(iter(self._llm_call_scopes.items()))
+                    oldest_calls.pop(0)
+                    self._open_scoped_llm_calls -= 1
+                    if not oldest_calls:
+                        del self._llm_call_scopes[oldest_key]
+                return run_id
+
+            open_calls = self._llm_call_scopes.get(scope_key)
+            if not open_calls:
+                return None
+            run_id = open_calls.pop()
+            self._open_scoped_llm_calls -= 1
+            if not open_calls:
+                del self._llm_call_scopes[scope_key]
+            return run_id
+
     def _generate_run_id(self, source: Any, event: Any) -> UUID:
         """Generate a consistent UUID for event tracing."""
         # 1. Memory event specific ID generation
@@ -320,12 +454,17 @@ class CrewAIEventListener:
         if hasattr(source, "id") and source.id:
             return source.id
 
-        # 4. event.messages hash — LLM fallback for crewAI < 1.0
+        # 4. LLM event scope — crewAI < 1.0 LLM events have no call_id, so pair started/ended events per agent and
+        # event source
+        scoped_run_id = self._scoped_llm_run_id(source, event)
+        if scoped_run_id is not None:
+            return scoped_run_id
+
+        # 5. event.messages hash — last-resort LLM fallback when no event scope is available
         if hasattr(event, "messages") and event.messages is not None:
-            messages = json.dumps(event.to_json().get("messages", []))
-            return self._hash_to_uuid(messages)
+            return self._hash_messages(event.messages)
 
-        # 5. Tool events — use crewAI's event scope tracking for correlation (crewAI >= 1.0)
+        # 6. Tool events — use crewAI's event scope tracking for correlation (crewAI >= 1.0)
         if hasattr(event, "tool_args"):
             # crewAI < 1.0: source is a Tool instance with .id, already handled by step 3.
             # Fallback to tool_args hash for other cases.
@@ -337,7 +476,7 @@ class CrewAIEventListener:
             agent_id = getattr(event, "agent_id", "") or ""
             return self._hash_to_uuid(f"{tool_name}_{tool_args}_{agent_id}")
 
-        # 6. event.agent.id — Agent events in crewAI >= 1.0 (source no longer has .id)
+        # 7. event.agent.id — Agent events in crewAI >= 1.0 (source no longer has .id)
         # Include task ID to generate unique run IDs when the same agent handles
         # multiple tasks (e.g. manager agent in hierarchical crews).
         event_agent = getattr(event, "agent", None)
@@ -345,12 +484,11 @@ class CrewAIEventListener:
             task_id = getattr(getattr(event, "task", None), "id", "")
             return self._hash_to_uuid(f"{event_agent.id}_{task_id}")
 
-        # 7. dict messages — lite_llm callback
+        # 8. dict messages — lite_llm callback
         if isinstance(event, dict) and "messages" in event:
-            messages = json.dumps(event["messages"])
-            return self._hash_to_uuid(messages)
+            return self._hash_messages(event["messages"])
 
-        # 8. Generic fallback
+        # 9. Generic fallback
         return self._hash_to_uuid(
             f"{getattr(event, 'crew_name', '')}_{getattr(event, 'agent', '')}_{getattr(event, 'task', '')}"
         )
@@ -528,7 +666,7 @@ class CrewAIEventListener:
     def _handle_tool_usage_started(self, source: Any, event: Any) -> None:
         """Handle tool usage start."""
         run_id = self._generate_run_id(source, event)
-        # Compute parent using the same hash as _generate_run_id step 6
+        # Compute parent using the same hash as _generate_run_id step 7
         # so the tool links to the correct agent node.
         agent_id = getattr(event, "agent_id", None) or str(getattr(getattr(event, "agent", None), "id", ""))
         task_id = getattr(event, "task_id", "")
@@ -574,7 +712,7 @@ class CrewAIEventListener:
         )
         self._active_tool_run_id = None
 
-    def _to_uuid(self, id: str | None | UUID) -> UUID | None:
+    def _to_uuid(self, id: str | UUID | None) -> UUID | None:
         if isinstance(id, UUID):
             return id
         if isinstance(id, str):
@@ -588,6 +726,7 @@ class CrewAIEventListener:
     def _handle_llm_call_started(self, source: Any, event: Any) -> None:
         """Handle LLM call start."""
         run_id = self._generate_run_id(source, event)
+        self._remember_llm_call(getattr(event, "messages", None), run_id)
         parent_run_id = self._to_uuid(getattr(event, "agent_id", None))
         llm_name = getattr(event, "model", None) or getattr(source, "model", "Unknown Model")
 
@@ -610,6 +749,7 @@ class CrewAIEventListener:
     def _handle_llm_call_completed(self, source: Any, event: Any) -> None:
         """Handle LLM call completion."""
         run_id = self._generate_run_id(source, event)
+        self._forget_llm_call(run_id)
 
         token_kwargs: dict[str, Any] = {}
         response = getattr(event, "response", None)
@@ -629,6 +769,7 @@ class CrewAIEventListener:
     def _handle_llm_call_failed(self, source: Any, event: Any) -> None:
         """Handle LLM call failure."""
         run_id = self._generate_run_id(source, event)
+        self._forget_llm_call(run_id)
         metadata = self._extract_metadata(event)
         metadata["error"] = getattr(event, "error", "Unknown error")
 
@@ -777,7 +918,7 @@ class CrewAIEventListener:
         start_time: datetime,
         end_time: datetime,
     ) -> None:
-        node_id = self._generate_run_id(kwargs, kwargs)
+        node_id = self._lookup_llm_call(kwargs.get("messages")) or self._generate_run_id(kwargs, kwargs)
 
         node = self._handler.get_node(node_id)
         if not node:
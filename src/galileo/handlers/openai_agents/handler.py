@@ -1,5 +1,7 @@
 import logging
+import threading
 import uuid
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime, timezone
 from typing import Any, cast
 
@@ -24,21 +26,49 @@ from galileo_core.schemas.logging.span import Span as GalileoSpan
 _logger = logging.getLogger(__name__)
 
 
+class _TraceState:
+    """
+    In-flight state for a single OpenAI Agents trace.
+
+    Attributes
+    ----------
+    nodes : dict[str, Node]
+        Stores Node objects keyed by their OpenAI span_id or trace_id (for root).
+    first_input : Any
+        The first non-empty LLM input seen in the trace, used as the trace input.
+    last_output : Any
+        The output of the last concluded workflow span, used as the trace output.
+    last_status_code : Optional[int]
+        The status code of the last concluded workflow span.
+    """
+
+    def __init__(self) -> None:
+        self.nodes: dict[str, Node] = {}
+        self.first_input: Any = None
+        self.last_output: Any = None
+        self.last_status_code: int | None = None
+
+
 class GalileoTracingProcessor(TracingProcessor):
     """
     OpenAI Agents TracingProcessor for logging traces to Galileo.
 
     Builds a tree of spans during agent execution and logs them hierarchically
-    to Galileo upon trace completion.
+    to Galileo upon trace completion. State is kept per trace, so concurrent
+    agent runs sharing one processor do not interfere with each other, and is
+    released as soon as the trace is committed to the logger.
 
     Attributes
     ----------
     _galileo_logger : GalileoLogger
         The Galileo logger instance.
     _flush_on_trace_end : bool
-        Whether to automatically flush the log batch to Galileo when a trace ends.
-    _nodes : dict[str, Node]
-        Stores Node objects keyed by their OpenAI span_id or trace_id (for root).
+        Whether to flush the log batch to Galileo when a trace ends. The flush runs on a background
+        thread so the agent run is not blocked on ingestion.
+    _traces : dict[str, _TraceState]
+        In-flight trace state keyed by OpenAI trace_id.
+    _logger_lock : threading.RLock
+        Serializes access to the Galileo logger, which builds one trace at a time.
     """
 
     def __init__(self, galileo_logger: GalileoLogger | None = None, flush_on_trace_end: bool = True):
@@ -54,14 +84,20 @@ class GalileoTracingProcessor(TracingProcessor):
         """
         self._galileo_logger: GalileoLogger = galileo_logger or galileo_context.get_logger_instance()
         self._flush_on_trace_end: bool = flush_on_trace_end
-        self._nodes: dict[str, Node] = {}
-        self._last_output: Any = None
-        self._last_status_code: int | None = None
-        self._first_input: Any = None
+        self._traces: dict[str, _TraceState] = {}
+        self._traces_lock = threading.Lock()
+        self._logger_lock = threading.RLock()
+        self._flush_executor: ThreadPoolExecutor | None = None
+        self._pending_flush: Future | None = None
+
+    def _get_trace_state(self, trace_id: str) -> _TraceState | None:
+        with self._traces_lock:
+            return self._traces.get(trace_id)
 
     def on_trace_start(self, trace: Trace) -> None:
         """Called when an OpenAI Agent trace starts."""
-        node = Node(
+        state = _TraceState()
+        state.nodes[trace.trace_id] = Node(
             node_type="agent",
             run_id=trace.trace_id,
             span_params={
@@ -71,42 +107,85 @@ class GalileoTracingProcessor(TracingProcessor):
                 "metadata": convert_to_string_dict(trace.metadata),
             },
         )
-        self._nodes[trace.trace_id] = node
+        with self._traces_lock:
+            self._traces[trace.trace_id] = state
 
     def on_trace_end(self, trace: Trace) -> None:
         """Called when an OpenAI Agent trace ends."""
-        node = self._nodes.get(trace.trace_id)
-        if not node:
+        with self._traces_lock:
+            state = self._traces.pop(trace.trace_id, None)
+        node = state.nodes.get(trace.trace_id) if state else None
+        if not state or not node:
             _logger.warning(f"End called for unknown trace_id {trace.trace_id}")
             return
 
         node.span_params["duration_ns"] = convert_time_delta_to_ns(_get_timestamp() - node.span_params["start_time"])
 
         # Log the trace to Galileo (this includes concluding the trace)
-        self._commit_trace(trace)
-        self._nodes = {}
-
-        self._last_output = None
-        self._last_status_code = None
-        self._first_input = None
+        with self._logger_lock:
+            self._commit_trace(trace, state)
 
         # Optionally flush the log batch
         if self._flush_on_trace_end:
-            self._galileo_logger.flush()
+            self._schedule_flush()
 
-    def _commit_trace(self, trace: Trace) -> None:
-        if not self._nodes:
+    def _commit_trace(self, trace: Trace, state: _TraceState) -> None:
+        if not state.nodes:
             _logger.warning("No nodes to commit")
             return
 
-        root_node = self._nodes.get(trace.trace_id)
+        root_node = state.nodes.get(trace.trace_id)
         if root_node:
-            self._log_node_tree(root_node, first_node=True)
+            self._log_node_tree(root_node, state, first_node=True)
         else:
             _logger.warning(f"Root node {trace.trace_id} not found")
-        self._galileo_logger.conclude(output=self._last_output, status_code=self._last_status_code)
+        self._galileo_logger.conclude(output=state.last_output, status_code=state.last_status_code)
 
-    def _log_node_tree(self, node: Node, first_node: bool = False) -> None:
+    def _schedule_flush(self) -> None:
+        """
+        Queue a flush of the logger on the background flush thread.
+
+        Flushes are coalesced: if a flush is already queued but has not started yet, it will pick up the newly
+        committed trace as well, so no additional flush is queued.
+        """
+        with self._traces_lock:
+            if self._pending_flush is not None and not self._pending_flush.running() and not self._pending_flush.done():
+                return
+            if self._flush_executor is None:
+                self._flush_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="galileo-agents-flush")
+            self._pending_flush = self._flush_executor.submit(self._flush)
+
+    def _flush(self) -> None:
+        """
+        Upload the committed traces.
+
+        Only detaching the traces from the logger happens under the logger lock, so traces can be committed while
+        the upload is in flight. Distributed loggers send each trace as it is committed, and flushing them only
+        waits for those requests.
+        """
+        with self._logger_lock:
+            if self._galileo_logger.mode == "distributed":
+                self._galileo_logger.flush()
+                return
+            upload = self._galileo_logger.flush_in_background()
+        if upload is None:
+            return
+        try:
+            upload.result()
+        except Exception as e:
+            _logger.warning(f"Ingestion error in flush: {e}")
+
+    def _drain_pending_flush(self) -> None:
+        """Wait for any queued background flush to finish."""
+        with self._traces_lock:
+            pending_flush = self._pending_flush
+        if pending_flush is not None:
+            try:
+                pending_flush.result()
+            except Exception as e:
+                _logger.warning(f"Background flush failed: {e}")
+
+    def _log_node_tree(self, node: Node, state: _TraceState, first_node: bool = False) -> None:
         """
         Log a node and its children recursively.
 
@@ -114,6 +193,8 @@ class GalileoTracingProcessor(TracingProcessor):
         ----------
         node : Node
             The node to log.
+        state : _TraceState
+            The state of the trace the node belongs to.
         first_node : bool
             Whether this is the root trace node.
         """
@@ -130,8 +211,8 @@ class GalileoTracingProcessor(TracingProcessor):
             metadata = convert_to_string_dict(metadata)
         if first_node:
             self._galileo_logger.add_trace(
-                input=self._first_input or "Agent Workflow",
-                output=self._last_output,
+                input=state.first_input or "Agent Workflow",
+                output=state.last_output,
                 duration_ns=node.span_params.get("duration_ns"),
                 created_at=start_time_iso,
                 name="Trace",
@@ -207,9 +288,9 @@ class GalileoTracingProcessor(TracingProcessor):
         # Process all child nodes
         last_child = None
         for child_id in node.children:
-            child_node = self._nodes.get(child_id)
+            child_node = state.nodes.get(child_id)
             if child_node:
-                self._log_node_tree(child_node)
+                self._log_node_tree(child_node, state)
                 last_child = child_node
             else:
                 _logger.warning(f"Child node {child_id} not found")
@@ -223,8 +304,8 @@ class GalileoTracingProcessor(TracingProcessor):
                 output = error
                 status_code = 500
             self._galileo_logger.conclude(output=serialize_to_str(output), status_code=status_code)
-            self._last_status_code = status_code
-            self._last_output = output
+            state.last_status_code = status_code
+            state.last_output = output
 
     def on_span_start(self, span: Span[Any]) -> None:
         """Called when an OpenAI Agent span starts."""
@@ -232,7 +313,12 @@ class GalileoTracingProcessor(TracingProcessor):
         trace_id = span.trace_id
         parent_id = span.parent_id or span.trace_id  # Parent is previous span or root trace
 
-        if span_id in self._nodes:
+        state = self._get_trace_state(trace_id)
+        if state is None:
+            _logger.warning(f"Span {span_id} started for unknown trace_id {trace_id}")
+            return
+
+        if span_id in state.nodes:
             _logger.warning(f"Span node already exists for span_id {span_id}, overwriting...")
 
         # Determine span type and name
@@ -257,8 +343,8 @@ class GalileoTracingProcessor(TracingProcessor):
                     "status_code": llm_data.get("status_code", 200),
                 }
             )
-            if not self._first_input and initial_params.get("input") != serialize_to_str(None):
-                self._first_input = initial_params.get("input")
+            if not state.first_input and initial_params.get("input") != serialize_to_str(None):
+                state.first_input = initial_params.get("input")
         elif galileo_type == "tool":
             tool_data = _extract_tool_data(span.span_data)
             initial_params.update(
@@ -295,10 +381,10 @@ class GalileoTracingProcessor(TracingProcessor):
 
         # Create the node
         node = Node(node_type=galileo_type, span_params=initial_params, run_id=span_id, parent_run_id=parent_id)
-        self._nodes[span_id] = node
+        state.nodes[span_id] = node
 
         # Add to parent's children list
-        parent_node = self._nodes.get(parent_id)
+        parent_node = state.nodes.get(parent_id)
         if not parent_node:
             _logger.warning(f"Parent node {parent_id} not found for span {span_id} in trace {trace_id}")
             return
@@ -307,8 +393,9 @@ class GalileoTracingProcessor(TracingProcessor):
     def on_span_end(self, span: Span[Any]) -> None:
         """Called when an OpenAI Agent span ends."""
         span_id = span.span_id
-        node = self._nodes.get(span_id)
-        if not node:
+        state = self._get_trace_state(span.trace_id)
+        node = state.nodes.get(span_id) if state else None
+        if not state or not node:
             _logger.warning(f"End called for unknown span_id {span_id}")
             return
 
@@ -334,11 +421,11 @@ class GalileoTracingProcessor(TracingProcessor):
             if node.span_params.get("input") is None:
                 node.span_params["input"] = llm_data.get("input")
                 if (
-                    not self._first_input
+                    not state.first_input
                     and node.span_params["input"]
                     and node.span_params["input"] != serialize_to_str(None)
                 ):
-                    self._first_input = node.span_params["input"]
+                    state.first_input = node.span_params["input"]
 
             # Extract embedded tool calls and merge with existing tool definitions
             if isinstance(span.span_data, ResponseSpanData) and span.span_data.response:
@@ -389,12 +476,23 @@ class GalileoTracingProcessor(TracingProcessor):
         node.span_params.update(end_params)
 
     def shutdown(self) -> None:
-        """Called when the application stops. Flushes any remaining logs."""
-        self._galileo_logger.flush()
+        """Called when the application stops. Drains pending background flushes and flushes any remaining logs."""
+        self.force_flush()
+        with self._traces_lock:
+            flush_executor, self._flush_executor = self._flush_executor, None
+            self._pending_flush = None
+        if flush_executor is not None:
+            flush_executor.shutdown(wait=True)
 
     def force_flush(self) -> None:
-        """Forces an immediate flush of all queued traces/spans."""
-        self._galileo_logger.flush()
+        """
+        Forces an immediate flush of all committed traces.
+
+        Waits for any queued background flush to complete, then flushes whatever is left on the logger. Traces that
+        have not ended yet are not affected.
+        """
+        self._drain_pending_flush()
+        self._flush()
 
     def _extract_embedded_tool_calls(self, response: Any) -> list[dict[str, Any]]:
         """Extract embedded tool calls from response.output."""
@@ -549,6 +549,10 @@ class LogStream(StateManagementMixin):
             # Pagination
             if results.has_next_page:
                 next_results = results.next_page()
+
+            # Stream every page with bounded memory
+            for record in results.iter_all(columns=["id", "input"]):
+                print(record["id"], record["input"])
         """
         if self.id is None:
             raise ValueError("Log stream ID is not set. Cannot query a local-only log stream.")
@@ -1,4 +1,6 @@
 import builtins
+import functools
+from dataclasses import dataclass
 from typing import overload
 
 from galileo.config import GalileoPythonConfig
@@ -13,6 +15,7 @@ from galileo.resources.models.log_stream_create_request import LogStreamCreateRe
 from galileo.resources.models.log_stream_response import LogStreamResponse
 from galileo.resources.types import Unset
 from galileo.schema.metrics import GalileoMetrics, LocalMetricConfig, Metric
+from galileo.shared.resolution_cache import resolution_cache
 from galileo.utils.env_helpers import _get_log_stream_from_env, _get_project_from_env
 from galileo.utils.log_config import get_logger
 from galileo.utils.metrics import create_metric_configs
@@ -227,6 +230,21 @@ class LogStream(LogStreamResponse):
         return local_metrics
 
 
+@dataclass
+class _LogStreamIndex:
+    """Every log stream of a project, indexed by name."""
+
+    log_streams: builtins.list[LogStream]
+
+    @functools.cached_property
+    def by_name(self) -> dict[str, LogStream]:
+        by_name: dict[str, LogStream] = {}
+        for log_stream in self.log_streams:
+            # Keep the first log stream of a name, as a scan of the list would.
+            by_name.setdefault(log_stream.name, log_stream)
+        return by_name
+
+
 class LogStreams:
     config: GalileoPythonConfig
 
@@ -353,6 +371,12 @@ class LogStreams:
 
         return all_log_streams
 
+    def _index(self, *, project_id: str, max_age: float | None = None) -> _LogStreamIndex:
+        """Internal helper: every log stream of the project indexed by name, cached process-wide."""
+        return resolution_cache.get_or_load(
+            ("log_streams", project_id), lambda: _LogStreamIndex(self._list_all(project_id=project_id)), max_age=max_age
+        )
+
     @overload
     def get(self, *, id: str, project_id: str | None = None, project_name: str | None = None) -> LogStream | None: ...
     @overload
@@ -415,9 +439,14 @@ class LogStreams:
             return LogStream(log_stream=log_stream_response)
 
         if name:
-            for log_stream in self._list_all(project_id=project_id):
-                if log_stream.name == name:
-                    return log_stream
+            log_stream = self._index(project_id=project_id).by_name.get(name)
+            if log_stream is None:
+                # A miss may come from an index loaded before the log stream was created elsewhere; only trust
+                # it for as long as a cached "not found" result.
+                index = self._index(project_id=project_id, max_age=resolution_cache.negative_ttl_seconds)
+                log_stream = index.by_name.get(name)
+            # The index is shared by every caller, so each one gets its own copy to mutate.
+            return LogStream(log_stream=log_stream) if log_stream is not None else None
         return None
 
     @overload
@@ -467,6 +496,7 @@ class LogStreams:
         response = create_log_stream_projects_project_id_log_streams_post.sync(
             project_id=project_id, client=self.config.api_client, body=body
         )
+        resolution_cache.invalidate(("log_streams", project_id))
 
         if isinstance(response, HTTPValidationError):
             raise response
@@ -2,13 +2,16 @@ import asyncio
 import atexit
 import contextlib
 import copy
+import importlib
 import inspect
 import json
 import logging
 import os
+import threading
 import time
 import uuid
 from collections.abc import Callable
+from concurrent.futures import Future
 from datetime import datetime
 from typing import TYPE_CHECKING, Any, Union
 
@@ -17,15 +20,14 @@ if TYPE_CHECKING:
 
 import backoff
 import httpx
+from pydantic import BaseModel
 
 from galileo.config import GalileoPythonConfig
 from galileo.constants import LoggerModeType
 from galileo.constants.tracing import PARENT_ID_HEADER, TRACE_ID_HEADER
 from galileo.exceptions import GalileoLoggerException
-from galileo.log_streams import LogStreams
 from galileo.logger.control import ControlAppliesTo, ControlCheckStage, ControlResult
 from galileo.logger.task_handler import ThreadPoolTaskHandler
-from galileo.projects import Projects
 from galileo.schema.content_blocks import (
     DataContentBlock,
     TextContentBlock,
@@ -63,13 +65,14 @@ from galileo.utils.decorators import (
     warn_catch_exception,
 )
 from galileo.utils.env_helpers import (
+    _get_background_init_or_default,
+    _get_defer_init_or_default,
     _get_log_stream_id_from_env,
     _get_log_stream_or_default,
     _get_mode_or_default,
     _get_project_id_from_env,
     _get_project_or_default,
 )
-from galileo.utils.metrics import populate_local_metrics
 from galileo.utils.retrievers import convert_to_documents
 from galileo.utils.serialization import serialize_to_str
 from galileo_core.helpers.execution import async_run
@@ -114,6 +117,44 @@ STUB_TRACE_NAME = "stub_trace"  # Name for stub traces created from distributed
 _ingest_service_cache: dict[str, bool] = {}
 _logger = logging.getLogger("galileo.logger")
 
+# Project and log stream resolution and local metrics import the generated API client, so they are only imported
+# when first used (see `galileo.tracing_lite`). They stay attributes of this module, e.g. for `mock.patch`.
+_LAZY_IMPORTS = {
+    "LogStreams": "galileo.log_streams",
+    "Projects": "galileo.projects",
+    "populate_local_metrics": "galileo.utils.metrics",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY_IMPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def _lazy_import(name: str) -> Any:
+    """Return the lazily imported module attribute ``name``, or the value it was patched with."""
+    return globals()[name] if name in globals() else __getattr__(name)
+
+
+def _run_in_thread(fn: Callable[[], Any], name: str) -> Future:
+    """Run ``fn`` on a new daemon thread and return a future for its result."""
+    future: Future = Future()
+
+    def run() -> None:
+        if not future.set_running_or_notify_cancel():
+            return
+        try:
+            future.set_result(fn())
+        except Exception as e:
+            future.set_exception(e)
+
+    threading.Thread(target=run, name=name, daemon=True).start()
+    return future
+
 
 def _ingest_cache_key(api_url: str, extra_headers: dict[str, str] | None) -> str:
     """Build a stable cache key from the values that determine the healthz probe's outcome.
@@ -125,6 +166,41 @@ def _ingest_cache_key(api_url: str, extra_headers: dict[str, str] | None) -> str
     return f"{api_url}|{headers}"
 
 
+# Rough per-step allowance for ids, timestamps, metrics and JSON structure on top of the step's content.
+_STEP_OVERHEAD_BYTES = 256
+_STEP_CONTENT_FIELDS = (
+    "input",
+    "redacted_input",
+    "output",
+    "redacted_output",
+    "tools",
+    "user_metadata",
+    "tags",
+    "dataset_input",
+    "dataset_output",
+    "dataset_metadata",
+)
+
+
+def _estimate_size(value: Any) -> int:
+    """Cheaply estimate the encoded size of a step field without serializing it."""
+    if value is None:
+        return 0
+    if isinstance(value, str | bytes):
+        return len(value)
+    if isinstance(value, dict):
+        return sum(len(str(key)) + _estimate_size(item) for key, item in value.items())
+    if isinstance(value, list | tuple):
+        return sum(_estimate_size(item) for item in value)
+    if isinstance(value, BaseModel):
+        return sum(_estimate_size(item) for item in value.__dict__.values())
+    return len(str(value))
+
+
+def _estimate_step_size(step: BaseStep) -> int:
+    return _STEP_OVERHEAD_BYTES + sum(_estimate_size(getattr(step, name, None)) for name in _STEP_CONTENT_FIELDS)
+
+
 class GalileoLogger(TracesLogger):
     """
     This class can be used to upload traces to Galileo.
@@ -201,8 +277,10 @@ class GalileoLogger(TracesLogger):
 
     _logger = logging.getLogger("galileo.logger")
     _traces_client: Union["Traces", "IngestTraces"] | None = None
+    _background_init: Future | None = None
     _task_handler: ThreadPoolTaskHandler
     _trace_completion_submitted: bool
+    _buffered_size_bytes: int = 0
 
     def __init__(
         self,
@@ -216,6 +294,8 @@ class GalileoLogger(TracesLogger):
         local_metrics: list[LocalMetricConfig] | None = None,
         mode: str | None = None,
         ingestion_hook: Callable[[TracesIngestRequest], None] | None = None,
+        defer_init: bool | None = None,
+        background_init: bool | None = None,
     ) -> None:
         """
         Initializes the logger.
@@ -256,16 +336,30 @@ class GalileoLogger(TracesLogger):
                 synchronous or asynchronous function. This is useful for implementing
                 custom logic such as data redaction before the traces are sent to
                 Galileo via the `ingest_traces` method.
+        defer_init: Optional[bool]
+            Resolve the project and log stream, and create the traces client, on the first flush (or session start)
+            instead of here, so creating a logger makes no requests. Resolution errors are then raised by that
+            first call. Only applies to batch mode. Defaults to the GALILEO_DEFER_INIT env var, or False.
+        background_init: Optional[bool]
+            Resolve the project and log stream, and probe the ingest service, on background threads started here,
+            so the logger accepts and buffers traces right away. The first flush waits for them, and retries any
+            step that failed. Only applies to batch mode. Defaults to the GALILEO_BACKGROUND_INIT env var, or False.
         """
         super().__init__()
         mode = _get_mode_or_default(mode)
         self.mode: LoggerModeType = mode
         self._task_counter = 0
+        self._traces_client_lock = threading.Lock()
 
         self._ingestion_hook = ingestion_hook
         if self._ingestion_hook and self.mode == "distributed":
             raise GalileoLoggerException("ingestion_hook can only be used in batch mode")
 
+        defer_init = _get_defer_init_or_default(defer_init)
+        background_init = _get_background_init_or_default(background_init)
+        if defer_init and background_init:
+            raise GalileoLoggerException("defer_init and background_init cannot both be enabled.")
+
         # Ingestion hook mode: skip project/log_stream validation and backend initialization
         # The user's hook handles all trace flushing, so no Galileo credentials are needed
         if ingestion_hook:
@@ -343,7 +437,13 @@ class GalileoLogger(TracesLogger):
             self._trace_completion_submitted = False
 
         # When using ingestion_hook, skip API initialization (hook handles ingestion)
-        if not self._ingestion_hook:
+        if not self._ingestion_hook and defer_init and self.mode == "batch":
+            # Deferred: `_get_traces_client()` resolves the project and log stream when traces are first sent.
+            self._traces_client = None
+        elif not self._ingestion_hook and background_init and self.mode == "batch":
+            self._traces_client = None
+            self._start_background_init()
+        elif not self._ingestion_hook:
             if not self.project_id:
                 self._init_project()
 
@@ -378,7 +478,7 @@ class GalileoLogger(TracesLogger):
     @nop_sync
     def _init_project(self) -> None:
         """Initializes the project ID."""
-        projects_client = Projects()
+        projects_client = _lazy_import("Projects")()
         project_obj = projects_client.get(name=self.project_name)
         if project_obj is None:
             # Create project if it doesn't exist
@@ -395,7 +495,7 @@ class GalileoLogger(TracesLogger):
     @nop_sync
     def _init_log_stream(self) -> None:
         """Initializes the log stream ID."""
-        log_streams_client = LogStreams()
+        log_streams_client = _lazy_import("LogStreams")()
         log_stream_obj = log_streams_client.get(name=self.log_stream_name, project_id=self.project_id)
         if log_stream_obj is None:
             # Create log stream if it doesn't exist
@@ -443,6 +543,39 @@ class GalileoLogger(TracesLogger):
                 _logger.debug("Ingest service healthz check failed, using standard client")
         return _ingest_service_cache[cache_key]
 
+    def _start_background_init(self) -> None:
+        """Resolve the project and log stream, and probe the ingest service, concurrently on background threads."""
+        ingest_probe = _run_in_thread(self._is_ingest_service_available, name="galileo-logger-ingest-probe")
+
+        def init() -> Traces | IngestTraces:
+            if not self.project_id:
+                self._init_project()
+            if not (self.log_stream_id or self.experiment_id):
+                self._init_log_stream()
+            ingest_probe.result()
+            return self._create_traces_client()
+
+        self._background_init = _run_in_thread(init, name="galileo-logger-init")
+
+    def _get_traces_client(self) -> Traces | IngestTraces:
+        """Return the traces client, creating it (and resolving the project and log stream) on first use."""
+        if self._traces_client is None:
+            with self._traces_client_lock:
+                if self._traces_client is None:
+                    self._traces_client = self._background_init_result() or self._create_traces_client()
+        return self._traces_client
+
+    def _background_init_result(self) -> Traces | IngestTraces | None:
+        """Wait for the background initialization, if any. Returns None if it failed, so that it is retried."""
+        future, self._background_init = self._background_init, None
+        if future is None:
+            return None
+        try:
+            return future.result()
+        except Exception as e:
+            self._logger.warning(f"Background initialization of the logger failed, retrying: {e}")
+            return None
+
     @nop_sync
     def _create_traces_client(self) -> Traces | IngestTraces:
         """Create the appropriate traces client.
@@ -560,9 +693,57 @@ class GalileoLogger(TracesLogger):
         )
         trace._parent = None
         self.traces.append(trace)
+        self._buffered_size_bytes += _estimate_step_size(trace)
         self._set_current_parent(trace)
         return trace
 
+    @nop_sync
+    def replay_trace(self, trace: LoggedTrace) -> LoggedTrace:
+        """
+        Add a copy of a previously logged, concluded trace to the logger.
+
+        The copy gets new IDs for the trace and all of its spans, and its timestamps are shifted so it starts now,
+        keeping the recorded durations.
+
+        Parameters
+        ----------
+        trace : LoggedTrace
+            The trace to replay. It is not modified.
+
+        Returns
+        -------
+        LoggedTrace
+            The added copy.
+        """
+        if self.current_parent() is not None:
+            raise ValueError("You must conclude the existing trace before adding a new one.")
+        replayed = trace.model_copy(deep=True)
+        offset = datetime.now(replayed.created_at.tzinfo) - replayed.created_at
+        steps: list[BaseStep] = [replayed]
+        while steps:
+            step = steps.pop()
+            step.id = uuid.uuid4()
+            step.created_at += offset
+            steps.extend(getattr(step, "spans", []))
+        replayed._parent = None
+        self.traces.append(replayed)
+        self._buffered_size_bytes += _estimate_size(replayed)
+        return replayed
+
+    def add_child_span_to_parent(self, span: Span) -> None:
+        super().add_child_span_to_parent(span)
+        self._buffered_size_bytes += _estimate_step_size(span)
+
+    @property
+    def buffered_size_bytes(self) -> int:
+        """
+        Estimated encoded size in bytes of the traces waiting for the next flush.
+
+        The estimate is kept up to date as traces and spans are added and concluded, so it is cheap to check before
+        every flush decision. It is reset when the logger is flushed.
+        """
+        return self._buffered_size_bytes
+
     @staticmethod
     def _convert_metadata_value(v: Any) -> str:
         """Convert a metadata value to string.
@@ -726,7 +907,7 @@ class GalileoLogger(TracesLogger):
         )
         @retry_on_transient_http_error
         async def ingest_traces_with_backoff(request: Any) -> None:
-            return await self._traces_client.ingest_traces(request)
+            return await self._get_traces_client().ingest_traces(request)
 
         self._task_handler.submit_task(
             task_id, lambda: ingest_traces_with_backoff(traces_ingest_request), dependent_on_prev=False
@@ -775,7 +956,7 @@ class GalileoLogger(TracesLogger):
         )
         @retry_on_transient_http_error
         async def ingest_spans_with_backoff(request: Any) -> None:
-            return await self._traces_client.ingest_spans(request)
+            return await self._get_traces_client().ingest_spans(request)
 
         self._task_handler.submit_task(
             task_id, lambda: ingest_spans_with_backoff(spans_ingest_request), dependent_on_prev=False
@@ -832,7 +1013,7 @@ class GalileoLogger(TracesLogger):
         )
         @retry_on_transient_http_error
         async def update_trace_with_backoff(request: Any) -> None:
-            return await self._traces_client.update_trace(request)
+            return await self._get_traces_client().update_trace(request)
 
         # Submit with dependency on the previous trace update for this trace
         if prev_trace_update_task:
@@ -899,7 +1080,7 @@ class GalileoLogger(TracesLogger):
         )
         @retry_on_transient_http_error
         async def update_span_with_backoff(request: Any) -> None:
-            return await self._traces_client.update_span(request)
+            return await self._get_traces_client().update_span(request)
 
         self._task_handler.submit_task_with_parent(
             task_id, lambda: update_span_with_backoff(span_update_request), parent_task_id=parent_task_id
@@ -1971,6 +2152,7 @@ class GalileoLogger(TracesLogger):
             current_parent.output = output
         if redacted_output is not None:
             current_parent.redacted_output = redacted_output
+        self._buffered_size_bytes += _estimate_size(output) + _estimate_size(redacted_output)
         if status_code is not None:
             current_parent.status_code = status_code
         if duration_ns is not None:
@@ -2084,6 +2266,49 @@ class GalileoLogger(TracesLogger):
                 self._logger.warning(f"Ingestion error in flush: {e}")
             return []
 
+    @nop_sync
+    def flush_in_background(self, traces: list[Trace] | None = None) -> Future | None:
+        """
+        Hand the buffered traces to a background upload and return without waiting for it.
+
+        The traces are detached from the logger before the upload starts, so new traces can be
+        logged while the batch is in flight. Unlike `flush`, upload errors are not handled here:
+        they are raised by the returned future's ``result()``. Only supported in batch mode.
+
+        Parameters
+        ----------
+        traces : Optional[list[Trace]]
+            Upload only these buffered traces, e.g. the concluded ones while concurrent tasks are still logging
+            others. They are uploaded as they are, and the other traces stay buffered. Defaults to every buffered
+            trace, concluding the current one first.
+
+        Returns
+        -------
+        Optional[Future]
+            A future resolving to the uploaded traces, or None if there was nothing to upload.
+        """
+        if self.mode == "distributed":
+            raise GalileoLoggerException("flush_in_background is only supported in batch mode.")
+        if not self.traces:
+            return None
+
+        if traces is not None:
+            detached = {id(trace) for trace in traces}
+            logged_traces = [trace for trace in self.traces if id(trace) in detached]
+            if not logged_traces:
+                return None
+            self.traces = [trace for trace in self.traces if id(trace) not in detached]
+            self._buffered_size_bytes = sum(_estimate_size(trace) for trace in self.traces)
+            return async_run(self._ingest_batch(logged_traces), wait_for_result=False)
+
+        self._auto_conclude_trace()
+
+        logged_traces = self.traces
+        self.traces = []
+        self._buffered_size_bytes = 0
+        self._set_current_parent(None)
+        return async_run(self._ingest_batch(logged_traces), wait_for_result=False)
+
     @nop_async
     @async_warn_catch_exception(exceptions=(Exception,))
     async def async_flush(self) -> list[LoggedTrace]:
@@ -2228,6 +2453,7 @@ class GalileoLogger(TracesLogger):
         self._logger.info("All distributed tracing requests are complete.")
 
         self.traces = []
+        self._buffered_size_bytes = 0
         self._set_current_parent(None)
 
         return []
@@ -2240,13 +2466,22 @@ class GalileoLogger(TracesLogger):
 
         self._auto_conclude_trace()
 
+        logged_traces = self.traces
+        await self._ingest_batch(logged_traces)
+
+        self.traces = []
+        self._buffered_size_bytes = 0
+        self._set_current_parent(None)  # Reset parent tracking
+        return logged_traces
+
+    async def _ingest_batch(self, logged_traces: list[LoggedTrace]) -> list[LoggedTrace]:
+        """Compute local metrics for a batch of concluded traces and send it to the backend (or the ingestion hook)."""
         if self.local_metrics:
             self._logger.info("Computing metrics for local scorers...")
             # TODO: parallelize, possibly with asyncio to_thread/gather
-            for trace in self.traces:
-                populate_local_metrics(trace, self.local_metrics)
+            for trace in logged_traces:
+                _lazy_import("populate_local_metrics")(trace, self.local_metrics)
 
-        logged_traces = self.traces
         trace_count = len(logged_traces)
         self._logger.info(f"Flushing {trace_count} {'trace' if trace_count == 1 else 'traces'}...")
 
@@ -2274,12 +2509,9 @@ class GalileoLogger(TracesLogger):
                 # See SC-60512.
                 await asyncio.to_thread(self._ingestion_hook, traces_ingest_request)
         else:
-            await self._traces_client.ingest_traces(traces_ingest_request)
+            await self._get_traces_client().ingest_traces(traces_ingest_request)
 
         self._logger.info(f"Successfully flushed {trace_count} {'trace' if trace_count == 1 else 'traces'}.")
-
-        self.traces = []
-        self._set_current_parent(None)  # Reset parent tracking
         return logged_traces
 
     @nop_sync
@@ -2373,7 +2605,7 @@ class GalileoLogger(TracesLogger):
         if external_id and external_id.strip() != "":
             self._logger.info(f"Searching for session with external ID: {external_id} ...")
             try:
-                sessions = await self._traces_client.get_sessions(
+                sessions = await self._get_traces_client().get_sessions(
                     LogRecordsSearchRequest(
                         filters=[
                             LogRecordsSearchFilter(
@@ -2396,7 +2628,7 @@ class GalileoLogger(TracesLogger):
 
         self._logger.info("Starting a new session...")
 
-        session = await self._traces_client.create_session(
+        session = await self._get_traces_client().create_session(
             SessionCreateRequest(
                 name=name, previous_session_id=previous_session_id, external_id=external_id, user_metadata=metadata
             )
@@ -2519,9 +2751,7 @@ class GalileoLogger(TracesLogger):
 
         Can be used in combination with the `ingestion_hook` to ingest modified traces.
         """
-        if self._traces_client is None:
-            self._traces_client = self._create_traces_client()
-        await self._traces_client.ingest_traces(ingest_request)
+        await self._get_traces_client().ingest_traces(ingest_request)
 
     @nop_sync
     @warn_catch_exception(exceptions=(Exception,))
@@ -2531,6 +2761,4 @@ class GalileoLogger(TracesLogger):
 
         Can be used in combination with the `ingestion_hook` to ingest modified traces.
         """
-        if self._traces_client is None:
-            self._traces_client = self._create_traces_client()
         return async_run(self.async_ingest_traces(ingest_request))
@@ -1,5 +1,6 @@
 import json
 import logging
+import threading
 import typing
 from collections.abc import Generator
 from contextlib import contextmanager
@@ -40,7 +41,10 @@ try:
     )
     from opentelemetry.sdk.resources import Resource  # pyright: ignore[reportAssignmentType]
     from opentelemetry.sdk.trace import Span, SpanProcessor  # pyright: ignore[reportAssignmentType]
-    from opentelemetry.sdk.trace.export import BatchSpanProcessor  # pyright: ignore[reportAssignmentType]
+    from opentelemetry.sdk.trace.export import (  # pyright: ignore[reportAssignmentType]
+        BatchSpanProcessor,
+        SpanExportResult,
+    )
     from opentelemetry.trace import Tracer  # pyright: ignore[reportAssignmentType]
 
     OTEL_AVAILABLE = True
@@ -83,6 +87,16 @@ class TracerProvider(Protocol):
     ) -> "Tracer": ...
 
 
+_GALILEO_RESOURCE_ATTRIBUTES = (
+    "galileo.project.name",
+    "galileo.logstream.name",
+    "galileo.session.id",
+    "galileo.experiment.id",
+    "galileo.dataset.input",
+    "galileo.dataset.output",
+    "galileo.dataset.metadata",
+)
+
 _TRACE_PROVIDER_CONTEXT_VAR: ContextVar[TracerProvider | None] = ContextVar("galileo_trace_provider", default=None)
 
 
@@ -140,62 +154,102 @@ class GalileoOTLPExporter(OTLPSpanExporter):
         self.project = _get_project_or_default(ctx_project)
         self.logstream = _get_log_stream_or_default(ctx_logstream)
 
+        self._export_lock = threading.Lock()
+
         exporter_headers = {"Galileo-API-Key": api_key, "project": self.project, "logstream": self.logstream}
 
         super().__init__(endpoint=endpoint, headers=exporter_headers, **kwargs)
 
     def export(self, spans: typing.Sequence[Any]) -> "Any":
-        """Override export to set resource attributes from span attributes before serialization."""
-        is_experiment = False
+        """
+        Export spans to Galileo, one OTLP request per destination.
+
+        Galileo attributes recorded on each span during ``on_start`` are merged into the span's resource so they
+        survive serialization. Spans are grouped by their (project, logstream, experiment, session) destination and
+        each group is sent with its own routing headers, so a batch that mixes projects or log streams is not
+        attributed to whichever span happened to be last. Spans that share the same original resource and Galileo
+        attributes share a single merged ``Resource``.
+
+        Parameters
+        ----------
+        spans : Sequence[ReadableSpan]
+            The finished spans handed over by the span processor.
+
+        Returns
+        -------
+        SpanExportResult
+            ``SUCCESS`` if every group was exported, otherwise the first failing group's result.
+        """
+        groups: dict[tuple[Any, ...], list[Any]] = {}
+        merged_resources: dict[tuple[int, tuple[tuple[str, Any], ...]], Any] = {}
         for span in spans:
+            attributes = span.attributes or {}
             # Read from span attributes (set during on_start when context was available)
-            project = span.attributes.get("galileo.project.name")
-            logstream = span.attributes.get("galileo.logstream.name")
-            session_id = span.attributes.get("galileo.session.id")
-            experiment_id = span.attributes.get("galileo.experiment.id")
-            dataset_input = span.attributes.get("galileo.dataset.input")
-            dataset_output = span.attributes.get("galileo.dataset.output")
-            dataset_metadata = span.attributes.get("galileo.dataset.metadata")
-
-            # Build resource attributes dict, filtering out None values
-            resource_attrs = {}
-            if project:
-                resource_attrs["galileo.project.name"] = project
-            # We can only have either logstream or experiment, if it's an experiment we want to prioritize it.
-            if logstream and not experiment_id:
-                resource_attrs["galileo.logstream.name"] = logstream
-            if session_id:
-                resource_attrs["galileo.session.id"] = session_id
-            if experiment_id:
-                resource_attrs["galileo.experiment.id"] = experiment_id
-                is_experiment = True
-            if dataset_input:
-                resource_attrs["galileo.dataset.input"] = dataset_input
-            if dataset_output:
-                resource_attrs["galileo.dataset.output"] = dataset_output
-            if dataset_metadata:
-                resource_attrs["galileo.dataset.metadata"] = dataset_metadata
-
+            resource_attrs = _galileo_resource_attributes(attributes)
             if resource_attrs:
-                # Merge new attributes into span's resource
-                new_resource = span.resource.merge(Resource(resource_attrs))
+                cache_key = (id(span.resource), tuple(resource_attrs.items()))
+                new_resource = merged_resources.get(cache_key)
+                if new_resource is None:
+                    # Merge new attributes into span's resource
+                    new_resource = span.resource.merge(Resource(resource_attrs))
+                    merged_resources[cache_key] = new_resource
                 # Mutate the internal _resource (ReadableSpan stores it there)
                 span._resource = new_resource
 
-        # for the last span update the headers
-        if spans:
-            last_span = spans[-1]
-            self._session.headers.update(
-                {
-                    "project": last_span.attributes.get("galileo.project.name"),
-                    "logstream": last_span.attributes.get("galileo.logstream.name"),
-                }
+            destination = (
+                attributes.get("galileo.project.name"),
+                attributes.get("galileo.logstream.name"),
+                attributes.get("galileo.experiment.id"),
+                attributes.get("galileo.session.id"),
             )
-            if is_experiment:
-                self._session.headers.update({"experimentid": last_span.attributes.get("galileo.experiment.id")})
-                self._session.headers.pop("logstream", None)  # Remove logstream header if experiment is present
-
-        return super().export(spans)
+            groups.setdefault(destination, []).append(span)
+
+        if not groups:
+            return super().export(spans)
+
+        result = None
+        for (project, logstream, experiment_id, _), group in groups.items():
+            # The headers live on the exporter's shared HTTP session, so hold the lock until the request is sent.
+            with self._export_lock:
+                self._set_routing_headers(project, logstream, experiment_id)
+                group_result = super().export(group)
+            if result is None or result == SpanExportResult.SUCCESS:
+                result = group_result
+        return result
+
+    def _set_routing_headers(self, project: str | None, logstream: str | None, experiment_id: str | None) -> None:
+        """Point the next OTLP request at the given project and log stream or experiment."""
+        headers = self._request_headers()
+        headers["project"] = project or self.project
+        if experiment_id:
+            # We can only have either logstream or experiment, if it's an experiment we want to prioritize it.
+            headers["experimentid"] = experiment_id
+            headers.pop("logstream", None)
+        else:
+            headers["logstream"] = logstream or self.logstream
+            headers.pop("experimentid", None)
+
+    def _request_headers(self) -> typing.MutableMapping[str, Any]:
+        # Older opentelemetry-exporter-otlp-proto-http releases keep the request headers on a ``requests.Session``,
+        # newer ones on their internal HTTP client.
+        session = getattr(self, "_session", None)
+        if session is not None:
+            return session.headers
+        return self._client._headers  # type: ignore[attr-defined]
+
+
+def _galileo_resource_attributes(attributes: typing.Mapping[str, Any]) -> dict[str, Any]:
+    """Build the Galileo resource attributes for a span, filtering out unset values."""
+    experiment_id = attributes.get("galileo.experiment.id")
+    resource_attrs = {}
+    for key in _GALILEO_RESOURCE_ATTRIBUTES:
+        # We can only have either logstream or experiment, if it's an experiment we want to prioritize it.
+        if key == "galileo.logstream.name" and experiment_id:
+            continue
+        value = attributes.get(key)
+        if value:
+            resource_attrs[key] = value
+    return resource_attrs
 
 
 class GalileoSpanProcessor(SpanProcessor):
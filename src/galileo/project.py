@@ -14,6 +14,7 @@ from galileo.resources.models.project_update import ProjectUpdate
 from galileo.resources.types import Unset
 from galileo.shared.base import StateManagementMixin, SyncState
 from galileo.shared.exceptions import APIError, ValidationError
+from galileo.shared.resolution_cache import resolution_cache
 
 if TYPE_CHECKING:
     from galileo.dataset import Dataset
@@ -852,6 +853,8 @@ class Project(StateManagementMixin):
             detailed_response = update_project_projects_project_id_put.sync_detailed(
                 project_id=self.id, client=config.api_client, body=body
             )
+            # The previous name of the project is not tracked, so drop every cached lookup.
+            resolution_cache.clear()
         except Exception as e:
             self._set_state(SyncState.FAILED_SYNC, error=e)
             logger.error(f"Project.save: id='{self.id}' - failed: {e}")
@@ -28,6 +28,7 @@ from galileo.resources.models.project_update_response import ProjectUpdateRespon
 from galileo.resources.models.user_collaborator import UserCollaborator
 from galileo.resources.models.user_collaborator_create import UserCollaboratorCreate
 from galileo.resources.types import UNSET, Unset
+from galileo.shared.resolution_cache import resolution_cache
 from galileo.utils.env_helpers import _get_project_from_env, _get_project_id_from_env
 from galileo.utils.exceptions import APIException
 from galileo.utils.log_config import get_logger
@@ -203,6 +204,8 @@ class Projects:
         """
         Retrieves a project by id or name (exactly one of `id` or `name` must be provided).
 
+        Lookups by name are cached process-wide for a few minutes (see ``galileo.shared.resolution_cache``).
+
         Parameters
         ----------
         id : str
@@ -249,21 +252,27 @@ class Projects:
             project = Project(project=project_response)
 
         elif name:
-            detailed_response = get_projects_projects_get.sync_detailed(
-                client=self.config.api_client, project_name=name, type_=ProjectType.GEN_AI
-            )
+            # The cache holds the response model, so each caller gets its own Project to mutate.
+            project_response = resolution_cache.get_or_load(("project", name), lambda: self._get_by_name(name))
+            if project_response:
+                project = Project(project=project_response)
 
-            if detailed_response.status_code != httpx.codes.OK:
-                raise ProjectsAPIException(detailed_response.content)
+        return project
 
-            projects_response = detailed_response.parsed
+    def _get_by_name(self, name: str) -> ProjectDB | None:
+        detailed_response = get_projects_projects_get.sync_detailed(
+            client=self.config.api_client, project_name=name, type_=ProjectType.GEN_AI
+        )
 
-            if not projects_response or len(projects_response) == 0:
-                return None
+        if detailed_response.status_code != httpx.codes.OK:
+            raise ProjectsAPIException(detailed_response.content)
 
-            project = Project(project=projects_response[0])
+        projects_response = detailed_response.parsed
 
-        return project
+        if not projects_response or len(projects_response) == 0:
+            return None
+
+        return projects_response[0]
 
     def create(self, name: str) -> Project:
         """
@@ -290,6 +299,7 @@ class Projects:
         body = ProjectCreate(name=name, type_=ProjectType.GEN_AI, create_example_templates=False, created_by=None)
 
         detailed_response = create_project_projects_post.sync_detailed(client=self.config.api_client, body=body)
+        resolution_cache.invalidate(("project", name.strip()))
 
         if detailed_response.status_code != httpx.codes.OK:
             raise ProjectsAPIException(detailed_response.content)
@@ -384,6 +394,7 @@ class Projects:
         detailed_response = delete_project_projects_project_id_delete.sync_detailed(
             project_id=project.id, client=self.config.api_client
         )
+        resolution_cache.invalidate(("project", project.name), ("log_streams", project.id))
 
         if detailed_response.status_code != httpx.codes.OK:
             raise ProjectsAPIException(str(detailed_response.content))
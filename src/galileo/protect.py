@@ -1,19 +1,70 @@
+import asyncio
+import json
 from collections.abc import Sequence
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
 
-from pydantic import UUID4
+import httpx
+from pydantic import UUID4, ValidationError
 
 from galileo.config import GalileoPythonConfig
-from galileo.constants.protect import TIMEOUT_SECS
+from galileo.constants.protect import MAX_CONCURRENCY, TIMEOUT_SECS
+from galileo.constants.routes import Routes
+from galileo.protect_cache import ProtectCache
 from galileo.resources.api.protect import invoke_protect_invoke_post
 from galileo.resources.models.http_validation_error import HTTPValidationError
 from galileo.resources.models.protect_request import ProtectRequest as APIRequest
 from galileo.resources.models.protect_response import ProtectResponse as APIResponse
+from galileo.utils.headers_data import get_sdk_header
+from galileo.utils.log_config import get_logger
+from galileo_core.constants.request_method import RequestMethod
 from galileo_core.helpers.execution import async_run
 from galileo_core.schemas.protect.payload import Payload
 from galileo_core.schemas.protect.request import Request
 from galileo_core.schemas.protect.response import Response
 from galileo_core.schemas.protect.ruleset import Ruleset
 
+if TYPE_CHECKING:
+    from galileo.logger import GalileoLogger
+
+_logger = get_logger(__name__)
+
+
+@dataclass
+class ProtectBatchResult:
+    """
+    Results of invoking Protect on many payloads, in the order of the payloads.
+
+    Attributes
+    ----------
+    results
+        The result of each payload, or None if its invocation failed.
+    errors
+        The exception raised by each failed invocation, by the index of its payload. Invocations that exceeded
+        their ``call_timeout`` fail with a ``TimeoutError``.
+    """
+
+    results: list[Response | HTTPValidationError | None]
+    errors: dict[int, Exception] = field(default_factory=dict)
+
+    @property
+    def ok(self) -> bool:
+        """Whether every invocation succeeded."""
+        return not self.errors
+
+    def __len__(self) -> int:
+        return len(self.results)
+
+    def __getitem__(self, index: int) -> Response | HTTPValidationError | None:
+        return self.results[index]
+
+
+def _to_core_response(response: APIResponse | HTTPValidationError | None) -> Response | HTTPValidationError | None:
+    """Convert a response of the generated client to the galileo_core ``Response`` returned by Protect calls."""
+    if isinstance(response, APIResponse):
+        return Response.model_validate(response.to_dict())
+    return response
+
 
 class Protect:
     config: GalileoPythonConfig
@@ -33,6 +84,7 @@ class Protect:
         timeout: float = TIMEOUT_SECS,
         metadata: dict[str, str] | None = None,
         headers: dict[str, str] | None = None,
+        cache: ProtectCache | None = None,
     ) -> Response | HTTPValidationError | None:
         request = Request(
             payload=payload,
@@ -50,13 +102,338 @@ class Protect:
         request_dict["prioritized_rulesets"] = request_dict.pop("rulesets", [])
         body = APIRequest.from_dict(request_dict)
 
+        if cache is not None and ProtectCache.accepts(prioritized_rulesets):
+            static_fields = body.to_dict()
+            del static_fields["payload"]
+            key = ProtectCache.key(_encode_body(payload, _encode_static_fields(static_fields)))
+            return await cache.get_or_invoke(key, lambda: self._ainvoke(body), central_stage=not prioritized_rulesets)
+        return await self._ainvoke(body)
+
+    async def _ainvoke(self, body: APIRequest) -> Response | HTTPValidationError | None:
         response: APIResponse | HTTPValidationError | None = await invoke_protect_invoke_post.asyncio(
             client=self.config.api_client, body=body
         )
+        return _to_core_response(response)
+
+    async def ainvoke_many(
+        self,
+        payloads: Sequence[Payload],
+        prioritized_rulesets: Sequence[Ruleset] | None = None,
+        project_id: UUID4 | None = None,
+        project_name: str | None = None,
+        stage_id: UUID4 | None = None,
+        stage_name: str | None = None,
+        stage_version: int | None = None,
+        timeout: float = TIMEOUT_SECS,
+        metadata: dict[str, str] | None = None,
+        headers: dict[str, str] | None = None,
+        max_concurrency: int = MAX_CONCURRENCY,
+        call_timeout: float | None = None,
+        logger: "GalileoLogger | None" = None,
+        cache: ProtectCache | None = None,
+    ) -> ProtectBatchResult:
+        """
+        Asynchronously invoke Protect on each of the given payloads, concurrently, with the same stage.
+
+        The stage parameters and ``cache`` are the same as ``ainvoke_protect``'s. See ``ProtectClient.ainvoke_many``
+        for ``max_concurrency``, ``call_timeout`` and ``logger``.
+
+        Returns
+        -------
+        ProtectBatchResult
+            The results in the order of the payloads, and the errors of the failed invocations.
+        """
+        client = ProtectClient(
+            prioritized_rulesets=prioritized_rulesets,
+            project_id=project_id,
+            project_name=project_name,
+            stage_id=stage_id,
+            stage_name=stage_name,
+            stage_version=stage_version,
+            timeout=timeout,
+            metadata=metadata,
+            headers=headers,
+            cache=cache,
+        )
+        return await client.ainvoke_many(
+            payloads, max_concurrency=max_concurrency, call_timeout=call_timeout, logger=logger
+        )
+
+    def invoke_many(
+        self,
+        payloads: Sequence[Payload],
+        prioritized_rulesets: Sequence[Ruleset] | None = None,
+        project_id: UUID4 | None = None,
+        project_name: str | None = None,
+        stage_id: UUID4 | None = None,
+        stage_name: str | None = None,
+        stage_version: int | None = None,
+        timeout: float = TIMEOUT_SECS,
+        metadata: dict[str, str] | None = None,
+        headers: dict[str, str] | None = None,
+        max_concurrency: int = MAX_CONCURRENCY,
+        call_timeout: float | None = None,
+        logger: "GalileoLogger | None" = None,
+        cache: ProtectCache | None = None,
+    ) -> ProtectBatchResult:
+        """
+        Invoke Protect on each of the given payloads, concurrently, with the same stage.
+
+        See ``ainvoke_many`` for the parameters.
+
+        Returns
+        -------
+        ProtectBatchResult
+            The results in the order of the payloads, and the errors of the failed invocations.
+        """
+        return async_run(
+            self.ainvoke_many(
+                payloads,
+                prioritized_rulesets=prioritized_rulesets,
+                project_id=project_id,
+                project_name=project_name,
+                stage_id=stage_id,
+                stage_name=stage_name,
+                stage_version=stage_version,
+                timeout=timeout,
+                metadata=metadata,
+                headers=headers,
+                max_concurrency=max_concurrency,
+                call_timeout=call_timeout,
+                logger=logger,
+                cache=cache,
+            )
+        )
+
+
+class ProtectClient:
+    """
+    A Protect client bound to one stage, for invoking Protect with low latency.
+
+    The stage, rulesets and other static fields are validated and serialized once, here. Each invocation then only
+    encodes the payload, sends the JSON body on the running event loop's pooled connection, and parses the response
+    straight from its bytes.
+
+    Parameters
+    ----------
+    prioritized_rulesets
+        Prioritized rulesets to be used for processing.
+        These should only be provided if using a local stage. Defaults to an
+        empty list if None.
+    project_id
+        ID of the project.
+    project_name
+        Name of the project.
+    stage_id
+        ID of the stage.
+    stage_name
+        Name of the stage.
+    stage_version
+        Version of the stage.
+    timeout
+        Timeout for the request in seconds. Defaults to TIMEOUT_SECS.
+    metadata
+        Metadata to be added when responding.
+    headers
+        Headers to be added to the response.
+    cache
+        If set, responses are cached in it and identical invocations are answered from it. Ignored if the rulesets
+        have non-deterministic actions, or actions that notify subscriptions.
+    """
+
+    config: GalileoPythonConfig
+
+    def __init__(
+        self,
+        prioritized_rulesets: Sequence[Ruleset] | None = None,
+        project_id: UUID4 | None = None,
+        project_name: str | None = None,
+        stage_id: UUID4 | None = None,
+        stage_name: str | None = None,
+        stage_version: int | None = None,
+        timeout: float = TIMEOUT_SECS,
+        metadata: dict[str, str] | None = None,
+        headers: dict[str, str] | None = None,
+        cache: ProtectCache | None = None,
+    ) -> None:
+        self.config = GalileoPythonConfig.get()
+        # Validate the stage and rulesets with a placeholder payload, and serialize them as `Protect.ainvoke` would.
+        request = Request(
+            payload=Payload(input=" "),
+            prioritized_rulesets=prioritized_rulesets or [],
+            project_id=str(project_id) if project_id is not None else None,
+            project_name=project_name,
+            stage_id=str(stage_id) if stage_id is not None else None,
+            stage_name=stage_name,
+            stage_version=stage_version,
+            timeout=timeout,
+            metadata=metadata,
+            headers=headers,
+        )
+        request_dict = request.model_dump(mode="json")
+        request_dict["prioritized_rulesets"] = request_dict.pop("rulesets", [])
+        static_fields = APIRequest.from_dict(request_dict).to_dict()
+        del static_fields["payload"]
+        self._static_json = _encode_static_fields(static_fields)
+        self._content_headers = {"Content-Type": "application/json", "X-Galileo-SDK": get_sdk_header()}
+        self._cache = cache if cache is not None and ProtectCache.accepts(prioritized_rulesets) else None
+        if cache is not None and self._cache is None:
+            _logger.debug("Not caching Protect responses: the rulesets have non-deterministic or notifying actions.")
+        self._central_stage = not prioritized_rulesets
+
+    def encode(self, payload: Payload) -> bytes:
+        """Return the JSON body of the Protect request for ``payload``."""
+        return _encode_body(payload, self._static_json)
+
+    async def ainvoke(self, payload: Payload) -> Response | HTTPValidationError | None:
+        """
+        Asynchronously invoke Protect with the given payload.
+
+        Parameters
+        ----------
+        payload
+            Payload to be processed.
+
+        Returns
+        -------
+        Protect invoke results.
+        """
+        body = self.encode(payload)
+        if self._cache is None:
+            return await self._send(body)
+        return await self._cache.get_or_invoke(
+            ProtectCache.key(body), lambda: self._send(body), central_stage=self._central_stage
+        )
+
+    async def _send(self, body: bytes) -> Response | HTTPValidationError | None:
+        response: httpx.Response = await self.config.api_client.arequest(
+            method=RequestMethod.POST,
+            path=Routes.protect_invoke,
+            content_headers=self._content_headers,
+            content=body,
+            return_raw_response=True,
+        )
+        if response.status_code == 200:
+            try:
+                return Response.model_validate_json(response.content)
+            except ValidationError:
+                pass
+        # Not a Protect response: let the generated client parse it, or raise the matching API error.
+        return _to_core_response(
+            invoke_protect_invoke_post._parse_response(client=self.config.api_client, response=response)
+        )
+
+    def invoke(self, payload: Payload) -> Response | HTTPValidationError | None:
+        """
+        Invoke Protect with the given payload.
+
+        Parameters
+        ----------
+        payload
+            Payload to be processed.
+
+        Returns
+        -------
+        Protect invoke results.
+        """
+        return async_run(self.ainvoke(payload))
+
+    async def ainvoke_many(
+        self,
+        payloads: Sequence[Payload],
+        max_concurrency: int = MAX_CONCURRENCY,
+        call_timeout: float | None = None,
+        logger: "GalileoLogger | None" = None,
+    ) -> ProtectBatchResult:
+        """
+        Asynchronously invoke Protect on each of the given payloads, concurrently.
+
+        A failed invocation does not stop the others: its exception is reported in the result's ``errors``.
+
+        Parameters
+        ----------
+        payloads
+            Payloads to be processed.
+        max_concurrency
+            Maximum number of invocations in flight at once. Defaults to MAX_CONCURRENCY.
+        call_timeout
+            Timeout of each invocation in seconds, including the time spent waiting for a response. If None, only the
+            API client's request timeout applies.
+        logger
+            If set, each result is logged to this logger as a Protect span, in the order of the payloads. The logger
+            must have a trace (or span) to add them to.
+
+        Returns
+        -------
+        ProtectBatchResult
+            The results in the order of the payloads, and the errors of the failed invocations.
+        """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be a positive integer")
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def invoke(payload: Payload) -> Response | HTTPValidationError | None:
+            async with semaphore:
+                return await asyncio.wait_for(self.ainvoke(payload), timeout=call_timeout)
+
+        outcomes = await asyncio.gather(*(invoke(payload) for payload in payloads), return_exceptions=True)
+        batch = ProtectBatchResult(results=[])
+        for index, outcome in enumerate(outcomes):
+            if isinstance(outcome, asyncio.TimeoutError):
+                outcome = TimeoutError(f"Protect invocation did not complete within {call_timeout} seconds")
+            if isinstance(outcome, Exception):
+                batch.errors[index] = outcome
+                batch.results.append(None)
+            elif isinstance(outcome, BaseException):
+                raise outcome
+            else:
+                batch.results.append(outcome)
+        if logger is not None:
+            for index, payload in enumerate(payloads):
+                _log_protect_span(logger, payload, batch.results[index], batch.errors.get(index))
+        return batch
+
+    def invoke_many(
+        self,
+        payloads: Sequence[Payload],
+        max_concurrency: int = MAX_CONCURRENCY,
+        call_timeout: float | None = None,
+        logger: "GalileoLogger | None" = None,
+    ) -> ProtectBatchResult:
+        """
+        Invoke Protect on each of the given payloads, concurrently.
+
+        See ``ainvoke_many`` for the parameters.
+
+        Returns
+        -------
+        ProtectBatchResult
+            The results in the order of the payloads, and the errors of the failed invocations.
+        """
+        return async_run(
+            self.ainvoke_many(payloads, max_concurrency=max_concurrency, call_timeout=call_timeout, logger=logger)
+        )
+
+
+def _encode_static_fields(static_fields: dict[str, Any]) -> str:
+    # The body is `{"payload":<payload>,<static fields>}`, so keep the static fields without their opening brace.
+    static_json = json.dumps(static_fields, separators=(",", ":")).removeprefix("{")
+    return static_json if static_json == "}" else "," + static_json
+
+
+def _encode_body(payload: Payload, static_json: str) -> bytes:
+    return f'{{"payload":{payload.model_dump_json()}{static_json}'.encode()
+
 
-        if isinstance(response, APIResponse):
-            return Response.model_validate(response.to_dict())
-        return response
+def _log_protect_span(
+    logger: "GalileoLogger", payload: Payload, result: Response | HTTPValidationError | None, error: Exception | None
+) -> None:
+    if isinstance(result, Response):
+        logger.add_protect_span(payload=payload, response=result, status_code=200)
+    elif isinstance(result, HTTPValidationError):
+        logger.add_protect_span(payload=payload, status_code=422)
+    else:
+        logger.add_protect_span(payload=payload, status_code=getattr(error, "status_code", None))
 
 
 async def ainvoke_protect(
@@ -70,6 +447,7 @@ async def ainvoke_protect(
     timeout: float = TIMEOUT_SECS,
     metadata: dict[str, str] | None = None,
     headers: dict[str, str] | None = None,
+    cache: ProtectCache | None = None,
 ) -> Response | HTTPValidationError | None:
     """Asynchronously invoke Protect with the given payload.
 
@@ -103,6 +481,9 @@ async def ainvoke_protect(
         Metadata to be added when responding.
     headers
         Headers to be added to the response.
+    cache
+        If set, responses are cached in it and identical invocations are answered from it. See ``ProtectCache`` for
+        when responses are not cached.
 
     Returns
     -------
@@ -119,6 +500,7 @@ async def ainvoke_protect(
         timeout=timeout,
         metadata=metadata,
         headers=headers,
+        cache=cache,
     )
 
 
@@ -133,6 +515,7 @@ def invoke_protect(
     timeout: float = TIMEOUT_SECS,
     metadata: dict[str, str] | None = None,
     headers: dict[str, str] | None = None,
+    cache: ProtectCache | None = None,
 ) -> Response | HTTPValidationError | None:
     """Invoke Protect with the given payload.
 
@@ -166,6 +549,9 @@ def invoke_protect(
         Metadata to be added when responding.
     headers
         Headers to be added to the response.
+    cache
+        If set, responses are cached in it and identical invocations are answered from it. See ``ProtectCache`` for
+        when responses are not cached.
 
     Returns
     -------
@@ -183,5 +569,6 @@ def invoke_protect(
             timeout=timeout,
             metadata=metadata,
             headers=headers,
+            cache=cache,
         )
     )
@@ -0,0 +1,200 @@
+import asyncio
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Sequence
+from concurrent.futures import Future
+from dataclasses import dataclass
+from typing import Any
+
+from galileo_core.schemas.protect.action import ActionType, OverrideAction
+from galileo_core.schemas.protect.response import Response
+from galileo_core.schemas.protect.ruleset import Ruleset
+
+DEFAULT_MAX_ENTRIES = 1024
+DEFAULT_TTL_SECONDS = 60.0
+# Result of an in-flight request whose caller was cancelled before it completed.
+_ABANDONED = object()
+
+
+@dataclass(frozen=True)
+class ProtectCacheStats:
+    """
+    A snapshot of the usage of a ``ProtectCache``.
+
+    Attributes
+    ----------
+    hits : int
+        Invocations answered from the cache.
+    misses : int
+        Invocations sent to Protect.
+    deduplicated : int
+        Invocations that waited for an identical one in flight instead of sending their own. Also counted as hits.
+    evictions : int
+        Entries removed to stay within ``max_entries``.
+    size : int
+        Entries currently cached, including expired ones that have not been looked up since.
+    """
+
+    hits: int
+    misses: int
+    deduplicated: int
+    evictions: int
+    size: int
+
+    @property
+    def hit_rate(self) -> float:
+        """The fraction of invocations answered from the cache, or 0 if there were none."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class ProtectCache:
+    """
+    In-memory LRU cache of Protect responses, for services that see the same payloads repeatedly.
+
+    Entries are keyed on a hash of the whole Protect request: the payload, the stage (ID, name, project and version),
+    the rulesets, and the metadata and headers echoed in the response. They expire after ``ttl_seconds``, so changes
+    to a central stage are picked up within that time, and the least recently used entries are evicted beyond
+    ``max_entries``. Concurrent invocations with the same key, on any thread or event loop, share a single request; if
+    the caller that sent it is cancelled, one of the others sends it again.
+
+    Only successful responses are cached. Caching is skipped when it would change behavior:
+
+    - for local rulesets with an override action that picks one of several choices at random, or that notifies
+      subscriptions when it is applied;
+    - for central stages, whose rulesets are not known to the client, when the response was overridden.
+
+    Parameters
+    ----------
+    max_entries : int
+        Maximum number of cached responses. Defaults to 1024.
+    ttl_seconds : float
+        How long a response is cached, in seconds. Defaults to 60.
+
+    Examples
+    --------
+    >>> cache = ProtectCache(max_entries=10_000, ttl_seconds=300)
+    >>> response = invoke_protect(payload=Payload(input="Hello!"), stage_id=stage_id, cache=cache)
+    >>> cache.stats().hit_rate
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES, ttl_seconds: float = DEFAULT_TTL_SECONDS) -> None:
+        if max_entries < 1:
+            raise ValueError("max_entries must be a positive integer")
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[str, tuple[float, Response]] = OrderedDict()
+        self._in_flight: dict[str, Future] = {}
+        self._hits = 0
+        self._misses = 0
+        self._deduplicated = 0
+        self._evictions = 0
+
+    @staticmethod
+    def key(request_body: bytes) -> str:
+        """Return the cache key of the serialized Protect request ``request_body``."""
+        return hashlib.sha256(request_body).hexdigest()
+
+    @staticmethod
+    def accepts(rulesets: Sequence[Ruleset] | None) -> bool:
+        """Whether responses for ``rulesets`` can be cached: their actions are deterministic and notify no one."""
+        for ruleset in rulesets or []:
+            action = ruleset.action
+            if action.subscriptions or (isinstance(action, OverrideAction) and len(action.choices) > 1):
+                return False
+        return True
+
+    async def get_or_invoke(self, key: str, invoke: Callable[[], Awaitable[Any]], central_stage: bool = False) -> Any:
+        """
+        Return the cached response of ``key``, or call ``invoke`` and cache its response.
+
+        Parameters
+        ----------
+        key : str
+            The cache key of the request.
+        invoke : Callable[[], Awaitable[Any]]
+            Sends the request. Only ``Response`` results are cached, and exceptions are raised and not cached.
+        central_stage : bool
+            Whether the request uses a central stage, so overridden responses are not cached.
+
+        Returns
+        -------
+        Any
+            The cached or new result.
+        """
+        while True:
+            with self._lock:
+                entry = self._entries.get(key)
+                if entry is not None and time.monotonic() - entry[0] < self.ttl_seconds:
+                    self._entries.move_to_end(key)
+                    self._hits += 1
+                    # Callers get their own copy, so changing a response does not change the cached one.
+                    return _copy(entry[1])
+                in_flight = self._in_flight.get(key)
+                if in_flight is None:
+                    self._misses += 1
+                    future: Future = Future()
+                    self._in_flight[key] = future
+                    break
+            # A concurrent.futures.Future can be awaited from any event loop, unlike an asyncio one. The shield keeps a
+            # cancelled waiter from cancelling the request that the others are waiting for.
+            result = await asyncio.shield(asyncio.wrap_future(in_flight))
+            if result is not _ABANDONED:
+                with self._lock:
+                    self._hits += 1
+                    self._deduplicated += 1
+                return _copy(result)
+            # The caller that sent the request was cancelled before it completed: take over and send it again.
+
+        try:
+            result = await invoke()
+        except Exception as e:
+            with self._lock:
+                del self._in_flight[key]
+            future.set_exception(e)
+            raise
+        except BaseException:
+            # Cancellation (e.g. by the caller's timeout) only concerns this caller, so the waiters are released to
+            # send the request themselves rather than being cancelled too.
+            with self._lock:
+                del self._in_flight[key]
+            future.set_result(_ABANDONED)
+            raise
+        with self._lock:
+            del self._in_flight[key]
+            if isinstance(result, Response) and not (central_stage and _is_overridden(result)):
+                self._entries[key] = (time.monotonic(), _copy(result))
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+                    self._evictions += 1
+        future.set_result(result)
+        return result
+
+    def clear(self) -> None:
+        """Remove every entry. Requests in flight are not affected."""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> ProtectCacheStats:
+        """Return a snapshot of the usage of the cache."""
+        with self._lock:
+            return ProtectCacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                deduplicated=self._deduplicated,
+                evictions=self._evictions,
+                size=len(self._entries),
+            )
+
+
+def _copy(result: Any) -> Any:
+    return result.model_copy(deep=True) if isinstance(result, Response) else result
+
+
+def _is_overridden(response: Response) -> bool:
+    action_result = (response.model_extra or {}).get("action_result")
+    return isinstance(action_result, dict) and action_result.get("type") == ActionType.OVERRIDE.value
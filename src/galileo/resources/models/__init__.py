@@ -1,1347 +1,2539 @@
-"""Contains all the data models used in inputs/outputs."""
+"""Contains all the data models used in inputs/outputs.
 
-from .action_result import ActionResult
-from .action_type import ActionType
-from .add_records_to_queue_request import AddRecordsToQueueRequest
-from .add_records_to_queue_response import AddRecordsToQueueResponse
-from .agent_span import AgentSpan
-from .agent_span_dataset_metadata import AgentSpanDatasetMetadata
-from .agent_span_user_metadata import AgentSpanUserMetadata
-from .agent_type import AgentType
-from .agentic_session_success_scorer import AgenticSessionSuccessScorer
-from .agentic_session_success_scorer_type import AgenticSessionSuccessScorerType
-from .agentic_session_success_template import AgenticSessionSuccessTemplate
-from .agentic_session_success_template_response_schema_type_0 import AgenticSessionSuccessTemplateResponseSchemaType0
-from .agentic_workflow_success_scorer import AgenticWorkflowSuccessScorer
-from .agentic_workflow_success_scorer_type import AgenticWorkflowSuccessScorerType
-from .agentic_workflow_success_template import AgenticWorkflowSuccessTemplate
-from .agentic_workflow_success_template_response_schema_type_0 import AgenticWorkflowSuccessTemplateResponseSchemaType0
-from .aggregated_trace_view_edge import AggregatedTraceViewEdge
-from .aggregated_trace_view_graph import AggregatedTraceViewGraph
-from .aggregated_trace_view_node import AggregatedTraceViewNode
-from .aggregated_trace_view_node_metrics import AggregatedTraceViewNodeMetrics
-from .aggregated_trace_view_request import AggregatedTraceViewRequest
-from .aggregated_trace_view_response import AggregatedTraceViewResponse
-from .and_node_log_records_filter import AndNodeLogRecordsFilter
-from .annotation_aggregate import AnnotationAggregate
-from .annotation_agreement_aggregate import AnnotationAgreementAggregate
-from .annotation_agreement_bucket import AnnotationAgreementBucket
-from .annotation_choice_aggregate import AnnotationChoiceAggregate
-from .annotation_choice_aggregate_counts import AnnotationChoiceAggregateCounts
-from .annotation_like_dislike_aggregate import AnnotationLikeDislikeAggregate
-from .annotation_queue_action import AnnotationQueueAction
-from .annotation_queue_count_request import AnnotationQueueCountRequest
-from .annotation_queue_count_response import AnnotationQueueCountResponse
-from .annotation_queue_created_at_filter import AnnotationQueueCreatedAtFilter
-from .annotation_queue_created_at_filter_operator import AnnotationQueueCreatedAtFilterOperator
-from .annotation_queue_created_at_sort import AnnotationQueueCreatedAtSort
-from .annotation_queue_created_by_sort import AnnotationQueueCreatedBySort
-from .annotation_queue_details_response import AnnotationQueueDetailsResponse
-from .annotation_queue_details_response_annotation_aggregates_by_annotator_type_0 import (
-    AnnotationQueueDetailsResponseAnnotationAggregatesByAnnotatorType0,
-)
-from .annotation_queue_details_response_annotation_aggregates_by_annotator_type_0_additional_property import (
-    AnnotationQueueDetailsResponseAnnotationAggregatesByAnnotatorType0AdditionalProperty,
-)
-from .annotation_queue_details_response_annotation_aggregates_type_0 import (
-    AnnotationQueueDetailsResponseAnnotationAggregatesType0,
-)
-from .annotation_queue_export_request import AnnotationQueueExportRequest
-from .annotation_queue_export_url_response import AnnotationQueueExportUrlResponse
-from .annotation_queue_id_filter import AnnotationQueueIDFilter
-from .annotation_queue_id_filter_operator import AnnotationQueueIDFilterOperator
-from .annotation_queue_name_filter import AnnotationQueueNameFilter
-from .annotation_queue_name_filter_operator import AnnotationQueueNameFilterOperator
-from .annotation_queue_name_sort import AnnotationQueueNameSort
-from .annotation_queue_num_annotators_filter import AnnotationQueueNumAnnotatorsFilter
-from .annotation_queue_num_annotators_filter_operator import AnnotationQueueNumAnnotatorsFilterOperator
-from .annotation_queue_num_annotators_sort import AnnotationQueueNumAnnotatorsSort
-from .annotation_queue_num_log_records_filter import AnnotationQueueNumLogRecordsFilter
-from .annotation_queue_num_log_records_filter_operator import AnnotationQueueNumLogRecordsFilterOperator
-from .annotation_queue_num_log_records_sort import AnnotationQueueNumLogRecordsSort
-from .annotation_queue_num_templates_filter import AnnotationQueueNumTemplatesFilter
-from .annotation_queue_num_templates_filter_operator import AnnotationQueueNumTemplatesFilterOperator
-from .annotation_queue_num_templates_sort import AnnotationQueueNumTemplatesSort
-from .annotation_queue_num_users_filter import AnnotationQueueNumUsersFilter
-from .annotation_queue_num_users_filter_operator import AnnotationQueueNumUsersFilterOperator
-from .annotation_queue_num_users_sort import AnnotationQueueNumUsersSort
-from .annotation_queue_overall_progress_filter import AnnotationQueueOverallProgressFilter
-from .annotation_queue_overall_progress_filter_operator import AnnotationQueueOverallProgressFilterOperator
-from .annotation_queue_overall_progress_sort import AnnotationQueueOverallProgressSort
-from .annotation_queue_partial_search_request import AnnotationQueuePartialSearchRequest
-from .annotation_queue_project_filter import AnnotationQueueProjectFilter
-from .annotation_queue_records_by_filter_tree import AnnotationQueueRecordsByFilterTree
-from .annotation_queue_records_by_record_i_ds import AnnotationQueueRecordsByRecordIDs
-from .annotation_queue_response import AnnotationQueueResponse
-from .annotation_queue_response_num_logs_annotated_type_0 import AnnotationQueueResponseNumLogsAnnotatedType0
-from .annotation_queue_response_progress_type_0 import AnnotationQueueResponseProgressType0
-from .annotation_queue_updated_at_filter import AnnotationQueueUpdatedAtFilter
-from .annotation_queue_updated_at_filter_operator import AnnotationQueueUpdatedAtFilterOperator
-from .annotation_queue_updated_at_sort import AnnotationQueueUpdatedAtSort
-from .annotation_queue_user_collaborator_create import AnnotationQueueUserCollaboratorCreate
-from .annotation_queue_user_collaborator_update import AnnotationQueueUserCollaboratorUpdate
-from .annotation_rating_create import AnnotationRatingCreate
-from .annotation_rating_db import AnnotationRatingDB
-from .annotation_rating_info import AnnotationRatingInfo
-from .annotation_score_aggregate import AnnotationScoreAggregate
-from .annotation_star_aggregate import AnnotationStarAggregate
-from .annotation_star_aggregate_counts import AnnotationStarAggregateCounts
-from .annotation_tags_aggregate import AnnotationTagsAggregate
-from .annotation_tags_aggregate_counts import AnnotationTagsAggregateCounts
-from .annotation_template_create import AnnotationTemplateCreate
-from .annotation_template_db import AnnotationTemplateDB
-from .annotation_template_reorder import AnnotationTemplateReorder
-from .annotation_template_update import AnnotationTemplateUpdate
-from .annotation_text_aggregate import AnnotationTextAggregate
-from .annotation_tree_choice_aggregate import AnnotationTreeChoiceAggregate
-from .annotation_tree_choice_aggregate_counts import AnnotationTreeChoiceAggregateCounts
-from .annotation_type import AnnotationType
-from .anthropic_authentication_type import AnthropicAuthenticationType
-from .anthropic_integration import AnthropicIntegration
-from .anthropic_integration_create import AnthropicIntegrationCreate
-from .anthropic_integration_create_custom_header_mapping_type_0 import (
-    AnthropicIntegrationCreateCustomHeaderMappingType0,
-)
-from .anthropic_integration_custom_header_mapping_type_0 import AnthropicIntegrationCustomHeaderMappingType0
-from .anthropic_integration_extra_type_0 import AnthropicIntegrationExtraType0
-from .api_key_action import ApiKeyAction
-from .api_key_login_request import ApiKeyLoginRequest
-from .auth_method import AuthMethod
-from .available_integrations import AvailableIntegrations
-from .aws_bedrock_integration import AwsBedrockIntegration
-from .aws_bedrock_integration_extra_type_0 import AwsBedrockIntegrationExtraType0
-from .aws_bedrock_integration_inference_profiles import AwsBedrockIntegrationInferenceProfiles
-from .aws_credential_type import AwsCredentialType
-from .aws_sage_maker_integration import AwsSageMakerIntegration
-from .aws_sage_maker_integration_create import AwsSageMakerIntegrationCreate
-from .aws_sage_maker_integration_create_inference_profiles import AwsSageMakerIntegrationCreateInferenceProfiles
-from .aws_sage_maker_integration_create_token import AwsSageMakerIntegrationCreateToken
-from .aws_sage_maker_integration_extra_type_0 import AwsSageMakerIntegrationExtraType0
-from .azure_authentication_type import AzureAuthenticationType
-from .azure_integration import AzureIntegration
-from .azure_integration_create import AzureIntegrationCreate
-from .azure_integration_create_custom_header_mapping_type_0 import AzureIntegrationCreateCustomHeaderMappingType0
-from .azure_integration_create_default_headers_type_0 import AzureIntegrationCreateDefaultHeadersType0
-from .azure_integration_create_deployments import AzureIntegrationCreateDeployments
-from .azure_integration_custom_header_mapping_type_0 import AzureIntegrationCustomHeaderMappingType0
-from .azure_integration_default_headers_type_0 import AzureIntegrationDefaultHeadersType0
-from .azure_integration_deployments import AzureIntegrationDeployments
-from .azure_integration_extra_type_0 import AzureIntegrationExtraType0
-from .azure_model_deployment import AzureModelDeployment
-from .base_aws_integration_create import BaseAwsIntegrationCreate
-from .base_aws_integration_create_inference_profiles import BaseAwsIntegrationCreateInferenceProfiles
-from .base_aws_integration_create_token import BaseAwsIntegrationCreateToken
-from .base_finetuned_scorer_db import BaseFinetunedScorerDB
-from .base_finetuned_scorer_db_class_name_to_vocab_ix_type_0 import BaseFinetunedScorerDBClassNameToVocabIxType0
-from .base_finetuned_scorer_db_class_name_to_vocab_ix_type_1 import BaseFinetunedScorerDBClassNameToVocabIxType1
-from .base_generated_scorer_db import BaseGeneratedScorerDB
-from .base_metric_roll_up_config_db import BaseMetricRollUpConfigDB
-from .base_prompt_template_response import BasePromptTemplateResponse
-from .base_prompt_template_version import BasePromptTemplateVersion
-from .base_prompt_template_version_response import BasePromptTemplateVersionResponse
-from .base_registered_scorer_db import BaseRegisteredScorerDB
-from .base_scorer import BaseScorer
-from .base_scorer_aggregates_type_0 import BaseScorerAggregatesType0
-from .base_scorer_class_name_to_vocab_ix_type_0 import BaseScorerClassNameToVocabIxType0
-from .base_scorer_class_name_to_vocab_ix_type_1 import BaseScorerClassNameToVocabIxType1
-from .base_scorer_extra_type_0 import BaseScorerExtraType0
-from .base_scorer_version_db import BaseScorerVersionDB
-from .base_scorer_version_response import BaseScorerVersionResponse
-from .bleu_scorer import BleuScorer
-from .body_create_code_scorer_version_scorers_scorer_id_version_code_post import (
-    BodyCreateCodeScorerVersionScorersScorerIdVersionCodePost,
-)
-from .body_create_dataset_datasets_post import BodyCreateDatasetDatasetsPost
-from .body_login_email_login_post import BodyLoginEmailLoginPost
-from .body_manual_llm_validate_multipart_scorers_llm_validate_multipart_post import (
-    BodyManualLlmValidateMultipartScorersLlmValidateMultipartPost,
-)
-from .body_validate_code_scorer_dataset_scorers_code_validate_dataset_post import (
-    BodyValidateCodeScorerDatasetScorersCodeValidateDatasetPost,
-)
-from .body_validate_code_scorer_log_record_scorers_code_validate_log_record_post import (
-    BodyValidateCodeScorerLogRecordScorersCodeValidateLogRecordPost,
-)
-from .body_validate_code_scorer_scorers_code_validate_post import BodyValidateCodeScorerScorersCodeValidatePost
-from .boolean_color_constraint import BooleanColorConstraint
-from .bucketed_metric import BucketedMetric
-from .bucketed_metric_buckets import BucketedMetricBuckets
-from .bucketed_metrics import BucketedMetrics
-from .bulk_delete_datasets_request import BulkDeleteDatasetsRequest
-from .bulk_delete_datasets_response import BulkDeleteDatasetsResponse
-from .bulk_delete_failure import BulkDeleteFailure
-from .bulk_delete_prompt_templates_request import BulkDeletePromptTemplatesRequest
-from .categorical_color_constraint import CategoricalColorConstraint
-from .categorical_color_constraint_operator import CategoricalColorConstraintOperator
-from .categorical_metric_info import CategoricalMetricInfo
-from .categorical_metric_info_category_counts import CategoricalMetricInfoCategoryCounts
-from .categorical_roll_up_method import CategoricalRollUpMethod
-from .chain_aggregation_strategy import ChainAggregationStrategy
-from .chain_poll_template import ChainPollTemplate
-from .chain_poll_template_response_schema_type_0 import ChainPollTemplateResponseSchemaType0
-from .choice_aggregate import ChoiceAggregate
-from .choice_aggregate_counts import ChoiceAggregateCounts
-from .choice_constraints import ChoiceConstraints
-from .choice_rating import ChoiceRating
-from .chunk_attribution_utilization_scorer import ChunkAttributionUtilizationScorer
-from .chunk_attribution_utilization_scorer_type import ChunkAttributionUtilizationScorerType
-from .chunk_attribution_utilization_template import ChunkAttributionUtilizationTemplate
-from .chunk_attribution_utilization_template_response_schema_type_0 import (
-    ChunkAttributionUtilizationTemplateResponseSchemaType0,
-)
-from .code_metric_generation_status import CodeMetricGenerationStatus
-from .code_metric_generation_status_response import CodeMetricGenerationStatusResponse
-from .collaborator_role import CollaboratorRole
-from .collaborator_role_info import CollaboratorRoleInfo
-from .collaborator_update import CollaboratorUpdate
-from .column_category import ColumnCategory
-from .column_info import ColumnInfo
-from .column_mapping import ColumnMapping
-from .column_mapping_config import ColumnMappingConfig
-from .column_mapping_mgt_type_0 import ColumnMappingMgtType0
-from .completeness_scorer import CompletenessScorer
-from .completeness_scorer_type import CompletenessScorerType
-from .completeness_template import CompletenessTemplate
-from .completeness_template_response_schema_type_0 import CompletenessTemplateResponseSchemaType0
-from .compute_health_score_request import ComputeHealthScoreRequest
-from .compute_health_score_request_mgt_overlay import ComputeHealthScoreRequestMgtOverlay
-from .content_modality import ContentModality
-from .context_adherence_scorer import ContextAdherenceScorer
-from .context_adherence_scorer_type import ContextAdherenceScorerType
-from .context_relevance_scorer import ContextRelevanceScorer
-from .control_action import ControlAction
-from .control_applies_to import ControlAppliesTo
-from .control_check_stage import ControlCheckStage
-from .control_resource_action import ControlResourceAction
-from .control_result import ControlResult
-from .control_span import ControlSpan
-from .control_span_dataset_metadata import ControlSpanDatasetMetadata
-from .control_span_user_metadata import ControlSpanUserMetadata
-from .core_scorer_name import CoreScorerName
-from .correctness_scorer import CorrectnessScorer
-from .cost_interval import CostInterval
-from .create_annotation_queue_request import CreateAnnotationQueueRequest
-from .create_code_metric_generation_request import CreateCodeMetricGenerationRequest
-from .create_code_metric_generation_response import CreateCodeMetricGenerationResponse
-from .create_custom_luna_scorer_version_request import CreateCustomLunaScorerVersionRequest
-from .create_job_request import CreateJobRequest
-from .create_job_request_validation_config_type_0 import CreateJobRequestValidationConfigType0
-from .create_job_response import CreateJobResponse
-from .create_job_response_validation_config_type_0 import CreateJobResponseValidationConfigType0
-from .create_llm_scorer_autogen_request import CreateLLMScorerAutogenRequest
-from .create_llm_scorer_version_request import CreateLLMScorerVersionRequest
-from .create_prompt_template_with_version_request_body import CreatePromptTemplateWithVersionRequestBody
-from .create_queue_template_request import CreateQueueTemplateRequest
-from .create_scorer_request import CreateScorerRequest
-from .create_scorer_version_request import CreateScorerVersionRequest
-from .create_update_registered_scorer_response import CreateUpdateRegisteredScorerResponse
-from .custom_authentication_type import CustomAuthenticationType
-from .custom_llm_config import CustomLLMConfig
-from .custom_llm_config_init_kwargs_type_0 import CustomLLMConfigInitKwargsType0
-from .customized_agentic_session_success_gpt_scorer import CustomizedAgenticSessionSuccessGPTScorer
-from .customized_agentic_session_success_gpt_scorer_aggregates_type_0 import (
-    CustomizedAgenticSessionSuccessGPTScorerAggregatesType0,
-)
-from .customized_agentic_session_success_gpt_scorer_class_name_to_vocab_ix_type_0 import (
-    CustomizedAgenticSessionSuccessGPTScorerClassNameToVocabIxType0,
-)
-from .customized_agentic_session_success_gpt_scorer_class_name_to_vocab_ix_type_1 import (
-    CustomizedAgenticSessionSuccessGPTScorerClassNameToVocabIxType1,
-)
-from .customized_agentic_session_success_gpt_scorer_extra_type_0 import (
-    CustomizedAgenticSessionSuccessGPTScorerExtraType0,
-)
-from .customized_agentic_workflow_success_gpt_scorer import CustomizedAgenticWorkflowSuccessGPTScorer
-from .customized_agentic_workflow_success_gpt_scorer_aggregates_type_0 import (
-    CustomizedAgenticWorkflowSuccessGPTScorerAggregatesType0,
-)
-from .customized_agentic_workflow_success_gpt_scorer_class_name_to_vocab_ix_type_0 import (
-    CustomizedAgenticWorkflowSuccessGPTScorerClassNameToVocabIxType0,
-)
-from .customized_agentic_workflow_success_gpt_scorer_class_name_to_vocab_ix_type_1 import (
-    CustomizedAgenticWorkflowSuccessGPTScorerClassNameToVocabIxType1,
-)
-from .customized_agentic_workflow_success_gpt_scorer_extra_type_0 import (
-    CustomizedAgenticWorkflowSuccessGPTScorerExtraType0,
-)
-from .customized_chunk_attribution_utilization_gpt_scorer import CustomizedChunkAttributionUtilizationGPTScorer
-from .customized_chunk_attribution_utilization_gpt_scorer_aggregates_type_0 import (
-    CustomizedChunkAttributionUtilizationGPTScorerAggregatesType0,
-)
-from .customized_chunk_attribution_utilization_gpt_scorer_class_name_to_vocab_ix_type_0 import (
-    CustomizedChunkAttributionUtilizationGPTScorerClassNameToVocabIxType0,
-)
-from .customized_chunk_attribution_utilization_gpt_scorer_class_name_to_vocab_ix_type_1 import (
-    CustomizedChunkAttributionUtilizationGPTScorerClassNameToVocabIxType1,
-)
-from .customized_chunk_attribution_utilization_gpt_scorer_extra_type_0 import (
-    CustomizedChunkAttributionUtilizationGPTScorerExtraType0,
-)
-from .customized_completeness_gpt_scorer import CustomizedCompletenessGPTScorer
-from .customized_completeness_gpt_scorer_aggregates_type_0 import CustomizedCompletenessGPTScorerAggregatesType0
-from .customized_completeness_gpt_scorer_class_name_to_vocab_ix_type_0 import (
-    CustomizedCompletenessGPTScorerClassNameToVocabIxType0,
-)
-from .customized_completeness_gpt_scorer_class_name_to_vocab_ix_type_1 import (
-    CustomizedCompletenessGPTScorerClassNameToVocabIxType1,
-)
-from .customized_completeness_gpt_scorer_extra_type_0 import CustomizedCompletenessGPTScorerExtraType0
-from .customized_factuality_gpt_scorer import CustomizedFactualityGPTScorer
-from .customized_factuality_gpt_scorer_aggregates_type_0 import CustomizedFactualityGPTScorerAggregatesType0
-from .customized_factuality_gpt_scorer_class_name_to_vocab_ix_type_0 import (
-    CustomizedFactualityGPTScorerClassNameToVocabIxType0,
-)
-from .customized_factuality_gpt_scorer_class_name_to_vocab_ix_type_1 import (
-    CustomizedFactualityGPTScorerClassNameToVocabIxType1,
-)
-from .customized_factuality_gpt_scorer_extra_type_0 import CustomizedFactualityGPTScorerExtraType0
-from .customized_ground_truth_adherence_gpt_scorer import CustomizedGroundTruthAdherenceGPTScorer
-from .customized_ground_truth_adherence_gpt_scorer_aggregates_type_0 import (
-    CustomizedGroundTruthAdherenceGPTScorerAggregatesType0,
-)
-from .customized_ground_truth_adherence_gpt_scorer_class_name_to_vocab_ix_type_0 import (
-    CustomizedGroundTruthAdherenceGPTScorerClassNameToVocabIxType0,
-)
-from .customized_ground_truth_adherence_gpt_scorer_class_name_to_vocab_ix_type_1 import (
-    CustomizedGroundTruthAdherenceGPTScorerClassNameToVocabIxType1,
-)
-from .customized_ground_truth_adherence_gpt_scorer_extra_type_0 import CustomizedGroundTruthAdherenceGPTScorerExtraType0
-from .customized_groundedness_gpt_scorer import CustomizedGroundednessGPTScorer
-from .customized_groundedness_gpt_scorer_aggregates_type_0 import CustomizedGroundednessGPTScorerAggregatesType0
-from .customized_groundedness_gpt_scorer_class_name_to_vocab_ix_type_0 import (
-    CustomizedGroundednessGPTScorerClassNameToVocabIxType0,
-)
-from .customized_groundedness_gpt_scorer_class_name_to_vocab_ix_type_1 import (
-    CustomizedGroundednessGPTScorerClassNameToVocabIxType1,
-)
-from .customized_groundedness_gpt_scorer_extra_type_0 import CustomizedGroundednessGPTScorerExtraType0
-from .customized_input_sexist_gpt_scorer import CustomizedInputSexistGPTScorer
-from .customized_input_sexist_gpt_scorer_aggregates_type_0 import CustomizedInputSexistGPTScorerAggregatesType0
-from .customized_input_sexist_gpt_scorer_class_name_to_vocab_ix_type_0 import (
-    CustomizedInputSexistGPTScorerClassNameToVocabIxType0,
-)
-from .customized_input_sexist_gpt_scorer_class_name_to_vocab_ix_type_1 import (
-    CustomizedInputSexistGPTScorerClassNameToVocabIxType1,
-)
-from .customized_input_sexist_gpt_scorer_extra_type_0 import CustomizedInputSexistGPTScorerExtraType0
-from .customized_input_toxicity_gpt_scorer import CustomizedInputToxicityGPTScorer
-from .customized_input_toxicity_gpt_scorer_aggregates_type_0 import CustomizedInputToxicityGPTScorerAggregatesType0
-from .customized_input_toxicity_gpt_scorer_class_name_to_vocab_ix_type_0 import (
-    CustomizedInputToxicityGPTScorerClassNameToVocabIxType0,
-)
-from .customized_input_toxicity_gpt_scorer_class_name_to_vocab_ix_type_1 import (
-    CustomizedInputToxicityGPTScorerClassNameToVocabIxType1,
-)
-from .customized_input_toxicity_gpt_scorer_extra_type_0 import CustomizedInputToxicityGPTScorerExtraType0
-from .customized_instruction_adherence_gpt_scorer import CustomizedInstructionAdherenceGPTScorer
-from .customized_instruction_adherence_gpt_scorer_aggregates_type_0 import (
-    CustomizedInstructionAdherenceGPTScorerAggregatesType0,
-)
-from .customized_instruction_adherence_gpt_scorer_class_name_to_vocab_ix_type_0 import (
-    CustomizedInstructionAdherenceGPTScorerClassNameToVocabIxType0,
-)
-from .customized_instruction_adherence_gpt_scorer_class_name_to_vocab_ix_type_1 import (
-    CustomizedInstructionAdherenceGPTScorerClassNameToVocabIxType1,
-)
-from .customized_instruction_adherence_gpt_scorer_extra_type_0 import CustomizedInstructionAdherenceGPTScorerExtraType0
-from .customized_prompt_injection_gpt_scorer import CustomizedPromptInjectionGPTScorer
-from .customized_prompt_injection_gpt_scorer_aggregates_type_0 import CustomizedPromptInjectionGPTScorerAggregatesType0
-from .customized_prompt_injection_gpt_scorer_class_name_to_vocab_ix_type_0 import (
-    CustomizedPromptInjectionGPTScorerClassNameToVocabIxType0,
-)
-from .customized_prompt_injection_gpt_scorer_class_name_to_vocab_ix_type_1 import (
-    CustomizedPromptInjectionGPTScorerClassNameToVocabIxType1,
-)
-from .customized_prompt_injection_gpt_scorer_extra_type_0 import CustomizedPromptInjectionGPTScorerExtraType0
-from .customized_sexist_gpt_scorer import CustomizedSexistGPTScorer
-from .customized_sexist_gpt_scorer_aggregates_type_0 import CustomizedSexistGPTScorerAggregatesType0
-from .customized_sexist_gpt_scorer_class_name_to_vocab_ix_type_0 import CustomizedSexistGPTScorerClassNameToVocabIxType0
-from .customized_sexist_gpt_scorer_class_name_to_vocab_ix_type_1 import CustomizedSexistGPTScorerClassNameToVocabIxType1
-from .customized_sexist_gpt_scorer_extra_type_0 import CustomizedSexistGPTScorerExtraType0
-from .customized_tool_error_rate_gpt_scorer import CustomizedToolErrorRateGPTScorer
-from .customized_tool_error_rate_gpt_scorer_aggregates_type_0 import CustomizedToolErrorRateGPTScorerAggregatesType0
-from .customized_tool_error_rate_gpt_scorer_class_name_to_vocab_ix_type_0 import (
-    CustomizedToolErrorRateGPTScorerClassNameToVocabIxType0,
-)
-from .customized_tool_error_rate_gpt_scorer_class_name_to_vocab_ix_type_1 import (
-    CustomizedToolErrorRateGPTScorerClassNameToVocabIxType1,
-)
-from .customized_tool_error_rate_gpt_scorer_extra_type_0 import CustomizedToolErrorRateGPTScorerExtraType0
-from .customized_tool_selection_quality_gpt_scorer import CustomizedToolSelectionQualityGPTScorer
-from .customized_tool_selection_quality_gpt_scorer_aggregates_type_0 import (
-    CustomizedToolSelectionQualityGPTScorerAggregatesType0,
-)
-from .customized_tool_selection_quality_gpt_scorer_class_name_to_vocab_ix_type_0 import (
-    CustomizedToolSelectionQualityGPTScorerClassNameToVocabIxType0,
-)
-from .customized_tool_selection_quality_gpt_scorer_class_name_to_vocab_ix_type_1 import (
-    CustomizedToolSelectionQualityGPTScorerClassNameToVocabIxType1,
-)
-from .customized_tool_selection_quality_gpt_scorer_extra_type_0 import CustomizedToolSelectionQualityGPTScorerExtraType0
-from .customized_toxicity_gpt_scorer import CustomizedToxicityGPTScorer
-from .customized_toxicity_gpt_scorer_aggregates_type_0 import CustomizedToxicityGPTScorerAggregatesType0
-from .customized_toxicity_gpt_scorer_class_name_to_vocab_ix_type_0 import (
-    CustomizedToxicityGPTScorerClassNameToVocabIxType0,
-)
-from .customized_toxicity_gpt_scorer_class_name_to_vocab_ix_type_1 import (
-    CustomizedToxicityGPTScorerClassNameToVocabIxType1,
-)
-from .customized_toxicity_gpt_scorer_extra_type_0 import CustomizedToxicityGPTScorerExtraType0
-from .data_type import DataType
-from .data_type_options import DataTypeOptions
-from .data_unit import DataUnit
-from .databricks_integration import DatabricksIntegration
-from .databricks_integration_create import DatabricksIntegrationCreate
-from .databricks_integration_extra_type_0 import DatabricksIntegrationExtraType0
-from .dataset_action import DatasetAction
-from .dataset_append_row import DatasetAppendRow
-from .dataset_append_row_values import DatasetAppendRowValues
-from .dataset_append_row_values_additional_property_type_3 import DatasetAppendRowValuesAdditionalPropertyType3
-from .dataset_content import DatasetContent
-from .dataset_content_filter import DatasetContentFilter
-from .dataset_content_filter_operator import DatasetContentFilterOperator
-from .dataset_content_sort_clause import DatasetContentSortClause
-from .dataset_copy_record_data import DatasetCopyRecordData
-from .dataset_created_at_sort import DatasetCreatedAtSort
-from .dataset_data import DatasetData
-from .dataset_db import DatasetDB
-from .dataset_delete_row import DatasetDeleteRow
-from .dataset_draft_filter import DatasetDraftFilter
-from .dataset_draft_filter_operator import DatasetDraftFilterOperator
-from .dataset_filter_rows import DatasetFilterRows
-from .dataset_format import DatasetFormat
-from .dataset_id_filter import DatasetIDFilter
-from .dataset_id_filter_operator import DatasetIDFilterOperator
-from .dataset_last_edited_by_user_at_sort import DatasetLastEditedByUserAtSort
-from .dataset_name_filter import DatasetNameFilter
-from .dataset_name_filter_operator import DatasetNameFilterOperator
-from .dataset_name_sort import DatasetNameSort
-from .dataset_not_in_project_filter import DatasetNotInProjectFilter
-from .dataset_prepend_row import DatasetPrependRow
-from .dataset_prepend_row_values import DatasetPrependRowValues
-from .dataset_prepend_row_values_additional_property_type_3 import DatasetPrependRowValuesAdditionalPropertyType3
-from .dataset_project import DatasetProject
-from .dataset_project_last_used_at_sort import DatasetProjectLastUsedAtSort
-from .dataset_projects_sort import DatasetProjectsSort
-from .dataset_remove_column import DatasetRemoveColumn
-from .dataset_rename_column import DatasetRenameColumn
-from .dataset_row import DatasetRow
-from .dataset_row_metadata import DatasetRowMetadata
-from .dataset_row_values_dict import DatasetRowValuesDict
-from .dataset_row_values_dict_additional_property_type_3 import DatasetRowValuesDictAdditionalPropertyType3
-from .dataset_row_values_item_type_3 import DatasetRowValuesItemType3
-from .dataset_rows_sort import DatasetRowsSort
-from .dataset_update_row import DatasetUpdateRow
-from .dataset_update_row_values import DatasetUpdateRowValues
-from .dataset_update_row_values_additional_property_type_3 import DatasetUpdateRowValuesAdditionalPropertyType3
-from .dataset_updated_at_sort import DatasetUpdatedAtSort
-from .dataset_used_in_project_filter import DatasetUsedInProjectFilter
-from .dataset_version_db import DatasetVersionDB
-from .dataset_version_index_sort import DatasetVersionIndexSort
-from .delete_prompt_response import DeletePromptResponse
-from .delete_run_response import DeleteRunResponse
-from .delete_scorer_response import DeleteScorerResponse
-from .document import Document
-from .document_metadata import DocumentMetadata
-from .error_severity import ErrorSeverity
-from .error_type import ErrorType
-from .event_status import EventStatus
-from .execution_status import ExecutionStatus
-from .experiment_create_request import ExperimentCreateRequest
-from .experiment_dataset import ExperimentDataset
-from .experiment_dataset_request import ExperimentDatasetRequest
-from .experiment_group_id_filter import ExperimentGroupIDFilter
-from .experiment_group_name_filter import ExperimentGroupNameFilter
-from .experiment_group_name_filter_operator import ExperimentGroupNameFilterOperator
-from .experiment_metrics_request import ExperimentMetricsRequest
-from .experiment_metrics_response import ExperimentMetricsResponse
-from .experiment_phase_status import ExperimentPhaseStatus
-from .experiment_playground import ExperimentPlayground
-from .experiment_prompt import ExperimentPrompt
-from .experiment_response import ExperimentResponse
-from .experiment_response_aggregate_feedback import ExperimentResponseAggregateFeedback
-from .experiment_response_aggregate_metrics import ExperimentResponseAggregateMetrics
-from .experiment_response_rating_aggregates import ExperimentResponseRatingAggregates
-from .experiment_response_rating_aggregates_additional_property import (
-    ExperimentResponseRatingAggregatesAdditionalProperty,
-)
-from .experiment_response_structured_aggregate_metrics_type_0 import ExperimentResponseStructuredAggregateMetricsType0
-from .experiment_response_tags import ExperimentResponseTags
-from .experiment_status import ExperimentStatus
-from .experiment_update_request import ExperimentUpdateRequest
-from .experiments_available_columns_response import ExperimentsAvailableColumnsResponse
-from .extended_agent_span_record import ExtendedAgentSpanRecord
-from .extended_agent_span_record_annotation_aggregates import ExtendedAgentSpanRecordAnnotationAggregates
-from .extended_agent_span_record_annotation_agreement import ExtendedAgentSpanRecordAnnotationAgreement
-from .extended_agent_span_record_annotations import ExtendedAgentSpanRecordAnnotations
-from .extended_agent_span_record_annotations_additional_property import (
-    ExtendedAgentSpanRecordAnnotationsAdditionalProperty,
-)
-from .extended_agent_span_record_dataset_metadata import ExtendedAgentSpanRecordDatasetMetadata
-from .extended_agent_span_record_feedback_rating_info import ExtendedAgentSpanRecordFeedbackRatingInfo
-from .extended_agent_span_record_files_type_0 import ExtendedAgentSpanRecordFilesType0
-from .extended_agent_span_record_metric_info_type_0 import ExtendedAgentSpanRecordMetricInfoType0
-from .extended_agent_span_record_user_metadata import ExtendedAgentSpanRecordUserMetadata
-from .extended_agent_span_record_with_children import ExtendedAgentSpanRecordWithChildren
-from .extended_agent_span_record_with_children_annotation_aggregates import (
-    ExtendedAgentSpanRecordWithChildrenAnnotationAggregates,
-)
-from .extended_agent_span_record_with_children_annotation_agreement import (
-    ExtendedAgentSpanRecordWithChildrenAnnotationAgreement,
-)
-from .extended_agent_span_record_with_children_annotations import ExtendedAgentSpanRecordWithChildrenAnnotations
-from .extended_agent_span_record_with_children_annotations_additional_property import (
-    ExtendedAgentSpanRecordWithChildrenAnnotationsAdditionalProperty,
-)
-from .extended_agent_span_record_with_children_dataset_metadata import (
-    ExtendedAgentSpanRecordWithChildrenDatasetMetadata,
-)
-from .extended_agent_span_record_with_children_feedback_rating_info import (
-    ExtendedAgentSpanRecordWithChildrenFeedbackRatingInfo,
-)
-from .extended_agent_span_record_with_children_files_type_0 import ExtendedAgentSpanRecordWithChildrenFilesType0
-from .extended_agent_span_record_with_children_metric_info_type_0 import (
-    ExtendedAgentSpanRecordWithChildrenMetricInfoType0,
-)
-from .extended_agent_span_record_with_children_user_metadata import ExtendedAgentSpanRecordWithChildrenUserMetadata
-from .extended_control_span_record import ExtendedControlSpanRecord
-from .extended_control_span_record_annotation_aggregates import ExtendedControlSpanRecordAnnotationAggregates
-from .extended_control_span_record_annotation_agreement import ExtendedControlSpanRecordAnnotationAgreement
-from .extended_control_span_record_annotations import ExtendedControlSpanRecordAnnotations
-from .extended_control_span_record_annotations_additional_property import (
-    ExtendedControlSpanRecordAnnotationsAdditionalProperty,
-)
-from .extended_control_span_record_dataset_metadata import ExtendedControlSpanRecordDatasetMetadata
-from .extended_control_span_record_feedback_rating_info import ExtendedControlSpanRecordFeedbackRatingInfo
-from .extended_control_span_record_files_type_0 import ExtendedControlSpanRecordFilesType0
-from .extended_control_span_record_metric_info_type_0 import ExtendedControlSpanRecordMetricInfoType0
-from .extended_control_span_record_user_metadata import ExtendedControlSpanRecordUserMetadata
-from .extended_llm_span_record import ExtendedLlmSpanRecord
-from .extended_llm_span_record_annotation_aggregates import ExtendedLlmSpanRecordAnnotationAggregates
-from .extended_llm_span_record_annotation_agreement import ExtendedLlmSpanRecordAnnotationAgreement
-from .extended_llm_span_record_annotations import ExtendedLlmSpanRecordAnnotations
-from .extended_llm_span_record_annotations_additional_property import ExtendedLlmSpanRecordAnnotationsAdditionalProperty
-from .extended_llm_span_record_dataset_metadata import ExtendedLlmSpanRecordDatasetMetadata
-from .extended_llm_span_record_feedback_rating_info import ExtendedLlmSpanRecordFeedbackRatingInfo
-from .extended_llm_span_record_files_type_0 import ExtendedLlmSpanRecordFilesType0
-from .extended_llm_span_record_metric_info_type_0 import ExtendedLlmSpanRecordMetricInfoType0
-from .extended_llm_span_record_tools_type_0_item import ExtendedLlmSpanRecordToolsType0Item
-from .extended_llm_span_record_user_metadata import ExtendedLlmSpanRecordUserMetadata
-from .extended_retriever_span_record import ExtendedRetrieverSpanRecord
-from .extended_retriever_span_record_annotation_aggregates import ExtendedRetrieverSpanRecordAnnotationAggregates
-from .extended_retriever_span_record_annotation_agreement import ExtendedRetrieverSpanRecordAnnotationAgreement
-from .extended_retriever_span_record_annotations import ExtendedRetrieverSpanRecordAnnotations
-from .extended_retriever_span_record_annotations_additional_property import (
-    ExtendedRetrieverSpanRecordAnnotationsAdditionalProperty,
-)
-from .extended_retriever_span_record_dataset_metadata import ExtendedRetrieverSpanRecordDatasetMetadata
-from .extended_retriever_span_record_feedback_rating_info import ExtendedRetrieverSpanRecordFeedbackRatingInfo
-from .extended_retriever_span_record_files_type_0 import ExtendedRetrieverSpanRecordFilesType0
-from .extended_retriever_span_record_metric_info_type_0 import ExtendedRetrieverSpanRecordMetricInfoType0
-from .extended_retriever_span_record_user_metadata import ExtendedRetrieverSpanRecordUserMetadata
-from .extended_retriever_span_record_with_children import ExtendedRetrieverSpanRecordWithChildren
-from .extended_retriever_span_record_with_children_annotation_aggregates import (
-    ExtendedRetrieverSpanRecordWithChildrenAnnotationAggregates,
-)
-from .extended_retriever_span_record_with_children_annotation_agreement import (
-    ExtendedRetrieverSpanRecordWithChildrenAnnotationAgreement,
-)
-from .extended_retriever_span_record_with_children_annotations import ExtendedRetrieverSpanRecordWithChildrenAnnotations
-from .extended_retriever_span_record_with_children_annotations_additional_property import (
-    ExtendedRetrieverSpanRecordWithChildrenAnnotationsAdditionalProperty,
-)
-from .extended_retriever_span_record_with_children_dataset_metadata import (
-    ExtendedRetrieverSpanRecordWithChildrenDatasetMetadata,
-)
-from .extended_retriever_span_record_with_children_feedback_rating_info import (
-    ExtendedRetrieverSpanRecordWithChildrenFeedbackRatingInfo,
-)
-from .extended_retriever_span_record_with_children_files_type_0 import ExtendedRetrieverSpanRecordWithChildrenFilesType0
-from .extended_retriever_span_record_with_children_metric_info_type_0 import (
-    ExtendedRetrieverSpanRecordWithChildrenMetricInfoType0,
-)
-from .extended_retriever_span_record_with_children_user_metadata import (
-    ExtendedRetrieverSpanRecordWithChildrenUserMetadata,
-)
-from .extended_session_record import ExtendedSessionRecord
-from .extended_session_record_annotation_aggregates import ExtendedSessionRecordAnnotationAggregates
-from .extended_session_record_annotation_agreement import ExtendedSessionRecordAnnotationAgreement
-from .extended_session_record_annotations import ExtendedSessionRecordAnnotations
-from .extended_session_record_annotations_additional_property import ExtendedSessionRecordAnnotationsAdditionalProperty
-from .extended_session_record_dataset_metadata import ExtendedSessionRecordDatasetMetadata
-from .extended_session_record_feedback_rating_info import ExtendedSessionRecordFeedbackRatingInfo
-from .extended_session_record_files_type_0 import ExtendedSessionRecordFilesType0
-from .extended_session_record_metric_info_type_0 import ExtendedSessionRecordMetricInfoType0
-from .extended_session_record_user_metadata import ExtendedSessionRecordUserMetadata
-from .extended_session_record_with_children import ExtendedSessionRecordWithChildren
-from .extended_session_record_with_children_annotation_aggregates import (
-    ExtendedSessionRecordWithChildrenAnnotationAggregates,
-)
-from .extended_session_record_with_children_annotation_agreement import (
-    ExtendedSessionRecordWithChildrenAnnotationAgreement,
-)
-from .extended_session_record_with_children_annotations import ExtendedSessionRecordWithChildrenAnnotations
-from .extended_session_record_with_children_annotations_additional_property import (
-    ExtendedSessionRecordWithChildrenAnnotationsAdditionalProperty,
-)
-from .extended_session_record_with_children_dataset_metadata import ExtendedSessionRecordWithChildrenDatasetMetadata
-from .extended_session_record_with_children_feedback_rating_info import (
-    ExtendedSessionRecordWithChildrenFeedbackRatingInfo,
-)
-from .extended_session_record_with_children_files_type_0 import ExtendedSessionRecordWithChildrenFilesType0
-from .extended_session_record_with_children_metric_info_type_0 import ExtendedSessionRecordWithChildrenMetricInfoType0
-from .extended_session_record_with_children_user_metadata import ExtendedSessionRecordWithChildrenUserMetadata
-from .extended_tool_span_record import ExtendedToolSpanRecord
-from .extended_tool_span_record_annotation_aggregates import ExtendedToolSpanRecordAnnotationAggregates
-from .extended_tool_span_record_annotation_agreement import ExtendedToolSpanRecordAnnotationAgreement
-from .extended_tool_span_record_annotations import ExtendedToolSpanRecordAnnotations
-from .extended_tool_span_record_annotations_additional_property import (
-    ExtendedToolSpanRecordAnnotationsAdditionalProperty,
-)
-from .extended_tool_span_record_dataset_metadata import ExtendedToolSpanRecordDatasetMetadata
-from .extended_tool_span_record_feedback_rating_info import ExtendedToolSpanRecordFeedbackRatingInfo
-from .extended_tool_span_record_files_type_0 import ExtendedToolSpanRecordFilesType0
-from .extended_tool_span_record_metric_info_type_0 import ExtendedToolSpanRecordMetricInfoType0
-from .extended_tool_span_record_user_metadata import ExtendedToolSpanRecordUserMetadata
-from .extended_tool_span_record_with_children import ExtendedToolSpanRecordWithChildren
-from .extended_tool_span_record_with_children_annotation_aggregates import (
-    ExtendedToolSpanRecordWithChildrenAnnotationAggregates,
-)
-from .extended_tool_span_record_with_children_annotation_agreement import (
-    ExtendedToolSpanRecordWithChildrenAnnotationAgreement,
-)
-from .extended_tool_span_record_with_children_annotations import ExtendedToolSpanRecordWithChildrenAnnotations
-from .extended_tool_span_record_with_children_annotations_additional_property import (
-    ExtendedToolSpanRecordWithChildrenAnnotationsAdditionalProperty,
-)
-from .extended_tool_span_record_with_children_dataset_metadata import ExtendedToolSpanRecordWithChildrenDatasetMetadata
-from .extended_tool_span_record_with_children_feedback_rating_info import (
-    ExtendedToolSpanRecordWithChildrenFeedbackRatingInfo,
-)
-from .extended_tool_span_record_with_children_files_type_0 import ExtendedToolSpanRecordWithChildrenFilesType0
-from .extended_tool_span_record_with_children_metric_info_type_0 import (
-    ExtendedToolSpanRecordWithChildrenMetricInfoType0,
-)
-from .extended_tool_span_record_with_children_user_metadata import ExtendedToolSpanRecordWithChildrenUserMetadata
-from .extended_trace_record import ExtendedTraceRecord
-from .extended_trace_record_annotation_aggregates import ExtendedTraceRecordAnnotationAggregates
-from .extended_trace_record_annotation_agreement import ExtendedTraceRecordAnnotationAgreement
-from .extended_trace_record_annotations import ExtendedTraceRecordAnnotations
-from .extended_trace_record_annotations_additional_property import ExtendedTraceRecordAnnotationsAdditionalProperty
-from .extended_trace_record_dataset_metadata import ExtendedTraceRecordDatasetMetadata
-from .extended_trace_record_feedback_rating_info import ExtendedTraceRecordFeedbackRatingInfo
-from .extended_trace_record_files_type_0 import ExtendedTraceRecordFilesType0
-from .extended_trace_record_metric_info_type_0 import ExtendedTraceRecordMetricInfoType0
-from .extended_trace_record_user_metadata import ExtendedTraceRecordUserMetadata
-from .extended_trace_record_with_children import ExtendedTraceRecordWithChildren
-from .extended_trace_record_with_children_annotation_aggregates import (
-    ExtendedTraceRecordWithChildrenAnnotationAggregates,
-)
-from .extended_trace_record_with_children_annotation_agreement import ExtendedTraceRecordWithChildrenAnnotationAgreement
-from .extended_trace_record_with_children_annotations import ExtendedTraceRecordWithChildrenAnnotations
-from .extended_trace_record_with_children_annotations_additional_property import (
-    ExtendedTraceRecordWithChildrenAnnotationsAdditionalProperty,
-)
-from .extended_trace_record_with_children_dataset_metadata import ExtendedTraceRecordWithChildrenDatasetMetadata
-from .extended_trace_record_with_children_feedback_rating_info import ExtendedTraceRecordWithChildrenFeedbackRatingInfo
-from .extended_trace_record_with_children_files_type_0 import ExtendedTraceRecordWithChildrenFilesType0
-from .extended_trace_record_with_children_metric_info_type_0 import ExtendedTraceRecordWithChildrenMetricInfoType0
-from .extended_trace_record_with_children_user_metadata import ExtendedTraceRecordWithChildrenUserMetadata
-from .extended_workflow_span_record import ExtendedWorkflowSpanRecord
-from .extended_workflow_span_record_annotation_aggregates import ExtendedWorkflowSpanRecordAnnotationAggregates
-from .extended_workflow_span_record_annotation_agreement import ExtendedWorkflowSpanRecordAnnotationAgreement
-from .extended_workflow_span_record_annotations import ExtendedWorkflowSpanRecordAnnotations
-from .extended_workflow_span_record_annotations_additional_property import (
-    ExtendedWorkflowSpanRecordAnnotationsAdditionalProperty,
-)
-from .extended_workflow_span_record_dataset_metadata import ExtendedWorkflowSpanRecordDatasetMetadata
-from .extended_workflow_span_record_feedback_rating_info import ExtendedWorkflowSpanRecordFeedbackRatingInfo
-from .extended_workflow_span_record_files_type_0 import ExtendedWorkflowSpanRecordFilesType0
-from .extended_workflow_span_record_metric_info_type_0 import ExtendedWorkflowSpanRecordMetricInfoType0
-from .extended_workflow_span_record_user_metadata import ExtendedWorkflowSpanRecordUserMetadata
-from .extended_workflow_span_record_with_children import ExtendedWorkflowSpanRecordWithChildren
-from .extended_workflow_span_record_with_children_annotation_aggregates import (
-    ExtendedWorkflowSpanRecordWithChildrenAnnotationAggregates,
-)
-from .extended_workflow_span_record_with_children_annotation_agreement import (
-    ExtendedWorkflowSpanRecordWithChildrenAnnotationAgreement,
-)
-from .extended_workflow_span_record_with_children_annotations import ExtendedWorkflowSpanRecordWithChildrenAnnotations
-from .extended_workflow_span_record_with_children_annotations_additional_property import (
-    ExtendedWorkflowSpanRecordWithChildrenAnnotationsAdditionalProperty,
-)
-from .extended_workflow_span_record_with_children_dataset_metadata import (
-    ExtendedWorkflowSpanRecordWithChildrenDatasetMetadata,
-)
-from .extended_workflow_span_record_with_children_feedback_rating_info import (
-    ExtendedWorkflowSpanRecordWithChildrenFeedbackRatingInfo,
-)
-from .extended_workflow_span_record_with_children_files_type_0 import ExtendedWorkflowSpanRecordWithChildrenFilesType0
-from .extended_workflow_span_record_with_children_metric_info_type_0 import (
-    ExtendedWorkflowSpanRecordWithChildrenMetricInfoType0,
-)
-from .extended_workflow_span_record_with_children_user_metadata import (
-    ExtendedWorkflowSpanRecordWithChildrenUserMetadata,
-)
-from .factuality_template import FactualityTemplate
-from .factuality_template_response_schema_type_0 import FactualityTemplateResponseSchemaType0
-from .feature_integration_costs import FeatureIntegrationCosts
-from .feedback_aggregate import FeedbackAggregate
-from .feedback_rating_info import FeedbackRatingInfo
-from .feedback_type import FeedbackType
-from .few_shot_example import FewShotExample
-from .file_content_part import FileContentPart
-from .file_metadata import FileMetadata
-from .file_source import FileSource
-from .file_status import FileStatus
-from .filter_leaf_log_records_filter import FilterLeafLogRecordsFilter
-from .fine_tuned_scorer import FineTunedScorer
-from .fine_tuned_scorer_action import FineTunedScorerAction
-from .fine_tuned_scorer_response import FineTunedScorerResponse
-from .fine_tuned_scorer_response_class_name_to_vocab_ix_type_0 import FineTunedScorerResponseClassNameToVocabIxType0
-from .fine_tuned_scorer_response_class_name_to_vocab_ix_type_1 import FineTunedScorerResponseClassNameToVocabIxType1
-from .generated_scorer_action import GeneratedScorerAction
-from .generated_scorer_configuration import GeneratedScorerConfiguration
-from .generated_scorer_response import GeneratedScorerResponse
-from .generated_scorer_validation_response import GeneratedScorerValidationResponse
-from .generation_response import GenerationResponse
-from .get_integration_status_integrations_name_status_get_response_get_integration_status_integrations_name_status_get import (
-    GetIntegrationStatusIntegrationsNameStatusGetResponseGetIntegrationStatusIntegrationsNameStatusGet,
-)
-from .get_integrations_and_model_info_for_run_llm_integrations_projects_project_id_runs_run_id_get_get_run_integrations_response import (
-    GetIntegrationsAndModelInfoForRunLlmIntegrationsProjectsProjectIdRunsRunIdGetGetRunIntegrationsResponse,
-)
-from .get_integrations_and_model_info_llm_integrations_get_response_get_integrations_and_model_info_llm_integrations_get import (
-    GetIntegrationsAndModelInfoLlmIntegrationsGetResponseGetIntegrationsAndModelInfoLlmIntegrationsGet,
-)
-from .get_named_custom_integration_status_integrations_custom_name_status_get_response_get_named_custom_integration_status_integrations_custom_name_status_get import (
-    GetNamedCustomIntegrationStatusIntegrationsCustomNameStatusGetResponseGetNamedCustomIntegrationStatusIntegrationsCustomNameStatusGet,
-)
-from .get_projects_paginated_response import GetProjectsPaginatedResponse
-from .get_projects_paginated_response_v2 import GetProjectsPaginatedResponseV2
-from .ground_truth_adherence_scorer import GroundTruthAdherenceScorer
-from .ground_truth_adherence_template import GroundTruthAdherenceTemplate
-from .ground_truth_adherence_template_response_schema_type_0 import GroundTruthAdherenceTemplateResponseSchemaType0
-from .groundedness_template import GroundednessTemplate
-from .groundedness_template_response_schema_type_0 import GroundednessTemplateResponseSchemaType0
-from .group_action import GroupAction
-from .group_collaborator import GroupCollaborator
-from .group_collaborator_create import GroupCollaboratorCreate
-from .group_member_action import GroupMemberAction
-from .hallucination_segment import HallucinationSegment
-from .health_score_result import HealthScoreResult
-from .health_score_result_secondary import HealthScoreResultSecondary
-from .health_score_type import HealthScoreType
-from .healthcheck_response import HealthcheckResponse
-from .histogram import Histogram
-from .histogram_bucket import HistogramBucket
-from .histogram_strategy import HistogramStrategy
-from .http_validation_error import HTTPValidationError
-from .image_generation_event import ImageGenerationEvent
-from .image_generation_event_images_type_0_item import ImageGenerationEventImagesType0Item
-from .image_generation_event_metadata_type_0 import ImageGenerationEventMetadataType0
-from .input_map import InputMap
-from .input_pii_scorer import InputPIIScorer
-from .input_sexist_scorer import InputSexistScorer
-from .input_sexist_scorer_type import InputSexistScorerType
-from .input_sexist_template import InputSexistTemplate
-from .input_sexist_template_response_schema_type_0 import InputSexistTemplateResponseSchemaType0
-from .input_tone_scorer import InputToneScorer
-from .input_toxicity_scorer import InputToxicityScorer
-from .input_toxicity_scorer_type import InputToxicityScorerType
-from .input_toxicity_template import InputToxicityTemplate
-from .input_toxicity_template_response_schema_type_0 import InputToxicityTemplateResponseSchemaType0
-from .input_type_enum import InputTypeEnum
-from .insight_summary import InsightSummary
-from .insight_summary_priority_category_type_0 import InsightSummaryPriorityCategoryType0
-from .insight_type import InsightType
-from .instruction_adherence_scorer import InstructionAdherenceScorer
-from .instruction_adherence_template import InstructionAdherenceTemplate
-from .instruction_adherence_template_response_schema_type_0 import InstructionAdherenceTemplateResponseSchemaType0
-from .integration_action import IntegrationAction
-from .integration_costs_data_point import IntegrationCostsDataPoint
-from .integration_costs_response import IntegrationCostsResponse
-from .integration_db import IntegrationDB
-from .integration_disable_request import IntegrationDisableRequest
-from .integration_models_response import IntegrationModelsResponse
-from .integration_models_response_recommended_models import IntegrationModelsResponseRecommendedModels
-from .integration_provider import IntegrationProvider
-from .integration_select_request import IntegrationSelectRequest
-from .internal_tool_call import InternalToolCall
-from .internal_tool_call_input_type_0 import InternalToolCallInputType0
-from .internal_tool_call_metadata_type_0 import InternalToolCallMetadataType0
-from .internal_tool_call_output_type_0 import InternalToolCallOutputType0
-from .invalid_result import InvalidResult
-from .invoke_response import InvokeResponse
-from .invoke_response_headers_type_0 import InvokeResponseHeadersType0
-from .invoke_response_metadata_type_0 import InvokeResponseMetadataType0
-from .invoke_response_metric_results import InvokeResponseMetricResults
-from .job_db import JobDB
-from .job_db_request_data import JobDBRequestData
-from .job_progress import JobProgress
-from .like_dislike_aggregate import LikeDislikeAggregate
-from .like_dislike_constraints import LikeDislikeConstraints
-from .like_dislike_rating import LikeDislikeRating
-from .list_annotation_queue_collaborators_response import ListAnnotationQueueCollaboratorsResponse
-from .list_annotation_queue_params import ListAnnotationQueueParams
-from .list_annotation_queue_response import ListAnnotationQueueResponse
-from .list_dataset_params import ListDatasetParams
-from .list_dataset_projects_response import ListDatasetProjectsResponse
-from .list_dataset_response import ListDatasetResponse
-from .list_dataset_version_params import ListDatasetVersionParams
-from .list_dataset_version_response import ListDatasetVersionResponse
-from .list_experiment_response import ListExperimentResponse
-from .list_group_collaborators_response import ListGroupCollaboratorsResponse
-from .list_log_stream_response import ListLogStreamResponse
-from .list_prompt_template_params import ListPromptTemplateParams
-from .list_prompt_template_response import ListPromptTemplateResponse
-from .list_prompt_template_version_params import ListPromptTemplateVersionParams
-from .list_prompt_template_version_response import ListPromptTemplateVersionResponse
-from .list_scorer_versions_response import ListScorerVersionsResponse
-from .list_scorers_request import ListScorersRequest
-from .list_scorers_response import ListScorersResponse
-from .list_user_collaborators_response import ListUserCollaboratorsResponse
-from .llm_export_format import LLMExportFormat
-from .llm_integration import LLMIntegration
-from .llm_metrics import LlmMetrics
-from .llm_span import LlmSpan
-from .llm_span_dataset_metadata import LlmSpanDatasetMetadata
-from .llm_span_tools_type_0_item import LlmSpanToolsType0Item
-from .llm_span_user_metadata import LlmSpanUserMetadata
-from .log_records_available_columns_request import LogRecordsAvailableColumnsRequest
-from .log_records_available_columns_response import LogRecordsAvailableColumnsResponse
-from .log_records_boolean_filter import LogRecordsBooleanFilter
-from .log_records_boolean_filter_operator import LogRecordsBooleanFilterOperator
-from .log_records_collection_filter import LogRecordsCollectionFilter
-from .log_records_collection_filter_operator import LogRecordsCollectionFilterOperator
-from .log_records_column_info import LogRecordsColumnInfo
-from .log_records_column_info_label_color_type_0 import LogRecordsColumnInfoLabelColorType0
-from .log_records_custom_metrics_query_request import LogRecordsCustomMetricsQueryRequest
-from .log_records_date_filter import LogRecordsDateFilter
-from .log_records_date_filter_operator import LogRecordsDateFilterOperator
-from .log_records_delete_request import LogRecordsDeleteRequest
-from .log_records_delete_response import LogRecordsDeleteResponse
-from .log_records_export_request import LogRecordsExportRequest
-from .log_records_filter_type import LogRecordsFilterType
-from .log_records_fully_annotated_filter import LogRecordsFullyAnnotatedFilter
-from .log_records_id_filter import LogRecordsIDFilter
-from .log_records_id_filter_operator import LogRecordsIDFilterOperator
-from .log_records_metrics_query_request import LogRecordsMetricsQueryRequest
-from .log_records_metrics_response import LogRecordsMetricsResponse
-from .log_records_metrics_response_aggregate_metrics import LogRecordsMetricsResponseAggregateMetrics
-from .log_records_metrics_response_aggregate_metrics_additional_property_type_2 import (
-    LogRecordsMetricsResponseAggregateMetricsAdditionalPropertyType2,
-)
-from .log_records_metrics_response_bucketed_metrics import LogRecordsMetricsResponseBucketedMetrics
-from .log_records_metrics_response_standard_errors_type_0 import LogRecordsMetricsResponseStandardErrorsType0
-from .log_records_number_filter import LogRecordsNumberFilter
-from .log_records_number_filter_operator import LogRecordsNumberFilterOperator
-from .log_records_partial_query_request import LogRecordsPartialQueryRequest
-from .log_records_partial_query_response import LogRecordsPartialQueryResponse
-from .log_records_query_count_request import LogRecordsQueryCountRequest
-from .log_records_query_count_response import LogRecordsQueryCountResponse
-from .log_records_query_request import LogRecordsQueryRequest
-from .log_records_query_response import LogRecordsQueryResponse
-from .log_records_sort_clause import LogRecordsSortClause
-from .log_records_text_filter import LogRecordsTextFilter
-from .log_records_text_filter_operator import LogRecordsTextFilterOperator
-from .log_span_update_request import LogSpanUpdateRequest
-from .log_span_update_response import LogSpanUpdateResponse
-from .log_spans_ingest_request import LogSpansIngestRequest
-from .log_spans_ingest_response import LogSpansIngestResponse
-from .log_stream_create_request import LogStreamCreateRequest
-from .log_stream_info import LogStreamInfo
-from .log_stream_response import LogStreamResponse
-from .log_stream_update_request import LogStreamUpdateRequest
-from .log_trace_update_request import LogTraceUpdateRequest
-from .log_trace_update_response import LogTraceUpdateResponse
-from .log_traces_ingest_request import LogTracesIngestRequest
-from .log_traces_ingest_response import LogTracesIngestResponse
-from .logging_method import LoggingMethod
-from .luna_input_type_enum import LunaInputTypeEnum
-from .luna_output_type_enum import LunaOutputTypeEnum
-from .mcp_approval_request_event import MCPApprovalRequestEvent
-from .mcp_approval_request_event_metadata_type_0 import MCPApprovalRequestEventMetadataType0
-from .mcp_approval_request_event_tool_invocation_type_0 import MCPApprovalRequestEventToolInvocationType0
-from .mcp_call_event import MCPCallEvent
-from .mcp_call_event_arguments_type_0 import MCPCallEventArgumentsType0
-from .mcp_call_event_metadata_type_0 import MCPCallEventMetadataType0
-from .mcp_call_event_result_type_0 import MCPCallEventResultType0
-from .mcp_list_tools_event import MCPListToolsEvent
-from .mcp_list_tools_event_metadata_type_0 import MCPListToolsEventMetadataType0
-from .mcp_list_tools_event_tools_type_0_item import MCPListToolsEventToolsType0Item
-from .message import Message
-from .message_event import MessageEvent
-from .message_event_content_parts_type_0_item import MessageEventContentPartsType0Item
-from .message_event_metadata_type_0 import MessageEventMetadataType0
-from .message_role import MessageRole
-from .messages_list_item import MessagesListItem
-from .messages_list_item_role import MessagesListItemRole
-from .metadata_filter import MetadataFilter
-from .metadata_filter_operator import MetadataFilterOperator
-from .metric_aggregates import MetricAggregates
-from .metric_aggregates_value_distribution_type_0 import MetricAggregatesValueDistributionType0
-from .metric_aggregation import MetricAggregation
-from .metric_aggregation_detail import MetricAggregationDetail
-from .metric_color import MetricColor
-from .metric_color_picker_boolean import MetricColorPickerBoolean
-from .metric_color_picker_categorical import MetricColorPickerCategorical
-from .metric_color_picker_multi_label import MetricColorPickerMultiLabel
-from .metric_color_picker_numeric import MetricColorPickerNumeric
-from .metric_computation import MetricComputation
-from .metric_computation_status import MetricComputationStatus
-from .metric_computation_value_type_4 import MetricComputationValueType4
-from .metric_computing import MetricComputing
-from .metric_critique_columnar import MetricCritiqueColumnar
-from .metric_critique_content import MetricCritiqueContent
-from .metric_error import MetricError
-from .metric_failed import MetricFailed
-from .metric_not_applicable import MetricNotApplicable
-from .metric_not_computed import MetricNotComputed
-from .metric_pending import MetricPending
-from .metric_roll_up import MetricRollUp
-from .metric_roll_up_metadata_type_0 import MetricRollUpMetadataType0
-from .metric_roll_up_roll_up_metrics import MetricRollUpRollUpMetrics
-from .metric_roll_up_roll_up_metrics_additional_property_type_1 import MetricRollUpRollUpMetricsAdditionalPropertyType1
-from .metric_settings_request import MetricSettingsRequest
-from .metric_settings_response import MetricSettingsResponse
-from .metric_success import MetricSuccess
-from .metric_success_metadata_type_0 import MetricSuccessMetadataType0
-from .metric_threshold import MetricThreshold
-from .metrics import Metrics
-from .metrics_testing_available_columns_request import MetricsTestingAvailableColumnsRequest
-from .mistral_integration import MistralIntegration
-from .mistral_integration_create import MistralIntegrationCreate
-from .mistral_integration_extra_type_0 import MistralIntegrationExtraType0
-from .modality_filter import ModalityFilter
-from .modality_filter_operator import ModalityFilterOperator
-from .model import Model
-from .model_cost_by import ModelCostBy
-from .model_properties import ModelProperties
-from .model_type import ModelType
-from .multi_modal_model_integration_config import MultiModalModelIntegrationConfig
-from .multimodal_capability import MultimodalCapability
-from .name import Name
-from .node_name_filter import NodeNameFilter
-from .node_name_filter_operator import NodeNameFilterOperator
-from .node_type import NodeType
-from .not_node_log_records_filter import NotNodeLogRecordsFilter
-from .numeric_color_constraint import NumericColorConstraint
-from .numeric_color_constraint_operator import NumericColorConstraintOperator
-from .numeric_roll_up_method import NumericRollUpMethod
-from .nvidia_integration import NvidiaIntegration
-from .nvidia_integration_create import NvidiaIntegrationCreate
-from .nvidia_integration_extra_type_0 import NvidiaIntegrationExtraType0
-from .open_ai_function import OpenAIFunction
-from .open_ai_integration import OpenAIIntegration
-from .open_ai_integration_create import OpenAIIntegrationCreate
-from .open_ai_integration_extra_type_0 import OpenAIIntegrationExtraType0
-from .open_ai_tool_choice import OpenAIToolChoice
-from .or_node_log_records_filter import OrNodeLogRecordsFilter
-from .organization_action import OrganizationAction
-from .output_map import OutputMap
-from .output_pii_scorer import OutputPIIScorer
-from .output_sexist_scorer import OutputSexistScorer
-from .output_sexist_scorer_type import OutputSexistScorerType
-from .output_tone_scorer import OutputToneScorer
-from .output_toxicity_scorer import OutputToxicityScorer
-from .output_toxicity_scorer_type import OutputToxicityScorerType
-from .output_type_enum import OutputTypeEnum
-from .override_action import OverrideAction
-from .partial_extended_agent_span_record import PartialExtendedAgentSpanRecord
-from .partial_extended_agent_span_record_annotation_aggregates import PartialExtendedAgentSpanRecordAnnotationAggregates
-from .partial_extended_agent_span_record_annotation_agreement import PartialExtendedAgentSpanRecordAnnotationAgreement
-from .partial_extended_agent_span_record_annotations import PartialExtendedAgentSpanRecordAnnotations
-from .partial_extended_agent_span_record_annotations_additional_property import (
-    PartialExtendedAgentSpanRecordAnnotationsAdditionalProperty,
-)
-from .partial_extended_agent_span_record_dataset_metadata import PartialExtendedAgentSpanRecordDatasetMetadata
-from .partial_extended_agent_span_record_feedback_rating_info import PartialExtendedAgentSpanRecordFeedbackRatingInfo
-from .partial_extended_agent_span_record_files_type_0 import PartialExtendedAgentSpanRecordFilesType0
-from .partial_extended_agent_span_record_metric_info_type_0 import PartialExtendedAgentSpanRecordMetricInfoType0
-from .partial_extended_agent_span_record_user_metadata import PartialExtendedAgentSpanRecordUserMetadata
-from .partial_extended_control_span_record import PartialExtendedControlSpanRecord
-from .partial_extended_control_span_record_annotation_aggregates import (
-    PartialExtendedControlSpanRecordAnnotationAggregates,
-)
-from .partial_extended_control_span_record_annotation_agreement import (
-    PartialExtendedControlSpanRecordAnnotationAgreement,
-)
-from .partial_extended_control_span_record_annotations import PartialExtendedControlSpanRecordAnnotations
-from .partial_extended_control_span_record_annotations_additional_property import (
-    PartialExtendedControlSpanRecordAnnotationsAdditionalProperty,
-)
-from .partial_extended_control_span_record_dataset_metadata import PartialExtendedControlSpanRecordDatasetMetadata
-from .partial_extended_control_span_record_feedback_rating_info import (
-    PartialExtendedControlSpanRecordFeedbackRatingInfo,
-)
-from .partial_extended_control_span_record_files_type_0 import PartialExtendedControlSpanRecordFilesType0
-from .partial_extended_control_span_record_metric_info_type_0 import PartialExtendedControlSpanRecordMetricInfoType0
-from .partial_extended_control_span_record_user_metadata import PartialExtendedControlSpanRecordUserMetadata
-from .partial_extended_llm_span_record import PartialExtendedLlmSpanRecord
-from .partial_extended_llm_span_record_annotation_aggregates import PartialExtendedLlmSpanRecordAnnotationAggregates
-from .partial_extended_llm_span_record_annotation_agreement import PartialExtendedLlmSpanRecordAnnotationAgreement
-from .partial_extended_llm_span_record_annotations import PartialExtendedLlmSpanRecordAnnotations
-from .partial_extended_llm_span_record_annotations_additional_property import (
-    PartialExtendedLlmSpanRecordAnnotationsAdditionalProperty,
-)
-from .partial_extended_llm_span_record_dataset_metadata import PartialExtendedLlmSpanRecordDatasetMetadata
-from .partial_extended_llm_span_record_feedback_rating_info import PartialExtendedLlmSpanRecordFeedbackRatingInfo
-from .partial_extended_llm_span_record_files_type_0 import PartialExtendedLlmSpanRecordFilesType0
-from .partial_extended_llm_span_record_metric_info_type_0 import PartialExtendedLlmSpanRecordMetricInfoType0
-from .partial_extended_llm_span_record_tools_type_0_item import PartialExtendedLlmSpanRecordToolsType0Item
-from .partial_extended_llm_span_record_user_metadata import PartialExtendedLlmSpanRecordUserMetadata
-from .partial_extended_retriever_span_record import PartialExtendedRetrieverSpanRecord
-from .partial_extended_retriever_span_record_annotation_aggregates import (
-    PartialExtendedRetrieverSpanRecordAnnotationAggregates,
-)
-from .partial_extended_retriever_span_record_annotation_agreement import (
-    PartialExtendedRetrieverSpanRecordAnnotationAgreement,
-)
-from .partial_extended_retriever_span_record_annotations import PartialExtendedRetrieverSpanRecordAnnotations
-from .partial_extended_retriever_span_record_annotations_additional_property import (
-    PartialExtendedRetrieverSpanRecordAnnotationsAdditionalProperty,
-)
-from .partial_extended_retriever_span_record_dataset_metadata import PartialExtendedRetrieverSpanRecordDatasetMetadata
-from .partial_extended_retriever_span_record_feedback_rating_info import (
-    PartialExtendedRetrieverSpanRecordFeedbackRatingInfo,
-)
-from .partial_extended_retriever_span_record_files_type_0 import PartialExtendedRetrieverSpanRecordFilesType0
-from .partial_extended_retriever_span_record_metric_info_type_0 import PartialExtendedRetrieverSpanRecordMetricInfoType0
-from .partial_extended_retriever_span_record_user_metadata import PartialExtendedRetrieverSpanRecordUserMetadata
-from .partial_extended_session_record import PartialExtendedSessionRecord
-from .partial_extended_session_record_annotation_aggregates import PartialExtendedSessionRecordAnnotationAggregates
-from .partial_extended_session_record_annotation_agreement import PartialExtendedSessionRecordAnnotationAgreement
-from .partial_extended_session_record_annotations import PartialExtendedSessionRecordAnnotations
-from .partial_extended_session_record_annotations_additional_property import (
-    PartialExtendedSessionRecordAnnotationsAdditionalProperty,
-)
-from .partial_extended_session_record_dataset_metadata import PartialExtendedSessionRecordDatasetMetadata
-from .partial_extended_session_record_feedback_rating_info import PartialExtendedSessionRecordFeedbackRatingInfo
-from .partial_extended_session_record_files_type_0 import PartialExtendedSessionRecordFilesType0
-from .partial_extended_session_record_metric_info_type_0 import PartialExtendedSessionRecordMetricInfoType0
-from .partial_extended_session_record_user_metadata import PartialExtendedSessionRecordUserMetadata
-from .partial_extended_tool_span_record import PartialExtendedToolSpanRecord
-from .partial_extended_tool_span_record_annotation_aggregates import PartialExtendedToolSpanRecordAnnotationAggregates
-from .partial_extended_tool_span_record_annotation_agreement import PartialExtendedToolSpanRecordAnnotationAgreement
-from .partial_extended_tool_span_record_annotations import PartialExtendedToolSpanRecordAnnotations
-from .partial_extended_tool_span_record_annotations_additional_property import (
-    PartialExtendedToolSpanRecordAnnotationsAdditionalProperty,
-)
-from .partial_extended_tool_span_record_dataset_metadata import PartialExtendedToolSpanRecordDatasetMetadata
-from .partial_extended_tool_span_record_feedback_rating_info import PartialExtendedToolSpanRecordFeedbackRatingInfo
-from .partial_extended_tool_span_record_files_type_0 import PartialExtendedToolSpanRecordFilesType0
-from .partial_extended_tool_span_record_metric_info_type_0 import PartialExtendedToolSpanRecordMetricInfoType0
-from .partial_extended_tool_span_record_user_metadata import PartialExtendedToolSpanRecordUserMetadata
-from .partial_extended_trace_record import PartialExtendedTraceRecord
-from .partial_extended_trace_record_annotation_aggregates import PartialExtendedTraceRecordAnnotationAggregates
-from .partial_extended_trace_record_annotation_agreement import PartialExtendedTraceRecordAnnotationAgreement
-from .partial_extended_trace_record_annotations import PartialExtendedTraceRecordAnnotations
-from .partial_extended_trace_record_annotations_additional_property import (
-    PartialExtendedTraceRecordAnnotationsAdditionalProperty,
-)
-from .partial_extended_trace_record_dataset_metadata import PartialExtendedTraceRecordDatasetMetadata
-from .partial_extended_trace_record_feedback_rating_info import PartialExtendedTraceRecordFeedbackRatingInfo
-from .partial_extended_trace_record_files_type_0 import PartialExtendedTraceRecordFilesType0
-from .partial_extended_trace_record_metric_info_type_0 import PartialExtendedTraceRecordMetricInfoType0
-from .partial_extended_trace_record_user_metadata import PartialExtendedTraceRecordUserMetadata
-from .partial_extended_workflow_span_record import PartialExtendedWorkflowSpanRecord
-from .partial_extended_workflow_span_record_annotation_aggregates import (
-    PartialExtendedWorkflowSpanRecordAnnotationAggregates,
-)
-from .partial_extended_workflow_span_record_annotation_agreement import (
-    PartialExtendedWorkflowSpanRecordAnnotationAgreement,
-)
-from .partial_extended_workflow_span_record_annotations import PartialExtendedWorkflowSpanRecordAnnotations
-from .partial_extended_workflow_span_record_annotations_additional_property import (
-    PartialExtendedWorkflowSpanRecordAnnotationsAdditionalProperty,
-)
-from .partial_extended_workflow_span_record_dataset_metadata import PartialExtendedWorkflowSpanRecordDatasetMetadata
-from .partial_extended_workflow_span_record_feedback_rating_info import (
-    PartialExtendedWorkflowSpanRecordFeedbackRatingInfo,
-)
-from .partial_extended_workflow_span_record_files_type_0 import PartialExtendedWorkflowSpanRecordFilesType0
-from .partial_extended_workflow_span_record_metric_info_type_0 import PartialExtendedWorkflowSpanRecordMetricInfoType0
-from .partial_extended_workflow_span_record_user_metadata import PartialExtendedWorkflowSpanRecordUserMetadata
-from .passthrough_action import PassthroughAction
-from .payload import Payload
-from .permission import Permission
-from .preview_dataset_request import PreviewDatasetRequest
-from .project_action import ProjectAction
-from .project_bookmark_filter import ProjectBookmarkFilter
-from .project_bookmark_sort import ProjectBookmarkSort
-from .project_collection_params import ProjectCollectionParams
-from .project_create import ProjectCreate
-from .project_create_response import ProjectCreateResponse
-from .project_created_at_filter import ProjectCreatedAtFilter
-from .project_created_at_filter_operator import ProjectCreatedAtFilterOperator
-from .project_created_at_sort_v1 import ProjectCreatedAtSortV1
-from .project_creator_filter import ProjectCreatorFilter
-from .project_creator_filter_operator import ProjectCreatorFilterOperator
-from .project_db import ProjectDB
-from .project_db_thin import ProjectDBThin
-from .project_delete_response import ProjectDeleteResponse
-from .project_id_filter import ProjectIDFilter
-from .project_id_filter_operator import ProjectIDFilterOperator
-from .project_integration_costs import ProjectIntegrationCosts
-from .project_item import ProjectItem
-from .project_labels import ProjectLabels
-from .project_name_filter import ProjectNameFilter
-from .project_name_filter_operator import ProjectNameFilterOperator
-from .project_name_sort_v1 import ProjectNameSortV1
-from .project_runs_filter import ProjectRunsFilter
-from .project_runs_filter_operator import ProjectRunsFilterOperator
-from .project_runs_sort import ProjectRunsSort
-from .project_type import ProjectType
-from .project_type_filter import ProjectTypeFilter
-from .project_type_filter_operator import ProjectTypeFilterOperator
-from .project_type_sort import ProjectTypeSort
-from .project_update import ProjectUpdate
-from .project_update_response import ProjectUpdateResponse
-from .project_updated_at_filter import ProjectUpdatedAtFilter
-from .project_updated_at_filter_operator import ProjectUpdatedAtFilterOperator
-from .project_updated_at_sort_v1 import ProjectUpdatedAtSortV1
-from .prompt_injection_scorer import PromptInjectionScorer
-from .prompt_injection_scorer_type import PromptInjectionScorerType
-from .prompt_injection_template import PromptInjectionTemplate
-from .prompt_injection_template_response_schema_type_0 import PromptInjectionTemplateResponseSchemaType0
-from .prompt_perplexity_scorer import PromptPerplexityScorer
-from .prompt_run_settings import PromptRunSettings
-from .prompt_run_settings_response_format_type_0 import PromptRunSettingsResponseFormatType0
-from .prompt_run_settings_tools_type_0_item import PromptRunSettingsToolsType0Item
-from .prompt_template_created_at_sort import PromptTemplateCreatedAtSort
-from .prompt_template_created_by_filter import PromptTemplateCreatedByFilter
-from .prompt_template_created_by_filter_operator import PromptTemplateCreatedByFilterOperator
-from .prompt_template_name_filter import PromptTemplateNameFilter
-from .prompt_template_name_filter_operator import PromptTemplateNameFilterOperator
-from .prompt_template_name_sort import PromptTemplateNameSort
-from .prompt_template_not_in_project_filter import PromptTemplateNotInProjectFilter
-from .prompt_template_updated_at_sort import PromptTemplateUpdatedAtSort
-from .prompt_template_used_in_project_filter import PromptTemplateUsedInProjectFilter
-from .prompt_template_version_created_at_sort import PromptTemplateVersionCreatedAtSort
-from .prompt_template_version_number_sort import PromptTemplateVersionNumberSort
-from .prompt_template_version_updated_at_sort import PromptTemplateVersionUpdatedAtSort
-from .protect_request import ProtectRequest
-from .protect_request_headers_type_0 import ProtectRequestHeadersType0
-from .protect_request_metadata_type_0 import ProtectRequestMetadataType0
-from .protect_response import ProtectResponse
-from .query_dataset_params import QueryDatasetParams
-from .reasoning_event import ReasoningEvent
-from .reasoning_event_metadata_type_0 import ReasoningEventMetadataType0
-from .reasoning_event_summary_type_1_item import ReasoningEventSummaryType1Item
-from .recommended_model_purpose import RecommendedModelPurpose
-from .recommended_models_response import RecommendedModelsResponse
-from .recommended_models_response_available import RecommendedModelsResponseAvailable
-from .recommended_models_response_available_additional_property import (
-    RecommendedModelsResponseAvailableAdditionalProperty,
-)
-from .recommended_models_response_supported import RecommendedModelsResponseSupported
-from .recommended_models_response_supported_additional_property import (
-    RecommendedModelsResponseSupportedAdditionalProperty,
-)
-from .recompute_log_records_metrics_request import RecomputeLogRecordsMetricsRequest
-from .registered_scorer import RegisteredScorer
-from .registered_scorer_action import RegisteredScorerAction
-from .registered_scorer_task_result_response import RegisteredScorerTaskResultResponse
-from .remove_records_from_queue_request import RemoveRecordsFromQueueRequest
-from .remove_records_from_queue_response import RemoveRecordsFromQueueResponse
-from .render_template_request import RenderTemplateRequest
-from .render_template_response import RenderTemplateResponse
-from .rendered_template import RenderedTemplate
-from .retriever_span import RetrieverSpan
-from .retriever_span_dataset_metadata import RetrieverSpanDatasetMetadata
-from .retriever_span_user_metadata import RetrieverSpanUserMetadata
-from .roll_up_method_display_options import RollUpMethodDisplayOptions
-from .roll_up_strategy import RollUpStrategy
-from .rollback_request import RollbackRequest
-from .root_type import RootType
-from .rouge_scorer import RougeScorer
-from .rule import Rule
-from .rule_operator import RuleOperator
-from .rule_result import RuleResult
-from .ruleset import Ruleset
-from .ruleset_result import RulesetResult
-from .rulesets_mixin import RulesetsMixin
-from .run_created_at_filter import RunCreatedAtFilter
-from .run_created_at_filter_operator import RunCreatedAtFilterOperator
-from .run_created_at_sort import RunCreatedAtSort
-from .run_created_by_filter import RunCreatedByFilter
-from .run_created_by_filter_operator import RunCreatedByFilterOperator
-from .run_db import RunDB
-from .run_db_thin import RunDBThin
-from .run_id_filter import RunIDFilter
-from .run_id_filter_operator import RunIDFilterOperator
-from .run_name_filter import RunNameFilter
-from .run_name_filter_operator import RunNameFilterOperator
-from .run_name_sort import RunNameSort
-from .run_params_map import RunParamsMap
-from .run_scorer_settings_patch_request import RunScorerSettingsPatchRequest
-from .run_scorer_settings_response import RunScorerSettingsResponse
-from .run_tag_create_request import RunTagCreateRequest
-from .run_tag_db import RunTagDB
-from .run_updated_at_filter import RunUpdatedAtFilter
-from .run_updated_at_filter_operator import RunUpdatedAtFilterOperator
-from .run_updated_at_sort import RunUpdatedAtSort
-from .score_aggregate import ScoreAggregate
-from .score_bucket import ScoreBucket
-from .score_constraints import ScoreConstraints
-from .score_rating import ScoreRating
-from .scorer_action import ScorerAction
-from .scorer_config import ScorerConfig
-from .scorer_created_at_filter import ScorerCreatedAtFilter
-from .scorer_created_at_filter_operator import ScorerCreatedAtFilterOperator
-from .scorer_creator_filter import ScorerCreatorFilter
-from .scorer_creator_filter_operator import ScorerCreatorFilterOperator
-from .scorer_defaults import ScorerDefaults
-from .scorer_enabled_in_playground_sort import ScorerEnabledInPlaygroundSort
-from .scorer_enabled_in_run_sort import ScorerEnabledInRunSort
-from .scorer_exclude_multimodal_scorers_filter import ScorerExcludeMultimodalScorersFilter
-from .scorer_exclude_slm_scorers_filter import ScorerExcludeSlmScorersFilter
-from .scorer_health_scores_response import ScorerHealthScoresResponse
-from .scorer_id_filter import ScorerIDFilter
-from .scorer_id_filter_operator import ScorerIDFilterOperator
-from .scorer_is_global_filter import ScorerIsGlobalFilter
-from .scorer_is_global_filter_operator import ScorerIsGlobalFilterOperator
-from .scorer_label_filter import ScorerLabelFilter
-from .scorer_label_filter_operator import ScorerLabelFilterOperator
-from .scorer_model_type_filter import ScorerModelTypeFilter
-from .scorer_model_type_filter_operator import ScorerModelTypeFilterOperator
-from .scorer_multimodal_capabilities_filter import ScorerMultimodalCapabilitiesFilter
-from .scorer_multimodal_capabilities_filter_operator import ScorerMultimodalCapabilitiesFilterOperator
-from .scorer_name import ScorerName
-from .scorer_name_filter import ScorerNameFilter
-from .scorer_name_filter_operator import ScorerNameFilterOperator
-from .scorer_name_sort import ScorerNameSort
-from .scorer_response import ScorerResponse
-from .scorer_scope_project_ref import ScorerScopeProjectRef
-from .scorer_scope_projects_filter import ScorerScopeProjectsFilter
-from .scorer_scoreable_node_types_filter import ScorerScoreableNodeTypesFilter
-from .scorer_scoreable_node_types_filter_operator import ScorerScoreableNodeTypesFilterOperator
-from .scorer_tags_filter import ScorerTagsFilter
-from .scorer_tags_filter_operator import ScorerTagsFilterOperator
-from .scorer_type import ScorerType
-from .scorer_type_filter import ScorerTypeFilter
-from .scorer_type_filter_operator import ScorerTypeFilterOperator
-from .scorer_types import ScorerTypes
-from .scorer_updated_at_filter import ScorerUpdatedAtFilter
-from .scorer_updated_at_filter_operator import ScorerUpdatedAtFilterOperator
-from .scorer_updated_at_sort import ScorerUpdatedAtSort
-from .scorer_version_health_score_entry import ScorerVersionHealthScoreEntry
-from .scorer_version_health_score_entry_secondary_type_0 import ScorerVersionHealthScoreEntrySecondaryType0
-from .scorers_configuration import ScorersConfiguration
-from .segment import Segment
-from .segment_filter import SegmentFilter
-from .select_columns import SelectColumns
-from .session_create_request import SessionCreateRequest
-from .session_create_request_user_metadata_type_0 import SessionCreateRequestUserMetadataType0
-from .session_create_response import SessionCreateResponse
-from .sexist_template import SexistTemplate
-from .sexist_template_response_schema_type_0 import SexistTemplateResponseSchemaType0
-from .stage_db import StageDB
-from .stage_metadata import StageMetadata
-from .stage_type import StageType
-from .stage_with_rulesets import StageWithRulesets
-from .standard_error import StandardError
-from .standard_error_context import StandardErrorContext
-from .star_aggregate import StarAggregate
-from .star_aggregate_counts import StarAggregateCounts
-from .star_constraints import StarConstraints
-from .star_rating import StarRating
-from .step_type import StepType
-from .string_data import StringData
-from .stub_trace_record import StubTraceRecord
-from .subscription_config import SubscriptionConfig
-from .synthetic_data_source_dataset import SyntheticDataSourceDataset
-from .synthetic_data_types import SyntheticDataTypes
-from .synthetic_dataset_extension_request import SyntheticDatasetExtensionRequest
-from .synthetic_dataset_extension_response import SyntheticDatasetExtensionResponse
-from .system_metric_info import SystemMetricInfo
-from .tags_aggregate import TagsAggregate
-from .tags_aggregate_counts import TagsAggregateCounts
-from .tags_constraints import TagsConstraints
-from .tags_rating import TagsRating
-from .task_resource_limits import TaskResourceLimits
-from .task_result_status import TaskResultStatus
-from .task_type import TaskType
-from .template_stub_request import TemplateStubRequest
-from .test_score import TestScore
-from .text_aggregate import TextAggregate
-from .text_constraints import TextConstraints
-from .text_content_part import TextContentPart
-from .text_rating import TextRating
-from .token import Token
-from .tool_call import ToolCall
-from .tool_call_function import ToolCallFunction
-from .tool_error_rate_scorer import ToolErrorRateScorer
-from .tool_error_rate_scorer_type import ToolErrorRateScorerType
-from .tool_error_rate_template import ToolErrorRateTemplate
-from .tool_error_rate_template_response_schema_type_0 import ToolErrorRateTemplateResponseSchemaType0
-from .tool_selection_quality_scorer import ToolSelectionQualityScorer
-from .tool_selection_quality_scorer_type import ToolSelectionQualityScorerType
-from .tool_selection_quality_template import ToolSelectionQualityTemplate
-from .tool_selection_quality_template_response_schema_type_0 import ToolSelectionQualityTemplateResponseSchemaType0
-from .tool_span import ToolSpan
-from .tool_span_dataset_metadata import ToolSpanDatasetMetadata
-from .tool_span_user_metadata import ToolSpanUserMetadata
-from .toxicity_template import ToxicityTemplate
-from .toxicity_template_response_schema_type_0 import ToxicityTemplateResponseSchemaType0
-from .trace import Trace
-from .trace_dataset_metadata import TraceDatasetMetadata
-from .trace_metadata import TraceMetadata
-from .trace_user_metadata import TraceUserMetadata
-from .tree_choice_aggregate import TreeChoiceAggregate
-from .tree_choice_aggregate_counts import TreeChoiceAggregateCounts
-from .tree_choice_constraints import TreeChoiceConstraints
-from .tree_choice_db_constraints import TreeChoiceDBConstraints
-from .tree_choice_node import TreeChoiceNode
-from .tree_choice_rating import TreeChoiceRating
-from .uncertainty_scorer import UncertaintyScorer
-from .update_annotation_queue_request import UpdateAnnotationQueueRequest
-from .update_dataset_content_request import UpdateDatasetContentRequest
-from .update_dataset_request import UpdateDatasetRequest
-from .update_dataset_version_request import UpdateDatasetVersionRequest
-from .update_prompt_template_request import UpdatePromptTemplateRequest
-from .update_scorer_request import UpdateScorerRequest
-from .update_scorer_scope_request import UpdateScorerScopeRequest
-from .upsert_dataset_content_request import UpsertDatasetContentRequest
-from .user_action import UserAction
-from .user_annotation_queue_collaborator import UserAnnotationQueueCollaborator
-from .user_collaborator import UserCollaborator
-from .user_collaborator_create import UserCollaboratorCreate
-from .user_db import UserDB
-from .user_info import UserInfo
-from .user_role import UserRole
-from .valid_result import ValidResult
-from .validate_code_scorer_dataset_response import ValidateCodeScorerDatasetResponse
-from .validate_code_scorer_response import ValidateCodeScorerResponse
-from .validate_llm_scorer_dataset_request import ValidateLLMScorerDatasetRequest
-from .validate_llm_scorer_dataset_request_sort_type_0 import ValidateLLMScorerDatasetRequestSortType0
-from .validate_llm_scorer_dataset_response import ValidateLLMScorerDatasetResponse
-from .validate_llm_scorer_log_record_request import ValidateLLMScorerLogRecordRequest
-from .validate_llm_scorer_log_record_response import ValidateLLMScorerLogRecordResponse
-from .validate_registered_scorer_result import ValidateRegisteredScorerResult
-from .validate_scorer_log_record_response import ValidateScorerLogRecordResponse
-from .validation_error import ValidationError
-from .validation_error_context import ValidationErrorContext
-from .vegas_gateway_integration import VegasGatewayIntegration
-from .vegas_gateway_integration_create import VegasGatewayIntegrationCreate
-from .vegas_gateway_integration_extra_type_0 import VegasGatewayIntegrationExtraType0
-from .vertex_ai_integration import VertexAIIntegration
-from .vertex_ai_integration_create import VertexAIIntegrationCreate
-from .vertex_ai_integration_extra_type_0 import VertexAIIntegrationExtraType0
-from .vertex_aigcs_config import VertexAIGCSConfig
-from .vertex_aigcs_config_response import VertexAIGCSConfigResponse
-from .web_search_action import WebSearchAction
-from .web_search_call_event import WebSearchCallEvent
-from .web_search_call_event_metadata_type_0 import WebSearchCallEventMetadataType0
-from .workflow_span import WorkflowSpan
-from .workflow_span_dataset_metadata import WorkflowSpanDatasetMetadata
-from .workflow_span_user_metadata import WorkflowSpanUserMetadata
-from .write_health_score_request import WriteHealthScoreRequest
-from .write_health_score_request_secondary_type_0 import WriteHealthScoreRequestSecondaryType0
-from .writer_integration import WriterIntegration
-from .writer_integration_create import WriterIntegrationCreate
-from .writer_integration_extra_type_0 import WriterIntegrationExtraType0
+Models are imported on first access, so that importing one of them does not import all of them.
+"""
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .action_result import ActionResult
+    from .action_type import ActionType
+    from .add_records_to_queue_request import AddRecordsToQueueRequest
+    from .add_records_to_queue_response import AddRecordsToQueueResponse
+    from .agent_span import AgentSpan
+    from .agent_span_dataset_metadata import AgentSpanDatasetMetadata
+    from .agent_span_user_metadata import AgentSpanUserMetadata
+    from .agent_type import AgentType
+    from .agentic_session_success_scorer import AgenticSessionSuccessScorer
+    from .agentic_session_success_scorer_type import AgenticSessionSuccessScorerType
+    from .agentic_session_success_template import AgenticSessionSuccessTemplate
+    from .agentic_session_success_template_response_schema_type_0 import (
+        AgenticSessionSuccessTemplateResponseSchemaType0,
+    )
+    from .agentic_workflow_success_scorer import AgenticWorkflowSuccessScorer
+    from .agentic_workflow_success_scorer_type import AgenticWorkflowSuccessScorerType
+    from .agentic_workflow_success_template import AgenticWorkflowSuccessTemplate
+    from .agentic_workflow_success_template_response_schema_type_0 import (
+        AgenticWorkflowSuccessTemplateResponseSchemaType0,
+    )
+    from .aggregated_trace_view_edge import AggregatedTraceViewEdge
+    from .aggregated_trace_view_graph import AggregatedTraceViewGraph
+    from .aggregated_trace_view_node import AggregatedTraceViewNode
+    from .aggregated_trace_view_node_metrics import AggregatedTraceViewNodeMetrics
+    from .aggregated_trace_view_request import AggregatedTraceViewRequest
+    from .aggregated_trace_view_response import AggregatedTraceViewResponse
+    from .and_node_log_records_filter import AndNodeLogRecordsFilter
+    from .annotation_aggregate import AnnotationAggregate
+    from .annotation_agreement_aggregate import AnnotationAgreementAggregate
+    from .annotation_agreement_bucket import AnnotationAgreementBucket
+    from .annotation_choice_aggregate import AnnotationChoiceAggregate
+    from .annotation_choice_aggregate_counts import AnnotationChoiceAggregateCounts
+    from .annotation_like_dislike_aggregate import AnnotationLikeDislikeAggregate
+    from .annotation_queue_action import AnnotationQueueAction
+    from .annotation_queue_count_request import AnnotationQueueCountRequest
+    from .annotation_queue_count_response import AnnotationQueueCountResponse
+    from .annotation_queue_created_at_filter import AnnotationQueueCreatedAtFilter
+    from .annotation_queue_created_at_filter_operator import AnnotationQueueCreatedAtFilterOperator
+    from .annotation_queue_created_at_sort import AnnotationQueueCreatedAtSort
+    from .annotation_queue_created_by_sort import AnnotationQueueCreatedBySort
+    from .annotation_queue_details_response import AnnotationQueueDetailsResponse
+    from .annotation_queue_details_response_annotation_aggregates_by_annotator_type_0 import (
+        AnnotationQueueDetailsResponseAnnotationAggregatesByAnnotatorType0,
+    )
+    from .annotation_queue_details_response_annotation_aggregates_by_annotator_type_0_additional_property import (
+        AnnotationQueueDetailsResponseAnnotationAggregatesByAnnotatorType0AdditionalProperty,
+    )
+    from .annotation_queue_details_response_annotation_aggregates_type_0 import (
+        AnnotationQueueDetailsResponseAnnotationAggregatesType0,
+    )
+    from .annotation_queue_export_request import AnnotationQueueExportRequest
+    from .annotation_queue_export_url_response import AnnotationQueueExportUrlResponse
+    from .annotation_queue_id_filter import AnnotationQueueIDFilter
+    from .annotation_queue_id_filter_operator import AnnotationQueueIDFilterOperator
+    from .annotation_queue_name_filter import AnnotationQueueNameFilter
+    from .annotation_queue_name_filter_operator import AnnotationQueueNameFilterOperator
+    from .annotation_queue_name_sort import AnnotationQueueNameSort
+    from .annotation_queue_num_annotators_filter import AnnotationQueueNumAnnotatorsFilter
+    from .annotation_queue_num_annotators_filter_operator import AnnotationQueueNumAnnotatorsFilterOperator
+    from .annotation_queue_num_annotators_sort import AnnotationQueueNumAnnotatorsSort
+    from .annotation_queue_num_log_records_filter import AnnotationQueueNumLogRecordsFilter
+    from .annotation_queue_num_log_records_filter_operator import AnnotationQueueNumLogRecordsFilterOperator
+    from .annotation_queue_num_log_records_sort import AnnotationQueueNumLogRecordsSort
+    from .annotation_queue_num_templates_filter import AnnotationQueueNumTemplatesFilter
+    from .annotation_queue_num_templates_filter_operator import AnnotationQueueNumTemplatesFilterOperator
+    from .annotation_queue_num_templates_sort import AnnotationQueueNumTemplatesSort
+    from .annotation_queue_num_users_filter import AnnotationQueueNumUsersFilter
+    from .annotation_queue_num_users_filter_operator import AnnotationQueueNumUsersFilterOperator
+    from .annotation_queue_num_users_sort import AnnotationQueueNumUsersSort
+    from .annotation_queue_overall_progress_filter import AnnotationQueueOverallProgressFilter
+    from .annotation_queue_overall_progress_filter_operator import AnnotationQueueOverallProgressFilterOperator
+    from .annotation_queue_overall_progress_sort import AnnotationQueueOverallProgressSort
+    from .annotation_queue_partial_search_request import AnnotationQueuePartialSearchRequest
+    from .annotation_queue_project_filter import AnnotationQueueProjectFilter
+    from .annotation_queue_records_by_filter_tree import AnnotationQueueRecordsByFilterTree
+    from .annotation_queue_records_by_record_i_ds import AnnotationQueueRecordsByRecordIDs
+    from .annotation_queue_response import AnnotationQueueResponse
+    from .annotation_queue_response_num_logs_annotated_type_0 import AnnotationQueueResponseNumLogsAnnotatedType0
+    from .annotation_queue_response_progress_type_0 import AnnotationQueueResponseProgressType0
+    from .annotation_queue_updated_at_filter import AnnotationQueueUpdatedAtFilter
+    from .annotation_queue_updated_at_filter_operator import AnnotationQueueUpdatedAtFilterOperator
+    from .annotation_queue_updated_at_sort import AnnotationQueueUpdatedAtSort
+    from .annotation_queue_user_collaborator_create import AnnotationQueueUserCollaboratorCreate
+    from .annotation_queue_user_collaborator_update import AnnotationQueueUserCollaboratorUpdate
+    from .annotation_rating_create import AnnotationRatingCreate
+    from .annotation_rating_db import AnnotationRatingDB
+    from .annotation_rating_info import AnnotationRatingInfo
+    from .annotation_score_aggregate import AnnotationScoreAggregate
+    from .annotation_star_aggregate import AnnotationStarAggregate
+    from .annotation_star_aggregate_counts import AnnotationStarAggregateCounts
+    from .annotation_tags_aggregate import AnnotationTagsAggregate
+    from .annotation_tags_aggregate_counts import AnnotationTagsAggregateCounts
+    from .annotation_template_create import AnnotationTemplateCreate
+    from .annotation_template_db import AnnotationTemplateDB
+    from .annotation_template_reorder import AnnotationTemplateReorder
+    from .annotation_template_update import AnnotationTemplateUpdate
+    from .annotation_text_aggregate import AnnotationTextAggregate
+    from .annotation_tree_choice_aggregate import AnnotationTreeChoiceAggregate
+    from .annotation_tree_choice_aggregate_counts import AnnotationTreeChoiceAggregateCounts
+    from .annotation_type import AnnotationType
+    from .anthropic_authentication_type import AnthropicAuthenticationType
+    from .anthropic_integration import AnthropicIntegration
+    from .anthropic_integration_create import AnthropicIntegrationCreate
+    from .anthropic_integration_create_custom_header_mapping_type_0 import (
+        AnthropicIntegrationCreateCustomHeaderMappingType0,
+    )
+    from .anthropic_integration_custom_header_mapping_type_0 import AnthropicIntegrationCustomHeaderMappingType0
+    from .anthropic_integration_extra_type_0 import AnthropicIntegrationExtraType0
+    from .api_key_action import ApiKeyAction
+    from .api_key_login_request import ApiKeyLoginRequest
+    from .auth_method import AuthMethod
+    from .available_integrations import AvailableIntegrations
+    from .aws_bedrock_integration import AwsBedrockIntegration
+    from .aws_bedrock_integration_extra_type_0 import AwsBedrockIntegrationExtraType0
+    from .aws_bedrock_integration_inference_profiles import AwsBedrockIntegrationInferenceProfiles
+    from .aws_credential_type import AwsCredentialType
+    from .aws_sage_maker_integration import AwsSageMakerIntegration
+    from .aws_sage_maker_integration_create import AwsSageMakerIntegrationCreate
+    from .aws_sage_maker_integration_create_inference_profiles import AwsSageMakerIntegrationCreateInferenceProfiles
+    from .aws_sage_maker_integration_create_token import AwsSageMakerIntegrationCreateToken
+    from .aws_sage_maker_integration_extra_type_0 import AwsSageMakerIntegrationExtraType0
+    from .azure_authentication_type import AzureAuthenticationType
+    from .azure_integration import AzureIntegration
+    from .azure_integration_create import AzureIntegrationCreate
+    from .azure_integration_create_custom_header_mapping_type_0 import AzureIntegrationCreateCustomHeaderMappingType0
+    from .azure_integration_create_default_headers_type_0 import AzureIntegrationCreateDefaultHeadersType0
+    from .azure_integration_create_deployments import AzureIntegrationCreateDeployments
+    from .azure_integration_custom_header_mapping_type_0 import AzureIntegrationCustomHeaderMappingType0
+    from .azure_integration_default_headers_type_0 import AzureIntegrationDefaultHeadersType0
+    from .azure_integration_deployments import AzureIntegrationDeployments
+    from .azure_integration_extra_type_0 import AzureIntegrationExtraType0
+    from .azure_model_deployment import AzureModelDeployment
+    from .base_aws_integration_create import BaseAwsIntegrationCreate
+    from .base_aws_integration_create_inference_profiles import BaseAwsIntegrationCreateInferenceProfiles
+    from .base_aws_integration_create_token import BaseAwsIntegrationCreateToken
+    from .base_finetuned_scorer_db import BaseFinetunedScorerDB
+    from .base_finetuned_scorer_db_class_name_to_vocab_ix_type_0 import BaseFinetunedScorerDBClassNameToVocabIxType0
+    from .base_finetuned_scorer_db_class_name_to_vocab_ix_type_1 import BaseFinetunedScorerDBClassNameToVocabIxType1
+    from .base_generated_scorer_db import BaseGeneratedScorerDB
+    from .base_metric_roll_up_config_db import BaseMetricRollUpConfigDB
+    from .base_prompt_template_response import BasePromptTemplateResponse
+    from .base_prompt_template_version import BasePromptTemplateVersion
+    from .base_prompt_template_version_response import BasePromptTemplateVersionResponse
+    from .base_registered_scorer_db import BaseRegisteredScorerDB
+    from .base_scorer import BaseScorer
+    from .base_scorer_aggregates_type_0 import BaseScorerAggregatesType0
+    from .base_scorer_class_name_to_vocab_ix_type_0 import BaseScorerClassNameToVocabIxType0
+    from .base_scorer_class_name_to_vocab_ix_type_1 import BaseScorerClassNameToVocabIxType1
+    from .base_scorer_extra_type_0 import BaseScorerExtraType0
+    from .base_scorer_version_db import BaseScorerVersionDB
+    from .base_scorer_version_response import BaseScorerVersionResponse
+    from .bleu_scorer import BleuScorer
+    from .body_create_code_scorer_version_scorers_scorer_id_version_code_post import (
+        BodyCreateCodeScorerVersionScorersScorerIdVersionCodePost,
+    )
+    from .body_create_dataset_datasets_post import BodyCreateDatasetDatasetsPost
+    from .body_login_email_login_post import BodyLoginEmailLoginPost
+    from .body_manual_llm_validate_multipart_scorers_llm_validate_multipart_post import (
+        BodyManualLlmValidateMultipartScorersLlmValidateMultipartPost,
+    )
+    from .body_validate_code_scorer_dataset_scorers_code_validate_dataset_post import (
+        BodyValidateCodeScorerDatasetScorersCodeValidateDatasetPost,
+    )
+    from .body_validate_code_scorer_log_record_scorers_code_validate_log_record_post import (
+        BodyValidateCodeScorerLogRecordScorersCodeValidateLogRecordPost,
+    )
+    from .body_validate_code_scorer_scorers_code_validate_post import BodyValidateCodeScorerScorersCodeValidatePost
+    from .boolean_color_constraint import BooleanColorConstraint
+    from .bucketed_metric import BucketedMetric
+    from .bucketed_metric_buckets import BucketedMetricBuckets
+    from .bucketed_metrics import BucketedMetrics
+    from .bulk_delete_datasets_request import BulkDeleteDatasetsRequest
+    from .bulk_delete_datasets_response import BulkDeleteDatasetsResponse
+    from .bulk_delete_failure import BulkDeleteFailure
+    from .bulk_delete_prompt_templates_request import BulkDeletePromptTemplatesRequest
+    from .categorical_color_constraint import CategoricalColorConstraint
+    from .categorical_color_constraint_operator import CategoricalColorConstraintOperator
+    from .categorical_metric_info import CategoricalMetricInfo
+    from .categorical_metric_info_category_counts import CategoricalMetricInfoCategoryCounts
+    from .categorical_roll_up_method import CategoricalRollUpMethod
+    from .chain_aggregation_strategy import ChainAggregationStrategy
+    from .chain_poll_template import ChainPollTemplate
+    from .chain_poll_template_response_schema_type_0 import ChainPollTemplateResponseSchemaType0
+    from .choice_aggregate import ChoiceAggregate
+    from .choice_aggregate_counts import ChoiceAggregateCounts
+    from .choice_constraints import ChoiceConstraints
+    from .choice_rating import ChoiceRating
+    from .chunk_attribution_utilization_scorer import ChunkAttributionUtilizationScorer
+    from .chunk_attribution_utilization_scorer_type import ChunkAttributionUtilizationScorerType
+    from .chunk_attribution_utilization_template import ChunkAttributionUtilizationTemplate
+    from .chunk_attribution_utilization_template_response_schema_type_0 import (
+        ChunkAttributionUtilizationTemplateResponseSchemaType0,
+    )
+    from .code_metric_generation_status import CodeMetricGenerationStatus
+    from .code_metric_generation_status_response import CodeMetricGenerationStatusResponse
+    from .collaborator_role import CollaboratorRole
+    from .collaborator_role_info import CollaboratorRoleInfo
+    from .collaborator_update import CollaboratorUpdate
+    from .column_category import ColumnCategory
+    from .column_info import ColumnInfo
+    from .column_mapping import ColumnMapping
+    from .column_mapping_config import ColumnMappingConfig
+    from .column_mapping_mgt_type_0 import ColumnMappingMgtType0
+    from .completeness_scorer import CompletenessScorer
+    from .completeness_scorer_type import CompletenessScorerType
+    from .completeness_template import CompletenessTemplate
+    from .completeness_template_response_schema_type_0 import CompletenessTemplateResponseSchemaType0
+    from .compute_health_score_request import ComputeHealthScoreRequest
+    from .compute_health_score_request_mgt_overlay import ComputeHealthScoreRequestMgtOverlay
+    from .content_modality import ContentModality
+    from .context_adherence_scorer import ContextAdherenceScorer
+    from .context_adherence_scorer_type import ContextAdherenceScorerType
+    from .context_relevance_scorer import ContextRelevanceScorer
+    from .control_action import ControlAction
+    from .control_applies_to import ControlAppliesTo
+    from .control_check_stage import ControlCheckStage
+    from .control_resource_action import ControlResourceAction
+    from .control_result import ControlResult
+    from .control_span import ControlSpan
+    from .control_span_dataset_metadata import ControlSpanDatasetMetadata
+    from .control_span_user_metadata import ControlSpanUserMetadata
+    from .core_scorer_name import CoreScorerName
+    from .correctness_scorer import CorrectnessScorer
+    from .cost_interval import CostInterval
+    from .create_annotation_queue_request import CreateAnnotationQueueRequest
+    from .create_code_metric_generation_request import CreateCodeMetricGenerationRequest
+    from .create_code_metric_generation_response import CreateCodeMetricGenerationResponse
+    from .create_custom_luna_scorer_version_request import CreateCustomLunaScorerVersionRequest
+    from .create_job_request import CreateJobRequest
+    from .create_job_request_validation_config_type_0 import CreateJobRequestValidationConfigType0
+    from .create_job_response import CreateJobResponse
+    from .create_job_response_validation_config_type_0 import CreateJobResponseValidationConfigType0
+    from .create_llm_scorer_autogen_request import CreateLLMScorerAutogenRequest
+    from .create_llm_scorer_version_request import CreateLLMScorerVersionRequest
+    from .create_prompt_template_with_version_request_body import CreatePromptTemplateWithVersionRequestBody
+    from .create_queue_template_request import CreateQueueTemplateRequest
+    from .create_scorer_request import CreateScorerRequest
+    from .create_scorer_version_request import CreateScorerVersionRequest
+    from .create_update_registered_scorer_response import CreateUpdateRegisteredScorerResponse
+    from .custom_authentication_type import CustomAuthenticationType
+    from .custom_llm_config import CustomLLMConfig
+    from .custom_llm_config_init_kwargs_type_0 import CustomLLMConfigInitKwargsType0
+    from .customized_agentic_session_success_gpt_scorer import CustomizedAgenticSessionSuccessGPTScorer
+    from .customized_agentic_session_success_gpt_scorer_aggregates_type_0 import (
+        CustomizedAgenticSessionSuccessGPTScorerAggregatesType0,
+    )
+    from .customized_agentic_session_success_gpt_scorer_class_name_to_vocab_ix_type_0 import (
+        CustomizedAgenticSessionSuccessGPTScorerClassNameToVocabIxType0,
+    )
+    from .customized_agentic_session_success_gpt_scorer_class_name_to_vocab_ix_type_1 import (
+        CustomizedAgenticSessionSuccessGPTScorerClassNameToVocabIxType1,
+    )
+    from .customized_agentic_session_success_gpt_scorer_extra_type_0 import (
+        CustomizedAgenticSessionSuccessGPTScorerExtraType0,
+    )
+    from .customized_agentic_workflow_success_gpt_scorer import CustomizedAgenticWorkflowSuccessGPTScorer
+    from .customized_agentic_workflow_success_gpt_scorer_aggregates_type_0 import (
+        CustomizedAgenticWorkflowSuccessGPTScorerAggregatesType0,
+    )
+    from .customized_agentic_workflow_success_gpt_scorer_class_name_to_vocab_ix_type_0 import (
+        CustomizedAgenticWorkflowSuccessGPTScorerClassNameToVocabIxType0,
+    )
+    from .customized_agentic_workflow_success_gpt_scorer_class_name_to_vocab_ix_type_1 import (
+        CustomizedAgenticWorkflowSuccessGPTScorerClassNameToVocabIxType1,
+    )
+    from .customized_agentic_workflow_success_gpt_scorer_extra_type_0 import (
+        CustomizedAgenticWorkflowSuccessGPTScorerExtraType0,
+    )
+    from .customized_chunk_attribution_utilization_gpt_scorer import CustomizedChunkAttributionUtilizationGPTScorer
+    from .customized_chunk_attribution_utilization_gpt_scorer_aggregates_type_0 import (
+        CustomizedChunkAttributionUtilizationGPTScorerAggregatesType0,
+    )
+    from .customized_chunk_attribution_utilization_gpt_scorer_class_name_to_vocab_ix_type_0 import (
+        CustomizedChunkAttributionUtilizationGPTScorerClassNameToVocabIxType0,
+    )
+    from .customized_chunk_attribution_utilization_gpt_scorer_class_name_to_vocab_ix_type_1 import (
+        CustomizedChunkAttributionUtilizationGPTScorerClassNameToVocabIxType1,
+    )
+    from .customized_chunk_attribution_utilization_gpt_scorer_extra_type_0 import (
+        CustomizedChunkAttributionUtilizationGPTScorerExtraType0,
+    )
+    from .customized_completeness_gpt_scorer import CustomizedCompletenessGPTScorer
+    from .customized_completeness_gpt_scorer_aggregates_type_0 import CustomizedCompletenessGPTScorerAggregatesType0
+    from .customized_completeness_gpt_scorer_class_name_to_vocab_ix_type_0 import (
+        CustomizedCompletenessGPTScorerClassNameToVocabIxType0,
+    )
+    from .customized_completeness_gpt_scorer_class_name_to_vocab_ix_type_1 import (
+        CustomizedCompletenessGPTScorerClassNameToVocabIxType1,
+    )
+    from .customized_completeness_gpt_scorer_extra_type_0 import CustomizedCompletenessGPTScorerExtraType0
+    from .customized_factuality_gpt_scorer import CustomizedFactualityGPTScorer
+    from .customized_factuality_gpt_scorer_aggregates_type_0 import CustomizedFactualityGPTScorerAggregatesType0
+    from .customized_factuality_gpt_scorer_class_name_to_vocab_ix_type_0 import (
+        CustomizedFactualityGPTScorerClassNameToVocabIxType0,
+    )
+    from .customized_factuality_gpt_scorer_class_name_to_vocab_ix_type_1 import (
+        CustomizedFactualityGPTScorerClassNameToVocabIxType1,
+    )
+    from .customized_factuality_gpt_scorer_extra_type_0 import CustomizedFactualityGPTScorerExtraType0
+    from .customized_ground_truth_adherence_gpt_scorer import CustomizedGroundTruthAdherenceGPTScorer
+    from .customized_ground_truth_adherence_gpt_scorer_aggregates_type_0 import (
+        CustomizedGroundTruthAdherenceGPTScorerAggregatesType0,
+    )
+    from .customized_ground_truth_adherence_gpt_scorer_class_name_to_vocab_ix_type_0 import (
+        CustomizedGroundTruthAdherenceGPTScorerClassNameToVocabIxType0,
+    )
+    from .customized_ground_truth_adherence_gpt_scorer_class_name_to_vocab_ix_type_1 import (
+        CustomizedGroundTruthAdherenceGPTScorerClassNameToVocabIxType1,
+    )
+    from .customized_ground_truth_adherence_gpt_scorer_extra_type_0 import (
+        CustomizedGroundTruthAdherenceGPTScorerExtraType0,
+    )
+    from .customized_groundedness_gpt_scorer import CustomizedGroundednessGPTScorer
+    from .customized_groundedness_gpt_scorer_aggregates_type_0 import CustomizedGroundednessGPTScorerAggregatesType0
+    from .customized_groundedness_gpt_scorer_class_name_to_vocab_ix_type_0 import (
+        CustomizedGroundednessGPTScorerClassNameToVocabIxType0,
+    )
+    from .customized_groundedness_gpt_scorer_class_name_to_vocab_ix_type_1 import (
+        CustomizedGroundednessGPTScorerClassNameToVocabIxType1,
+    )
+    from .customized_groundedness_gpt_scorer_extra_type_0 import CustomizedGroundednessGPTScorerExtraType0
+    from .customized_input_sexist_gpt_scorer import CustomizedInputSexistGPTScorer
+    from .customized_input_sexist_gpt_scorer_aggregates_type_0 import CustomizedInputSexistGPTScorerAggregatesType0
+    from .customized_input_sexist_gpt_scorer_class_name_to_vocab_ix_type_0 import (
+        CustomizedInputSexistGPTScorerClassNameToVocabIxType0,
+    )
+    from .customized_input_sexist_gpt_scorer_class_name_to_vocab_ix_type_1 import (
+        CustomizedInputSexistGPTScorerClassNameToVocabIxType1,
+    )
+    from .customized_input_sexist_gpt_scorer_extra_type_0 import CustomizedInputSexistGPTScorerExtraType0
+    from .customized_input_toxicity_gpt_scorer import CustomizedInputToxicityGPTScorer
+    from .customized_input_toxicity_gpt_scorer_aggregates_type_0 import CustomizedInputToxicityGPTScorerAggregatesType0
+    from .customized_input_toxicity_gpt_scorer_class_name_to_vocab_ix_type_0 import (
+        CustomizedInputToxicityGPTScorerClassNameToVocabIxType0,
+    )
+    from .customized_input_toxicity_gpt_scorer_class_name_to_vocab_ix_type_1 import (
+        CustomizedInputToxicityGPTScorerClassNameToVocabIxType1,
+    )
+    from .customized_input_toxicity_gpt_scorer_extra_type_0 import CustomizedInputToxicityGPTScorerExtraType0
+    from .customized_instruction_adherence_gpt_scorer import CustomizedInstructionAdherenceGPTScorer
+    from .customized_instruction_adherence_gpt_scorer_aggregates_type_0 import (
+        CustomizedInstructionAdherenceGPTScorerAggregatesType0,
+    )
+    from .customized_instruction_adherence_gpt_scorer_class_name_to_vocab_ix_type_0 import (
+        CustomizedInstructionAdherenceGPTScorerClassNameToVocabIxType0,
+    )
+    from .customized_instruction_adherence_gpt_scorer_class_name_to_vocab_ix_type_1 import (
+        CustomizedInstructionAdherenceGPTScorerClassNameToVocabIxType1,
+    )
+    from .customized_instruction_adherence_gpt_scorer_extra_type_0 import (
+        CustomizedInstructionAdherenceGPTScorerExtraType0,
+    )
+    from .customized_prompt_injection_gpt_scorer import CustomizedPromptInjectionGPTScorer
+    from .customized_prompt_injection_gpt_scorer_aggregates_type_0 import (
+        CustomizedPromptInjectionGPTScorerAggregatesType0,
+    )
+    from .customized_prompt_injection_gpt_scorer_class_name_to_vocab_ix_type_0 import (
+        CustomizedPromptInjectionGPTScorerClassNameToVocabIxType0,
+    )
+    from .customized_prompt_injection_gpt_scorer_class_name_to_vocab_ix_type_1 import (
+        CustomizedPromptInjectionGPTScorerClassNameToVocabIxType1,
+    )
+    from .customized_prompt_injection_gpt_scorer_extra_type_0 import CustomizedPromptInjectionGPTScorerExtraType0
+    from .customized_sexist_gpt_scorer import CustomizedSexistGPTScorer
+    from .customized_sexist_gpt_scorer_aggregates_type_0 import CustomizedSexistGPTScorerAggregatesType0
+    from .customized_sexist_gpt_scorer_class_name_to_vocab_ix_type_0 import (
+        CustomizedSexistGPTScorerClassNameToVocabIxType0,
+    )
+    from .customized_sexist_gpt_scorer_class_name_to_vocab_ix_type_1 import (
+        CustomizedSexistGPTScorerClassNameToVocabIxType1,
+    )
+    from .customized_sexist_gpt_scorer_extra_type_0 import CustomizedSexistGPTScorerExtraType0
+    from .customized_tool_error_rate_gpt_scorer import CustomizedToolErrorRateGPTScorer
+    from .customized_tool_error_rate_gpt_scorer_aggregates_type_0 import CustomizedToolErrorRateGPTScorerAggregatesType0
+    from .customized_tool_error_rate_gpt_scorer_class_name_to_vocab_ix_type_0 import (
+        CustomizedToolErrorRateGPTScorerClassNameToVocabIxType0,
+    )
+    from .customized_tool_error_rate_gpt_scorer_class_name_to_vocab_ix_type_1 import (
+        CustomizedToolErrorRateGPTScorerClassNameToVocabIxType1,
+    )
+    from .customized_tool_error_rate_gpt_scorer_extra_type_0 import CustomizedToolErrorRateGPTScorerExtraType0
+    from .customized_tool_selection_quality_gpt_scorer import CustomizedToolSelectionQualityGPTScorer
+    from .customized_tool_selection_quality_gpt_scorer_aggregates_type_0 import (
+        CustomizedToolSelectionQualityGPTScorerAggregatesType0,
+    )
+    from .customized_tool_selection_quality_gpt_scorer_class_name_to_vocab_ix_type_0 import (
+        CustomizedToolSelectionQualityGPTScorerClassNameToVocabIxType0,
+    )
+    from .customized_tool_selection_quality_gpt_scorer_class_name_to_vocab_ix_type_1 import (
+        CustomizedToolSelectionQualityGPTScorerClassNameToVocabIxType1,
+    )
+    from .customized_tool_selection_quality_gpt_scorer_extra_type_0 import (
+        CustomizedToolSelectionQualityGPTScorerExtraType0,
+    )
+    from .customized_toxicity_gpt_scorer import CustomizedToxicityGPTScorer
+    from .customized_toxicity_gpt_scorer_aggregates_type_0 import CustomizedToxicityGPTScorerAggregatesType0
+    from .customized_toxicity_gpt_scorer_class_name_to_vocab_ix_type_0 import (
+        CustomizedToxicityGPTScorerClassNameToVocabIxType0,
+    )
+    from .customized_toxicity_gpt_scorer_class_name_to_vocab_ix_type_1 import (
+        CustomizedToxicityGPTScorerClassNameToVocabIxType1,
+    )
+    from .customized_toxicity_gpt_scorer_extra_type_0 import CustomizedToxicityGPTScorerExtraType0
+    from .data_type import DataType
+    from .data_type_options import DataTypeOptions
+    from .data_unit import DataUnit
+    from .databricks_integration import DatabricksIntegration
+    from .databricks_integration_create import DatabricksIntegrationCreate
+    from .databricks_integration_extra_type_0 import DatabricksIntegrationExtraType0
+    from .dataset_action import DatasetAction
+    from .dataset_append_row import DatasetAppendRow
+    from .dataset_append_row_values import DatasetAppendRowValues
+    from .dataset_append_row_values_additional_property_type_3 import DatasetAppendRowValuesAdditionalPropertyType3
+    from .dataset_content import DatasetContent
+    from .dataset_content_filter import DatasetContentFilter
+    from .dataset_content_filter_operator import DatasetContentFilterOperator
+    from .dataset_content_sort_clause import DatasetContentSortClause
+    from .dataset_copy_record_data import DatasetCopyRecordData
+    from .dataset_created_at_sort import DatasetCreatedAtSort
+    from .dataset_data import DatasetData
+    from .dataset_db import DatasetDB
+    from .dataset_delete_row import DatasetDeleteRow
+    from .dataset_draft_filter import DatasetDraftFilter
+    from .dataset_draft_filter_operator import DatasetDraftFilterOperator
+    from .dataset_filter_rows import DatasetFilterRows
+    from .dataset_format import DatasetFormat
+    from .dataset_id_filter import DatasetIDFilter
+    from .dataset_id_filter_operator import DatasetIDFilterOperator
+    from .dataset_last_edited_by_user_at_sort import DatasetLastEditedByUserAtSort
+    from .dataset_name_filter import DatasetNameFilter
+    from .dataset_name_filter_operator import DatasetNameFilterOperator
+    from .dataset_name_sort import DatasetNameSort
+    from .dataset_not_in_project_filter import DatasetNotInProjectFilter
+    from .dataset_prepend_row import DatasetPrependRow
+    from .dataset_prepend_row_values import DatasetPrependRowValues
+    from .dataset_prepend_row_values_additional_property_type_3 import DatasetPrependRowValuesAdditionalPropertyType3
+    from .dataset_project import DatasetProject
+    from .dataset_project_last_used_at_sort import DatasetProjectLastUsedAtSort
+    from .dataset_projects_sort import DatasetProjectsSort
+    from .dataset_remove_column import DatasetRemoveColumn
+    from .dataset_rename_column import DatasetRenameColumn
+    from .dataset_row import DatasetRow
+    from .dataset_row_metadata import DatasetRowMetadata
+    from .dataset_row_values_dict import DatasetRowValuesDict
+    from .dataset_row_values_dict_additional_property_type_3 import DatasetRowValuesDictAdditionalPropertyType3
+    from .dataset_row_values_item_type_3 import DatasetRowValuesItemType3
+    from .dataset_rows_sort import DatasetRowsSort
+    from .dataset_update_row import DatasetUpdateRow
+    from .dataset_update_row_values import DatasetUpdateRowValues
+    from .dataset_update_row_values_additional_property_type_3 import DatasetUpdateRowValuesAdditionalPropertyType3
+    from .dataset_updated_at_sort import DatasetUpdatedAtSort
+    from .dataset_used_in_project_filter import DatasetUsedInProjectFilter
+    from .dataset_version_db import DatasetVersionDB
+    from .dataset_version_index_sort import DatasetVersionIndexSort
+    from .delete_prompt_response import DeletePromptResponse
+    from .delete_run_response import DeleteRunResponse
+    from .delete_scorer_response import DeleteScorerResponse
+    from .document import Document
+    from .document_metadata import DocumentMetadata
+    from .error_severity import ErrorSeverity
+    from .error_type import ErrorType
+    from .event_status import EventStatus
+    from .execution_status import ExecutionStatus
+    from .experiment_create_request import ExperimentCreateRequest
+    from .experiment_dataset import ExperimentDataset
+    from .experiment_dataset_request import ExperimentDatasetRequest
+    from .experiment_group_id_filter import ExperimentGroupIDFilter
+    from .experiment_group_name_filter import ExperimentGroupNameFilter
+    from .experiment_group_name_filter_operator import ExperimentGroupNameFilterOperator
+    from .experiment_metrics_request import ExperimentMetricsRequest
+    from .experiment_metrics_response import ExperimentMetricsResponse
+    from .experiment_phase_status import ExperimentPhaseStatus
+    from .experiment_playground import ExperimentPlayground
+    from .experiment_prompt import ExperimentPrompt
+    from .experiment_response import ExperimentResponse
+    from .experiment_response_aggregate_feedback import ExperimentResponseAggregateFeedback
+    from .experiment_response_aggregate_metrics import ExperimentResponseAggregateMetrics
+    from .experiment_response_rating_aggregates import ExperimentResponseRatingAggregates
+    from .experiment_response_rating_aggregates_additional_property import (
+        ExperimentResponseRatingAggregatesAdditionalProperty,
+    )
+    from .experiment_response_structured_aggregate_metrics_type_0 import (
+        ExperimentResponseStructuredAggregateMetricsType0,
+    )
+    from .experiment_response_tags import ExperimentResponseTags
+    from .experiment_status import ExperimentStatus
+    from .experiment_update_request import ExperimentUpdateRequest
+    from .experiments_available_columns_response import ExperimentsAvailableColumnsResponse
+    from .extended_agent_span_record import ExtendedAgentSpanRecord
+    from .extended_agent_span_record_annotation_aggregates import ExtendedAgentSpanRecordAnnotationAggregates
+    from .extended_agent_span_record_annotation_agreement import ExtendedAgentSpanRecordAnnotationAgreement
+    from .extended_agent_span_record_annotations import ExtendedAgentSpanRecordAnnotations
+    from .extended_agent_span_record_annotations_additional_property import (
+        ExtendedAgentSpanRecordAnnotationsAdditionalProperty,
+    )
+    from .extended_agent_span_record_dataset_metadata import ExtendedAgentSpanRecordDatasetMetadata
+    from .extended_agent_span_record_feedback_rating_info import ExtendedAgentSpanRecordFeedbackRatingInfo
+    from .extended_agent_span_record_files_type_0 import ExtendedAgentSpanRecordFilesType0
+    from .extended_agent_span_record_metric_info_type_0 import ExtendedAgentSpanRecordMetricInfoType0
+    from .extended_agent_span_record_user_metadata import ExtendedAgentSpanRecordUserMetadata
+    from .extended_agent_span_record_with_children import ExtendedAgentSpanRecordWithChildren
+    from .extended_agent_span_record_with_children_annotation_aggregates import (
+        ExtendedAgentSpanRecordWithChildrenAnnotationAggregates,
+    )
+    from .extended_agent_span_record_with_children_annotation_agreement import (
+        ExtendedAgentSpanRecordWithChildrenAnnotationAgreement,
+    )
+    from .extended_agent_span_record_with_children_annotations import ExtendedAgentSpanRecordWithChildrenAnnotations
+    from .extended_agent_span_record_with_children_annotations_additional_property import (
+        ExtendedAgentSpanRecordWithChildrenAnnotationsAdditionalProperty,
+    )
+    from .extended_agent_span_record_with_children_dataset_metadata import (
+        ExtendedAgentSpanRecordWithChildrenDatasetMetadata,
+    )
+    from .extended_agent_span_record_with_children_feedback_rating_info import (
+        ExtendedAgentSpanRecordWithChildrenFeedbackRatingInfo,
+    )
+    from .extended_agent_span_record_with_children_files_type_0 import ExtendedAgentSpanRecordWithChildrenFilesType0
+    from .extended_agent_span_record_with_children_metric_info_type_0 import (
+        ExtendedAgentSpanRecordWithChildrenMetricInfoType0,
+    )
+    from .extended_agent_span_record_with_children_user_metadata import ExtendedAgentSpanRecordWithChildrenUserMetadata
+    from .extended_control_span_record import ExtendedControlSpanRecord
+    from .extended_control_span_record_annotation_aggregates import ExtendedControlSpanRecordAnnotationAggregates
+    from .extended_control_span_record_annotation_agreement import ExtendedControlSpanRecordAnnotationAgreement
+    from .extended_control_span_record_annotations import ExtendedControlSpanRecordAnnotations
+    from .extended_control_span_record_annotations_additional_property import (
+        ExtendedControlSpanRecordAnnotationsAdditionalProperty,
+    )
+    from .extended_control_span_record_dataset_metadata import ExtendedControlSpanRecordDatasetMetadata
+    from .extended_control_span_record_feedback_rating_info import ExtendedControlSpanRecordFeedbackRatingInfo
+    from .extended_control_span_record_files_type_0 import ExtendedControlSpanRecordFilesType0
+    from .extended_control_span_record_metric_info_type_0 import ExtendedControlSpanRecordMetricInfoType0
+    from .extended_control_span_record_user_metadata import ExtendedControlSpanRecordUserMetadata
+    from .extended_llm_span_record import ExtendedLlmSpanRecord
+    from .extended_llm_span_record_annotation_aggregates import ExtendedLlmSpanRecordAnnotationAggregates
+    from .extended_llm_span_record_annotation_agreement import ExtendedLlmSpanRecordAnnotationAgreement
+    from .extended_llm_span_record_annotations import ExtendedLlmSpanRecordAnnotations
+    from .extended_llm_span_record_annotations_additional_property import (
+        ExtendedLlmSpanRecordAnnotationsAdditionalProperty,
+    )
+    from .extended_llm_span_record_dataset_metadata import ExtendedLlmSpanRecordDatasetMetadata
+    from .extended_llm_span_record_feedback_rating_info import ExtendedLlmSpanRecordFeedbackRatingInfo
+    from .extended_llm_span_record_files_type_0 import ExtendedLlmSpanRecordFilesType0
+    from .extended_llm_span_record_metric_info_type_0 import ExtendedLlmSpanRecordMetricInfoType0
+    from .extended_llm_span_record_tools_type_0_item import ExtendedLlmSpanRecordToolsType0Item
+    from .extended_llm_span_record_user_metadata import ExtendedLlmSpanRecordUserMetadata
+    from .extended_retriever_span_record import ExtendedRetrieverSpanRecord
+    from .extended_retriever_span_record_annotation_aggregates import ExtendedRetrieverSpanRecordAnnotationAggregates
+    from .extended_retriever_span_record_annotation_agreement import ExtendedRetrieverSpanRecordAnnotationAgreement
+    from .extended_retriever_span_record_annotations import ExtendedRetrieverSpanRecordAnnotations
+    from .extended_retriever_span_record_annotations_additional_property import (
+        ExtendedRetrieverSpanRecordAnnotationsAdditionalProperty,
+    )
+    from .extended_retriever_span_record_dataset_metadata import ExtendedRetrieverSpanRecordDatasetMetadata
+    from .extended_retriever_span_record_feedback_rating_info import ExtendedRetrieverSpanRecordFeedbackRatingInfo
+    from .extended_retriever_span_record_files_type_0 import ExtendedRetrieverSpanRecordFilesType0
+    from .extended_retriever_span_record_metric_info_type_0 import ExtendedRetrieverSpanRecordMetricInfoType0
+    from .extended_retriever_span_record_user_metadata import ExtendedRetrieverSpanRecordUserMetadata
+    from .extended_retriever_span_record_with_children import ExtendedRetrieverSpanRecordWithChildren
+    from .extended_retriever_span_record_with_children_annotation_aggregates import (
+        ExtendedRetrieverSpanRecordWithChildrenAnnotationAggregates,
+    )
+    from .extended_retriever_span_record_with_children_annotation_agreement import (
+        ExtendedRetrieverSpanRecordWithChildrenAnnotationAgreement,
+    )
+    from .extended_retriever_span_record_with_children_annotations import (
+        ExtendedRetrieverSpanRecordWithChildrenAnnotations,
+    )
+    from .extended_retriever_span_record_with_children_annotations_additional_property import (
+        ExtendedRetrieverSpanRecordWithChildrenAnnotationsAdditionalProperty,
+    )
+    from .extended_retriever_span_record_with_children_dataset_metadata import (
+        ExtendedRetrieverSpanRecordWithChildrenDatasetMetadata,
+    )
+    from .extended_retriever_span_record_with_children_feedback_rating_info import (
+        ExtendedRetrieverSpanRecordWithChildrenFeedbackRatingInfo,
+    )
+    from .extended_retriever_span_record_with_children_files_type_0 import (
+        ExtendedRetrieverSpanRecordWithChildrenFilesType0,
+    )
+    from .extended_retriever_span_record_with_children_metric_info_type_0 import (
+        ExtendedRetrieverSpanRecordWithChildrenMetricInfoType0,
+    )
+    from .extended_retriever_span_record_with_children_user_metadata import (
+        ExtendedRetrieverSpanRecordWithChildrenUserMetadata,
+    )
+    from .extended_session_record import ExtendedSessionRecord
+    from .extended_session_record_annotation_aggregates import ExtendedSessionRecordAnnotationAggregates
+    from .extended_session_record_annotation_agreement import ExtendedSessionRecordAnnotationAgreement
+    from .extended_session_record_annotations import ExtendedSessionRecordAnnotations
+    from .extended_session_record_annotations_additional_property import (
+        ExtendedSessionRecordAnnotationsAdditionalProperty,
+    )
+    from .extended_session_record_dataset_metadata import ExtendedSessionRecordDatasetMetadata
+    from .extended_session_record_feedback_rating_info import ExtendedSessionRecordFeedbackRatingInfo
+    from .extended_session_record_files_type_0 import ExtendedSessionRecordFilesType0
+    from .extended_session_record_metric_info_type_0 import ExtendedSessionRecordMetricInfoType0
+    from .extended_session_record_user_metadata import ExtendedSessionRecordUserMetadata
+    from .extended_session_record_with_children import ExtendedSessionRecordWithChildren
+    from .extended_session_record_with_children_annotation_aggregates import (
+        ExtendedSessionRecordWithChildrenAnnotationAggregates,
+    )
+    from .extended_session_record_with_children_annotation_agreement import (
+        ExtendedSessionRecordWithChildrenAnnotationAgreement,
+    )
+    from .extended_session_record_with_children_annotations import ExtendedSessionRecordWithChildrenAnnotations
+    from .extended_session_record_with_children_annotations_additional_property import (
+        ExtendedSessionRecordWithChildrenAnnotationsAdditionalProperty,
+    )
+    from .extended_session_record_with_children_dataset_metadata import ExtendedSessionRecordWithChildrenDatasetMetadata
+    from .extended_session_record_with_children_feedback_rating_info import (
+        ExtendedSessionRecordWithChildrenFeedbackRatingInfo,
+    )
+    from .extended_session_record_with_children_files_type_0 import ExtendedSessionRecordWithChildrenFilesType0
+    from .extended_session_record_with_children_metric_info_type_0 import (
+        ExtendedSessionRecordWithChildrenMetricInfoType0,
+    )
+    from .extended_session_record_with_children_user_metadata import ExtendedSessionRecordWithChildrenUserMetadata
+    from .extended_tool_span_record import ExtendedToolSpanRecord
+    from .extended_tool_span_record_annotation_aggregates import ExtendedToolSpanRecordAnnotationAggregates
+    from .extended_tool_span_record_annotation_agreement import ExtendedToolSpanRecordAnnotationAgreement
+    from .extended_tool_span_record_annotations import ExtendedToolSpanRecordAnnotations
+    from .extended_tool_span_record_annotations_additional_property import (
+        ExtendedToolSpanRecordAnnotationsAdditionalProperty,
+    )
+    from .extended_tool_span_record_dataset_metadata import ExtendedToolSpanRecordDatasetMetadata
+    from .extended_tool_span_record_feedback_rating_info import ExtendedToolSpanRecordFeedbackRatingInfo
+    from .extended_tool_span_record_files_type_0 import ExtendedToolSpanRecordFilesType0
+    from .extended_tool_span_record_metric_info_type_0 import ExtendedToolSpanRecordMetricInfoType0
+    from .extended_tool_span_record_user_metadata import ExtendedToolSpanRecordUserMetadata
+    from .extended_tool_span_record_with_children import ExtendedToolSpanRecordWithChildren
+    from .extended_tool_span_record_with_children_annotation_aggregates import (
+        ExtendedToolSpanRecordWithChildrenAnnotationAggregates,
+    )
+    from .extended_tool_span_record_with_children_annotation_agreement import (
+        ExtendedToolSpanRecordWithChildrenAnnotationAgreement,
+    )
+    from .extended_tool_span_record_with_children_annotations import ExtendedToolSpanRecordWithChildrenAnnotations
+    from .extended_tool_span_record_with_children_annotations_additional_property import (
+        ExtendedToolSpanRecordWithChildrenAnnotationsAdditionalProperty,
+    )
+    from .extended_tool_span_record_with_children_dataset_metadata import (
+        ExtendedToolSpanRecordWithChildrenDatasetMetadata,
+    )
+    from .extended_tool_span_record_with_children_feedback_rating_info import (
+        ExtendedToolSpanRecordWithChildrenFeedbackRatingInfo,
+    )
+    from .extended_tool_span_record_with_children_files_type_0 import ExtendedToolSpanRecordWithChildrenFilesType0
+    from .extended_tool_span_record_with_children_metric_info_type_0 import (
+        ExtendedToolSpanRecordWithChildrenMetricInfoType0,
+    )
+    from .extended_tool_span_record_with_children_user_metadata import ExtendedToolSpanRecordWithChildrenUserMetadata
+    from .extended_trace_record import ExtendedTraceRecord
+    from .extended_trace_record_annotation_aggregates import ExtendedTraceRecordAnnotationAggregates
+    from .extended_trace_record_annotation_agreement import ExtendedTraceRecordAnnotationAgreement
+    from .extended_trace_record_annotations import ExtendedTraceRecordAnnotations
+    from .extended_trace_record_annotations_additional_property import ExtendedTraceRecordAnnotationsAdditionalProperty
+    from .extended_trace_record_dataset_metadata import ExtendedTraceRecordDatasetMetadata
+    from .extended_trace_record_feedback_rating_info import ExtendedTraceRecordFeedbackRatingInfo
+    from .extended_trace_record_files_type_0 import ExtendedTraceRecordFilesType0
+    from .extended_trace_record_metric_info_type_0 import ExtendedTraceRecordMetricInfoType0
+    from .extended_trace_record_user_metadata import ExtendedTraceRecordUserMetadata
+    from .extended_trace_record_with_children import ExtendedTraceRecordWithChildren
+    from .extended_trace_record_with_children_annotation_aggregates import (
+        ExtendedTraceRecordWithChildrenAnnotationAggregates,
+    )
+    from .extended_trace_record_with_children_annotation_agreement import (
+        ExtendedTraceRecordWithChildrenAnnotationAgreement,
+    )
+    from .extended_trace_record_with_children_annotations import ExtendedTraceRecordWithChildrenAnnotations
+    from .extended_trace_record_with_children_annotations_additional_property import (
+        ExtendedTraceRecordWithChildrenAnnotationsAdditionalProperty,
+    )
+    from .extended_trace_record_with_children_dataset_metadata import ExtendedTraceRecordWithChildrenDatasetMetadata
+    from .extended_trace_record_with_children_feedback_rating_info import (
+        ExtendedTraceRecordWithChildrenFeedbackRatingInfo,
+    )
+    from .extended_trace_record_with_children_files_type_0 import ExtendedTraceRecordWithChildrenFilesType0
+    from .extended_trace_record_with_children_metric_info_type_0 import ExtendedTraceRecordWithChildrenMetricInfoType0
+    from .extended_trace_record_with_children_user_metadata import ExtendedTraceRecordWithChildrenUserMetadata
+    from .extended_workflow_span_record import ExtendedWorkflowSpanRecord
+    from .extended_workflow_span_record_annotation_aggregates import ExtendedWorkflowSpanRecordAnnotationAggregates
+    from .extended_workflow_span_record_annotation_agreement import ExtendedWorkflowSpanRecordAnnotationAgreement
+    from .extended_workflow_span_record_annotations import ExtendedWorkflowSpanRecordAnnotations
+    from .extended_workflow_span_record_annotations_additional_property import (
+        ExtendedWorkflowSpanRecordAnnotationsAdditionalProperty,
+    )
+    from .extended_workflow_span_record_dataset_metadata import ExtendedWorkflowSpanRecordDatasetMetadata
+    from .extended_workflow_span_record_feedback_rating_info import ExtendedWorkflowSpanRecordFeedbackRatingInfo
+    from .extended_workflow_span_record_files_type_0 import ExtendedWorkflowSpanRecordFilesType0
+    from .extended_workflow_span_record_metric_info_type_0 import ExtendedWorkflowSpanRecordMetricInfoType0
+    from .extended_workflow_span_record_user_metadata import ExtendedWorkflowSpanRecordUserMetadata
+    from .extended_workflow_span_record_with_children import ExtendedWorkflowSpanRecordWithChildren
+    from .extended_workflow_span_record_with_children_annotation_aggregates import (
+        ExtendedWorkflowSpanRecordWithChildrenAnnotationAggregates,
+    )
+    from .extended_workflow_span_record_with_children_annotation_agreement import (
+        ExtendedWorkflowSpanRecordWithChildrenAnnotationAgreement,
+    )
+    from .extended_workflow_span_record_with_children_annotations import (
+        ExtendedWorkflowSpanRecordWithChildrenAnnotations,
+    )
+    from .extended_workflow_span_record_with_children_annotations_additional_property import (
+        ExtendedWorkflowSpanRecordWithChildrenAnnotationsAdditionalProperty,
+    )
+    from .extended_workflow_span_record_with_children_dataset_metadata import (
+        ExtendedWorkflowSpanRecordWithChildrenDatasetMetadata,
+    )
+    from .extended_workflow_span_record_with_children_feedback_rating_info import (
+        ExtendedWorkflowSpanRecordWithChildrenFeedbackRatingInfo,
+    )
+    from .extended_workflow_span_record_with_children_files_type_0 import (
+        ExtendedWorkflowSpanRecordWithChildrenFilesType0,
+    )
+    from .extended_workflow_span_record_with_children_metric_info_type_0 import (
+        ExtendedWorkflowSpanRecordWithChildrenMetricInfoType0,
+    )
+    from .extended_workflow_span_record_with_children_user_metadata import (
+        ExtendedWorkflowSpanRecordWithChildrenUserMetadata,
+    )
+    from .factuality_template import FactualityTemplate
+    from .factuality_template_response_schema_type_0 import FactualityTemplateResponseSchemaType0
+    from .feature_integration_costs import FeatureIntegrationCosts
+    from .feedback_aggregate import FeedbackAggregate
+    from .feedback_rating_info import FeedbackRatingInfo
+    from .feedback_type import FeedbackType
+    from .few_shot_example import FewShotExample
+    from .file_content_part import FileContentPart
+    from .file_metadata import FileMetadata
+    from .file_source import FileSource
+    from .file_status import FileStatus
+    from .filter_leaf_log_records_filter import FilterLeafLogRecordsFilter
+    from .fine_tuned_scorer import FineTunedScorer
+    from .fine_tuned_scorer_action import FineTunedScorerAction
+    from .fine_tuned_scorer_response import FineTunedScorerResponse
+    from .fine_tuned_scorer_response_class_name_to_vocab_ix_type_0 import FineTunedScorerResponseClassNameToVocabIxType0
+    from .fine_tuned_scorer_response_class_name_to_vocab_ix_type_1 import FineTunedScorerResponseClassNameToVocabIxType1
+    from .generated_scorer_action import GeneratedScorerAction
+    from .generated_scorer_configuration import GeneratedScorerConfiguration
+    from .generated_scorer_response import GeneratedScorerResponse
+    from .generated_scorer_validation_response import GeneratedScorerValidationResponse
+    from .generation_response import GenerationResponse
+    from .get_integration_status_integrations_name_status_get_response_get_integration_status_integrations_name_status_get import (
+        GetIntegrationStatusIntegrationsNameStatusGetResponseGetIntegrationStatusIntegrationsNameStatusGet,
+    )
+    from .get_integrations_and_model_info_for_run_llm_integrations_projects_project_id_runs_run_id_get_get_run_integrations_response import (
+        GetIntegrationsAndModelInfoForRunLlmIntegrationsProjectsProjectIdRunsRunIdGetGetRunIntegrationsResponse,
+    )
+    from .get_integrations_and_model_info_llm_integrations_get_response_get_integrations_and_model_info_llm_integrations_get import (
+        GetIntegrationsAndModelInfoLlmIntegrationsGetResponseGetIntegrationsAndModelInfoLlmIntegrationsGet,
+    )
+    from .get_named_custom_integration_status_integrations_custom_name_status_get_response_get_named_custom_integration_status_integrations_custom_name_status_get import (
+        GetNamedCustomIntegrationStatusIntegrationsCustomNameStatusGetResponseGetNamedCustomIntegrationStatusIntegrationsCustomNameStatusGet,
+    )
+    from .get_projects_paginated_response import GetProjectsPaginatedResponse
+    from .get_projects_paginated_response_v2 import GetProjectsPaginatedResponseV2
+    from .ground_truth_adherence_scorer import GroundTruthAdherenceScorer
+    from .ground_truth_adherence_template import GroundTruthAdherenceTemplate
+    from .ground_truth_adherence_template_response_schema_type_0 import GroundTruthAdherenceTemplateResponseSchemaType0
+    from .groundedness_template import GroundednessTemplate
+    from .groundedness_template_response_schema_type_0 import GroundednessTemplateResponseSchemaType0
+    from .group_action import GroupAction
+    from .group_collaborator import GroupCollaborator
+    from .group_collaborator_create import GroupCollaboratorCreate
+    from .group_member_action import GroupMemberAction
+    from .hallucination_segment import HallucinationSegment
+    from .health_score_result import HealthScoreResult
+    from .health_score_result_secondary import HealthScoreResultSecondary
+    from .health_score_type import HealthScoreType
+    from .healthcheck_response import HealthcheckResponse
+    from .histogram import Histogram
+    from .histogram_bucket import HistogramBucket
+    from .histogram_strategy import HistogramStrategy
+    from .http_validation_error import HTTPValidationError
+    from .image_generation_event import ImageGenerationEvent
+    from .image_generation_event_images_type_0_item import ImageGenerationEventImagesType0Item
+    from .image_generation_event_metadata_type_0 import ImageGenerationEventMetadataType0
+    from .input_map import InputMap
+    from .input_pii_scorer import InputPIIScorer
+    from .input_sexist_scorer import InputSexistScorer
+    from .input_sexist_scorer_type import InputSexistScorerType
+    from .input_sexist_template import InputSexistTemplate
+    from .input_sexist_template_response_schema_type_0 import InputSexistTemplateResponseSchemaType0
+    from .input_tone_scorer import InputToneScorer
+    from .input_toxicity_scorer import InputToxicityScorer
+    from .input_toxicity_scorer_type import InputToxicityScorerType
+    from .input_toxicity_template import InputToxicityTemplate
+    from .input_toxicity_template_response_schema_type_0 import InputToxicityTemplateResponseSchemaType0
+    from .input_type_enum import InputTypeEnum
+    from .insight_summary import InsightSummary
+    from .insight_summary_priority_category_type_0 import InsightSummaryPriorityCategoryType0
+    from .insight_type import InsightType
+    from .instruction_adherence_scorer import InstructionAdherenceScorer
+    from .instruction_adherence_template import InstructionAdherenceTemplate
+    from .instruction_adherence_template_response_schema_type_0 import InstructionAdherenceTemplateResponseSchemaType0
+    from .integration_action import IntegrationAction
+    from .integration_costs_data_point import IntegrationCostsDataPoint
+    from .integration_costs_response import IntegrationCostsResponse
+    from .integration_db import IntegrationDB
+    from .integration_disable_request import IntegrationDisableRequest
+    from .integration_models_response import IntegrationModelsResponse
+    from .integration_models_response_recommended_models import IntegrationModelsResponseRecommendedModels
+    from .integration_provider import IntegrationProvider
+    from .integration_select_request import IntegrationSelectRequest
+    from .internal_tool_call import InternalToolCall
+    from .internal_tool_call_input_type_0 import InternalToolCallInputType0
+    from .internal_tool_call_metadata_type_0 import InternalToolCallMetadataType0
+    from .internal_tool_call_output_type_0 import InternalToolCallOutputType0
+    from .invalid_result import InvalidResult
+    from .invoke_response import InvokeResponse
+    from .invoke_response_headers_type_0 import InvokeResponseHeadersType0
+    from .invoke_response_metadata_type_0 import InvokeResponseMetadataType0
+    from .invoke_response_metric_results import InvokeResponseMetricResults
+    from .job_db import JobDB
+    from .job_db_request_data import JobDBRequestData
+    from .job_progress import JobProgress
+    from .like_dislike_aggregate import LikeDislikeAggregate
+    from .like_dislike_constraints import LikeDislikeConstraints
+    from .like_dislike_rating import LikeDislikeRating
+    from .list_annotation_queue_collaborators_response import ListAnnotationQueueCollaboratorsResponse
+    from .list_annotation_queue_params import ListAnnotationQueueParams
+    from .list_annotation_queue_response import ListAnnotationQueueResponse
+    from .list_dataset_params import ListDatasetParams
+    from .list_dataset_projects_response import ListDatasetProjectsResponse
+    from .list_dataset_response import ListDatasetResponse
+    from .list_dataset_version_params import ListDatasetVersionParams
+    from .list_dataset_version_response import ListDatasetVersionResponse
+    from .list_experiment_response import ListExperimentResponse
+    from .list_group_collaborators_response import ListGroupCollaboratorsResponse
+    from .list_log_stream_response import ListLogStreamResponse
+    from .list_prompt_template_params import ListPromptTemplateParams
+    from .list_prompt_template_response import ListPromptTemplateResponse
+    from .list_prompt_template_version_params import ListPromptTemplateVersionParams
+    from .list_prompt_template_version_response import ListPromptTemplateVersionResponse
+    from .list_scorer_versions_response import ListScorerVersionsResponse
+    from .list_scorers_request import ListScorersRequest
+    from .list_scorers_response import ListScorersResponse
+    from .list_user_collaborators_response import ListUserCollaboratorsResponse
+    from .llm_export_format import LLMExportFormat
+    from .llm_integration import LLMIntegration
+    from .llm_metrics import LlmMetrics
+    from .llm_span import LlmSpan
+    from .llm_span_dataset_metadata import LlmSpanDatasetMetadata
+    from .llm_span_tools_type_0_item import LlmSpanToolsType0Item
+    from .llm_span_user_metadata import LlmSpanUserMetadata
+    from .log_records_available_columns_request import LogRecordsAvailableColumnsRequest
+    from .log_records_available_columns_response import LogRecordsAvailableColumnsResponse
+    from .log_records_boolean_filter import LogRecordsBooleanFilter
+    from .log_records_boolean_filter_operator import LogRecordsBooleanFilterOperator
+    from .log_records_collection_filter import LogRecordsCollectionFilter
+    from .log_records_collection_filter_operator import LogRecordsCollectionFilterOperator
+    from .log_records_column_info import LogRecordsColumnInfo
+    from .log_records_column_info_label_color_type_0 import LogRecordsColumnInfoLabelColorType0
+    from .log_records_custom_metrics_query_request import LogRecordsCustomMetricsQueryRequest
+    from .log_records_date_filter import LogRecordsDateFilter
+    from .log_records_date_filter_operator import LogRecordsDateFilterOperator
+    from .log_records_delete_request import LogRecordsDeleteRequest
+    from .log_records_delete_response import LogRecordsDeleteResponse
+    from .log_records_export_request import LogRecordsExportRequest
+    from .log_records_filter_type import LogRecordsFilterType
+    from .log_records_fully_annotated_filter import LogRecordsFullyAnnotatedFilter
+    from .log_records_id_filter import LogRecordsIDFilter
+    from .log_records_id_filter_operator import LogRecordsIDFilterOperator
+    from .log_records_metrics_query_request import LogRecordsMetricsQueryRequest
+    from .log_records_metrics_response import LogRecordsMetricsResponse
+    from .log_records_metrics_response_aggregate_metrics import LogRecordsMetricsResponseAggregateMetrics
+    from .log_records_metrics_response_aggregate_metrics_additional_property_type_2 import (
+        LogRecordsMetricsResponseAggregateMetricsAdditionalPropertyType2,
+    )
+    from .log_records_metrics_response_bucketed_metrics import LogRecordsMetricsResponseBucketedMetrics
+    from .log_records_metrics_response_standard_errors_type_0 import LogRecordsMetricsResponseStandardErrorsType0
+    from .log_records_number_filter import LogRecordsNumberFilter
+    from .log_records_number_filter_operator import LogRecordsNumberFilterOperator
+    from .log_records_partial_query_request import LogRecordsPartialQueryRequest
+    from .log_records_partial_query_response import LogRecordsPartialQueryResponse
+    from .log_records_query_count_request import LogRecordsQueryCountRequest
+    from .log_records_query_count_response import LogRecordsQueryCountResponse
+    from .log_records_query_request import LogRecordsQueryRequest
+    from .log_records_query_response import LogRecordsQueryResponse
+    from .log_records_sort_clause import LogRecordsSortClause
+    from .log_records_text_filter import LogRecordsTextFilter
+    from .log_records_text_filter_operator import LogRecordsTextFilterOperator
+    from .log_span_update_request import LogSpanUpdateRequest
+    from .log_span_update_response import LogSpanUpdateResponse
+    from .log_spans_ingest_request import LogSpansIngestRequest
+    from .log_spans_ingest_response import LogSpansIngestResponse
+    from .log_stream_create_request import LogStreamCreateRequest
+    from .log_stream_info import LogStreamInfo
+    from .log_stream_response import LogStreamResponse
+    from .log_stream_update_request import LogStreamUpdateRequest
+    from .log_trace_update_request import LogTraceUpdateRequest
+    from .log_trace_update_response import LogTraceUpdateResponse
+    from .log_traces_ingest_request import LogTracesIngestRequest
+    from .log_traces_ingest_response import LogTracesIngestResponse
+    from .logging_method import LoggingMethod
+    from .luna_input_type_enum import LunaInputTypeEnum
+    from .luna_output_type_enum import LunaOutputTypeEnum
+    from .mcp_approval_request_event import MCPApprovalRequestEvent
+    from .mcp_approval_request_event_metadata_type_0 import MCPApprovalRequestEventMetadataType0
+    from .mcp_approval_request_event_tool_invocation_type_0 import MCPApprovalRequestEventToolInvocationType0
+    from .mcp_call_event import MCPCallEvent
+    from .mcp_call_event_arguments_type_0 import MCPCallEventArgumentsType0
+    from .mcp_call_event_metadata_type_0 import MCPCallEventMetadataType0
+    from .mcp_call_event_result_type_0 import MCPCallEventResultType0
+    from .mcp_list_tools_event import MCPListToolsEvent
+    from .mcp_list_tools_event_metadata_type_0 import MCPListToolsEventMetadataType0
+    from .mcp_list_tools_event_tools_type_0_item import MCPListToolsEventToolsType0Item
+    from .message import Message
+    from .message_event import MessageEvent
+    from .message_event_content_parts_type_0_item import MessageEventContentPartsType0Item
+    from .message_event_metadata_type_0 import MessageEventMetadataType0
+    from .message_role import MessageRole
+    from .messages_list_item import MessagesListItem
+    from .messages_list_item_role import MessagesListItemRole
+    from .metadata_filter import MetadataFilter
+    from .metadata_filter_operator import MetadataFilterOperator
+    from .metric_aggregates import MetricAggregates
+    from .metric_aggregates_value_distribution_type_0 import MetricAggregatesValueDistributionType0
+    from .metric_aggregation import MetricAggregation
+    from .metric_aggregation_detail import MetricAggregationDetail
+    from .metric_color import MetricColor
+    from .metric_color_picker_boolean import MetricColorPickerBoolean
+    from .metric_color_picker_categorical import MetricColorPickerCategorical
+    from .metric_color_picker_multi_label import MetricColorPickerMultiLabel
+    from .metric_color_picker_numeric import MetricColorPickerNumeric
+    from .metric_computation import MetricComputation
+    from .metric_computation_status import MetricComputationStatus
+    from .metric_computation_value_type_4 import MetricComputationValueType4
+    from .metric_computing import MetricComputing
+    from .metric_critique_columnar import MetricCritiqueColumnar
+    from .metric_critique_content import MetricCritiqueContent
+    from .metric_error import MetricError
+    from .metric_failed import MetricFailed
+    from .metric_not_applicable import MetricNotApplicable
+    from .metric_not_computed import MetricNotComputed
+    from .metric_pending import MetricPending
+    from .metric_roll_up import MetricRollUp
+    from .metric_roll_up_metadata_type_0 import MetricRollUpMetadataType0
+    from .metric_roll_up_roll_up_metrics import MetricRollUpRollUpMetrics
+    from .metric_roll_up_roll_up_metrics_additional_property_type_1 import (
+        MetricRollUpRollUpMetricsAdditionalPropertyType1,
+    )
+    from .metric_settings_request import MetricSettingsRequest
+    from .metric_settings_response import MetricSettingsResponse
+    from .metric_success import MetricSuccess
+    from .metric_success_metadata_type_0 import MetricSuccessMetadataType0
+    from .metric_threshold import MetricThreshold
+    from .metrics import Metrics
+    from .metrics_testing_available_columns_request import MetricsTestingAvailableColumnsRequest
+    from .mistral_integration import MistralIntegration
+    from .mistral_integration_create import MistralIntegrationCreate
+    from .mistral_integration_extra_type_0 import MistralIntegrationExtraType0
+    from .modality_filter import ModalityFilter
+    from .modality_filter_operator import ModalityFilterOperator
+    from .model import Model
+    from .model_cost_by import ModelCostBy
+    from .model_properties import ModelProperties
+    from .model_type import ModelType
+    from .multi_modal_model_integration_config import MultiModalModelIntegrationConfig
+    from .multimodal_capability import MultimodalCapability
+    from .name import Name
+    from .node_name_filter import NodeNameFilter
+    from .node_name_filter_operator import NodeNameFilterOperator
+    from .node_type import NodeType
+    from .not_node_log_records_filter import NotNodeLogRecordsFilter
+    from .numeric_color_constraint import NumericColorConstraint
+    from .numeric_color_constraint_operator import NumericColorConstraintOperator
+    from .numeric_roll_up_method import NumericRollUpMethod
+    from .nvidia_integration import NvidiaIntegration
+    from .nvidia_integration_create import NvidiaIntegrationCreate
+    from .nvidia_integration_extra_type_0 import NvidiaIntegrationExtraType0
+    from .open_ai_function import OpenAIFunction
+    from .open_ai_integration import OpenAIIntegration
+    from .open_ai_integration_create import OpenAIIntegrationCreate
+    from .open_ai_integration_extra_type_0 import OpenAIIntegrationExtraType0
+    from .open_ai_tool_choice import OpenAIToolChoice
+    from .or_node_log_records_filter import OrNodeLogRecordsFilter
+    from .organization_action import OrganizationAction
+    from .output_map import OutputMap
+    from .output_pii_scorer import OutputPIIScorer
+    from .output_sexist_scorer import OutputSexistScorer
+    from .output_sexist_scorer_type import OutputSexistScorerType
+    from .output_tone_scorer import OutputToneScorer
+    from .output_toxicity_scorer import OutputToxicityScorer
+    from .output_toxicity_scorer_type import OutputToxicityScorerType
+    from .output_type_enum import OutputTypeEnum
+    from .override_action import OverrideAction
+    from .partial_extended_agent_span_record import PartialExtendedAgentSpanRecord
+    from .partial_extended_agent_span_record_annotation_aggregates import (
+        PartialExtendedAgentSpanRecordAnnotationAggregates,
+    )
+    from .partial_extended_agent_span_record_annotation_agreement import (
+        PartialExtendedAgentSpanRecordAnnotationAgreement,
+    )
+    from .partial_extended_agent_span_record_annotations import PartialExtendedAgentSpanRecordAnnotations
+    from .partial_extended_agent_span_record_annotations_additional_property import (
+        PartialExtendedAgentSpanRecordAnnotationsAdditionalProperty,
+    )
+    from .partial_extended_agent_span_record_dataset_metadata import PartialExtendedAgentSpanRecordDatasetMetadata
+    from .partial_extended_agent_span_record_feedback_rating_info import (
+        PartialExtendedAgentSpanRecordFeedbackRatingInfo,
+    )
+    from .partial_extended_agent_span_record_files_type_0 import PartialExtendedAgentSpanRecordFilesType0
+    from .partial_extended_agent_span_record_metric_info_type_0 import PartialExtendedAgentSpanRecordMetricInfoType0
+    from .partial_extended_agent_span_record_user_metadata import PartialExtendedAgentSpanRecordUserMetadata
+    from .partial_extended_control_span_record import PartialExtendedControlSpanRecord
+    from .partial_extended_control_span_record_annotation_aggregates import (
+        PartialExtendedControlSpanRecordAnnotationAggregates,
+    )
+    from .partial_extended_control_span_record_annotation_agreement import (
+        PartialExtendedControlSpanRecordAnnotationAgreement,
+    )
+    from .partial_extended_control_span_record_annotations import PartialExtendedControlSpanRecordAnnotations
+    from .partial_extended_control_span_record_annotations_additional_property import (
+        PartialExtendedControlSpanRecordAnnotationsAdditionalProperty,
+    )
+    from .partial_extended_control_span_record_dataset_metadata import PartialExtendedControlSpanRecordDatasetMetadata
+    from .partial_extended_control_span_record_feedback_rating_info import (
+        PartialExtendedControlSpanRecordFeedbackRatingInfo,
+    )
+    from .partial_extended_control_span_record_files_type_0 import PartialExtendedControlSpanRecordFilesType0
+    from .partial_extended_control_span_record_metric_info_type_0 import PartialExtendedControlSpanRecordMetricInfoType0
+    from .partial_extended_control_span_record_user_metadata import PartialExtendedControlSpanRecordUserMetadata
+    from .partial_extended_llm_span_record import PartialExtendedLlmSpanRecord
+    from .partial_extended_llm_span_record_annotation_aggregates import PartialExtendedLlmSpanRecordAnnotationAggregates
+    from .partial_extended_llm_span_record_annotation_agreement import PartialExtendedLlmSpanRecordAnnotationAgreement
+    from .partial_extended_llm_span_record_annotations import PartialExtendedLlmSpanRecordAnnotations
+    from .partial_extended_llm_span_record_annotations_additional_property import (
+        PartialExtendedLlmSpanRecordAnnotationsAdditionalProperty,
+    )
+    from .partial_extended_llm_span_record_dataset_metadata import PartialExtendedLlmSpanRecordDatasetMetadata
+    from .partial_extended_llm_span_record_feedback_rating_info import PartialExtendedLlmSpanRecordFeedbackRatingInfo
+    from .partial_extended_llm_span_record_files_type_0 import PartialExtendedLlmSpanRecordFilesType0
+    from .partial_extended_llm_span_record_metric_info_type_0 import PartialExtendedLlmSpanRecordMetricInfoType0
+    from .partial_extended_llm_span_record_tools_type_0_item import PartialExtendedLlmSpanRecordToolsType0Item
+    from .partial_extended_llm_span_record_user_metadata import PartialExtendedLlmSpanRecordUserMetadata
+    from .partial_extended_retriever_span_record import PartialExtendedRetrieverSpanRecord
+    from .partial_extended_retriever_span_record_annotation_aggregates import (
+        PartialExtendedRetrieverSpanRecordAnnotationAggregates,
+    )
+    from .partial_extended_retriever_span_record_annotation_agreement import (
+        PartialExtendedRetrieverSpanRecordAnnotationAgreement,
+    )
+    from .partial_extended_retriever_span_record_annotations import PartialExtendedRetrieverSpanRecordAnnotations
+    from .partial_extended_retriever_span_record_annotations_additional_property import (
+        PartialExtendedRetrieverSpanRecordAnnotationsAdditionalProperty,
+    )
+    from .partial_extended_retriever_span_record_dataset_metadata import (
+        PartialExtendedRetrieverSpanRecordDatasetMetadata,
+    )
+    from .partial_extended_retriever_span_record_feedback_rating_info import (
+        PartialExtendedRetrieverSpanRecordFeedbackRatingInfo,
+    )
+    from .partial_extended_retriever_span_record_files_type_0 import PartialExtendedRetrieverSpanRecordFilesType0
+    from .partial_extended_retriever_span_record_metric_info_type_0 import (
+        PartialExtendedRetrieverSpanRecordMetricInfoType0,
+    )
+    from .partial_extended_retriever_span_record_user_metadata import PartialExtendedRetrieverSpanRecordUserMetadata
+    from .partial_extended_session_record import PartialExtendedSessionRecord
+    from .partial_extended_session_record_annotation_aggregates import PartialExtendedSessionRecordAnnotationAggregates
+    from .partial_extended_session_record_annotation_agreement import PartialExtendedSessionRecordAnnotationAgreement
+    from .partial_extended_session_record_annotations import PartialExtendedSessionRecordAnnotations
+    from .partial_extended_session_record_annotations_additional_property import (
+        PartialExtendedSessionRecordAnnotationsAdditionalProperty,
+    )
+    from .partial_extended_session_record_dataset_metadata import PartialExtendedSessionRecordDatasetMetadata
+    from .partial_extended_session_record_feedback_rating_info import PartialExtendedSessionRecordFeedbackRatingInfo
+    from .partial_extended_session_record_files_type_0 import PartialExtendedSessionRecordFilesType0
+    from .partial_extended_session_record_metric_info_type_0 import PartialExtendedSessionRecordMetricInfoType0
+    from .partial_extended_session_record_user_metadata import PartialExtendedSessionRecordUserMetadata
+    from .partial_extended_tool_span_record import PartialExtendedToolSpanRecord
+    from .partial_extended_tool_span_record_annotation_aggregates import (
+        PartialExtendedToolSpanRecordAnnotationAggregates,
+    )
+    from .partial_extended_tool_span_record_annotation_agreement import PartialExtendedToolSpanRecordAnnotationAgreement
+    from .partial_extended_tool_span_record_annotations import PartialExtendedToolSpanRecordAnnotations
+    from .partial_extended_tool_span_record_annotations_additional_property import (
+        PartialExtendedToolSpanRecordAnnotationsAdditionalProperty,
+    )
+    from .partial_extended_tool_span_record_dataset_metadata import PartialExtendedToolSpanRecordDatasetMetadata
+    from .partial_extended_tool_span_record_feedback_rating_info import PartialExtendedToolSpanRecordFeedbackRatingInfo
+    from .partial_extended_tool_span_record_files_type_0 import PartialExtendedToolSpanRecordFilesType0
+    from .partial_extended_tool_span_record_metric_info_type_0 import PartialExtendedToolSpanRecordMetricInfoType0
+    from .partial_extended_tool_span_record_user_metadata import PartialExtendedToolSpanRecordUserMetadata
+    from .partial_extended_trace_record import PartialExtendedTraceRecord
+    from .partial_extended_trace_record_annotation_aggregates import PartialExtendedTraceRecordAnnotationAggregates
+    from .partial_extended_trace_record_annotation_agreement import PartialExtendedTraceRecordAnnotationAgreement
+    from .partial_extended_trace_record_annotations import PartialExtendedTraceRecordAnnotations
+    from .partial_extended_trace_record_annotations_additional_property import (
+        PartialExtendedTraceRecordAnnotationsAdditionalProperty,
+    )
+    from .partial_extended_trace_record_dataset_metadata import PartialExtendedTraceRecordDatasetMetadata
+    from .partial_extended_trace_record_feedback_rating_info import PartialExtendedTraceRecordFeedbackRatingInfo
+    from .partial_extended_trace_record_files_type_0 import PartialExtendedTraceRecordFilesType0
+    from .partial_extended_trace_record_metric_info_type_0 import PartialExtendedTraceRecordMetricInfoType0
+    from .partial_extended_trace_record_user_metadata import PartialExtendedTraceRecordUserMetadata
+    from .partial_extended_workflow_span_record import PartialExtendedWorkflowSpanRecord
+    from .partial_extended_workflow_span_record_annotation_aggregates import (
+        PartialExtendedWorkflowSpanRecordAnnotationAggregates,
+    )
+    from .partial_extended_workflow_span_record_annotation_agreement import (
+        PartialExtendedWorkflowSpanRecordAnnotationAgreement,
+    )
+    from .partial_extended_workflow_span_record_annotations import PartialExtendedWorkflowSpanRecordAnnotations
+    from .partial_extended_workflow_span_record_annotations_additional_property import (
+        PartialExtendedWorkflowSpanRecordAnnotationsAdditionalProperty,
+    )
+    from .partial_extended_workflow_span_record_dataset_metadata import PartialExtendedWorkflowSpanRecordDatasetMetadata
+    from .partial_extended_workflow_span_record_feedback_rating_info import (
+        PartialExtendedWorkflowSpanRecordFeedbackRatingInfo,
+    )
+    from .partial_extended_workflow_span_record_files_type_0 import PartialExtendedWorkflowSpanRecordFilesType0
+    from .partial_extended_workflow_span_record_metric_info_type_0 import (
+        PartialExtendedWorkflowSpanRecordMetricInfoType0,
+    )
+    from .partial_extended_workflow_span_record_user_metadata import PartialExtendedWorkflowSpanRecordUserMetadata
+    from .passthrough_action import PassthroughAction
+    from .payload import Payload
+    from .permission import Permission
+    from .preview_dataset_request import PreviewDatasetRequest
+    from .project_action import ProjectAction
+    from .project_bookmark_filter import ProjectBookmarkFilter
+    from .project_bookmark_sort import ProjectBookmarkSort
+    from .project_collection_params import ProjectCollectionParams
+    from .project_create import ProjectCreate
+    from .project_create_response import ProjectCreateResponse
+    from .project_created_at_filter import ProjectCreatedAtFilter
+    from .project_created_at_filter_operator import ProjectCreatedAtFilterOperator
+    from .project_created_at_sort_v1 import ProjectCreatedAtSortV1
+    from .project_creator_filter import ProjectCreatorFilter
+    from .project_creator_filter_operator import ProjectCreatorFilterOperator
+    from .project_db import ProjectDB
+    from .project_db_thin import ProjectDBThin
+    from .project_delete_response import ProjectDeleteResponse
+    from .project_id_filter import ProjectIDFilter
+    from .project_id_filter_operator import ProjectIDFilterOperator
+    from .project_integration_costs import ProjectIntegrationCosts
+    from .project_item import ProjectItem
+    from .project_labels import ProjectLabels
+    from .project_name_filter import ProjectNameFilter
+    from .project_name_filter_operator import ProjectNameFilterOperator
+    from .project_name_sort_v1 import ProjectNameSortV1
+    from .project_runs_filter import ProjectRunsFilter
+    from .project_runs_filter_operator import ProjectRunsFilterOperator
+    from .project_runs_sort import ProjectRunsSort
+    from .project_type import ProjectType
+    from .project_type_filter import ProjectTypeFilter
+    from .project_type_filter_operator import ProjectTypeFilterOperator
+    from .project_type_sort import ProjectTypeSort
+    from .project_update import ProjectUpdate
+    from .project_update_response import ProjectUpdateResponse
+    from .project_updated_at_filter import ProjectUpdatedAtFilter
+    from .project_updated_at_filter_operator import ProjectUpdatedAtFilterOperator
+    from .project_updated_at_sort_v1 import ProjectUpdatedAtSortV1
+    from .prompt_injection_scorer import PromptInjectionScorer
+    from .prompt_injection_scorer_type import PromptInjectionScorerType
+    from .prompt_injection_template import PromptInjectionTemplate
+    from .prompt_injection_template_response_schema_type_0 import PromptInjectionTemplateResponseSchemaType0
+    from .prompt_perplexity_scorer import PromptPerplexityScorer
+    from .prompt_run_settings import PromptRunSettings
+    from .prompt_run_settings_response_format_type_0 import PromptRunSettingsResponseFormatType0
+    from .prompt_run_settings_tools_type_0_item import PromptRunSettingsToolsType0Item
+    from .prompt_template_created_at_sort import PromptTemplateCreatedAtSort
+    from .prompt_template_created_by_filter import PromptTemplateCreatedByFilter
+    from .prompt_template_created_by_filter_operator import PromptTemplateCreatedByFilterOperator
+    from .prompt_template_name_filter import PromptTemplateNameFilter
+    from .prompt_template_name_filter_operator import PromptTemplateNameFilterOperator
+    from .prompt_template_name_sort import PromptTemplateNameSort
+    from .prompt_template_not_in_project_filter import PromptTemplateNotInProjectFilter
+    from .prompt_template_updated_at_sort import PromptTemplateUpdatedAtSort
+    from .prompt_template_used_in_project_filter import PromptTemplateUsedInProjectFilter
+    from .prompt_template_version_created_at_sort import PromptTemplateVersionCreatedAtSort
+    from .prompt_template_version_number_sort import PromptTemplateVersionNumberSort
+    from .prompt_template_version_updated_at_sort import PromptTemplateVersionUpdatedAtSort
+    from .protect_request import ProtectRequest
+    from .protect_request_headers_type_0 import ProtectRequestHeadersType0
+    from .protect_request_metadata_type_0 import ProtectRequestMetadataType0
+    from .protect_response import ProtectResponse
+    from .query_dataset_params import QueryDatasetParams
+    from .reasoning_event import ReasoningEvent
+    from .reasoning_event_metadata_type_0 import ReasoningEventMetadataType0
+    from .reasoning_event_summary_type_1_item import ReasoningEventSummaryType1Item
+    from .recommended_model_purpose import RecommendedModelPurpose
+    from .recommended_models_response import RecommendedModelsResponse
+    from .recommended_models_response_available import RecommendedModelsResponseAvailable
+    from .recommended_models_response_available_additional_property import (
+        RecommendedModelsResponseAvailableAdditionalProperty,
+    )
+    from .recommended_models_response_supported import RecommendedModelsResponseSupported
+    from .recommended_models_response_supported_additional_property import (
+        RecommendedModelsResponseSupportedAdditionalProperty,
+    )
+    from .recompute_log_records_metrics_request import RecomputeLogRecordsMetricsRequest
+    from .registered_scorer import RegisteredScorer
+    from .registered_scorer_action import RegisteredScorerAction
+    from .registered_scorer_task_result_response import RegisteredScorerTaskResultResponse
+    from .remove_records_from_queue_request import RemoveRecordsFromQueueRequest
+    from .remove_records_from_queue_response import RemoveRecordsFromQueueResponse
+    from .render_template_request import RenderTemplateRequest
+    from .render_template_response import RenderTemplateResponse
+    from .rendered_template import RenderedTemplate
+    from .retriever_span import RetrieverSpan
+    from .retriever_span_dataset_metadata import RetrieverSpanDatasetMetadata
+    from .retriever_span_user_metadata import RetrieverSpanUserMetadata
+    from .roll_up_method_display_options import RollUpMethodDisplayOptions
+    from .roll_up_strategy import RollUpStrategy
+    from .rollback_request import RollbackRequest
+    from .root_type import RootType
+    from .rouge_scorer import RougeScorer
+    from .rule import Rule
+    from .rule_operator import RuleOperator
+    from .rule_result import RuleResult
+    from .ruleset import Ruleset
+    from .ruleset_result import RulesetResult
+    from .rulesets_mixin import RulesetsMixin
+    from .run_created_at_filter import RunCreatedAtFilter
+    from .run_created_at_filter_operator import RunCreatedAtFilterOperator
+    from .run_created_at_sort import RunCreatedAtSort
+    from .run_created_by_filter import RunCreatedByFilter
+    from .run_created_by_filter_operator import RunCreatedByFilterOperator
+    from .run_db import RunDB
+    from .run_db_thin import RunDBThin
+    from .run_id_filter import RunIDFilter
+    from .run_id_filter_operator import RunIDFilterOperator
+    from .run_name_filter import RunNameFilter
+    from .run_name_filter_operator import RunNameFilterOperator
+    from .run_name_sort import RunNameSort
+    from .run_params_map import RunParamsMap
+    from .run_scorer_settings_patch_request import RunScorerSettingsPatchRequest
+    from .run_scorer_settings_response import RunScorerSettingsResponse
+    from .run_tag_create_request import RunTagCreateRequest
+    from .run_tag_db import RunTagDB
+    from .run_updated_at_filter import RunUpdatedAtFilter
+    from .run_updated_at_filter_operator import RunUpdatedAtFilterOperator
+    from .run_updated_at_sort import RunUpdatedAtSort
+    from .score_aggregate import ScoreAggregate
+    from .score_bucket import ScoreBucket
+    from .score_constraints import ScoreConstraints
+    from .score_rating import ScoreRating
+    from .scorer_action import ScorerAction
+    from .scorer_config import ScorerConfig
+    from .scorer_created_at_filter import ScorerCreatedAtFilter
+    from .scorer_created_at_filter_operator import ScorerCreatedAtFilterOperator
+    from .scorer_creator_filter import ScorerCreatorFilter
+    from .scorer_creator_filter_operator import ScorerCreatorFilterOperator
+    from .scorer_defaults import ScorerDefaults
+    from .scorer_enabled_in_playground_sort import ScorerEnabledInPlaygroundSort
+    from .scorer_enabled_in_run_sort import ScorerEnabledInRunSort
+    from .scorer_exclude_multimodal_scorers_filter import ScorerExcludeMultimodalScorersFilter
+    from .scorer_exclude_slm_scorers_filter import ScorerExcludeSlmScorersFilter
+    from .scorer_health_scores_response import ScorerHealthScoresResponse
+    from .scorer_id_filter import ScorerIDFilter
+    from .scorer_id_filter_operator import ScorerIDFilterOperator
+    from .scorer_is_global_filter import ScorerIsGlobalFilter
+    from .scorer_is_global_filter_operator import ScorerIsGlobalFilterOperator
+    from .scorer_label_filter import ScorerLabelFilter
+    from .scorer_label_filter_operator import ScorerLabelFilterOperator
+    from .scorer_model_type_filter import ScorerModelTypeFilter
+    from .scorer_model_type_filter_operator import ScorerModelTypeFilterOperator
+    from .scorer_multimodal_capabilities_filter import ScorerMultimodalCapabilitiesFilter
+    from .scorer_multimodal_capabilities_filter_operator import ScorerMultimodalCapabilitiesFilterOperator
+    from .scorer_name import ScorerName
+    from .scorer_name_filter import ScorerNameFilter
+    from .scorer_name_filter_operator import ScorerNameFilterOperator
+    from .scorer_name_sort import ScorerNameSort
+    from .scorer_response import ScorerResponse
+    from .scorer_scope_project_ref import ScorerScopeProjectRef
+    from .scorer_scope_projects_filter import ScorerScopeProjectsFilter
+    from .scorer_scoreable_node_types_filter import ScorerScoreableNodeTypesFilter
+    from .scorer_scoreable_node_types_filter_operator import ScorerScoreableNodeTypesFilterOperator
+    from .scorer_tags_filter import ScorerTagsFilter
+    from .scorer_tags_filter_operator import ScorerTagsFilterOperator
+    from .scorer_type import ScorerType
+    from .scorer_type_filter import ScorerTypeFilter
+    from .scorer_type_filter_operator import ScorerTypeFilterOperator
+    from .scorer_types import ScorerTypes
+    from .scorer_updated_at_filter import ScorerUpdatedAtFilter
+    from .scorer_updated_at_filter_operator import ScorerUpdatedAtFilterOperator
+    from .scorer_updated_at_sort import ScorerUpdatedAtSort
+    from .scorer_version_health_score_entry import ScorerVersionHealthScoreEntry
+    from .scorer_version_health_score_entry_secondary_type_0 import ScorerVersionHealthScoreEntrySecondaryType0
+    from .scorers_configuration import ScorersConfiguration
+    from .segment import Segment
+    from .segment_filter import SegmentFilter
+    from .select_columns import SelectColumns
+    from .session_create_request import SessionCreateRequest
+    from .session_create_request_user_metadata_type_0 import SessionCreateRequestUserMetadataType0
+    from .session_create_response import SessionCreateResponse
+    from .sexist_template import SexistTemplate
+    from .sexist_template_response_schema_type_0 import SexistTemplateResponseSchemaType0
+    from .stage_db import StageDB
+    from .stage_metadata import StageMetadata
+    from .stage_type import StageType
+    from .stage_with_rulesets import StageWithRulesets
+    from .standard_error import StandardError
+    from .standard_error_context import StandardErrorContext
+    from .star_aggregate import StarAggregate
+    from .star_aggregate_counts import StarAggregateCounts
+    from .star_constraints import StarConstraints
+    from .star_rating import StarRating
+    from .step_type import StepType
+    from .string_data import StringData
+    from .stub_trace_record import StubTraceRecord
+    from .subscription_config import SubscriptionConfig
+    from .synthetic_data_source_dataset import SyntheticDataSourceDataset
+    from .synthetic_data_types import SyntheticDataTypes
+    from .synthetic_dataset_extension_request import SyntheticDatasetExtensionRequest
+    from .synthetic_dataset_extension_response import SyntheticDatasetExtensionResponse
+    from .system_metric_info import SystemMetricInfo
+    from .tags_aggregate import TagsAggregate
+    from .tags_aggregate_counts import TagsAggregateCounts
+    from .tags_constraints import TagsConstraints
+    from .tags_rating import TagsRating
+    from .task_resource_limits import TaskResourceLimits
+    from .task_result_status import TaskResultStatus
+    from .task_type import TaskType
+    from .template_stub_request import TemplateStubRequest
+    from .test_score import TestScore
+    from .text_aggregate import TextAggregate
+    from .text_constraints import TextConstraints
+    from .text_content_part import TextContentPart
+    from .text_rating import TextRating
+    from .token import Token
+    from .tool_call import ToolCall
+    from .tool_call_function import ToolCallFunction
+    from .tool_error_rate_scorer import ToolErrorRateScorer
+    from .tool_error_rate_scorer_type import ToolErrorRateScorerType
+    from .tool_error_rate_template import ToolErrorRateTemplate
+    from .tool_error_rate_template_response_schema_type_0 import ToolErrorRateTemplateResponseSchemaType0
+    from .tool_selection_quality_scorer import ToolSelectionQualityScorer
+    from .tool_selection_quality_scorer_type import ToolSelectionQualityScorerType
+    from .tool_selection_quality_template import ToolSelectionQualityTemplate
+    from .tool_selection_quality_template_response_schema_type_0 import ToolSelectionQualityTemplateResponseSchemaType0
+    from .tool_span import ToolSpan
+    from .tool_span_dataset_metadata import ToolSpanDatasetMetadata
+    from .tool_span_user_metadata import ToolSpanUserMetadata
+    from .toxicity_template import ToxicityTemplate
+    from .toxicity_template_response_schema_type_0 import ToxicityTemplateResponseSchemaType0
+    from .trace import Trace
+    from .trace_dataset_metadata import TraceDatasetMetadata
+    from .trace_metadata import TraceMetadata
+    from .trace_user_metadata import TraceUserMetadata
+    from .tree_choice_aggregate import TreeChoiceAggregate
+    from .tree_choice_aggregate_counts import TreeChoiceAggregateCounts
+    from .tree_choice_constraints import TreeChoiceConstraints
+    from .tree_choice_db_constraints import TreeChoiceDBConstraints
+    from .tree_choice_node import TreeChoiceNode
+    from .tree_choice_rating import TreeChoiceRating
+    from .uncertainty_scorer import UncertaintyScorer
+    from .update_annotation_queue_request import UpdateAnnotationQueueRequest
+    from .update_dataset_content_request import UpdateDatasetContentRequest
+    from .update_dataset_request import UpdateDatasetRequest
+    from .update_dataset_version_request import UpdateDatasetVersionRequest
+    from .update_prompt_template_request import UpdatePromptTemplateRequest
+    from .update_scorer_request import UpdateScorerRequest
+    from .update_scorer_scope_request import UpdateScorerScopeRequest
+    from .upsert_dataset_content_request import UpsertDatasetContentRequest
+    from .user_action import UserAction
+    from .user_annotation_queue_collaborator import UserAnnotationQueueCollaborator
+    from .user_collaborator import UserCollaborator
+    from .user_collaborator_create import UserCollaboratorCreate
+    from .user_db import UserDB
+    from .user_info import UserInfo
+    from .user_role import UserRole
+    from .valid_result import ValidResult
+    from .validate_code_scorer_dataset_response import ValidateCodeScorerDatasetResponse
+    from .validate_code_scorer_response import ValidateCodeScorerResponse
+    from .validate_llm_scorer_dataset_request import ValidateLLMScorerDatasetRequest
+    from .validate_llm_scorer_dataset_request_sort_type_0 import ValidateLLMScorerDatasetRequestSortType0
+    from .validate_llm_scorer_dataset_response import ValidateLLMScorerDatasetResponse
+    from .validate_llm_scorer_log_record_request import ValidateLLMScorerLogRecordRequest
+    from .validate_llm_scorer_log_record_response import ValidateLLMScorerLogRecordResponse
+    from .validate_registered_scorer_result import ValidateRegisteredScorerResult
+    from .validate_scorer_log_record_response import ValidateScorerLogRecordResponse
+    from .validation_error import ValidationError
+    from .validation_error_context import ValidationErrorContext
+    from .vegas_gateway_integration import VegasGatewayIntegration
+    from .vegas_gateway_integration_create import VegasGatewayIntegrationCreate
+    from .vegas_gateway_integration_extra_type_0 import VegasGatewayIntegrationExtraType0
+    from .vertex_ai_integration import VertexAIIntegration
+    from .vertex_ai_integration_create import VertexAIIntegrationCreate
+    from .vertex_ai_integration_extra_type_0 import VertexAIIntegrationExtraType0
+    from .vertex_aigcs_config import VertexAIGCSConfig
+    from .vertex_aigcs_config_response import VertexAIGCSConfigResponse
+    from .web_search_action import WebSearchAction
+    from .web_search_call_event import WebSearchCallEvent
+    from .web_search_call_event_metadata_type_0 import WebSearchCallEventMetadataType0
+    from .workflow_span import WorkflowSpan
+    from .workflow_span_dataset_metadata import WorkflowSpanDatasetMetadata
+    from .workflow_span_user_metadata import WorkflowSpanUserMetadata
+    from .write_health_score_request import WriteHealthScoreRequest
+    from .write_health_score_request_secondary_type_0 import WriteHealthScoreRequestSecondaryType0
+    from .writer_integration import WriterIntegration
+    from .writer_integration_create import WriterIntegrationCreate
+    from .writer_integration_extra_type_0 import WriterIntegrationExtraType0
+
+_MODEL_MODULES = {
+    "ActionResult": ".action_result",
+    "ActionType": ".action_type",
+    "AddRecordsToQueueRequest": ".add_records_to_queue_request",
+    "AddRecordsToQueueResponse": ".add_records_to_queue_response",
+    "AgentSpan": ".agent_span",
+    "AgentSpanDatasetMetadata": ".agent_span_dataset_metadata",
+    "AgentSpanUserMetadata": ".agent_span_user_metadata",
+    "AgentType": ".agent_type",
+    "AgenticSessionSuccessScorer": ".agentic_session_success_scorer",
+    "AgenticSessionSuccessScorerType": ".agentic_session_success_scorer_type",
+    "AgenticSessionSuccessTemplate": ".agentic_session_success_template",
+    "AgenticSessionSuccessTemplateResponseSchemaType0": ".agentic_session_success_template_response_schema_type_0",
+    "AgenticWorkflowSuccessScorer": ".agentic_workflow_success_scorer",
+    "AgenticWorkflowSuccessScorerType": ".agentic_workflow_success_scorer_type",
+    "AgenticWorkflowSuccessTemplate": ".agentic_workflow_success_template",
+    "AgenticWorkflowSuccessTemplateResponseSchemaType0": ".agentic_workflow_success_template_response_schema_type_0",
+    "AggregatedTraceViewEdge": ".aggregated_trace_view_edge",
+    "AggregatedTraceViewGraph": ".aggregated_trace_view_graph",
+    "AggregatedTraceViewNode": ".aggregated_trace_view_node",
+    "AggregatedTraceViewNodeMetrics": ".aggregated_trace_view_node_metrics",
+    "AggregatedTraceViewRequest": ".aggregated_trace_view_request",
+    "AggregatedTraceViewResponse": ".aggregated_trace_view_response",
+    "AndNodeLogRecordsFilter": ".and_node_log_records_filter",
+    "AnnotationAggregate": ".annotation_aggregate",
+    "AnnotationAgreementAggregate": ".annotation_agreement_aggregate",
+    "AnnotationAgreementBucket": ".annotation_agreement_bucket",
+    "AnnotationChoiceAggregate": ".annotation_choice_aggregate",
+    "AnnotationChoiceAggregateCounts": ".annotation_choice_aggregate_counts",
+    "AnnotationLikeDislikeAggregate": ".annotation_like_dislike_aggregate",
+    "AnnotationQueueAction": ".annotation_queue_action",
+    "AnnotationQueueCountRequest": ".annotation_queue_count_request",
+    "AnnotationQueueCountResponse": ".annotation_queue_count_response",
+    "AnnotationQueueCreatedAtFilter": ".annotation_queue_created_at_filter",
+    "AnnotationQueueCreatedAtFilterOperator": ".annotation_queue_created_at_filter_operator",
+    "AnnotationQueueCreatedAtSort": ".annotation_queue_created_at_sort",
+    "AnnotationQueueCreatedBySort": ".annotation_queue_created_by_sort",
+    "AnnotationQueueDetailsResponse": ".annotation_queue_details_response",
+    "AnnotationQueueDetailsResponseAnnotationAggregatesByAnnotatorType0": ".annotation_queue_details_response_annotation_aggregates_by_annotator_type_0",
+    "AnnotationQueueDetailsResponseAnnotationAggregatesByAnnotatorType0AdditionalProperty": ".annotation_queue_details_response_annotation_aggregates_by_annotator_type_0_additional_property",
+    "AnnotationQueueDetailsResponseAnnotationAggregatesType0": ".annotation_queue_details_response_annotation_aggregates_type_0",
+    "AnnotationQueueExportRequest": ".annotation_queue_export_request",
+    "AnnotationQueueExportUrlResponse": ".annotation_queue_export_url_response",
+    "AnnotationQueueIDFilter": ".annotation_queue_id_filter",
+    "AnnotationQueueIDFilterOperator": ".annotation_queue_id_filter_operator",
+    "AnnotationQueueNameFilter": ".annotation_queue_name_filter",
+    "AnnotationQueueNameFilterOperator": ".annotation_queue_name_filter_operator",
+    "AnnotationQueueNameSort": ".annotation_queue_name_sort",
+    "AnnotationQueueNumAnnotatorsFilter": ".annotation_queue_num_annotators_filter",
+    "AnnotationQueueNumAnnotatorsFilterOperator": ".annotation_queue_num_annotators_filter_operator",
+    "AnnotationQueueNumAnnotatorsSort": ".annotation_queue_num_annotators_sort",
+    "AnnotationQueueNumLogRecordsFilter": ".annotation_queue_num_log_records_filter",
+    "AnnotationQueueNumLogRecordsFilterOperator": ".annotation_queue_num_log_records_filter_operator",
+    "AnnotationQueueNumLogRecordsSort": ".annotation_queue_num_log_records_sort",
+    "AnnotationQueueNumTemplatesFilter": ".annotation_queue_num_templates_filter",
+    "AnnotationQueueNumTemplatesFilterOperator": ".annotation_queue_num_templates_filter_operator",
+    "AnnotationQueueNumTemplatesSort": ".annotation_queue_num_templates_sort",
+    "AnnotationQueueNumUsersFilter": ".annotation_queue_num_users_filter",
+    "AnnotationQueueNumUsersFilterOperator": ".annotation_queue_num_users_filter_operator",
+    "AnnotationQueueNumUsersSort": ".annotation_queue_num_users_sort",
+    "AnnotationQueueOverallProgressFilter": ".annotation_queue_overall_progress_filter",
+    "AnnotationQueueOverallProgressFilterOperator": ".annotation_queue_overall_progress_filter_operator",
+    "AnnotationQueueOverallProgressSort": ".annotation_queue_overall_progress_sort",
+    "AnnotationQueuePartialSearchRequest": ".annotation_queue_partial_search_request",
+    "AnnotationQueueProjectFilter": ".annotation_queue_project_filter",
+    "AnnotationQueueRecordsByFilterTree": ".annotation_queue_records_by_filter_tree",
+    "AnnotationQueueRecordsByRecordIDs": ".annotation_queue_records_by_record_i_ds",
+    "AnnotationQueueResponse": ".annotation_queue_response",
+    "AnnotationQueueResponseNumLogsAnnotatedType0": ".annotation_queue_response_num_logs_annotated_type_0",
+    "AnnotationQueueResponseProgressType0": ".annotation_queue_response_progress_type_0",
+    "AnnotationQueueUpdatedAtFilter": ".annotation_queue_updated_at_filter",
+    "AnnotationQueueUpdatedAtFilterOperator": ".annotation_queue_updated_at_filter_operator",
+    "AnnotationQueueUpdatedAtSort": ".annotation_queue_updated_at_sort",
+    "AnnotationQueueUserCollaboratorCreate": ".annotation_queue_user_collaborator_create",
+    "AnnotationQueueUserCollaboratorUpdate": ".annotation_queue_user_collaborator_update",
+    "AnnotationRatingCreate": ".annotation_rating_create",
+    "AnnotationRatingDB": ".annotation_rating_db",
+    "AnnotationRatingInfo": ".annotation_rating_info",
+    "AnnotationScoreAggregate": ".annotation_score_aggregate",
+    "AnnotationStarAggregate": ".annotation_star_aggregate",
+    "AnnotationStarAggregateCounts": ".annotation_star_aggregate_counts",
+    "AnnotationTagsAggregate": ".annotation_tags_aggregate",
+    "AnnotationTagsAggregateCounts": ".annotation_tags_aggregate_counts",
+    "AnnotationTemplateCreate": ".annotation_template_create",
+    "AnnotationTemplateDB": ".annotation_template_db",
+    "AnnotationTemplateReorder": ".annotation_template_reorder",
+    "AnnotationTemplateUpdate": ".annotation_template_update",
+    "AnnotationTextAggregate": ".annotation_text_aggregate",
+    "AnnotationTreeChoiceAggregate": ".annotation_tree_choice_aggregate",
+    "AnnotationTreeChoiceAggregateCounts": ".annotation_tree_choice_aggregate_counts",
+    "AnnotationType": ".annotation_type",
+    "AnthropicAuthenticationType": ".anthropic_authentication_type",
+    "AnthropicIntegration": ".anthropic_integration",
+    "AnthropicIntegrationCreate": ".anthropic_integration_create",
+    "AnthropicIntegrationCreateCustomHeaderMappingType0": ".anthropic_integration_create_custom_header_mapping_type_0",
+    "AnthropicIntegrationCustomHeaderMappingType0": ".anthropic_integration_custom_header_mapping_type_0",
+    "AnthropicIntegrationExtraType0": ".anthropic_integration_extra_type_0",
+    "ApiKeyAction": ".api_key_action",
+    "ApiKeyLoginRequest": ".api_key_login_request",
+    "AuthMethod": ".auth_method",
+    "AvailableIntegrations": ".available_integrations",
+    "AwsBedrockIntegration": ".aws_bedrock_integration",
+    "AwsBedrockIntegrationExtraType0": ".aws_bedrock_integration_extra_type_0",
+    "AwsBedrockIntegrationInferenceProfiles": ".aws_bedrock_integration_inference_profiles",
+    "AwsCredentialType": ".aws_credential_type",
+    "AwsSageMakerIntegration": ".aws_sage_maker_integration",
+    "AwsSageMakerIntegrationCreate": ".aws_sage_maker_integration_create",
+    "AwsSageMakerIntegrationCreateInferenceProfiles": ".aws_sage_maker_integration_create_inference_profiles",
+    "AwsSageMakerIntegrationCreateToken": ".aws_sage_maker_integration_create_token",
+    "AwsSageMakerIntegrationExtraType0": ".aws_sage_maker_integration_extra_type_0",
+    "AzureAuthenticationType": ".azure_authentication_type",
+    "AzureIntegration": ".azure_integration",
+    "AzureIntegrationCreate": ".azure_integration_create",
+    "AzureIntegrationCreateCustomHeaderMappingType0": ".azure_integration_create_custom_header_mapping_type_0",
+    "AzureIntegrationCreateDefaultHeadersType0": ".azure_integration_create_default_headers_type_0",
+    "AzureIntegrationCreateDeployments": ".azure_integration_create_deployments",
+    "AzureIntegrationCustomHeaderMappingType0": ".azure_integration_custom_header_mapping_type_0",
+    "AzureIntegrationDefaultHeadersType0": ".azure_integration_default_headers_type_0",
+    "AzureIntegrationDeployments": ".azure_integration_deployments",
+    "AzureIntegrationExtraType0": ".azure_integration_extra_type_0",
+    "AzureModelDeployment": ".azure_model_deployment",
+    "BaseAwsIntegrationCreate": ".base_aws_integration_create",
+    "BaseAwsIntegrationCreateInferenceProfiles": ".base_aws_integration_create_inference_profiles",
+    "BaseAwsIntegrationCreateToken": ".base_aws_integration_create_token",
+    "BaseFinetunedScorerDB": ".base_finetuned_scorer_db",
+    "BaseFinetunedScorerDBClassNameToVocabIxType0": ".base_finetuned_scorer_db_class_name_to_vocab_ix_type_0",
+    "BaseFinetunedScorerDBClassNameToVocabIxType1": ".base_finetuned_scorer_db_class_name_to_vocab_ix_type_1",
+    "BaseGeneratedScorerDB": ".base_generated_scorer_db",
+    "BaseMetricRollUpConfigDB": ".base_metric_roll_up_config_db",
+    "BasePromptTemplateResponse": ".base_prompt_template_response",
+    "BasePromptTemplateVersion": ".base_prompt_template_version",
+    "BasePromptTemplateVersionResponse": ".base_prompt_template_version_response",
+    "BaseRegisteredScorerDB": ".base_registered_scorer_db",
+    "BaseScorer": ".base_scorer",
+    "BaseScorerAggregatesType0": ".base_scorer_aggregates_type_0",
+    "BaseScorerClassNameToVocabIxType0": ".base_scorer_class_name_to_vocab_ix_type_0",
+    "BaseScorerClassNameToVocabIxType1": ".base_scorer_class_name_to_vocab_ix_type_1",
+    "BaseScorerExtraType0": ".base_scorer_extra_type_0",
+    "BaseScorerVersionDB": ".base_scorer_version_db",
+    "BaseScorerVersionResponse": ".base_scorer_version_response",
+    "BleuScorer": ".bleu_scorer",
+    "BodyCreateCodeScorerVersionScorersScorerIdVersionCodePost": ".body_create_code_scorer_version_scorers_scorer_id_version_code_post",
+    "BodyCreateDatasetDatasetsPost": ".body_create_dataset_datasets_post",
+    "BodyLoginEmailLoginPost": ".body_login_email_login_post",
+    "BodyManualLlmValidateMultipartScorersLlmValidateMultipartPost": ".body_manual_llm_validate_multipart_scorers_llm_validate_multipart_post",
+    "BodyValidateCodeScorerDatasetScorersCodeValidateDatasetPost": ".body_validate_code_scorer_dataset_scorers_code_validate_dataset_post",
+    "BodyValidateCodeScorerLogRecordScorersCodeValidateLogRecordPost": ".body_validate_code_scorer_log_record_scorers_code_validate_log_record_post",
+    "BodyValidateCodeScorerScorersCodeValidatePost": ".body_validate_code_scorer_scorers_code_validate_post",
+    "BooleanColorConstraint": ".boolean_color_constraint",
+    "BucketedMetric": ".bucketed_metric",
+    "BucketedMetricBuckets": ".bucketed_metric_buckets",
+    "BucketedMetrics": ".bucketed_metrics",
+    "BulkDeleteDatasetsRequest": ".bulk_delete_datasets_request",
+    "BulkDeleteDatasetsResponse": ".bulk_delete_datasets_response",
+    "BulkDeleteFailure": ".bulk_delete_failure",
+    "BulkDeletePromptTemplatesRequest": ".bulk_delete_prompt_templates_request",
+    "CategoricalColorConstraint": ".categorical_color_constraint",
+    "CategoricalColorConstraintOperator": ".categorical_color_constraint_operator",
+    "CategoricalMetricInfo": ".categorical_metric_info",
+    "CategoricalMetricInfoCategoryCounts": ".categorical_metric_info_category_counts",
+    "CategoricalRollUpMethod": ".categorical_roll_up_method",
+    "ChainAggregationStrategy": ".chain_aggregation_strategy",
+    "ChainPollTemplate": ".chain_poll_template",
+    "ChainPollTemplateResponseSchemaType0": ".chain_poll_template_response_schema_type_0",
+    "ChoiceAggregate": ".choice_aggregate",
+    "ChoiceAggregateCounts": ".choice_aggregate_counts",
+    "ChoiceConstraints": ".choice_constraints",
+    "ChoiceRating": ".choice_rating",
+    "ChunkAttributionUtilizationScorer": ".chunk_attribution_utilization_scorer",
+    "ChunkAttributionUtilizationScorerType": ".chunk_attribution_utilization_scorer_type",
+    "ChunkAttributionUtilizationTemplate": ".chunk_attribution_utilization_template",
+    "ChunkAttributionUtilizationTemplateResponseSchemaType0": ".chunk_attribution_utilization_template_response_schema_type_0",
+    "CodeMetricGenerationStatus": ".code_metric_generation_status",
+    "CodeMetricGenerationStatusResponse": ".code_metric_generation_status_response",
+    "CollaboratorRole": ".collaborator_role",
+    "CollaboratorRoleInfo": ".collaborator_role_info",
+    "CollaboratorUpdate": ".collaborator_update",
+    "ColumnCategory": ".column_category",
+    "ColumnInfo": ".column_info",
+    "ColumnMapping": ".column_mapping",
+    "ColumnMappingConfig": ".column_mapping_config",
+    "ColumnMappingMgtType0": ".column_mapping_mgt_type_0",
+    "CompletenessScorer": ".completeness_scorer",
+    "CompletenessScorerType": ".completeness_scorer_type",
+    "CompletenessTemplate": ".completeness_template",
+    "CompletenessTemplateResponseSchemaType0": ".completeness_template_response_schema_type_0",
+    "ComputeHealthScoreRequest": ".compute_health_score_request",
+    "ComputeHealthScoreRequestMgtOverlay": ".compute_health_score_request_mgt_overlay",
+    "ContentModality": ".content_modality",
+    "ContextAdherenceScorer": ".context_adherence_scorer",
+    "ContextAdherenceScorerType": ".context_adherence_scorer_type",
+    "ContextRelevanceScorer": ".context_relevance_scorer",
+    "ControlAction": ".control_action",
+    "ControlAppliesTo": ".control_applies_to",
+    "ControlCheckStage": ".control_check_stage",
+    "ControlResourceAction": ".control_resource_action",
+    "ControlResult": ".control_result",
+    "ControlSpan": ".control_span",
+    "ControlSpanDatasetMetadata": ".control_span_dataset_metadata",
+    "ControlSpanUserMetadata": ".control_span_user_metadata",
+    "CoreScorerName": ".core_scorer_name",
+    "CorrectnessScorer": ".correctness_scorer",
+    "CostInterval": ".cost_interval",
+    "CreateAnnotationQueueRequest": ".create_annotation_queue_request",
+    "CreateCodeMetricGenerationRequest": ".create_code_metric_generation_request",
+    "CreateCodeMetricGenerationResponse": ".create_code_metric_generation_response",
+    "CreateCustomLunaScorerVersionRequest": ".create_custom_luna_scorer_version_request",
+    "CreateJobRequest": ".create_job_request",
+    "CreateJobRequestValidationConfigType0": ".create_job_request_validation_config_type_0",
+    "CreateJobResponse": ".create_job_response",
+    "CreateJobResponseValidationConfigType0": ".create_job_response_validation_config_type_0",
+    "CreateLLMScorerAutogenRequest": ".create_llm_scorer_autogen_request",
+    "CreateLLMScorerVersionRequest": ".create_llm_scorer_version_request",
+    "CreatePromptTemplateWithVersionRequestBody": ".create_prompt_template_with_version_request_body",
+    "CreateQueueTemplateRequest": ".create_queue_template_request",
+    "CreateScorerRequest": ".create_scorer_request",
+    "CreateScorerVersionRequest": ".create_scorer_version_request",
+    "CreateUpdateRegisteredScorerResponse": ".create_update_registered_scorer_response",
+    "CustomAuthenticationType": ".custom_authentication_type",
+    "CustomLLMConfig": ".custom_llm_config",
+    "CustomLLMConfigInitKwargsType0": ".custom_llm_config_init_kwargs_type_0",
+    "CustomizedAgenticSessionSuccessGPTScorer": ".customized_agentic_session_success_gpt_scorer",
+    "CustomizedAgenticSessionSuccessGPTScorerAggregatesType0": ".customized_agentic_session_success_gpt_scorer_aggregates_type_0",
+    "CustomizedAgenticSessionSuccessGPTScorerClassNameToVocabIxType0": ".customized_agentic_session_success_gpt_scorer_class_name_to_vocab_ix_type_0",
+    "CustomizedAgenticSessionSuccessGPTScorerClassNameToVocabIxType1": ".customized_agentic_session_success_gpt_scorer_class_name_to_vocab_ix_type_1",
+    "CustomizedAgenticSessionSuccessGPTScorerExtraType0": ".customized_agentic_session_success_gpt_scorer_extra_type_0",
+    "CustomizedAgenticWorkflowSuccessGPTScorer": ".customized_agentic_workflow_success_gpt_scorer",
+    "CustomizedAgenticWorkflowSuccessGPTScorerAggregatesType0": ".customized_agentic_workflow_success_gpt_scorer_aggregates_type_0",
+    "CustomizedAgenticWorkflowSuccessGPTScorerClassNameToVocabIxType0": ".customized_agentic_workflow_success_gpt_scorer_class_name_to_vocab_ix_type_0",
+    "CustomizedAgenticWorkflowSuccessGPTScorerClassNameToVocabIxType1": ".customized_agentic_workflow_success_gpt_scorer_class_name_to_vocab_ix_type_1",
+    "CustomizedAgenticWorkflowSuccessGPTScorerExtraType0": ".customized_agentic_workflow_success_gpt_scorer_extra_type_0",
+    "CustomizedChunkAttributionUtilizationGPTScorer": ".customized_chunk_attribution_utilization_gpt_scorer",
+    "CustomizedChunkAttributionUtilizationGPTScorerAggregatesType0": ".customized_chunk_attribution_utilization_gpt_scorer_aggregates_type_0",
+    "CustomizedChunkAttributionUtilizationGPTScorerClassNameToVocabIxType0": ".customized_chunk_attribution_utilization_gpt_scorer_class_name_to_vocab_ix_type_0",
+    "CustomizedChunkAttributionUtilizationGPTScorerClassNameToVocabIxType1": ".customized_chunk_attribution_utilization_gpt_scorer_class_name_to_vocab_ix_type_1",
+    "CustomizedChunkAttributionUtilizationGPTScorerExtraType0": ".customized_chunk_attribution_utilization_gpt_scorer_extra_type_0",
+    "CustomizedCompletenessGPTScorer": ".customized_completeness_gpt_scorer",
+    "CustomizedCompletenessGPTScorerAggregatesType0": ".customized_completeness_gpt_scorer_aggregates_type_0",
+    "CustomizedCompletenessGPTScorerClassNameToVocabIxType0": ".customized_completeness_gpt_scorer_class_name_to_vocab_ix_type_0",
+    "CustomizedCompletenessGPTScorerClassNameToVocabIxType1": ".customized_completeness_gpt_scorer_class_name_to_vocab_ix_type_1",
+    "CustomizedCompletenessGPTScorerExtraType0": ".customized_completeness_gpt_scorer_extra_type_0",
+    "CustomizedFactualityGPTScorer": ".customized_factuality_gpt_scorer",
+    "CustomizedFactualityGPTScorerAggregatesType0": ".customized_factuality_gpt_scorer_aggregates_type_0",
+    "CustomizedFactualityGPTScorerClassNameToVocabIxType0": ".customized_factuality_gpt_scorer_class_name_to_vocab_ix_type_0",
+    "CustomizedFactualityGPTScorerClassNameToVocabIxType1": ".customized_factuality_gpt_scorer_class_name_to_vocab_ix_type_1",
+    "CustomizedFactualityGPTScorerExtraType0": ".customized_factuality_gpt_scorer_extra_type_0",
+    "CustomizedGroundTruthAdherenceGPTScorer": ".customized_ground_truth_adherence_gpt_scorer",
+    "CustomizedGroundTruthAdherenceGPTScorerAggregatesType0": ".customized_ground_truth_adherence_gpt_scorer_aggregates_type_0",
+    "CustomizedGroundTruthAdherenceGPTScorerClassNameToVocabIxType0": ".customized_ground_truth_adherence_gpt_scorer_class_name_to_vocab_ix_type_0",
+    "CustomizedGroundTruthAdherenceGPTScorerClassNameToVocabIxType1": ".customized_ground_truth_adherence_gpt_scorer_class_name_to_vocab_ix_type_1",
+    "CustomizedGroundTruthAdherenceGPTScorerExtraType0": ".customized_ground_truth_adherence_gpt_scorer_extra_type_0",
+    "CustomizedGroundednessGPTScorer": ".customized_groundedness_gpt_scorer",
+    "CustomizedGroundednessGPTScorerAggregatesType0": ".customized_groundedness_gpt_scorer_aggregates_type_0",
+    "CustomizedGroundednessGPTScorerClassNameToVocabIxType0": ".customized_groundedness_gpt_scorer_class_name_to_vocab_ix_type_0",
+    "CustomizedGroundednessGPTScorerClassNameToVocabIxType1": ".customized_groundedness_gpt_scorer_class_name_to_vocab_ix_type_1",
+    "CustomizedGroundednessGPTScorerExtraType0": ".customized_groundedness_gpt_scorer_extra_type_0",
+    "CustomizedInputSexistGPTScorer": ".customized_input_sexist_gpt_scorer",
+    "CustomizedInputSexistGPTScorerAggregatesType0": ".customized_input_sexist_gpt_scorer_aggregates_type_0",
+    "CustomizedInputSexistGPTScorerClassNameToVocabIxType0": ".customized_input_sexist_gpt_scorer_class_name_to_vocab_ix_type_0",
+    "CustomizedInputSexistGPTScorerClassNameToVocabIxType1": ".customized_input_sexist_gpt_scorer_class_name_to_vocab_ix_type_1",
+    "CustomizedInputSexistGPTScorerExtraType0": ".customized_input_sexist_gpt_scorer_extra_type_0",
+    "CustomizedInputToxicityGPTScorer": ".customized_input_toxicity_gpt_scorer",
+    "CustomizedInputToxicityGPTScorerAggregatesType0": ".customized_input_toxicity_gpt_scorer_aggregates_type_0",
+    "CustomizedInputToxicityGPTScorerClassNameToVocabIxType0": ".customized_input_toxicity_gpt_scorer_class_name_to_vocab_ix_type_0",
+    "CustomizedInputToxicityGPTScorerClassNameToVocabIxType1": ".customized_input_toxicity_gpt_scorer_class_name_to_vocab_ix_type_1",
+    "CustomizedInputToxicityGPTScorerExtraType0": ".customized_input_toxicity_gpt_scorer_extra_type_0",
+    "CustomizedInstructionAdherenceGPTScorer": ".customized_instruction_adherence_gpt_scorer",
+    "CustomizedInstructionAdherenceGPTScorerAggregatesType0": ".customized_instruction_adherence_gpt_scorer_aggregates_type_0",
+    "CustomizedInstructionAdherenceGPTScorerClassNameToVocabIxType0": ".customized_instruction_adherence_gpt_scorer_class_name_to_vocab_ix_type_0",
+    "CustomizedInstructionAdherenceGPTScorerClassNameToVocabIxType1": ".customized_instruction_adherence_gpt_scorer_class_name_to_vocab_ix_type_1",
+    "CustomizedInstructionAdherenceGPTScorerExtraType0": ".customized_instruction_adherence_gpt_scorer_extra_type_0",
+    "CustomizedPromptInjectionGPTScorer": ".customized_prompt_injection_gpt_scorer",
+    "CustomizedPromptInjectionGPTScorerAggregatesType0": ".customized_prompt_injection_gpt_scorer_aggregates_type_0",
+    "CustomizedPromptInjectionGPTScorerClassNameToVocabIxType0": ".customized_prompt_injection_gpt_scorer_class_name_to_vocab_ix_type_0",
+    "CustomizedPromptInjectionGPTScorerClassNameToVocabIxType1": ".customized_prompt_injection_gpt_scorer_class_name_to_vocab_ix_type_1",
+    "CustomizedPromptInjectionGPTScorerExtraType0": ".customized_prompt_injection_gpt_scorer_extra_type_0",
+    "CustomizedSexistGPTScorer": ".customized_sexist_gpt_scorer",
+    "CustomizedSexistGPTScorerAggregatesType0": ".customized_sexist_gpt_scorer_aggregates_type_0",
+    "CustomizedSexistGPTScorerClassNameToVocabIxType0": ".customized_sexist_gpt_scorer_class_name_to_vocab_ix_type_0",
+    "CustomizedSexistGPTScorerClassNameToVocabIxType1": ".customized_sexist_gpt_scorer_class_name_to_vocab_ix_type_1",
+    "CustomizedSexistGPTScorerExtraType0": ".customized_sexist_gpt_scorer_extra_type_0",
+    "CustomizedToolErrorRateGPTScorer": ".customized_tool_error_rate_gpt_scorer",
+    "CustomizedToolErrorRateGPTScorerAggregatesType0": ".customized_tool_error_rate_gpt_scorer_aggregates_type_0",
+    "CustomizedToolErrorRateGPTScorerClassNameToVocabIxType0": ".customized_tool_error_rate_gpt_scorer_class_name_to_vocab_ix_type_0",
+    "CustomizedToolErrorRateGPTScorerClassNameToVocabIxType1": ".customized_tool_error_rate_gpt_scorer_class_name_to_vocab_ix_type_1",
+    "CustomizedToolErrorRateGPTScorerExtraType0": ".customized_tool_error_rate_gpt_scorer_extra_type_0",
+    "CustomizedToolSelectionQualityGPTScorer": ".customized_tool_selection_quality_gpt_scorer",
+    "CustomizedToolSelectionQualityGPTScorerAggregatesType0": ".customized_tool_selection_quality_gpt_scorer_aggregates_type_0",
+    "CustomizedToolSelectionQualityGPTScorerClassNameToVocabIxType0": ".customized_tool_selection_quality_gpt_scorer_class_name_to_vocab_ix_type_0",
+    "CustomizedToolSelectionQualityGPTScorerClassNameToVocabIxType1": ".customized_tool_selection_quality_gpt_scorer_class_name_to_vocab_ix_type_1",
+    "CustomizedToolSelectionQualityGPTScorerExtraType0": ".customized_tool_selection_quality_gpt_scorer_extra_type_0",
+    "CustomizedToxicityGPTScorer": ".customized_toxicity_gpt_scorer",
+    "CustomizedToxicityGPTScorerAggregatesType0": ".customized_toxicity_gpt_scorer_aggregates_type_0",
+    "CustomizedToxicityGPTScorerClassNameToVocabIxType0": ".customized_toxicity_gpt_scorer_class_name_to_vocab_ix_type_0",
+    "CustomizedToxicityGPTScorerClassNameToVocabIxType1": ".customized_toxicity_gpt_scorer_class_name_to_vocab_ix_type_1",
+    "CustomizedToxicityGPTScorerExtraType0": ".customized_toxicity_gpt_scorer_extra_type_0",
+    "DataType": ".data_type",
+    "DataTypeOptions": ".data_type_options",
+    "DataUnit": ".data_unit",
+    "DatabricksIntegration": ".databricks_integration",
+    "DatabricksIntegrationCreate": ".databricks_integration_create",
+    "DatabricksIntegrationExtraType0": ".databricks_integration_extra_type_0",
+    "DatasetAction": ".dataset_action",
+    "DatasetAppendRow": ".dataset_append_row",
+    "DatasetAppendRowValues": ".dataset_append_row_values",
+    "DatasetAppendRowValuesAdditionalPropertyType3": ".dataset_append_row_values_additional_property_type_3",
+    "DatasetContent": ".dataset_content",
+    "DatasetContentFilter": ".dataset_content_filter",
+    "DatasetContentFilterOperator": ".dataset_content_filter_operator",
+    "DatasetContentSortClause": ".dataset_content_sort_clause",
+    "DatasetCopyRecordData": ".dataset_copy_record_data",
+    "DatasetCreatedAtSort": ".dataset_created_at_sort",
+    "DatasetData": ".dataset_data",
+    "DatasetDB": ".dataset_db",
+    "DatasetDeleteRow": ".dataset_delete_row",
+    "DatasetDraftFilter": ".dataset_draft_filter",
+    "DatasetDraftFilterOperator": ".dataset_draft_filter_operator",
+    "DatasetFilterRows": ".dataset_filter_rows",
+    "DatasetFormat": ".dataset_format",
+    "DatasetIDFilter": ".dataset_id_filter",
+    "DatasetIDFilterOperator": ".dataset_id_filter_operator",
+    "DatasetLastEditedByUserAtSort": ".dataset_last_edited_by_user_at_sort",
+    "DatasetNameFilter": ".dataset_name_filter",
+    "DatasetNameFilterOperator": ".dataset_name_filter_operator",
+    "DatasetNameSort": ".dataset_name_sort",
+    "DatasetNotInProjectFilter": ".dataset_not_in_project_filter",
+    "DatasetPrependRow": ".dataset_prepend_row",
+    "DatasetPrependRowValues": ".dataset_prepend_row_values",
+    "DatasetPrependRowValuesAdditionalPropertyType3": ".dataset_prepend_row_values_additional_property_type_3",
+    "DatasetProject": ".dataset_project",
+    "DatasetProjectLastUsedAtSort": ".dataset_project_last_used_at_sort",
+    "DatasetProjectsSort": ".dataset_projects_sort",
+    "DatasetRemoveColumn": ".dataset_remove_column",
+    "DatasetRenameColumn": ".dataset_rename_column",
+    "DatasetRow": ".dataset_row",
+    "DatasetRowMetadata": ".dataset_row_metadata",
+    "DatasetRowValuesDict": ".dataset_row_values_dict",
+    "DatasetRowValuesDictAdditionalPropertyType3": ".dataset_row_values_dict_additional_property_type_3",
+    "DatasetRowValuesItemType3": ".dataset_row_values_item_type_3",
+    "DatasetRowsSort": ".dataset_rows_sort",
+    "DatasetUpdateRow": ".dataset_update_row",
+    "DatasetUpdateRowValues": ".dataset_update_row_values",
+    "DatasetUpdateRowValuesAdditionalPropertyType3": ".dataset_update_row_values_additional_property_type_3",
+    "DatasetUpdatedAtSort": ".dataset_updated_at_sort",
+    "DatasetUsedInProjectFilter": ".dataset_used_in_project_filter",
+    "DatasetVersionDB": ".dataset_version_db",
+    "DatasetVersionIndexSort": ".dataset_version_index_sort",
+    "DeletePromptResponse": ".delete_prompt_response",
+    "DeleteRunResponse": ".delete_run_response",
+    "DeleteScorerResponse": ".delete_scorer_response",
+    "Document": ".document",
+    "DocumentMetadata": ".document_metadata",
+    "ErrorSeverity": ".error_severity",
+    "ErrorType": ".error_type",
+    "EventStatus": ".event_status",
+    "ExecutionStatus": ".execution_status",
+    "ExperimentCreateRequest": ".experiment_create_request",
+    "ExperimentDataset": ".experiment_dataset",
+    "ExperimentDatasetRequest": ".experiment_dataset_request",
+    "ExperimentGroupIDFilter": ".experiment_group_id_filter",
+    "ExperimentGroupNameFilter": ".experiment_group_name_filter",
+    "ExperimentGroupNameFilterOperator": ".experiment_group_name_filter_operator",
+    "ExperimentMetricsRequest": ".experiment_metrics_request",
+    "ExperimentMetricsResponse": ".experiment_metrics_response",
+    "ExperimentPhaseStatus": ".experiment_phase_status",
+    "ExperimentPlayground": ".experiment_playground",
+    "ExperimentPrompt": ".experiment_prompt",
+    "ExperimentResponse": ".experiment_response",
+    "ExperimentResponseAggregateFeedback": ".experiment_response_aggregate_feedback",
+    "ExperimentResponseAggregateMetrics": ".experiment_response_aggregate_metrics",
+    "ExperimentResponseRatingAggregates": ".experiment_response_rating_aggregates",
+    "ExperimentResponseRatingAggregatesAdditionalProperty": ".experiment_response_rating_aggregates_additional_property",
+    "ExperimentResponseStructuredAggregateMetricsType0": ".experiment_response_structured_aggregate_metrics_type_0",
+    "ExperimentResponseTags": ".experiment_response_tags",
+    "ExperimentStatus": ".experiment_status",
+    "ExperimentUpdateRequest": ".experiment_update_request",
+    "ExperimentsAvailableColumnsResponse": ".experiments_available_columns_response",
+    "ExtendedAgentSpanRecord": ".extended_agent_span_record",
+    "ExtendedAgentSpanRecordAnnotationAggregates": ".extended_agent_span_record_annotation_aggregates",
+    "ExtendedAgentSpanRecordAnnotationAgreement": ".extended_agent_span_record_annotation_agreement",
+    "ExtendedAgentSpanRecordAnnotations": ".extended_agent_span_record_annotations",
+    "ExtendedAgentSpanRecordAnnotationsAdditionalProperty": ".extended_agent_span_record_annotations_additional_property",
+    "ExtendedAgentSpanRecordDatasetMetadata": ".extended_agent_span_record_dataset_metadata",
+    "ExtendedAgentSpanRecordFeedbackRatingInfo": ".extended_agent_span_record_feedback_rating_info",
+    "ExtendedAgentSpanRecordFilesType0": ".extended_agent_span_record_files_type_0",
+    "ExtendedAgentSpanRecordMetricInfoType0": ".extended_agent_span_record_metric_info_type_0",
+    "ExtendedAgentSpanRecordUserMetadata": ".extended_agent_span_record_user_metadata",
+    "ExtendedAgentSpanRecordWithChildren": ".extended_agent_span_record_with_children",
+    "ExtendedAgentSpanRecordWithChildrenAnnotationAggregates": ".extended_agent_span_record_with_children_annotation_aggregates",
+    "ExtendedAgentSpanRecordWithChildrenAnnotationAgreement": ".extended_agent_span_record_with_children_annotation_agreement",
+    "ExtendedAgentSpanRecordWithChildrenAnnotations": ".extended_agent_span_record_with_children_annotations",
+    "ExtendedAgentSpanRecordWithChildrenAnnotationsAdditionalProperty": ".extended_agent_span_record_with_children_annotations_additional_property",
+    "ExtendedAgentSpanRecordWithChildrenDatasetMetadata": ".extended_agent_span_record_with_children_dataset_metadata",
+    "ExtendedAgentSpanRecordWithChildrenFeedbackRatingInfo": ".extended_agent_span_record_with_children_feedback_rating_info",
+    "ExtendedAgentSpanRecordWithChildrenFilesType0": ".extended_agent_span_record_with_children_files_type_0",
+    "ExtendedAgentSpanRecordWithChildrenMetricInfoType0": ".extended_agent_span_record_with_children_metric_info_type_0",
+    "ExtendedAgentSpanRecordWithChildrenUserMetadata": ".extended_agent_span_record_with_children_user_metadata",
+    "ExtendedControlSpanRecord": ".extended_control_span_record",
+    "ExtendedControlSpanRecordAnnotationAggregates": ".extended_control_span_record_annotation_aggregates",
+    "ExtendedControlSpanRecordAnnotationAgreement": ".extended_control_span_record_annotation_agreement",
+    "ExtendedControlSpanRecordAnnotations": ".extended_control_span_record_annotations",
+    "ExtendedControlSpanRecordAnnotationsAdditionalProperty": ".extended_control_span_record_annotations_additional_property",
+    "ExtendedControlSpanRecordDatasetMetadata": ".extended_control_span_record_dataset_metadata",
+    "ExtendedControlSpanRecordFeedbackRatingInfo": ".extended_control_span_record_feedback_rating_info",
+    "ExtendedControlSpanRecordFilesType0": ".extended_control_span_record_files_type_0",
+    "ExtendedControlSpanRecordMetricInfoType0": ".extended_control_span_record_metric_info_type_0",
+    "ExtendedControlSpanRecordUserMetadata": ".extended_control_span_record_user_metadata",
+    "ExtendedLlmSpanRecord": ".extended_llm_span_record",
+    "ExtendedLlmSpanRecordAnnotationAggregates": ".extended_llm_span_record_annotation_aggregates",
+    "ExtendedLlmSpanRecordAnnotationAgreement": ".extended_llm_span_record_annotation_agreement",
+    "ExtendedLlmSpanRecordAnnotations": ".extended_llm_span_record_annotations",
+    "ExtendedLlmSpanRecordAnnotationsAdditionalProperty": ".extended_llm_span_record_annotations_additional_property",
+    "ExtendedLlmSpanRecordDatasetMetadata": ".extended_llm_span_record_dataset_metadata",
+    "ExtendedLlmSpanRecordFeedbackRatingInfo": ".extended_llm_span_record_feedback_rating_info",
+    "ExtendedLlmSpanRecordFilesType0": ".extended_llm_span_record_files_type_0",
+    "ExtendedLlmSpanRecordMetricInfoType0": ".extended_llm_span_record_metric_info_type_0",
+    "ExtendedLlmSpanRecordToolsType0Item": ".extended_llm_span_record_tools_type_0_item",
+    "ExtendedLlmSpanRecordUserMetadata": ".extended_llm_span_record_user_metadata",
+    "ExtendedRetrieverSpanRecord": ".extended_retriever_span_record",
+    "ExtendedRetrieverSpanRecordAnnotationAggregates": ".extended_retriever_span_record_annotation_aggregates",
+    "ExtendedRetrieverSpanRecordAnnotationAgreement": ".extended_retriever_span_record_annotation_agreement",
+    "ExtendedRetrieverSpanRecordAnnotations": ".extended_retriever_span_record_annotations",
+    "ExtendedRetrieverSpanRecordAnnotationsAdditionalProperty": ".extended_retriever_span_record_annotations_additional_property",
+    "ExtendedRetrieverSpanRecordDatasetMetadata": ".extended_retriever_span_record_dataset_metadata",
+    "ExtendedRetrieverSpanRecordFeedbackRatingInfo": ".extended_retriever_span_record_feedback_rating_info",
+    "ExtendedRetrieverSpanRecordFilesType0": ".extended_retriever_span_record_files_type_0",
+    "ExtendedRetrieverSpanRecordMetricInfoType0": ".extended_retriever_span_record_metric_info_type_0",
+    "ExtendedRetrieverSpanRecordUserMetadata": ".extended_retriever_span_record_user_metadata",
+    "ExtendedRetrieverSpanRecordWithChildren": ".extended_retriever_span_record_with_children",
+    "ExtendedRetrieverSpanRecordWithChildrenAnnotationAggregates": ".extended_retriever_span_record_with_children_annotation_aggregates",
+    "ExtendedRetrieverSpanRecordWithChildrenAnnotationAgreement": ".extended_retriever_span_record_with_children_annotation_agreement",
+    "ExtendedRetrieverSpanRecordWithChildrenAnnotations": ".extended_retriever_span_record_with_children_annotations",
+    "ExtendedRetrieverSpanRecordWithChildrenAnnotationsAdditionalProperty": ".extended_retriever_span_record_with_children_annotations_additional_property",
+    "ExtendedRetrieverSpanRecordWithChildrenDatasetMetadata": ".extended_retriever_span_record_with_children_dataset_metadata",
+    "ExtendedRetrieverSpanRecordWithChildrenFeedbackRatingInfo": ".extended_retriever_span_record_with_children_feedback_rating_info",
+    "ExtendedRetrieverSpanRecordWithChildrenFilesType0": ".extended_retriever_span_record_with_children_files_type_0",
+    "ExtendedRetrieverSpanRecordWithChildrenMetricInfoType0": ".extended_retriever_span_record_with_children_metric_info_type_0",
+    "ExtendedRetrieverSpanRecordWithChildrenUserMetadata": ".extended_retriever_span_record_with_children_user_metadata",
+    "ExtendedSessionRecord": ".extended_session_record",
+    "ExtendedSessionRecordAnnotationAggregates": ".extended_session_record_annotation_aggregates",
+    "ExtendedSessionRecordAnnotationAgreement": ".extended_session_record_annotation_agreement",
+    "ExtendedSessionRecordAnnotations": ".extended_session_record_annotations",
+    "ExtendedSessionRecordAnnotationsAdditionalProperty": ".extended_session_record_annotations_additional_property",
+    "ExtendedSessionRecordDatasetMetadata": ".extended_session_record_dataset_metadata",
+    "ExtendedSessionRecordFeedbackRatingInfo": ".extended_session_record_feedback_rating_info",
+    "ExtendedSessionRecordFilesType0": ".extended_session_record_files_type_0",
+    "ExtendedSessionRecordMetricInfoType0": ".extended_session_record_metric_info_type_0",
+    "ExtendedSessionRecordUserMetadata": ".extended_session_record_user_metadata",
+    "ExtendedSessionRecordWithChildren": ".extended_session_record_with_children",
+    "ExtendedSessionRecordWithChildrenAnnotationAggregates": ".extended_session_record_with_children_annotation_aggregates",
+    "ExtendedSessionRecordWithChildrenAnnotationAgreement": ".extended_session_record_with_children_annotation_agreement",
+    "ExtendedSessionRecordWithChildrenAnnotations": ".extended_session_record_with_children_annotations",
+    "ExtendedSessionRecordWithChildrenAnnotationsAdditionalProperty": ".extended_session_record_with_children_annotations_additional_property",
+    "ExtendedSessionRecordWithChildrenDatasetMetadata": ".extended_session_record_with_children_dataset_metadata",
+    "ExtendedSessionRecordWithChildrenFeedbackRatingInfo": ".extended_session_record_with_children_feedback_rating_info",
+    "ExtendedSessionRecordWithChildrenFilesType0": ".extended_session_record_with_children_files_type_0",
+    "ExtendedSessionRecordWithChildrenMetricInfoType0": ".extended_session_record_with_children_metric_info_type_0",
+    "ExtendedSessionRecordWithChildrenUserMetadata": ".extended_session_record_with_children_user_metadata",
+    "ExtendedToolSpanRecord": ".extended_tool_span_record",
+    "ExtendedToolSpanRecordAnnotationAggregates": ".extended_tool_span_record_annotation_aggregates",
+    "ExtendedToolSpanRecordAnnotationAgreement": ".extended_tool_span_record_annotation_agreement",
+    "ExtendedToolSpanRecordAnnotations": ".extended_tool_span_record_annotations",
+    "ExtendedToolSpanRecordAnnotationsAdditionalProperty": ".extended_tool_span_record_annotations_additional_property",
+    "ExtendedToolSpanRecordDatasetMetadata": ".extended_tool_span_record_dataset_metadata",
+    "ExtendedToolSpanRecordFeedbackRatingInfo": ".extended_tool_span_record_feedback_rating_info",
+    "ExtendedToolSpanRecordFilesType0": ".extended_tool_span_record_files_type_0",
+    "ExtendedToolSpanRecordMetricInfoType0": ".extended_tool_span_record_metric_info_type_0",
+    "ExtendedToolSpanRecordUserMetadata": ".extended_tool_span_record_user_metadata",
+    "ExtendedToolSpanRecordWithChildren": ".extended_tool_span_record_with_children",
+    "ExtendedToolSpanRecordWithChildrenAnnotationAggregates": ".extended_tool_span_record_with_children_annotation_aggregates",
+    "ExtendedToolSpanRecordWithChildrenAnnotationAgreement": ".extended_tool_span_record_with_children_annotation_agreement",
+    "ExtendedToolSpanRecordWithChildrenAnnotations": ".extended_tool_span_record_with_children_annotations",
+    "ExtendedToolSpanRecordWithChildrenAnnotationsAdditionalProperty": ".extended_tool_span_record_with_children_annotations_additional_property",
+    "ExtendedToolSpanRecordWithChildrenDatasetMetadata": ".extended_tool_span_record_with_children_dataset_metadata",
+    "ExtendedToolSpanRecordWithChildrenFeedbackRatingInfo": ".extended_tool_span_record_with_children_feedback_rating_info",
+    "ExtendedToolSpanRecordWithChildrenFilesType0": ".extended_tool_span_record_with_children_files_type_0",
+    "ExtendedToolSpanRecordWithChildrenMetricInfoType0": ".extended_tool_span_record_with_children_metric_info_type_0",
+    "ExtendedToolSpanRecordWithChildrenUserMetadata": ".extended_tool_span_record_with_children_user_metadata",
+    "ExtendedTraceRecord": ".extended_trace_record",
+    "ExtendedTraceRecordAnnotationAggregates": ".extended_trace_record_annotation_aggregates",
+    "ExtendedTraceRecordAnnotationAgreement": ".extended_trace_record_annotation_agreement",
+    "ExtendedTraceRecordAnnotations": ".extended_trace_record_annotations",
+    "ExtendedTraceRecordAnnotationsAdditionalProperty": ".extended_trace_record_annotations_additional_property",
+    "ExtendedTraceRecordDatasetMetadata": ".extended_trace_record_dataset_metadata",
+    "ExtendedTraceRecordFeedbackRatingInfo": ".extended_trace_record_feedback_rating_info",
+    "ExtendedTraceRecordFilesType0": ".extended_trace_record_files_type_0",
+    "ExtendedTraceRecordMetricInfoType0": ".extended_trace_record_metric_info_type_0",
+    "ExtendedTraceRecordUserMetadata": ".extended_trace_record_user_metadata",
+    "ExtendedTraceRecordWithChildren": ".extended_trace_record_with_children",
+    "ExtendedTraceRecordWithChildrenAnnotationAggregates": ".extended_trace_record_with_children_annotation_aggregates",
+    "ExtendedTraceRecordWithChildrenAnnotationAgreement": ".extended_trace_record_with_children_annotation_agreement",
+    "ExtendedTraceRecordWithChildrenAnnotations": ".extended_trace_record_with_children_annotations",
+    "ExtendedTraceRecordWithChildrenAnnotationsAdditionalProperty": ".extended_trace_record_with_children_annotations_additional_property",
+    "ExtendedTraceRecordWithChildrenDatasetMetadata": ".extended_trace_record_with_children_dataset_metadata",
+    "ExtendedTraceRecordWithChildrenFeedbackRatingInfo": ".extended_trace_record_with_children_feedback_rating_info",
+    "ExtendedTraceRecordWithChildrenFilesType0": ".extended_trace_record_with_children_files_type_0",
+    "ExtendedTraceRecordWithChildrenMetricInfoType0": ".extended_trace_record_with_children_metric_info_type_0",
+    "ExtendedTraceRecordWithChildrenUserMetadata": ".extended_trace_record_with_children_user_metadata",
+    "ExtendedWorkflowSpanRecord": ".extended_workflow_span_record",
+    "ExtendedWorkflowSpanRecordAnnotationAggregates": ".extended_workflow_span_record_annotation_aggregates",
+    "ExtendedWorkflowSpanRecordAnnotationAgreement": ".extended_workflow_span_record_annotation_agreement",
+    "ExtendedWorkflowSpanRecordAnnotations": ".extended_workflow_span_record_annotations",
+    "ExtendedWorkflowSpanRecordAnnotationsAdditionalProperty": ".extended_workflow_span_record_annotations_additional_property",
+    "ExtendedWorkflowSpanRecordDatasetMetadata": ".extended_workflow_span_record_dataset_metadata",
+    "ExtendedWorkflowSpanRecordFeedbackRatingInfo": ".extended_workflow_span_record_feedback_rating_info",
+    "ExtendedWorkflowSpanRecordFilesType0": ".extended_workflow_span_record_files_type_0",
+    "ExtendedWorkflowSpanRecordMetricInfoType0": ".extended_workflow_span_record_metric_info_type_0",
+    "ExtendedWorkflowSpanRecordUserMetadata": ".extended_workflow_span_record_user_metadata",
+    "ExtendedWorkflowSpanRecordWithChildren": ".extended_workflow_span_record_with_children",
+    "ExtendedWorkflowSpanRecordWithChildrenAnnotationAggregates": ".extended_workflow_span_record_with_children_annotation_aggregates",
+    "ExtendedWorkflowSpanRecordWithChildrenAnnotationAgreement": ".extended_workflow_span_record_with_children_annotation_agreement",
+    "ExtendedWorkflowSpanRecordWithChildrenAnnotations": ".extended_workflow_span_record_with_children_annotations",
+    "ExtendedWorkflowSpanRecordWithChildrenAnnotationsAdditionalProperty": ".extended_workflow_span_record_with_children_annotations_additional_property",
+    "ExtendedWorkflowSpanRecordWithChildrenDatasetMetadata": ".extended_workflow_span_record_with_children_dataset_metadata",
+    "ExtendedWorkflowSpanRecordWithChildrenFeedbackRatingInfo": ".extended_workflow_span_record_with_children_feedback_rating_info",
+    "ExtendedWorkflowSpanRecordWithChildrenFilesType0": ".extended_workflow_span_record_with_children_files_type_0",
+    "ExtendedWorkflowSpanRecordWithChildrenMetricInfoType0": ".extended_workflow_span_record_with_children_metric_info_type_0",
+    "ExtendedWorkflowSpanRecordWithChildrenUserMetadata": ".extended_workflow_span_record_with_children_user_metadata",
+    "FactualityTemplate": ".factuality_template",
+    "FactualityTemplateResponseSchemaType0": ".factuality_template_response_schema_type_0",
+    "FeatureIntegrationCosts": ".feature_integration_costs",
+    "FeedbackAggregate": ".feedback_aggregate",
+    "FeedbackRatingInfo": ".feedback_rating_info",
+    "FeedbackType": ".feedback_type",
+    "FewShotExample": ".few_shot_example",
+    "FileContentPart": ".file_content_part",
+    "FileMetadata": ".file_metadata",
+    "FileSource": ".file_source",
+    "FileStatus": ".file_status",
+    "FilterLeafLogRecordsFilter": ".filter_leaf_log_records_filter",
+    "FineTunedScorer": ".fine_tuned_scorer",
+    "FineTunedScorerAction": ".fine_tuned_scorer_action",
+    "FineTunedScorerResponse": ".fine_tuned_scorer_response",
+    "FineTunedScorerResponseClassNameToVocabIxType0": ".fine_tuned_scorer_response_class_name_to_vocab_ix_type_0",
+    "FineTunedScorerResponseClassNameToVocabIxType1": ".fine_tuned_scorer_response_class_name_to_vocab_ix_type_1",
+    "GeneratedScorerAction": ".generated_scorer_action",
+    "GeneratedScorerConfiguration": ".generated_scorer_configuration",
+    "GeneratedScorerResponse": ".generated_scorer_response",
+    "GeneratedScorerValidationResponse": ".generated_scorer_validation_response",
+    "GenerationResponse": ".generation_response",
+    "GetIntegrationStatusIntegrationsNameStatusGetResponseGetIntegrationStatusIntegrationsNameStatusGet": ".get_integration_status_integrations_name_status_get_response_get_integration_status_integrations_name_status_get",
+    "GetIntegrationsAndModelInfoForRunLlmIntegrationsProjectsProjectIdRunsRunIdGetGetRunIntegrationsResponse": ".get_integrations_and_model_info_for_run_llm_integrations_projects_project_id_runs_run_id_get_get_run_integrations_response",
+    "GetIntegrationsAndModelInfoLlmIntegrationsGetResponseGetIntegrationsAndModelInfoLlmIntegrationsGet": ".get_integrations_and_model_info_llm_integrations_get_response_get_integrations_and_model_info_llm_integrations_get",
+    "GetNamedCustomIntegrationStatusIntegrationsCustomNameStatusGetResponseGetNamedCustomIntegrationStatusIntegrationsCustomNameStatusGet": ".get_named_custom_integration_status_integrations_custom_name_status_get_response_get_named_custom_integration_status_integrations_custom_name_status_get",
+    "GetProjectsPaginatedResponse": ".get_projects_paginated_response",
+    "GetProjectsPaginatedResponseV2": ".get_projects_paginated_response_v2",
+    "GroundTruthAdherenceScorer": ".ground_truth_adherence_scorer",
+    "GroundTruthAdherenceTemplate": ".ground_truth_adherence_template",
+    "GroundTruthAdherenceTemplateResponseSchemaType0": ".ground_truth_adherence_template_response_schema_type_0",
+    "GroundednessTemplate": ".groundedness_template",
+    "GroundednessTemplateResponseSchemaType0": ".groundedness_template_response_schema_type_0",
+    "GroupAction": ".group_action",
+    "GroupCollaborator": ".group_collaborator",
+    "GroupCollaboratorCreate": ".group_collaborator_create",
+    "GroupMemberAction": ".group_member_action",
+    "HallucinationSegment": ".hallucination_segment",
+    "HealthScoreResult": ".health_score_result",
+    "HealthScoreResultSecondary": ".health_score_result_secondary",
+    "HealthScoreType": ".health_score_type",
+    "HealthcheckResponse": ".healthcheck_response",
+    "Histogram": ".histogram",
+    "HistogramBucket": ".histogram_bucket",
+    "HistogramStrategy": ".histogram_strategy",
+    "HTTPValidationError": ".http_validation_error",
+    "ImageGenerationEvent": ".image_generation_event",
+    "ImageGenerationEventImagesType0Item": ".image_generation_event_images_type_0_item",
+    "ImageGenerationEventMetadataType0": ".image_generation_event_metadata_type_0",
+    "InputMap": ".input_map",
+    "InputPIIScorer": ".input_pii_scorer",
+    "InputSexistScorer": ".input_sexist_scorer",
+    "InputSexistScorerType": ".input_sexist_scorer_type",
+    "InputSexistTemplate": ".input_sexist_template",
+    "InputSexistTemplateResponseSchemaType0": ".input_sexist_template_response_schema_type_0",
+    "InputToneScorer": ".input_tone_scorer",
+    "InputToxicityScorer": ".input_toxicity_scorer",
+    "InputToxicityScorerType": ".input_toxicity_scorer_type",
+    "InputToxicityTemplate": ".input_toxicity_template",
+    "InputToxicityTemplateResponseSchemaType0": ".input_toxicity_template_response_schema_type_0",
+    "InputTypeEnum": ".input_type_enum",
+    "InsightSummary": ".insight_summary",
+    "InsightSummaryPriorityCategoryType0": ".insight_summary_priority_category_type_0",
+    "InsightType": ".insight_type",
+    "InstructionAdherenceScorer": ".instruction_adherence_scorer",
+    "InstructionAdherenceTemplate": ".instruction_adherence_template",
+    "InstructionAdherenceTemplateResponseSchemaType0": ".instruction_adherence_template_response_schema_type_0",
+    "IntegrationAction": ".integration_action",
+    "IntegrationCostsDataPoint": ".integration_costs_data_point",
+    "IntegrationCostsResponse": ".integration_costs_response",
+    "IntegrationDB": ".integration_db",
+    "IntegrationDisableRequest": ".integration_disable_request",
+    "IntegrationModelsResponse": ".integration_models_response",
+    "IntegrationModelsResponseRecommendedModels": ".integration_models_response_recommended_models",
+    "IntegrationProvider": ".integration_provider",
+    "IntegrationSelectRequest": ".integration_select_request",
+    "InternalToolCall": ".internal_tool_call",
+    "InternalToolCallInputType0": ".internal_tool_call_input_type_0",
+    "InternalToolCallMetadataType0": ".internal_tool_call_metadata_type_0",
+    "InternalToolCallOutputType0": ".internal_tool_call_output_type_0",
+    "InvalidResult": ".invalid_result",
+    "InvokeResponse": ".invoke_response",
+    "InvokeResponseHeadersType0": ".invoke_response_headers_type_0",
+    "InvokeResponseMetadataType0": ".invoke_response_metadata_type_0",
+    "InvokeResponseMetricResults": ".invoke_response_metric_results",
+    "JobDB": ".job_db",
+    "JobDBRequestData": ".job_db_request_data",
+    "JobProgress": ".job_progress",
+    "LikeDislikeAggregate": ".like_dislike_aggregate",
+    "LikeDislikeConstraints": ".like_dislike_constraints",
+    "LikeDislikeRating": ".like_dislike_rating",
+    "ListAnnotationQueueCollaboratorsResponse": ".list_annotation_queue_collaborators_response",
+    "ListAnnotationQueueParams": ".list_annotation_queue_params",
+    "ListAnnotationQueueResponse": ".list_annotation_queue_response",
+    "ListDatasetParams": ".list_dataset_params",
+    "ListDatasetProjectsResponse": ".list_dataset_projects_response",
+    "ListDatasetResponse": ".list_dataset_response",
+    "ListDatasetVersionParams": ".list_dataset_version_params",
+    "ListDatasetVersionResponse": ".list_dataset_version_response",
+    "ListExperimentResponse": ".list_experiment_response",
+    "ListGroupCollaboratorsResponse": ".list_group_collaborators_response",
+    "ListLogStreamResponse": ".list_log_stream_response",
+    "ListPromptTemplateParams": ".list_prompt_template_params",
+    "ListPromptTemplateResponse": ".list_prompt_template_response",
+    "ListPromptTemplateVersionParams": ".list_prompt_template_version_params",
+    "ListPromptTemplateVersionResponse": ".list_prompt_template_version_response",
+    "ListScorerVersionsResponse": ".list_scorer_versions_response",
+    "ListScorersRequest": ".list_scorers_request",
+    "ListScorersResponse": ".list_scorers_response",
+    "ListUserCollaboratorsResponse": ".list_user_collaborators_response",
+    "LLMExportFormat": ".llm_export_format",
+    "LLMIntegration": ".llm_integration",
+    "LlmMetrics": ".llm_metrics",
+    "LlmSpan": ".llm_span",
+    "LlmSpanDatasetMetadata": ".llm_span_dataset_metadata",
+    "LlmSpanToolsType0Item": ".llm_span_tools_type_0_item",
+    "LlmSpanUserMetadata": ".llm_span_user_metadata",
+    "LogRecordsAvailableColumnsRequest": ".log_records_available_columns_request",
+    "LogRecordsAvailableColumnsResponse": ".log_records_available_columns_response",
+    "LogRecordsBooleanFilter": ".log_records_boolean_filter",
+    "LogRecordsBooleanFilterOperator": ".log_records_boolean_filter_operator",
+    "LogRecordsCollectionFilter": ".log_records_collection_filter",
+    "LogRecordsCollectionFilterOperator": ".log_records_collection_filter_operator",
+    "LogRecordsColumnInfo": ".log_records_column_info",
+    "LogRecordsColumnInfoLabelColorType0": ".log_records_column_info_label_color_type_0",
+    "LogRecordsCustomMetricsQueryRequest": ".log_records_custom_metrics_query_request",
+    "LogRecordsDateFilter": ".log_records_date_filter",
+    "LogRecordsDateFilterOperator": ".log_records_date_filter_operator",
+    "LogRecordsDeleteRequest": ".log_records_delete_request",
+    "LogRecordsDeleteResponse": ".log_records_delete_response",
+    "LogRecordsExportRequest": ".log_records_export_request",
+    "LogRecordsFilterType": ".log_records_filter_type",
+    "LogRecordsFullyAnnotatedFilter": ".log_records_fully_annotated_filter",
+    "LogRecordsIDFilter": ".log_records_id_filter",
+    "LogRecordsIDFilterOperator": ".log_records_id_filter_operator",
+    "LogRecordsMetricsQueryRequest": ".log_records_metrics_query_request",
+    "LogRecordsMetricsResponse": ".log_records_metrics_response",
+    "LogRecordsMetricsResponseAggregateMetrics": ".log_records_metrics_response_aggregate_metrics",
+    "LogRecordsMetricsResponseAggregateMetricsAdditionalPropertyType2": ".log_records_metrics_response_aggregate_metrics_additional_property_type_2",
+    "LogRecordsMetricsResponseBucketedMetrics": ".log_records_metrics_response_bucketed_metrics",
+    "LogRecordsMetricsResponseStandardErrorsType0": ".log_records_metrics_response_standard_errors_type_0",
+    "LogRecordsNumberFilter": ".log_records_number_filter",
+    "LogRecordsNumberFilterOperator": ".log_records_number_filter_operator",
+    "LogRecordsPartialQueryRequest": ".log_records_partial_query_request",
+    "LogRecordsPartialQueryResponse": ".log_records_partial_query_response",
+    "LogRecordsQueryCountRequest": ".log_records_query_count_request",
+    "LogRecordsQueryCountResponse": ".log_records_query_count_response",
+    "LogRecordsQueryRequest": ".log_records_query_request",
+    "LogRecordsQueryResponse": ".log_records_query_response",
+    "LogRecordsSortClause": ".log_records_sort_clause",
+    "LogRecordsTextFilter": ".log_records_text_filter",
+    "LogRecordsTextFilterOperator": ".log_records_text_filter_operator",
+    "LogSpanUpdateRequest": ".log_span_update_request",
+    "LogSpanUpdateResponse": ".log_span_update_response",
+    "LogSpansIngestRequest": ".log_spans_ingest_request",
+    "LogSpansIngestResponse": ".log_spans_ingest_response",
+    "LogStreamCreateRequest": ".log_stream_create_request",
+    "LogStreamInfo": ".log_stream_info",
+    "LogStreamResponse": ".log_stream_response",
+    "LogStreamUpdateRequest": ".log_stream_update_request",
+    "LogTraceUpdateRequest": ".log_trace_update_request",
+    "LogTraceUpdateResponse": ".log_trace_update_response",
+    "LogTracesIngestRequest": ".log_traces_ingest_request",
+    "LogTracesIngestResponse": ".log_traces_ingest_response",
+    "LoggingMethod": ".logging_method",
+    "LunaInputTypeEnum": ".luna_input_type_enum",
+    "LunaOutputTypeEnum": ".luna_output_type_enum",
+    "MCPApprovalRequestEvent": ".mcp_approval_request_event",
+    "MCPApprovalRequestEventMetadataType0": ".mcp_approval_request_event_metadata_type_0",
+    "MCPApprovalRequestEventToolInvocationType0": ".mcp_approval_request_event_tool_invocation_type_0",
+    "MCPCallEvent": ".mcp_call_event",
+    "MCPCallEventArgumentsType0": ".mcp_call_event_arguments_type_0",
+    "MCPCallEventMetadataType0": ".mcp_call_event_metadata_type_0",
+    "MCPCallEventResultType0": ".mcp_call_event_result_type_0",
+    "MCPListToolsEvent": ".mcp_list_tools_event",
+    "MCPListToolsEventMetadataType0": ".mcp_list_tools_event_metadata_type_0",
+    "MCPListToolsEventToolsType0Item": ".mcp_list_tools_event_tools_type_0_item",
+    "Message": ".message",
+    "MessageEvent": ".message_event",
+    "MessageEventContentPartsType0Item": ".message_event_content_parts_type_0_item",
+    "MessageEventMetadataType0": ".message_event_metadata_type_0",
+    "MessageRole": ".message_role",
+    "MessagesListItem": ".messages_list_item",
+    "MessagesListItemRole": ".messages_list_item_role",
+    "MetadataFilter": ".metadata_filter",
+    "MetadataFilterOperator": ".metadata_filter_operator",
+    "MetricAggregates": ".metric_aggregates",
+    "MetricAggregatesValueDistributionType0": ".metric_aggregates_value_distribution_type_0",
+    "MetricAggregation": ".metric_aggregation",
+    "MetricAggregationDetail": ".metric_aggregation_detail",
+    "MetricColor": ".metric_color",
+    "MetricColorPickerBoolean": ".metric_color_picker_boolean",
+    "MetricColorPickerCategorical": ".metric_color_picker_categorical",
+    "MetricColorPickerMultiLabel": ".metric_color_picker_multi_label",
+    "MetricColorPickerNumeric": ".metric_color_picker_numeric",
+    "MetricComputation": ".metric_computation",
+    "MetricComputationStatus": ".metric_computation_status",
+    "MetricComputationValueType4": ".metric_computation_value_type_4",
+    "MetricComputing": ".metric_computing",
+    "MetricCritiqueColumnar": ".metric_critique_columnar",
+    "MetricCritiqueContent": ".metric_critique_content",
+    "MetricError": ".metric_error",
+    "MetricFailed": ".metric_failed",
+    "MetricNotApplicable": ".metric_not_applicable",
+    "MetricNotComputed": ".metric_not_computed",
+    "MetricPending": ".metric_pending",
+    "MetricRollUp": ".metric_roll_up",
+    "MetricRollUpMetadataType0": ".metric_roll_up_metadata_type_0",
+    "MetricRollUpRollUpMetrics": ".metric_roll_up_roll_up_metrics",
+    "MetricRollUpRollUpMetricsAdditionalPropertyType1": ".metric_roll_up_roll_up_metrics_additional_property_type_1",
+    "MetricSettingsRequest": ".metric_settings_request",
+    "MetricSettingsResponse": ".metric_settings_response",
+    "MetricSuccess": ".metric_success",
+    "MetricSuccessMetadataType0": ".metric_success_metadata_type_0",
+    "MetricThreshold": ".metric_threshold",
+    "Metrics": ".metrics",
+    "MetricsTestingAvailableColumnsRequest": ".metrics_testing_available_columns_request",
+    "MistralIntegration": ".mistral_integration",
+    "MistralIntegrationCreate": ".mistral_integration_create",
+    "MistralIntegrationExtraType0": ".mistral_integration_extra_type_0",
+    "ModalityFilter": ".modality_filter",
+    "ModalityFilterOperator": ".modality_filter_operator",
+    "Model": ".model",
+    "ModelCostBy": ".model_cost_by",
+    "ModelProperties": ".model_properties",
+    "ModelType": ".model_type",
+    "MultiModalModelIntegrationConfig": ".multi_modal_model_integration_config",
+    "MultimodalCapability": ".multimodal_capability",
+    "Name": ".name",
+    "NodeNameFilter": ".node_name_filter",
+    "NodeNameFilterOperator": ".node_name_filter_operator",
+    "NodeType": ".node_type",
+    "NotNodeLogRecordsFilter": ".not_node_log_records_filter",
+    "NumericColorConstraint": ".numeric_color_constraint",
+    "NumericColorConstraintOperator": ".numeric_color_constraint_operator",
+    "NumericRollUpMethod": ".numeric_roll_up_method",
+    "NvidiaIntegration": ".nvidia_integration",
+    "NvidiaIntegrationCreate": ".nvidia_integration_create",
+    "NvidiaIntegrationExtraType0": ".nvidia_integration_extra_type_0",
+    "OpenAIFunction": ".open_ai_function",
+    "OpenAIIntegration": ".open_ai_integration",
+    "OpenAIIntegrationCreate": ".open_ai_integration_create",
+    "OpenAIIntegrationExtraType0": ".open_ai_integration_extra_type_0",
+    "OpenAIToolChoice": ".open_ai_tool_choice",
+    "OrNodeLogRecordsFilter": ".or_node_log_records_filter",
+    "OrganizationAction": ".organization_action",
+    "OutputMap": ".output_map",
+    "OutputPIIScorer": ".output_pii_scorer",
+    "OutputSexistScorer": ".output_sexist_scorer",
+    "OutputSexistScorerType": ".output_sexist_scorer_type",
+    "OutputToneScorer": ".output_tone_scorer",
+    "OutputToxicityScorer": ".output_toxicity_scorer",
+    "OutputToxicityScorerType": ".output_toxicity_scorer_type",
+    "OutputTypeEnum": ".output_type_enum",
+    "OverrideAction": ".override_action",
+    "PartialExtendedAgentSpanRecord": ".partial_extended_agent_span_record",
+    "PartialExtendedAgentSpanRecordAnnotationAggregates": ".partial_extended_agent_span_record_annotation_aggregates",
+    "PartialExtendedAgentSpanRecordAnnotationAgreement": ".partial_extended_agent_span_record_annotation_agreement",
+    "PartialExtendedAgentSpanRecordAnnotations": ".partial_extended_agent_span_record_annotations",
+    "PartialExtendedAgentSpanRecordAnnotationsAdditionalProperty": ".partial_extended_agent_span_record_annotations_additional_property",
+    "PartialExtendedAgentSpanRecordDatasetMetadata": ".partial_extended_agent_span_record_dataset_metadata",
+    "PartialExtendedAgentSpanRecordFeedbackRatingInfo": ".partial_extended_agent_span_record_feedback_rating_info",
+    "PartialExtendedAgentSpanRecordFilesType0": ".partial_extended_agent_span_record_files_type_0",
+    "PartialExtendedAgentSpanRecordMetricInfoType0": ".partial_extended_agent_span_record_metric_info_type_0",
+    "PartialExtendedAgentSpanRecordUserMetadata": ".partial_extended_agent_span_record_user_metadata",
+    "PartialExtendedControlSpanRecord": ".partial_extended_control_span_record",
+    "PartialExtendedControlSpanRecordAnnotationAggregates": ".partial_extended_control_span_record_annotation_aggregates",
+    "PartialExtendedControlSpanRecordAnnotationAgreement": ".partial_extended_control_span_record_annotation_agreement",
+    "PartialExtendedControlSpanRecordAnnotations": ".partial_extended_control_span_record_annotations",
+    "PartialExtendedControlSpanRecordAnnotationsAdditionalProperty": ".partial_extended_control_span_record_annotations_additional_property",
+    "PartialExtendedControlSpanRecordDatasetMetadata": ".partial_extended_control_span_record_dataset_metadata",
+    "PartialExtendedControlSpanRecordFeedbackRatingInfo": ".partial_extended_control_span_record_feedback_rating_info",
+    "PartialExtendedControlSpanRecordFilesType0": ".partial_extended_control_span_record_files_type_0",
+    "PartialExtendedControlSpanRecordMetricInfoType0": ".partial_extended_control_span_record_metric_info_type_0",
+    "PartialExtendedControlSpanRecordUserMetadata": ".partial_extended_control_span_record_user_metadata",
+    "PartialExtendedLlmSpanRecord": ".partial_extended_llm_span_record",
+    "PartialExtendedLlmSpanRecordAnnotationAggregates": ".partial_extended_llm_span_record_annotation_aggregates",
+    "PartialExtendedLlmSpanRecordAnnotationAgreement": ".partial_extended_llm_span_record_annotation_agreement",
+    "PartialExtendedLlmSpanRecordAnnotations": ".partial_extended_llm_span_record_annotations",
+    "PartialExtendedLlmSpanRecordAnnotationsAdditionalProperty": ".partial_extended_llm_span_record_annotations_additional_property",
+    "PartialExtendedLlmSpanRecordDatasetMetadata": ".partial_extended_llm_span_record_dataset_metadata",
+    "PartialExtendedLlmSpanRecordFeedbackRatingInfo": ".partial_extended_llm_span_record_feedback_rating_info",
+    "PartialExtendedLlmSpanRecordFilesType0": ".partial_extended_llm_span_record_files_type_0",
+    "PartialExtendedLlmSpanRecordMetricInfoType0": ".partial_extended_llm_span_record_metric_info_type_0",
+    "PartialExtendedLlmSpanRecordToolsType0Item": ".partial_extended_llm_span_record_tools_type_0_item",
+    "PartialExtendedLlmSpanRecordUserMetadata": ".partial_extended_llm_span_record_user_metadata",
+    "PartialExtendedRetrieverSpanRecord": ".partial_extended_retriever_span_record",
+    "PartialExtendedRetrieverSpanRecordAnnotationAggregates": ".partial_extended_retriever_span_record_annotation_aggregates",
+    "PartialExtendedRetrieverSpanRecordAnnotationAgreement": ".partial_extended_retriever_span_record_annotation_agreement",
+    "PartialExtendedRetrieverSpanRecordAnnotations": ".partial_extended_retriever_span_record_annotations",
+    "PartialExtendedRetrieverSpanRecordAnnotationsAdditionalProperty": ".partial_extended_retriever_span_record_annotations_additional_property",
+    "PartialExtendedRetrieverSpanRecordDatasetMetadata": ".partial_extended_retriever_span_record_dataset_metadata",
+    "PartialExtendedRetrieverSpanRecordFeedbackRatingInfo": ".partial_extended_retriever_span_record_feedback_rating_info",
+    "PartialExtendedRetrieverSpanRecordFilesType0": ".partial_extended_retriever_span_record_files_type_0",
+    "PartialExtendedRetrieverSpanRecordMetricInfoType0": ".partial_extended_retriever_span_record_metric_info_type_0",
+    "PartialExtendedRetrieverSpanRecordUserMetadata": ".partial_extended_retriever_span_record_user_metadata",
+    "PartialExtendedSessionRecord": ".partial_extended_session_record",
+    "PartialExtendedSessionRecordAnnotationAggregates": ".partial_extended_session_record_annotation_aggregates",
+    "PartialExtendedSessionRecordAnnotationAgreement": ".partial_extended_session_record_annotation_agreement",
+    "PartialExtendedSessionRecordAnnotations": ".partial_extended_session_record_annotations",
+    "PartialExtendedSessionRecordAnnotationsAdditionalProperty": ".partial_extended_session_record_annotations_additional_property",
+    "PartialExtendedSessionRecordDatasetMetadata": ".partial_extended_session_record_dataset_metadata",
+    "PartialExtendedSessionRecordFeedbackRatingInfo": ".partial_extended_session_record_feedback_rating_info",
+    "PartialExtendedSessionRecordFilesType0": ".partial_extended_session_record_files_type_0",
+    "PartialExtendedSessionRecordMetricInfoType0": ".partial_extended_session_record_metric_info_type_0",
+    "PartialExtendedSessionRecordUserMetadata": ".partial_extended_session_record_user_metadata",
+    "PartialExtendedToolSpanRecord": ".partial_extended_tool_span_record",
+    "PartialExtendedToolSpanRecordAnnotationAggregates": ".partial_extended_tool_span_record_annotation_aggregates",
+    "PartialExtendedToolSpanRecordAnnotationAgreement": ".partial_extended_tool_span_record_annotation_agreement",
+    "PartialExtendedToolSpanRecordAnnotations": ".partial_extended_tool_span_record_annotations",
+    "PartialExtendedToolSpanRecordAnnotationsAdditionalProperty": ".partial_extended_tool_span_record_annotations_additional_property",
+    "PartialExtendedToolSpanRecordDatasetMetadata": ".partial_extended_tool_span_record_dataset_metadata",
+    "PartialExtendedToolSpanRecordFeedbackRatingInfo": ".partial_extended_tool_span_record_feedback_rating_info",
+    "PartialExtendedToolSpanRecordFilesType0": ".partial_extended_tool_span_record_files_type_0",
+    "PartialExtendedToolSpanRecordMetricInfoType0": ".partial_extended_tool_span_record_metric_info_type_0",
+    "PartialExtendedToolSpanRecordUserMetadata": ".partial_extended_tool_span_record_user_metadata",
+    "PartialExtendedTraceRecord": ".partial_extended_trace_record",
+    "PartialExtendedTraceRecordAnnotationAggregates": ".partial_extended_trace_record_annotation_aggregates",
+    "PartialExtendedTraceRecordAnnotationAgreement": ".partial_extended_trace_record_annotation_agreement",
+    "PartialExtendedTraceRecordAnnotations": ".partial_extended_trace_record_annotations",
+    "PartialExtendedTraceRecordAnnotationsAdditionalProperty": ".partial_extended_trace_record_annotations_additional_property",
+    "PartialExtendedTraceRecordDatasetMetadata": ".partial_extended_trace_record_dataset_metadata",
+    "PartialExtendedTraceRecordFeedbackRatingInfo": ".partial_extended_trace_record_feedback_rating_info",
+    "PartialExtendedTraceRecordFilesType0": ".partial_extended_trace_record_files_type_0",
+    "PartialExtendedTraceRecordMetricInfoType0": ".partial_extended_trace_record_metric_info_type_0",
+    "PartialExtendedTraceRecordUserMetadata": ".partial_extended_trace_record_user_metadata",
+    "PartialExtendedWorkflowSpanRecord": ".partial_extended_workflow_span_record",
+    "PartialExtendedWorkflowSpanRecordAnnotationAggregates": ".partial_extended_workflow_span_record_annotation_aggregates",
+    "PartialExtendedWorkflowSpanRecordAnnotationAgreement": ".partial_extended_workflow_span_record_annotation_agreement",
+    "PartialExtendedWorkflowSpanRecordAnnotations": ".partial_extended_workflow_span_record_annotations",
+    "PartialExtendedWorkflowSpanRecordAnnotationsAdditionalProperty": ".partial_extended_workflow_span_record_annotations_additional_property",
+    "PartialExtendedWorkflowSpanRecordDatasetMetadata": ".partial_extended_workflow_span_record_dataset_metadata",
+    "PartialExtendedWorkflowSpanRecordFeedbackRatingInfo": ".partial_extended_workflow_span_record_feedback_rating_info",
+    "PartialExtendedWorkflowSpanRecordFilesType0": ".partial_extended_workflow_span_record_files_type_0",
+    "PartialExtendedWorkflowSpanRecordMetricInfoType0": ".partial_extended_workflow_span_record_metric_info_type_0",
+    "PartialExtendedWorkflowSpanRecordUserMetadata": ".partial_extended_workflow_span_record_user_metadata",
+    "PassthroughAction": ".passthrough_action",
+    "Payload": ".payload",
+    "Permission": ".permission",
+    "PreviewDatasetRequest": ".preview_dataset_request",
+    "ProjectAction": ".project_action",
+    "ProjectBookmarkFilter": ".project_bookmark_filter",
+    "ProjectBookmarkSort": ".project_bookmark_sort",
+    "ProjectCollectionParams": ".project_collection_params",
+    "ProjectCreate": ".project_create",
+    "ProjectCreateResponse": ".project_create_response",
+    "ProjectCreatedAtFilter": ".project_created_at_filter",
+    "ProjectCreatedAtFilterOperator": ".project_created_at_filter_operator",
+    "ProjectCreatedAtSortV1": ".project_created_at_sort_v1",
+    "ProjectCreatorFilter": ".project_creator_filter",
+    "ProjectCreatorFilterOperator": ".project_creator_filter_operator",
+    "ProjectDB": ".project_db",
+    "ProjectDBThin": ".project_db_thin",
+    "ProjectDeleteResponse": ".project_delete_response",
+    "ProjectIDFilter": ".project_id_filter",
+    "ProjectIDFilterOperator": ".project_id_filter_operator",
+    "ProjectIntegrationCosts": ".project_integration_costs",
+    "ProjectItem": ".project_item",
+    "ProjectLabels": ".project_labels",
+    "ProjectNameFilter": ".project_name_filter",
+    "ProjectNameFilterOperator": ".project_name_filter_operator",
+    "ProjectNameSortV1": ".project_name_sort_v1",
+    "ProjectRunsFilter": ".project_runs_filter",
+    "ProjectRunsFilterOperator": ".project_runs_filter_operator",
+    "ProjectRunsSort": ".project_runs_sort",
+    "ProjectType": ".project_type",
+    "ProjectTypeFilter": ".project_type_filter",
+    "ProjectTypeFilterOperator": ".project_type_filter_operator",
+    "ProjectTypeSort": ".project_type_sort",
+    "ProjectUpdate": ".project_update",
+    "ProjectUpdateResponse": ".project_update_response",
+    "ProjectUpdatedAtFilter": ".project_updated_at_filter",
+    "ProjectUpdatedAtFilterOperator": ".project_updated_at_filter_operator",
+    "ProjectUpdatedAtSortV1": ".project_updated_at_sort_v1",
+    "PromptInjectionScorer": ".prompt_injection_scorer",
+    "PromptInjectionScorerType": ".prompt_injection_scorer_type",
+    "PromptInjectionTemplate": ".prompt_injection_template",
+    "PromptInjectionTemplateResponseSchemaType0": ".prompt_injection_template_response_schema_type_0",
+    "PromptPerplexityScorer": ".prompt_perplexity_scorer",
+    "PromptRunSettings": ".prompt_run_settings",
+    "PromptRunSettingsResponseFormatType0": ".prompt_run_settings_response_format_type_0",
+    "PromptRunSettingsToolsType0Item": ".prompt_run_settings_tools_type_0_item",
+    "PromptTemplateCreatedAtSort": ".prompt_template_created_at_sort",
+    "PromptTemplateCreatedByFilter": ".prompt_template_created_by_filter",
+    "PromptTemplateCreatedByFilterOperator": ".prompt_template_created_by_filter_operator",
+    "PromptTemplateNameFilter": ".prompt_template_name_filter",
+    "PromptTemplateNameFilterOperator": ".prompt_template_name_filter_operator",
+    "PromptTemplateNameSort": ".prompt_template_name_sort",
+    "PromptTemplateNotInProjectFilter": ".prompt_template_not_in_project_filter",
+    "PromptTemplateUpdatedAtSort": ".prompt_template_updated_at_sort",
+    "PromptTemplateUsedInProjectFilter": ".prompt_template_used_in_project_filter",
+    "PromptTemplateVersionCreatedAtSort": ".prompt_template_version_created_at_sort",
+    "PromptTemplateVersionNumberSort": ".prompt_template_version_number_sort",
+    "PromptTemplateVersionUpdatedAtSort": ".prompt_template_version_updated_at_sort",
+    "ProtectRequest": ".protect_request",
+    "ProtectRequestHeadersType0": ".protect_request_headers_type_0",
+    "ProtectRequestMetadataType0": ".protect_request_metadata_type_0",
+    "ProtectResponse": ".protect_response",
+    "QueryDatasetParams": ".query_dataset_params",
+    "ReasoningEvent": ".reasoning_event",
+    "ReasoningEventMetadataType0": ".reasoning_event_metadata_type_0",
+    "ReasoningEventSummaryType1Item": ".reasoning_event_summary_type_1_item",
+    "RecommendedModelPurpose": ".recommended_model_purpose",
+    "RecommendedModelsResponse": ".recommended_models_response",
+    "RecommendedModelsResponseAvailable": ".recommended_models_response_available",
+    "RecommendedModelsResponseAvailableAdditionalProperty": ".recommended_models_response_available_additional_property",
+    "RecommendedModelsResponseSupported": ".recommended_models_response_supported",
+    "RecommendedModelsResponseSupportedAdditionalProperty": ".recommended_models_response_supported_additional_property",
+    "RecomputeLogRecordsMetricsRequest": ".recompute_log_records_metrics_request",
+    "RegisteredScorer": ".registered_scorer",
+    "RegisteredScorerAction": ".registered_scorer_action",
+    "RegisteredScorerTaskResultResponse": ".registered_scorer_task_result_response",
+    "RemoveRecordsFromQueueRequest": ".remove_records_from_queue_request",
+    "RemoveRecordsFromQueueResponse": ".remove_records_from_queue_response",
+    "RenderTemplateRequest": ".render_template_request",
+    "RenderTemplateResponse": ".render_template_response",
+    "RenderedTemplate": ".rendered_template",
+    "RetrieverSpan": ".retriever_span",
+    "RetrieverSpanDatasetMetadata": ".retriever_span_dataset_metadata",
+    "RetrieverSpanUserMetadata": ".retriever_span_user_metadata",
+    "RollUpMethodDisplayOptions": ".roll_up_method_display_options",
+    "RollUpStrategy": ".roll_up_strategy",
+    "RollbackRequest": ".rollback_request",
+    "RootType": ".root_type",
+    "RougeScorer": ".rouge_scorer",
+    "Rule": ".rule",
+    "RuleOperator": ".rule_operator",
+    "RuleResult": ".rule_result",
+    "Ruleset": ".ruleset",
+    "RulesetResult": ".ruleset_result",
+    "RulesetsMixin": ".rulesets_mixin",
+    "RunCreatedAtFilter": ".run_created_at_filter",
+    "RunCreatedAtFilterOperator": ".run_created_at_filter_operator",
+    "RunCreatedAtSort": ".run_created_at_sort",
+    "RunCreatedByFilter": ".run_created_by_filter",
+    "RunCreatedByFilterOperator": ".run_created_by_filter_operator",
+    "RunDB": ".run_db",
+    "RunDBThin": ".run_db_thin",
+    "RunIDFilter": ".run_id_filter",
+    "RunIDFilterOperator": ".run_id_filter_operator",
+    "RunNameFilter": ".run_name_filter",
+    "RunNameFilterOperator": ".run_name_filter_operator",
+    "RunNameSort": ".run_name_sort",
+    "RunParamsMap": ".run_params_map",
+    "RunScorerSettingsPatchRequest": ".run_scorer_settings_patch_request",
+    "RunScorerSettingsResponse": ".run_scorer_settings_response",
+    "RunTagCreateRequest": ".run_tag_create_request",
+    "RunTagDB": ".run_tag_db",
+    "RunUpdatedAtFilter": ".run_updated_at_filter",
+    "RunUpdatedAtFilterOperator": ".run_updated_at_filter_operator",
+    "RunUpdatedAtSort": ".run_updated_at_sort",
+    "ScoreAggregate": ".score_aggregate",
+    "ScoreBucket": ".score_bucket",
+    "ScoreConstraints": ".score_constraints",
+    "ScoreRating": ".score_rating",
+    "ScorerAction": ".scorer_action",
+    "ScorerConfig": ".scorer_config",
+    "ScorerCreatedAtFilter": ".scorer_created_at_filter",
+    "ScorerCreatedAtFilterOperator": ".scorer_created_at_filter_operator",
+    "ScorerCreatorFilter": ".scorer_creator_filter",
+    "ScorerCreatorFilterOperator": ".scorer_creator_filter_operator",
+    "ScorerDefaults": ".scorer_defaults",
+    "ScorerEnabledInPlaygroundSort": ".scorer_enabled_in_playground_sort",
+    "ScorerEnabledInRunSort": ".scorer_enabled_in_run_sort",
+    "ScorerExcludeMultimodalScorersFilter": ".scorer_exclude_multimodal_scorers_filter",
+    "ScorerExcludeSlmScorersFilter": ".scorer_exclude_slm_scorers_filter",
+    "ScorerHealthScoresResponse": ".scorer_health_scores_response",
+    "ScorerIDFilter": ".scorer_id_filter",
+    "ScorerIDFilterOperator": ".scorer_id_filter_operator",
+    "ScorerIsGlobalFilter": ".scorer_is_global_filter",
+    "ScorerIsGlobalFilterOperator": ".scorer_is_global_filter_operator",
+    "ScorerLabelFilter": ".scorer_label_filter",
+    "ScorerLabelFilterOperator": ".scorer_label_filter_operator",
+    "ScorerModelTypeFilter": ".scorer_model_type_filter",
+    "ScorerModelTypeFilterOperator": ".scorer_model_type_filter_operator",
+    "ScorerMultimodalCapabilitiesFilter": ".scorer_multimodal_capabilities_filter",
+    "ScorerMultimodalCapabilitiesFilterOperator": ".scorer_multimodal_capabilities_filter_operator",
+    "ScorerName": ".scorer_name",
+    "ScorerNameFilter": ".scorer_name_filter",
+    "ScorerNameFilterOperator": ".scorer_name_filter_operator",
+    "ScorerNameSort": ".scorer_name_sort",
+    "ScorerResponse": ".scorer_response",
+    "ScorerScopeProjectRef": ".scorer_scope_project_ref",
+    "ScorerScopeProjectsFilter": ".scorer_scope_projects_filter",
+    "ScorerScoreableNodeTypesFilter": ".scorer_scoreable_node_types_filter",
+    "ScorerScoreableNodeTypesFilterOperator": ".scorer_scoreable_node_types_filter_operator",
+    "ScorerTagsFilter": ".scorer_tags_filter",
+    "ScorerTagsFilterOperator": ".scorer_tags_filter_operator",
+    "ScorerType": ".scorer_type",
+    "ScorerTypeFilter": ".scorer_type_filter",
+    "ScorerTypeFilterOperator": ".scorer_type_filter_operator",
+    "ScorerTypes": ".scorer_types",
+    "ScorerUpdatedAtFilter": ".scorer_updated_at_filter",
+    "ScorerUpdatedAtFilterOperator": ".scorer_updated_at_filter_operator",
+    "ScorerUpdatedAtSort": ".scorer_updated_at_sort",
+    "ScorerVersionHealthScoreEntry": ".scorer_version_health_score_entry",
+    "ScorerVersionHealthScoreEntrySecondaryType0": ".scorer_version_health_score_entry_secondary_type_0",
+    "ScorersConfiguration": ".scorers_configuration",
+    "Segment": ".segment",
+    "SegmentFilter": ".segment_filter",
+    "SelectColumns": ".select_columns",
+    "SessionCreateRequest": ".session_create_request",
+    "SessionCreateRequestUserMetadataType0": ".session_create_request_user_metadata_type_0",
+    "SessionCreateResponse": ".session_create_response",
+    "SexistTemplate": ".sexist_template",
+    "SexistTemplateResponseSchemaType0": ".sexist_template_response_schema_type_0",
+    "StageDB": ".stage_db",
+    "StageMetadata": ".stage_metadata",
+    "StageType": ".stage_type",
+    "StageWithRulesets": ".stage_with_rulesets",
+    "StandardError": ".standard_error",
+    "StandardErrorContext": ".standard_error_context",
+    "StarAggregate": ".star_aggregate",
+    "StarAggregateCounts": ".star_aggregate_counts",
+    "StarConstraints": ".star_constraints",
+    "StarRating": ".star_rating",
+    "StepType": ".step_type",
+    "StringData": ".string_data",
+    "StubTraceRecord": ".stub_trace_record",
+    "SubscriptionConfig": ".subscription_config",
+    "SyntheticDataSourceDataset": ".synthetic_data_source_dataset",
+    "SyntheticDataTypes": ".synthetic_data_types",
+    "SyntheticDatasetExtensionRequest": ".synthetic_dataset_extension_request",
+    "SyntheticDatasetExtensionResponse": ".synthetic_dataset_extension_response",
+    "SystemMetricInfo": ".system_metric_info",
+    "TagsAggregate": ".tags_aggregate",
+    "TagsAggregateCounts": ".tags_aggregate_counts",
+    "TagsConstraints": ".tags_constraints",
+    "TagsRating": ".tags_rating",
+    "TaskResourceLimits": ".task_resource_limits",
+    "TaskResultStatus": ".task_result_status",
+    "TaskType": ".task_type",
+    "TemplateStubRequest": ".template_stub_request",
+    "TestScore": ".test_score",
+    "TextAggregate": ".text_aggregate",
+    "TextConstraints": ".text_constraints",
+    "TextContentPart": ".text_content_part",
+    "TextRating": ".text_rating",
+    "Token": ".token",
+    "ToolCall": ".tool_call",
+    "ToolCallFunction": ".tool_call_function",
+    "ToolErrorRateScorer": ".tool_error_rate_scorer",
+    "ToolErrorRateScorerType": ".tool_error_rate_scorer_type",
+    "ToolErrorRateTemplate": ".tool_error_rate_template",
+    "ToolErrorRateTemplateResponseSchemaType0": ".tool_error_rate_template_response_schema_type_0",
+    "ToolSelectionQualityScorer": ".tool_selection_quality_scorer",
+    "ToolSelectionQualityScorerType": ".tool_selection_quality_scorer_type",
+    "ToolSelectionQualityTemplate": ".tool_selection_quality_template",
+    "ToolSelectionQualityTemplateResponseSchemaType0": ".tool_selection_quality_template_response_schema_type_0",
+    "ToolSpan": ".tool_span",
+    "ToolSpanDatasetMetadata": ".tool_span_dataset_metadata",
+    "ToolSpanUserMetadata": ".tool_span_user_metadata",
+    "ToxicityTemplate": ".toxicity_template",
+    "ToxicityTemplateResponseSchemaType0": ".toxicity_template_response_schema_type_0",
+    "Trace": ".trace",
+    "TraceDatasetMetadata": ".trace_dataset_metadata",
+    "TraceMetadata": ".trace_metadata",
+    "TraceUserMetadata": ".trace_user_metadata",
+    "TreeChoiceAggregate": ".tree_choice_aggregate",
+    "TreeChoiceAggregateCounts": ".tree_choice_aggregate_counts",
+    "TreeChoiceConstraints": ".tree_choice_constraints",
+    "TreeChoiceDBConstraints": ".tree_choice_db_constraints",
+    "TreeChoiceNode": ".tree_choice_node",
+    "TreeChoiceRating": ".tree_choice_rating",
+    "UncertaintyScorer": ".uncertainty_scorer",
+    "UpdateAnnotationQueueRequest": ".update_annotation_queue_request",
+    "UpdateDatasetContentRequest": ".update_dataset_content_request",
+    "UpdateDatasetRequest": ".update_dataset_request",
+    "UpdateDatasetVersionRequest": ".update_dataset_version_request",
+    "UpdatePromptTemplateRequest": ".update_prompt_template_request",
+    "UpdateScorerRequest": ".update_scorer_request",
+    "UpdateScorerScopeRequest": ".update_scorer_scope_request",
+    "UpsertDatasetContentRequest": ".upsert_dataset_content_request",
+    "UserAction": ".user_action",
+    "UserAnnotationQueueCollaborator": ".user_annotation_queue_collaborator",
+    "UserCollaborator": ".user_collaborator",
+    "UserCollaboratorCreate": ".user_collaborator_create",
+    "UserDB": ".user_db",
+    "UserInfo": ".user_info",
+    "UserRole": ".user_role",
+    "ValidResult": ".valid_result",
+    "ValidateCodeScorerDatasetResponse": ".validate_code_scorer_dataset_response",
+    "ValidateCodeScorerResponse": ".validate_code_scorer_response",
+    "ValidateLLMScorerDatasetRequest": ".validate_llm_scorer_dataset_request",
+    "ValidateLLMScorerDatasetRequestSortType0": ".validate_llm_scorer_dataset_request_sort_type_0",
+    "ValidateLLMScorerDatasetResponse": ".validate_llm_scorer_dataset_response",
+    "ValidateLLMScorerLogRecordRequest": ".validate_llm_scorer_log_record_request",
+    "ValidateLLMScorerLogRecordResponse": ".validate_llm_scorer_log_record_response",
+    "ValidateRegisteredScorerResult": ".validate_registered_scorer_result",
+    "ValidateScorerLogRecordResponse": ".validate_scorer_log_record_response",
+    "ValidationError": ".validation_error",
+    "ValidationErrorContext": ".validation_error_context",
+    "VegasGatewayIntegration": ".vegas_gateway_integration",
+    "VegasGatewayIntegrationCreate": ".vegas_gateway_integration_create",
+    "VegasGatewayIntegrationExtraType0": ".vegas_gateway_integration_extra_type_0",
+    "VertexAIIntegration": ".vertex_ai_integration",
+    "VertexAIIntegrationCreate": ".vertex_ai_integration_create",
+    "VertexAIIntegrationExtraType0": ".vertex_ai_integration_extra_type_0",
+    "VertexAIGCSConfig": ".vertex_aigcs_config",
+    "VertexAIGCSConfigResponse": ".vertex_aigcs_config_response",
+    "WebSearchAction": ".web_search_action",
+    "WebSearchCallEvent": ".web_search_call_event",
+    "WebSearchCallEventMetadataType0": ".web_search_call_event_metadata_type_0",
+    "WorkflowSpan": ".workflow_span",
+    "WorkflowSpanDatasetMetadata": ".workflow_span_dataset_metadata",
+    "WorkflowSpanUserMetadata": ".workflow_span_user_metadata",
+    "WriteHealthScoreRequest": ".write_health_score_request",
+    "WriteHealthScoreRequestSecondaryType0": ".write_health_score_request_secondary_type_0",
+    "WriterIntegration": ".writer_integration",
+    "WriterIntegrationCreate": ".writer_integration_create",
+    "WriterIntegrationExtraType0": ".writer_integration_extra_type_0",
+}
 
 __all__ = (
     "ActionResult",
@@ -2473,3 +3665,16 @@ __all__ = (
     "WriterIntegrationCreate",
     "WriterIntegrationExtraType0",
 )
+
+
+def __getattr__(name: str) -> Any:
+    module = _MODEL_MODULES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
@@ -0,0 +1,232 @@
+"""Columnar materialization of query and export records for Arrow and DataFrame workflows."""
+
+from __future__ import annotations
+
+from array import array
+from collections.abc import Collection, Iterable
+from typing import TYPE_CHECKING, Any
+
+from galileo.shared.query_result import _flatten_dict
+
+if TYPE_CHECKING:
+    import numpy
+    import pyarrow
+
+_EMPTY, _NUMBER, _STRING, _OBJECT = "empty", "number", "string", "object"
+
+
+class _ColumnBuilder:
+    """
+    Typed buffer for the values of one column, filled in a single pass over the records.
+
+    Numbers go to an integer buffer until the first fractional value and to a float buffer from then on, with a
+    missing-value mask. Strings are dictionary-encoded as they arrive, and a column that mixes kinds (or has integers
+    beyond 64 bits) falls back to a list of Python values.
+    """
+
+    def __init__(self) -> None:
+        self.kind = _EMPTY
+        self.length = 0
+        self.ints = array("q")
+        self.numbers = array("d")
+        self.missing = bytearray()
+        self.all_int = True
+        self.all_bool = True
+        self.codes = array("i")
+        self.categories: dict[str, int] = {}
+        self.values: list[Any] = []
+
+    def append(self, value: Any) -> None:
+        if value is None:
+            self.pad(self.length + 1)
+            return
+        kind = _STRING if isinstance(value, str) else _NUMBER if isinstance(value, int | float) else _OBJECT
+        if self.kind == _EMPTY and kind != _OBJECT:
+            self.kind = kind
+            length, self.length = self.length, 0
+            self.pad(length)
+        elif kind != self.kind and self.kind != _OBJECT:
+            self._to_objects()
+
+        if self.kind == _NUMBER and not self._append_number(value):
+            # Integers beyond 64 bits are kept as Python values.
+            self._to_objects()
+        if self.kind == _STRING:
+            self.codes.append(self.categories.setdefault(value, len(self.categories)))
+        elif self.kind == _OBJECT:
+            self.values.append(value)
+        self.length += 1
+
+    def pad(self, length: int) -> None:
+        """Append missing values until the column has ``length`` rows."""
+        count = length - self.length
+        if count <= 0:
+            return
+        if self.kind == _NUMBER:
+            self._number_buffer().extend([0] * count)
+            self.missing.extend(b"\x01" * count)
+        elif self.kind == _STRING:
+            self.codes.extend([-1] * count)
+        elif self.kind == _OBJECT:
+            self.values.extend([None] * count)
+        self.length = length
+
+    def _append_number(self, value: float) -> bool:
+        """Append a number, or return False if it is an integer that does not fit in 64 bits."""
+        if self.all_int and not isinstance(value, float):
+            try:
+                self.ints.append(value)
+            except OverflowError:
+                return False
+        else:
+            if self.all_int:
+                # The first fractional value moves the integers so far to the float buffer.
+                self.numbers, self.ints, self.all_int = array("d", self.ints), array("q"), False
+            self.numbers.append(value)
+        self.missing.append(0)
+        self.all_bool = self.all_bool and isinstance(value, bool)
+        return True
+
+    def _number_buffer(self) -> array:
+        return self.ints if self.all_int else self.numbers
+
+    def python_values(self) -> list[Any]:
+        if self.kind == _NUMBER:
+            cast = bool if self.all_bool else int if self.all_int else float
+            return [
+                None if missing else cast(n) for n, missing in zip(self._number_buffer(), self.missing, strict=True)
+            ]
+        if self.kind == _STRING:
+            categories = list(self.categories)
+            return [categories[code] if code >= 0 else None for code in self.codes]
+        if self.kind == _OBJECT:
+            return list(self.values)
+        return [None] * self.length
+
+    def _to_objects(self) -> None:
+        self.values = self.python_values()
+        self.kind = _OBJECT
+        self.ints, self.numbers, self.missing = array("q"), array("d"), bytearray()
+        self.codes, self.categories = array("i"), {}
+
+    def to_numpy(self) -> numpy.ndarray:
+        import numpy
+
+        if self.kind == _NUMBER:
+            values = numpy.frombuffer(self._number_buffer(), dtype=numpy.int64 if self.all_int else numpy.float64)
+            missing = numpy.frombuffer(self.missing, dtype=numpy.bool_)
+            if not missing.any() and self.all_int:
+                return values.astype(bool) if self.all_bool else values.copy()
+            values = values.astype(numpy.float64)
+            values[missing] = numpy.nan
+            return values
+        if self.kind == _STRING:
+            # Every distinct string is stored once and shared by the rows that use it; code -1 picks the None.
+            categories = numpy.array([*self.categories, None], dtype=object)
+            return categories[numpy.frombuffer(self.codes, dtype=numpy.int32)]
+        values = numpy.empty(self.length, dtype=object)
+        values[:] = self.python_values()
+        return values
+
+    def to_arrow(self) -> pyarrow.Array:
+        import numpy
+        import pyarrow
+
+        if self.kind == _NUMBER:
+            mask = numpy.frombuffer(self.missing, dtype=numpy.bool_)
+            if self.all_int:
+                values = numpy.frombuffer(self.ints, dtype=numpy.int64)
+                if self.all_bool:
+                    return pyarrow.array(values.astype(bool), mask=mask, type=pyarrow.bool_())
+                return pyarrow.array(values, mask=mask, type=pyarrow.int64())
+            return pyarrow.array(numpy.frombuffer(self.numbers, dtype=numpy.float64), mask=mask, type=pyarrow.float64())
+        if self.kind == _STRING:
+            codes = numpy.frombuffer(self.codes, dtype=numpy.int32)
+            indices = pyarrow.array(codes, mask=codes < 0, type=pyarrow.int32())
+            return pyarrow.DictionaryArray.from_arrays(indices, pyarrow.array(list(self.categories), pyarrow.string()))
+        if self.kind == _EMPTY:
+            return pyarrow.nulls(self.length)
+        try:
+            return pyarrow.array(self.values)
+        except (pyarrow.ArrowInvalid, pyarrow.ArrowTypeError, OverflowError):
+            # Values of mixed types (e.g. strings and numbers) or integers beyond 64 bits are kept as their string
+            # representation.
+            return pyarrow.array([None if v is None else str(v) for v in self.values], pyarrow.string())
+
+
+def _build_columns(records: Iterable[dict[str, Any]], columns: Collection[str] | None) -> dict[str, _ColumnBuilder]:
+    builders = {column: _ColumnBuilder() for column in columns} if columns is not None else {}
+    length = 0
+    for record in records:
+        for name, value in _flatten_dict(record).items():
+            builder = builders.get(name)
+            if builder is None:
+                if columns is not None:
+                    continue
+                builder = builders[name] = _ColumnBuilder()
+            builder.pad(length)
+            builder.append(value)
+        length += 1
+    for builder in builders.values():
+        builder.pad(length)
+    return builders
+
+
+def _require(module: str) -> None:
+    try:
+        __import__(module)
+    except ImportError as e:
+        raise ImportError(f"{module} is required for columnar results. Install it with: pip install {module}") from e
+
+
+def records_to_columns(
+    records: Iterable[dict[str, Any]], columns: Collection[str] | None = None
+) -> dict[str, numpy.ndarray]:
+    """
+    Materialize records into one NumPy array per column, in a single pass.
+
+    Nested records are flattened the same way as ``QueryResult`` records (e.g. ``metrics_cost``). Numeric columns,
+    such as metrics and durations, become ``int64``, ``float64`` (with NaN for missing values) or ``bool`` arrays.
+    String columns, such as names and models, are dictionary-encoded while reading, so each distinct value is stored
+    once. Other columns are ``object`` arrays.
+
+    Args:
+        records: The records to materialize, e.g. a ``QueryResult`` or the iterator returned by ``export_records()``.
+        columns: Flattened column names to keep. Defaults to None, which keeps every column.
+
+    Returns
+    -------
+        dict[str, numpy.ndarray]: The columns, which can be passed to ``pandas.DataFrame`` as is.
+
+    Raises
+    ------
+        ImportError: If NumPy is not installed.
+    """
+    _require("numpy")
+    return {name: builder.to_numpy() for name, builder in _build_columns(records, columns).items()}
+
+
+def records_to_arrow(records: Iterable[dict[str, Any]], columns: Collection[str] | None = None) -> pyarrow.Table:
+    """
+    Materialize records into a PyArrow table, in a single pass.
+
+    Columns are typed as in ``records_to_columns``, and string columns are Arrow dictionary arrays.
+
+    Args:
+        records: The records to materialize, e.g. a ``QueryResult`` or the iterator returned by ``export_records()``.
+        columns: Flattened column names to keep. Defaults to None, which keeps every column.
+
+    Returns
+    -------
+        pyarrow.Table: The records as a table, e.g. for ``table.to_pandas()`` or writing Parquet files.
+
+    Raises
+    ------
+        ImportError: If NumPy or PyArrow is not installed.
+    """
+    _require("numpy")
+    _require("pyarrow")
+    import pyarrow
+
+    builders = _build_columns(records, columns)
+    return pyarrow.table({name: builder.to_arrow() for name, builder in builders.items()})
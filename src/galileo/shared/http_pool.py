@@ -0,0 +1,257 @@
+"""Process-wide registry of pooled ``httpx.AsyncClient`` instances, one per event loop.
+
+An ``httpx.AsyncClient`` (and its connection pool) is bound to the event loop that first uses it. The SDK runs its
+async requests on the event loops of ``async_run``'s thread pool, the logger's task handler and the caller's own
+loop, so the clients are kept per loop:
+
+- Every request made on a loop shares that loop's client and its keep-alive connections, whether it comes from the
+  generated API functions, ``Traces`` or ``IngestTraces``.
+- A client is never reused on another loop, and is dropped when its loop is closed or garbage collected.
+- The pool limits, keep-alive expiry and HTTP/2 are configured with the ``GALILEO_HTTP_MAX_CONNECTIONS``,
+  ``GALILEO_HTTP_MAX_KEEPALIVE_CONNECTIONS``, ``GALILEO_HTTP_KEEPALIVE_EXPIRY`` and ``GALILEO_HTTP2`` env vars.
+- ``http_pool.stats()`` reports how many clients, connections and requests are in use.
+"""
+
+import asyncio
+import os
+import threading
+import weakref
+from collections.abc import Callable, Hashable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any
+
+import httpx
+
+from galileo.utils.dependencies import is_dependency_available
+from galileo.utils.log_config import get_logger
+from galileo_core.constants.http_headers import HttpHeaders
+from galileo_core.constants.request_method import RequestMethod
+from galileo_core.helpers.api_client import DEFAULT_TIMEOUT_SECONDS, ApiClient
+
+_logger = get_logger(__name__)
+
+DEFAULT_MAX_CONNECTIONS = 100
+DEFAULT_MAX_KEEPALIVE_CONNECTIONS = 20
+DEFAULT_KEEPALIVE_EXPIRY_SECONDS = 30.0
+
+
+@dataclass(frozen=True)
+class HttpPoolStats:
+    """
+    A snapshot of the usage of the pooled clients.
+
+    Attributes
+    ----------
+    loops : int
+        Event loops that have a client.
+    clients : int
+        Open clients across all loops.
+    clients_created : int
+        Clients created since the process started (or the registry was cleared).
+    client_reuses : int
+        Requests for a client that were served by an existing one.
+    connections : int
+        Connections held by the clients' pools.
+    idle_connections : int
+        Connections that are open and waiting to be reused.
+    in_flight_requests : int
+        Requests that have been sent and not yet answered.
+    requests : int
+        Requests sent through the pooled clients.
+    """
+
+    loops: int
+    clients: int
+    clients_created: int
+    client_reuses: int
+    connections: int
+    idle_connections: int
+    in_flight_requests: int
+    requests: int
+
+
+class AsyncClientRegistry:
+    """
+    Thread-safe registry of ``httpx.AsyncClient`` instances, keyed by event loop and client settings.
+
+    Parameters
+    ----------
+    limits : httpx.Limits
+        The connection pool limits of the clients created by the registry.
+    http2 : bool
+        Whether the clients negotiate HTTP/2. Requires the ``h2`` package, and is ignored with a warning without it.
+    """
+
+    def __init__(self, limits: httpx.Limits | None = None, http2: bool = False) -> None:
+        self.limits = limits or httpx.Limits(
+            max_connections=DEFAULT_MAX_CONNECTIONS,
+            max_keepalive_connections=DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+            keepalive_expiry=DEFAULT_KEEPALIVE_EXPIRY_SECONDS,
+        )
+        self.http2 = http2 and _h2_available()
+        self._lock = threading.Lock()
+        self._clients: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, dict[Hashable, httpx.AsyncClient]] = (
+            weakref.WeakKeyDictionary()
+        )
+        self._clients_created = 0
+        self._client_reuses = 0
+        self._in_flight_requests = 0
+        self._requests = 0
+
+    def get(self, key: Hashable, build: Callable[..., httpx.AsyncClient]) -> httpx.AsyncClient:
+        """
+        Return the running event loop's client for ``key``, building it on first use.
+
+        Parameters
+        ----------
+        key : Hashable
+            Identifies the settings of the client, e.g. its base URL and SSL context.
+        build : Callable[..., httpx.AsyncClient]
+            Creates the client. It is passed the registry's ``limits`` and ``http2`` as keyword arguments.
+
+        Returns
+        -------
+        httpx.AsyncClient
+            The client, which must only be used on the running event loop.
+
+        Raises
+        ------
+        RuntimeError
+            If there is no running event loop.
+        """
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            clients = self._clients.setdefault(loop, {})
+            client = clients.get(key)
+            if client is not None and not client.is_closed:
+                self._client_reuses += 1
+                return client
+            client = build(limits=self.limits, http2=self.http2)
+            clients[key] = client
+            self._clients_created += 1
+            self._drop_closed_loops()
+        return client
+
+    @contextmanager
+    def track_request(self) -> Iterator[None]:
+        """Count a request in the registry's stats while it is in flight."""
+        with self._lock:
+            self._in_flight_requests += 1
+            self._requests += 1
+        try:
+            yield
+        finally:
+            with self._lock:
+                self._in_flight_requests -= 1
+
+    async def aclose(self) -> None:
+        """Close the running event loop's clients and their connections."""
+        with self._lock:
+            clients = self._clients.pop(asyncio.get_running_loop(), {})
+        for client in clients.values():
+            await client.aclose()
+
+    def clear(self) -> None:
+        """Forget every client and reset the stats. Clients in use keep working until their loop drops them."""
+        with self._lock:
+            self._clients.clear()
+            self._clients_created = 0
+            self._client_reuses = 0
+            self._requests = 0
+
+    def stats(self) -> HttpPoolStats:
+        """Return a snapshot of the usage of the pooled clients."""
+        with self._lock:
+            clients = [client for loop_clients in self._clients.values() for client in loop_clients.values()]
+            loops = len(self._clients)
+            clients_created, client_reuses = self._clients_created, self._client_reuses
+            in_flight_requests, requests = self._in_flight_requests, self._requests
+        connections = [connection for client in clients for connection in _pool_connections(client)]
+        return HttpPoolStats(
+            loops=loops,
+            clients=sum(not client.is_closed for client in clients),
+            clients_created=clients_created,
+            client_reuses=client_reuses,
+            connections=len(connections),
+            idle_connections=sum(connection.is_idle() for connection in connections),
+            in_flight_requests=in_flight_requests,
+            requests=requests,
+        )
+
+    def _drop_closed_loops(self) -> None:
+        for loop in [loop for loop in self._clients if loop.is_closed()]:
+            del self._clients[loop]
+
+
+class PooledApiClient(ApiClient):
+    """An ``ApiClient`` that sends its async requests through the running event loop's pooled client."""
+
+    @property
+    def async_client(self) -> httpx.AsyncClient:
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return super().async_client
+        key = (self.host.unicode_string(), id(self.ssl_context), repr(self.limits), self.connect_timeout_seconds)
+        return http_pool.get(key, self._build_async_client)
+
+    def _build_async_client(self, limits: httpx.Limits, http2: bool) -> httpx.AsyncClient:
+        kwargs = self._client_kwargs(
+            base_url=self.host.unicode_string(),
+            ssl_context=self.ssl_context,
+            read_timeout=DEFAULT_TIMEOUT_SECONDS,
+            limits=self.limits or limits,
+            connect_timeout_seconds=self.connect_timeout_seconds,
+        )
+        return httpx.AsyncClient(**kwargs, http2=http2)
+
+    async def arequest(
+        self, method: RequestMethod, path: str, content_headers: dict[str, str] = HttpHeaders.json(), **kwargs: Any
+    ) -> Any:
+        with http_pool.track_request():
+            return await super().arequest(method=method, path=path, content_headers=content_headers, **kwargs)
+
+    @classmethod
+    def from_api_client(cls, api_client: ApiClient) -> "PooledApiClient":
+        """Create a pooled client with the same settings and credentials as ``api_client``."""
+        return cls.model_construct(**{name: getattr(api_client, name) for name in ApiClient.model_fields})
+
+
+def _pool_connections(client: httpx.AsyncClient) -> list[Any]:
+    # httpx does not expose its pool, so this reads the httpcore pool behind the default transport, if there is one.
+    pool = getattr(getattr(client, "_transport", None), "_pool", None)
+    return list(getattr(pool, "connections", []))
+
+
+def _h2_available() -> bool:
+    if is_dependency_available("h2"):
+        return True
+    _logger.warning("Ignoring GALILEO_HTTP2 because the h2 package is not installed (pip install httpx[http2])")
+    return False
+
+
+def _number_from_env(name: str, default: float, cast: Callable[[str], float]) -> Any:
+    value = os.environ.get(name)
+    if not value:
+        return default
+    try:
+        return cast(value)
+    except ValueError:
+        _logger.warning(f"Ignoring invalid {name} value {value!r}")
+        return default
+
+
+def _limits_from_env() -> httpx.Limits:
+    return httpx.Limits(
+        max_connections=_number_from_env("GALILEO_HTTP_MAX_CONNECTIONS", DEFAULT_MAX_CONNECTIONS, int),
+        max_keepalive_connections=_number_from_env(
+            "GALILEO_HTTP_MAX_KEEPALIVE_CONNECTIONS", DEFAULT_MAX_KEEPALIVE_CONNECTIONS, int
+        ),
+        keepalive_expiry=_number_from_env("GALILEO_HTTP_KEEPALIVE_EXPIRY", DEFAULT_KEEPALIVE_EXPIRY_SECONDS, float),
+    )
+
+
+http_pool = AsyncClientRegistry(
+    limits=_limits_from_env(), http2=os.environ.get("GALILEO_HTTP2", "").lower() in ("1", "true", "yes")
+)
@@ -3,13 +3,17 @@
 from __future__ import annotations
 
 import logging
-from collections.abc import Callable, Iterator
+from collections.abc import Callable, Collection, Iterator
+from concurrent.futures import ThreadPoolExecutor
 from typing import TYPE_CHECKING, Any
 
 from galileo.resources.models import LogRecordsQueryResponse
 from galileo.resources.types import UNSET
 
 if TYPE_CHECKING:
+    import numpy
+    import pyarrow
+
     from galileo.resources.models import LogRecordsSortClause
     from galileo.schema.filters import FilterType
     from galileo.search import RecordType
@@ -41,6 +45,27 @@ def _flatten_dict(d: dict[str, Any], parent_key: str = "", sep: str = "_") -> di
     return dict(items)
 
 
+def _flatten_record(record: Any, columns: Collection[str] | None = None) -> dict[str, Any]:
+    """Flatten a single response record, keeping only ``columns`` (flattened names) when given."""
+    flat_dict = _flatten_dict(record.to_dict())
+    if columns is None:
+        return flat_dict
+    return {column: flat_dict[column] for column in columns if column in flat_dict}
+
+
+def _response_records(response: LogRecordsQueryResponse) -> list[Any]:
+    if isinstance(response.records, type(UNSET)) or response.records is None:
+        return []
+    return response.records
+
+
+def _response_next_starting_token(response: LogRecordsQueryResponse) -> int | None:
+    token = response.next_starting_token
+    if isinstance(token, type(UNSET)) or token is None:
+        return None
+    return token
+
+
 class QueryResult:
     """
     A list-like wrapper for query results that provides easy access to records and pagination.
@@ -84,6 +109,10 @@ class QueryResult:
             for record in result:
                 print(record["id"])
 
+        # Streaming every page with bounded memory
+        for record in log_stream.get_spans(limit=500).iter_all(columns=["id", "input"]):
+            print(record["id"], record["input"])
+
         # Check pagination status
         print(f"Total records in this page: {len(result)}")
         print(f"Has next page: {result.has_next_page}")
@@ -125,10 +154,7 @@ class QueryResult:
     @property
     def next_starting_token(self) -> int | None:
         """Token for fetching the next page, or None if this is the last page."""
-        token = self._response.next_starting_token
-        if isinstance(token, type(UNSET)) or token is None:
-            return None
-        return token
+        return _response_next_starting_token(self._response)
 
     @property
     def paginated(self) -> bool:
@@ -162,23 +188,24 @@ class QueryResult:
 
     def _flatten_records(self) -> list[dict[str, Any]]:
         """Convert response records to flattened dictionaries."""
-        if isinstance(self._response.records, type(UNSET)) or self._response.records is None:
-            return []
+        return [_flatten_record(record) for record in _response_records(self._response)]
 
-        flattened = []
-        for record in self._response.records:
-            # Convert record to dict
-            record_dict = record.to_dict()
-            # Flatten nested structures
-            flat_dict = _flatten_dict(record_dict)
-            flattened.append(flat_dict)
-
-        return flattened
+    def _fetch_page(self, starting_token: int) -> LogRecordsQueryResponse:
+        logger.debug(f"QueryResult: fetching page with starting_token={starting_token}")
+        return self._query_fn(
+            record_type=self._record_type,
+            filters=self._filters,
+            sort=self._sort,
+            limit=self.limit,
+            starting_token=starting_token,
+        )
 
     def next_page(self) -> QueryResult:
         """
         Fetch the next page and extend current results.
 
+        Every fetched page stays in memory. Use ``iter_all()`` to scan all pages with bounded memory instead.
+
         Returns
         -------
             QueryResult: Returns self with the new records appended.
@@ -205,27 +232,112 @@ class QueryResult:
         if not self.has_next_page:
             raise ValueError("No next page available. Check has_next_page before calling next_page().")
 
-        logger.debug(f"QueryResult.next_page: fetching page with starting_token={self.next_starting_token}")
-
-        # Call the query function with the next starting token
-        next_response = self._query_fn(
-            record_type=self._record_type,
-            filters=self._filters,
-            sort=self._sort,
-            limit=self.limit,
-            starting_token=self.next_starting_token,
-        )
+        next_response = self._fetch_page(self.next_starting_token)
 
         # Extend current records with new page
-        if not isinstance(next_response.records, type(UNSET)) and next_response.records:
-            for record in next_response.records:
-                flat_dict = _flatten_dict(record.to_dict())
-                self._records.append(flat_dict)
+        self._records.extend(_flatten_record(record) for record in _response_records(next_response))
 
         # Update response metadata
         self._response = next_response
         return self
 
+    def iter_all(self, columns: Collection[str] | None = None, prefetch: bool = True) -> Iterator[dict[str, Any]]:
+        """
+        Iterate over the records of this page and of every following page.
+
+        Unlike ``next_page()``, pages are not accumulated: only the page being iterated (and the next one, when
+        prefetching) is held in memory, and each record is flattened only when it is reached. This result is not
+        modified.
+
+        Args:
+            columns: Flattened column names to keep in each record (e.g. ``["id", "input", "metrics_cost"]``).
+                Defaults to None, which keeps every column.
+            prefetch: Whether to fetch the next page in the background while the current one is iterated.
+
+        Returns
+        -------
+            An iterator over the flattened record dictionaries.
+
+        Examples
+        --------
+            result = log_stream.get_spans(limit=500)
+            for record in result.iter_all(columns=["id", "input"]):
+                print(record["id"], record["input"])
+        """
+        if self._flattened_records is not None:
+            # next_page() may already have loaded several pages into this result.
+            loaded: Iterator[dict[str, Any]] = (
+                record if columns is None else {column: record[column] for column in columns if column in record}
+                for record in self._flattened_records
+            )
+        else:
+            loaded = (_flatten_record(record, columns) for record in _response_records(self._response))
+
+        starting_token = self.next_starting_token
+        executor = None
+        if prefetch and starting_token is not None:
+            executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="galileo-query-prefetch")
+        try:
+            pending = executor.submit(self._fetch_page, starting_token) if executor is not None else None
+            yield from loaded
+            while starting_token is not None:
+                response = pending.result() if pending is not None else self._fetch_page(starting_token)
+                starting_token = _response_next_starting_token(response)
+                # Request the following page before handing out the records of this one.
+                if executor is not None and starting_token is not None:
+                    pending = executor.submit(self._fetch_page, starting_token)
+                for record in _response_records(response):
+                    yield _flatten_record(record, columns)
+        finally:
+            if executor is not None:
+                # An abandoned iteration does not wait for the page being prefetched.
+                executor.shutdown(wait=False, cancel_futures=True)
+
+    def to_columns(self, columns: Collection[str] | None = None, all_pages: bool = False) -> dict[str, numpy.ndarray]:
+        """
+        Materialize the records into one NumPy array per column.
+
+        Numeric columns (metrics, durations) become typed arrays and string columns (names, models) are
+        dictionary-encoded, in a single pass over the records. Requires NumPy.
+
+        Args:
+            columns: Flattened column names to keep. Defaults to None, which keeps every column.
+            all_pages: Whether to also stream in every following page with ``iter_all()``. Defaults to False, which
+                only uses the records already loaded in this result.
+
+        Returns
+        -------
+            dict[str, numpy.ndarray]: The columns, e.g. for ``pandas.DataFrame(result.to_columns())``.
+
+        Examples
+        --------
+            result = log_stream.get_spans(limit=500)
+            columns = result.to_columns(columns=["name", "metrics_duration_ns"], all_pages=True)
+        """
+        from galileo.shared.columnar import records_to_columns  # noqa: PLC0415  # circular import
+
+        return records_to_columns(self.iter_all(columns) if all_pages else self._records, columns)
+
+    def to_arrow(self, columns: Collection[str] | None = None, all_pages: bool = False) -> pyarrow.Table:
+        """
+        Materialize the records into a PyArrow table.
+
+        Columns are typed as in ``to_columns()``, with string columns as Arrow dictionary arrays. Requires NumPy and
+        PyArrow.
+
+        Args:
+            columns: Flattened column names to keep. Defaults to None, which keeps every column.
+            all_pages: Whether to also stream in every following page with ``iter_all()``. Defaults to False, which
+                only uses the records already loaded in this result.
+
+        Returns
+        -------
+            pyarrow.Table: The records as a table.
+        """
+        from galileo.shared.columnar import records_to_arrow  # noqa: PLC0415  # circular import
+
+        return records_to_arrow(self.iter_all(columns) if all_pages else self._records, columns)
+
     def __len__(self) -> int:
         """Return the number of records in this page."""
         return len(self._records)
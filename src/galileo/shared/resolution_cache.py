@@ -0,0 +1,149 @@
+"""Process-wide cache of project and log stream lookups by name.
+
+Loggers, experiments and exports resolve project and log stream names to IDs whenever they are created, and every
+per-thread logger repeats those lookups. This module keeps the results for a short time so that they are shared:
+
+- Entries expire after ``GALILEO_RESOLUTION_CACHE_TTL`` seconds (default 300; 0 disables the cache).
+- Lookups that found nothing are cached too, for at most ``DEFAULT_NEGATIVE_TTL_SECONDS``.
+- Creating, renaming or deleting a resource invalidates the affected entries, and resetting the configuration
+  clears the cache.
+- Concurrent lookups of the same key wait for a single request instead of each sending their own.
+- Cached values are shared by every caller, so callers cache response models or IDs and build their own wrappers.
+"""
+
+import os
+import threading
+import time
+from collections.abc import Callable, Hashable
+from typing import Any, TypeVar
+
+from galileo.utils.log_config import get_logger
+
+_logger = get_logger(__name__)
+
+T = TypeVar("T")
+
+DEFAULT_TTL_SECONDS = 300.0
+DEFAULT_NEGATIVE_TTL_SECONDS = 30.0
+
+
+class _KeyLock:
+    """The lock of a key being loaded, and the number of threads loading or waiting for it."""
+
+    __slots__ = ("lock", "users")
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.users = 0
+
+
+class ResolutionCache:
+    """
+    Thread-safe cache with a time to live, for the results of name lookups.
+
+    Parameters
+    ----------
+    ttl_seconds : float
+        How long a found value is kept. 0 disables the cache.
+    negative_ttl_seconds : float
+        How long a None result (not found) is kept. Capped at ``ttl_seconds``.
+    """
+
+    def __init__(
+        self, ttl_seconds: float = DEFAULT_TTL_SECONDS, negative_ttl_seconds: float = DEFAULT_NEGATIVE_TTL_SECONDS
+    ) -> None:
+        self.ttl_seconds = ttl_seconds
+        self.negative_ttl_seconds = min(negative_ttl_seconds, ttl_seconds)
+        self._lock = threading.Lock()
+        self._entries: dict[Hashable, tuple[float, Any]] = {}
+        # Locks of the keys being loaded, removed once no thread is loading or waiting for the key.
+        self._key_locks: dict[Hashable, _KeyLock] = {}
+        # Bumped on every invalidation, so that a lookup started before it does not store its stale result.
+        self._generation = 0
+
+    def get_or_load(self, key: Hashable, load: Callable[[], T], max_age: float | None = None) -> T:
+        """
+        Return the cached value of ``key``, or load and cache it.
+
+        Parameters
+        ----------
+        key : Hashable
+            The cache key, e.g. ``("project", name)``.
+        load : Callable[[], T]
+            Looks the value up, returning None if it does not exist. Exceptions are raised and not cached.
+        max_age : Optional[float]
+            Reload the value if it was loaded more than ``max_age`` seconds ago, even if it has not expired.
+
+        Returns
+        -------
+        T
+            The cached or loaded value.
+        """
+        if self.ttl_seconds <= 0:
+            return load()
+        found, value = self._lookup(key, max_age)
+        if found:
+            return value
+        with self._lock:
+            key_lock = self._key_locks.get(key)
+            if key_lock is None:
+                key_lock = self._key_locks[key] = _KeyLock()
+            key_lock.users += 1
+        try:
+            with key_lock.lock:
+                # Another thread may have loaded the key while this one waited for the lock.
+                found, value = self._lookup(key, max_age)
+                if found:
+                    return value
+                with self._lock:
+                    generation = self._generation
+                value = load()
+                with self._lock:
+                    if generation == self._generation:
+                        self._entries[key] = (time.monotonic(), value)
+            return value
+        finally:
+            with self._lock:
+                key_lock.users -= 1
+                if not key_lock.users:
+                    del self._key_locks[key]
+
+    def invalidate(self, *keys: Hashable) -> None:
+        """Remove the entries of ``keys``."""
+        with self._lock:
+            self._generation += 1
+            for key in keys:
+                self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Remove every entry."""
+        with self._lock:
+            self._generation += 1
+            self._entries.clear()
+
+    def _lookup(self, key: Hashable, max_age: float | None) -> tuple[bool, Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is None:
+            return False, None
+        loaded_at, value = entry
+        ttl = self.ttl_seconds if value is not None else self.negative_ttl_seconds
+        if max_age is not None:
+            ttl = min(ttl, max_age)
+        if time.monotonic() - loaded_at >= ttl:
+            return False, None
+        return True, value
+
+
+def _ttl_from_env() -> float:
+    value = os.environ.get("GALILEO_RESOLUTION_CACHE_TTL")
+    if not value:
+        return DEFAULT_TTL_SECONDS
+    try:
+        return float(value)
+    except ValueError:
+        _logger.warning(f"Ignoring invalid GALILEO_RESOLUTION_CACHE_TTL value {value!r}")
+        return DEFAULT_TTL_SECONDS
+
+
+resolution_cache = ResolutionCache(ttl_seconds=_ttl_from_env())
@@ -1,5 +1,4 @@
 import logging
-from threading import local
 from typing import Any
 from uuid import UUID
 
@@ -15,6 +14,7 @@ from galileo.schema.trace import (
     TracesIngestRequest,
     TraceUpdateRequest,
 )
+from galileo.shared.http_pool import http_pool
 from galileo.utils.decorators import async_warn_catch_exception
 from galileo.utils.headers_data import get_sdk_header
 from galileo_core.constants.http_headers import HttpHeaders
@@ -200,14 +200,17 @@ class IngestTraces:
             "Galileo-API-Key": api_key,
             "X-Galileo-SDK": get_sdk_header(),
         }
-        self._thread_local = local()
 
     @property
     def _client(self) -> httpx.AsyncClient:
-        """Per-thread AsyncClient to avoid cross-event-loop errors."""
-        if not hasattr(self._thread_local, "client"):
-            self._thread_local.client = httpx.AsyncClient(timeout=60)
-        return self._thread_local.client
+        """The running event loop's pooled AsyncClient, which avoids cross-event-loop errors."""
+        return http_pool.get("ingest", lambda **pool_settings: httpx.AsyncClient(timeout=60, **pool_settings))
+
+    async def _send(self, method: str, url: str, payload: dict[str, Any]) -> dict[str, Any]:
+        with http_pool.track_request():
+            resp = await self._client.request(method, url, json=payload, headers=self._headers)
+        resp.raise_for_status()
+        return resp.json()
 
     @async_warn_catch_exception(logger=_logger)
     async def ingest_traces(self, traces_ingest_request: TracesIngestRequest) -> dict[str, Any]:
@@ -219,9 +222,7 @@ class IngestTraces:
         url = f"{self.base_url}{Routes.ingest_traces.format(project_id=self.project_id)}"
         payload = traces_ingest_request.model_dump(mode="json", exclude_none=True)
         _logger.info("IngestTraces: posting %d trace(s) to %s", len(traces_ingest_request.traces), url)
-        resp = await self._client.post(url, json=payload, headers=self._headers)
-        resp.raise_for_status()
-        return resp.json()
+        return await self._send("POST", url, payload)
 
     @async_warn_catch_exception(logger=_logger)
     async def ingest_spans(self, spans_ingest_request: SpansIngestRequest) -> dict[str, Any]:
@@ -233,9 +234,7 @@ class IngestTraces:
         url = f"{self.base_url}{Routes.ingest_spans.format(project_id=self.project_id)}"
         payload = spans_ingest_request.model_dump(mode="json", exclude_none=True)
         _logger.info("IngestTraces: posting %d span(s) to %s", len(spans_ingest_request.spans), url)
-        resp = await self._client.post(url, json=payload, headers=self._headers)
-        resp.raise_for_status()
-        return resp.json()
+        return await self._send("POST", url, payload)
 
     @async_warn_catch_exception(logger=_logger)
     async def update_trace(self, trace_update_request: TraceUpdateRequest) -> dict[str, Any]:
@@ -248,9 +247,7 @@ class IngestTraces:
             f"{self.base_url}{Routes.trace.format(project_id=self.project_id, trace_id=trace_update_request.trace_id)}"
         )
         payload = trace_update_request.model_dump(mode="json")
-        resp = await self._client.patch(url, json=payload, headers=self._headers)
-        resp.raise_for_status()
-        return resp.json()
+        return await self._send("PATCH", url, payload)
 
     @async_warn_catch_exception(logger=_logger)
     async def update_span(self, span_update_request: SpanUpdateRequest) -> dict[str, Any]:
@@ -261,9 +258,7 @@ class IngestTraces:
 
         url = f"{self.base_url}{Routes.span.format(project_id=self.project_id, span_id=span_update_request.span_id)}"
         payload = span_update_request.model_dump(mode="json")
-        resp = await self._client.patch(url, json=payload, headers=self._headers)
-        resp.raise_for_status()
-        return resp.json()
+        return await self._send("PATCH", url, payload)
 
     @async_warn_catch_exception(logger=_logger)
     async def create_session(self, session_create_request: SessionCreateRequest) -> dict[str, Any]:
@@ -274,9 +269,7 @@ class IngestTraces:
 
         url = f"{self.base_url}{Routes.sessions.format(project_id=self.project_id)}"
         payload = session_create_request.model_dump(mode="json")
-        resp = await self._client.post(url, json=payload, headers=self._headers)
-        resp.raise_for_status()
-        return resp.json()
+        return await self._send("POST", url, payload)
 
     async def get_sessions(self, session_search_request: LogRecordsSearchRequest) -> dict[str, Any]:
         if self.experiment_id:
@@ -286,6 +279,4 @@ class IngestTraces:
 
         url = f"{self.base_url}{Routes.sessions_search.format(project_id=self.project_id)}"
         payload = session_search_request.model_dump(mode="json")
-        resp = await self._client.post(url, json=payload, headers=self._headers)
-        resp.raise_for_status()
-        return resp.json()
+        return await self._send("POST", url, payload)
@@ -0,0 +1,58 @@
+"""
+Slim entry point for logging traces.
+
+Importing ``galileo.tracing_lite`` only loads the logger, the trace schemas and the ingest clients: project, log
+stream and experiment management, local scorers and the generated API client are left out of the import graph. It
+is meant for services that only log traces and care about cold-start time and memory, e.g. serverless functions:
+
+```python
+from galileo.tracing_lite import galileo_context, log, openai
+```
+
+The objects are the same as those of the ``galileo`` package, so both entry points can be mixed. Set
+``GALILEO_DEFER_INIT=1`` (or pass ``defer_init=True`` to ``GalileoLogger``) so that loggers resolve their project
+and log stream when traces are first flushed, instead of making those requests when they are created.
+"""
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from galileo.decorator import GalileoDecorator, galileo_context, log, start_session
+    from galileo.logger import GalileoLogger
+    from galileo.openai import openai
+    from galileo.tracing import get_tracing_headers
+
+_LAZY_IMPORTS = {
+    "GalileoDecorator": "galileo.decorator",
+    "GalileoLogger": "galileo.logger",
+    "galileo_context": "galileo.decorator",
+    "get_tracing_headers": "galileo.tracing",
+    "log": "galileo.decorator",
+    # The OpenAI wrapper requires the openai package, so it is only imported when used.
+    "openai": "galileo.openai",
+    "start_session": "galileo.decorator",
+}
+
+__all__ = [
+    "GalileoDecorator",
+    "GalileoLogger",
+    "galileo_context",
+    "get_tracing_headers",
+    "log",
+    "openai",
+    "start_session",
+]
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY_IMPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
@@ -1,9 +1,13 @@
+import io
+import json
+from collections.abc import Iterable, Iterator
 from typing import TYPE_CHECKING, Any, Optional, Union
 
 from galileo.config import GalileoPythonConfig
 from galileo.resources.models.dataset_content import DatasetContent
 from galileo.resources.types import Unset
 from galileo.schema.datasets import DatasetRecord
+from galileo_core.utils.dataset import process_dataset_value
 
 if TYPE_CHECKING:
     from galileo.datasets import Dataset
@@ -32,22 +36,55 @@ def remap_output_to_ground_truth(content: DatasetContent) -> DatasetContent:
     return content
 
 
-def normalize_dataset_rows(rows: list[dict[str, Any]]) -> list[dict[str, Any]]:
+def normalize_dataset_row(row: dict[str, Any]) -> dict[str, Any]:
     """
-    Normalize dataset rows by renaming ``ground_truth`` to ``output``.
+    Normalize a dataset row by renaming ``ground_truth`` to ``output``.
 
     Allows callers to use either field name. ``output`` takes precedence when both
-    are present. The caller's original dicts are never mutated.
+    are present. The caller's original dict is never mutated.
     """
-    normalized = []
-    for row in rows:
-        if "ground_truth" in row:
-            row = dict(row)  # avoid mutating caller's data
-            ground_truth = row.pop("ground_truth")
-            if "output" not in row:
-                row["output"] = ground_truth
-        normalized.append(row)
-    return normalized
+    if "ground_truth" in row:
+        row = dict(row)  # avoid mutating caller's data
+        ground_truth = row.pop("ground_truth")
+        if "output" not in row:
+            row["output"] = ground_truth
+    return row
+
+
+def normalize_dataset_rows(rows: Iterable[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Normalize dataset rows with ``normalize_dataset_row``."""
+    return [normalize_dataset_row(row) for row in rows]
+
+
+class JsonlRowReader(io.RawIOBase):
+    """
+    Binary stream of rows encoded as JSONL, one line at a time as the stream is read.
+
+    Rows are encoded like ``galileo_core.utils.dataset.parse_dataset`` does when it writes them to a JSONL file, so
+    the reader can be uploaded in place of that file without materializing it. Only the lines not yet read are held
+    in memory. The stream has no known length and cannot be rewound.
+    """
+
+    def __init__(self, rows: Iterable[dict[str, Any]]) -> None:
+        super().__init__()
+        self._rows: Iterator[dict[str, Any]] = iter(rows)
+        self._buffer = bytearray()
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer: Any) -> int:
+        with memoryview(buffer) as view:
+            while len(self._buffer) < len(view):
+                row = next(self._rows, None)
+                if row is None:
+                    break
+                line = json.dumps({key: process_dataset_value(value) for key, value in row.items()}, default=str)
+                self._buffer += line.encode("utf-8") + b"\n"
+            size = min(len(view), len(self._buffer))
+            view[:size] = self._buffer[:size]
+        del self._buffer[:size]
+        return size
 
 
 def validate_dataset_in_project(
@@ -162,13 +199,31 @@ def get_dataset_and_records(id: str | None = None, name: str | None = None) -> t
     return dataset, get_records_for_dataset(dataset)
 
 
+def get_next_starting_token(content: DatasetContent, page_size: int, starting_token: int) -> int | None:
+    """Return the token of the page after ``content``, or None if ``content`` is the last page."""
+    # Prefer the token the server hands out, and treat an explicit None as the end of the dataset.
+    next_starting_token = content.next_starting_token
+    if isinstance(next_starting_token, int):
+        return next_starting_token
+    if next_starting_token is None or len(content.rows) < page_size:
+        return None
+    # Without a token, a full page may be followed by more rows at the next offset.
+    return starting_token + len(content.rows)
+
+
 def get_records_for_dataset(dataset: "Dataset") -> list[DatasetRecord]:
-    from galileo.datasets import convert_dataset_row_to_record
+    from galileo.datasets import MAX_DATASET_ROWS, convert_dataset_row_to_record, iter_dataset_content
 
-    content = dataset.get_content()
+    # Large pages keep typical datasets to a single request; bigger ones are paged instead of truncated.
+    content = dataset.get_content(starting_token=0, limit=MAX_DATASET_ROWS)
     if not content:
         raise ValueError("dataset has no content")
-    return [convert_dataset_row_to_record(row) for row in content.rows]
+    records = [convert_dataset_row_to_record(row) for row in content.rows]
+    next_starting_token = get_next_starting_token(content, MAX_DATASET_ROWS, 0)
+    if content.rows and next_starting_token is not None:
+        for page in iter_dataset_content(dataset, page_size=MAX_DATASET_ROWS, starting_token=next_starting_token):
+            records.extend(convert_dataset_row_to_record(row) for row in page.rows)
+    return records
 
 
 def create_rows_from_records(records: list[dict[str, Any] | str]) -> list[DatasetRecord]:
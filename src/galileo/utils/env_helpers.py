@@ -120,3 +120,47 @@ def _get_log_stream_id_from_env() -> str | None:
         The log stream ID from environment variable, or None if not set.
     """
     return getenv("GALILEO_LOG_STREAM_ID")
+
+
+def _get_defer_init_or_default(defer_init: bool | None) -> bool:
+    """
+    Get whether loggers defer resolving their project and log stream, falling back to GALILEO_DEFER_INIT env var.
+
+    Parameters
+    ----------
+    defer_init : Optional[bool]
+        The value passed to the logger, or None to check environment variable.
+
+    Returns
+    -------
+    bool
+        True if the project and log stream are resolved on the first flush instead of when the logger is created.
+    """
+    if defer_init is None:
+        return _get_flag_from_env("GALILEO_DEFER_INIT")
+    return defer_init
+
+
+def _get_background_init_or_default(background_init: bool | None) -> bool:
+    """
+    Get whether loggers resolve their project and log stream in the background, falling back to
+    GALILEO_BACKGROUND_INIT env var.
+
+    Parameters
+    ----------
+    background_init : Optional[bool]
+        The value passed to the logger, or None to check environment variable.
+
+    Returns
+    -------
+    bool
+        True if the project, log stream and ingest service are resolved on background threads when the logger is
+        created, instead of on the caller's thread.
+    """
+    if background_init is None:
+        return _get_flag_from_env("GALILEO_BACKGROUND_INIT")
+    return background_init
+
+
+def _get_flag_from_env(name: str) -> bool:
+    return getenv(name, "").lower() in ("1", "true", "yes")
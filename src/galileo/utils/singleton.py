@@ -217,6 +217,22 @@ class GalileoLoggerSingleton:
                 self._galileo_loggers[key].terminate()
                 del self._galileo_loggers[key]
 
+    def discard(self, logger: GalileoLogger) -> None:
+        """
+        Terminate and remove a specific GalileoLogger instance, whichever thread it was created on.
+
+        Parameters
+        ----------
+        logger (GalileoLogger)
+            The logger instance to remove.
+        """
+        with self._lock:
+            keys_to_remove = [k for k, v in self._galileo_loggers.items() if v is logger]
+            for key in keys_to_remove:
+                del self._galileo_loggers[key]
+        if keys_to_remove:
+            logger.terminate()
+
     def reset_all(self) -> None:
         """Reset (terminate and remove) all GalileoLogger instances."""
         with self._lock:
@@ -0,0 +1,111 @@
+"""Tests for the per-event-loop registry of pooled HTTP clients."""
+
+import asyncio
+from collections.abc import Callable
+
+import httpx
+
+from galileo.config import GalileoPythonConfig
+from galileo.resources.api.health import healthcheck_healthcheck_get
+from galileo.shared.http_pool import AsyncClientRegistry, PooledApiClient, http_pool
+from galileo_core.constants.request_method import RequestMethod
+from galileo_core.helpers.execution import async_run
+
+
+def build_client(**pool_settings) -> httpx.AsyncClient:
+    return httpx.AsyncClient(**pool_settings)
+
+
+def test_clients_are_shared_within_a_loop_and_not_across_loops() -> None:
+    registry = AsyncClientRegistry()
+
+    async def get_twice() -> tuple[httpx.AsyncClient, httpx.AsyncClient]:
+        return registry.get("key", build_client), registry.get("key", build_client)
+
+    first_loop, other_loop = asyncio.new_event_loop(), asyncio.new_event_loop()
+    first, second = first_loop.run_until_complete(get_twice())
+    first_loop.close()
+    other_loop_client, _ = other_loop.run_until_complete(get_twice())
+
+    assert first is second
+    assert other_loop_client is not first
+    stats = registry.stats()
+    assert stats.clients_created == 2
+    assert stats.client_reuses == 2
+    # The first loop was closed, so its client was dropped when the other loop created one.
+    assert stats.loops == 1
+    other_loop.close()
+
+
+def test_clients_are_built_with_the_registry_limits() -> None:
+    limits = httpx.Limits(max_connections=3, max_keepalive_connections=1)
+    registry = AsyncClientRegistry(limits=limits)
+    received = {}
+
+    def build(**pool_settings) -> httpx.AsyncClient:
+        received.update(pool_settings)
+        return httpx.AsyncClient(**pool_settings)
+
+    async def get() -> httpx.AsyncClient:
+        return registry.get("key", build)
+
+    asyncio.run(get())
+
+    assert received == {"limits": limits, "http2": False}
+
+
+def test_closed_clients_are_replaced() -> None:
+    registry = AsyncClientRegistry()
+
+    async def get_close_and_get() -> tuple[httpx.AsyncClient, httpx.AsyncClient]:
+        client = registry.get("key", build_client)
+        await client.aclose()
+        return client, registry.get("key", build_client)
+
+    closed, replacement = asyncio.run(get_close_and_get())
+
+    assert closed is not replacement
+    assert not replacement.is_closed
+
+
+def test_track_request_counts_in_flight_requests() -> None:
+    registry = AsyncClientRegistry()
+
+    with registry.track_request():
+        assert registry.stats().in_flight_requests == 1
+
+    stats = registry.stats()
+    assert stats.in_flight_requests == 0
+    assert stats.requests == 1
+
+
+def test_config_api_client_is_pooled() -> None:
+    api_client = GalileoPythonConfig.get().api_client
+
+    assert isinstance(api_client, PooledApiClient)
+    assert GalileoPythonConfig.get().api_client is api_client
+
+
+def test_generated_api_calls_reuse_the_loop_client(mock_request: Callable) -> None:
+    # Given: the configured API client and a mocked endpoint
+    mock_request(
+        method=RequestMethod.GET,
+        path="/healthcheck",
+        json={"api_version": "1.0.0", "message": "ok", "version": "1.0.0"},
+    )
+    client = GalileoPythonConfig.get().api_client
+    http_pool.clear()
+
+    async def call_twice() -> None:
+        await healthcheck_healthcheck_get.asyncio(client=client)
+        await healthcheck_healthcheck_get.asyncio(client=client)
+
+    # When: two requests are made on the same event loop
+    async_run(call_twice())
+
+    # Then: they share one pooled client
+    stats = http_pool.stats()
+    assert stats.requests == 2
+    assert stats.clients_created == 1
+    assert stats.client_reuses == 1
+    assert stats.in_flight_requests == 0
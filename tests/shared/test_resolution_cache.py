@@ -0,0 +1,164 @@
+"""Tests for the process-wide name resolution cache."""
+
+import threading
+import time
+from datetime import datetime
+from unittest.mock import MagicMock, patch
+
+from galileo.log_streams import LogStream, LogStreams
+from galileo.projects import Projects
+from galileo.resources.models import LogStreamResponse
+from galileo.shared.resolution_cache import ResolutionCache
+
+
+def test_caches_values_until_they_expire() -> None:
+    cache = ResolutionCache(ttl_seconds=0.2, negative_ttl_seconds=0.2)
+    load = MagicMock(side_effect=["first", "second"])
+
+    assert cache.get_or_load("key", load) == "first"
+    assert cache.get_or_load("key", load) == "first"
+    time.sleep(0.25)
+    assert cache.get_or_load("key", load) == "second"
+    assert load.call_count == 2
+
+
+def test_not_found_results_expire_sooner() -> None:
+    cache = ResolutionCache(ttl_seconds=60, negative_ttl_seconds=0.1)
+    load = MagicMock(side_effect=[None, "created"])
+
+    assert cache.get_or_load("key", load) is None
+    assert cache.get_or_load("key", load) is None
+    time.sleep(0.15)
+    assert cache.get_or_load("key", load) == "created"
+
+
+def test_invalidate_and_max_age_reload_the_value() -> None:
+    cache = ResolutionCache(ttl_seconds=60)
+    load = MagicMock(side_effect=["first", "second", "third"])
+
+    assert cache.get_or_load("key", load) == "first"
+    cache.invalidate("key")
+    assert cache.get_or_load("key", load) == "second"
+    assert cache.get_or_load("key", load, max_age=0) == "third"
+
+
+def test_zero_ttl_disables_the_cache() -> None:
+    cache = ResolutionCache(ttl_seconds=0)
+    load = MagicMock(side_effect=["first", "second"])
+
+    assert cache.get_or_load("key", load) == "first"
+    assert cache.get_or_load("key", load) == "second"
+
+
+def test_concurrent_lookups_share_one_load() -> None:
+    cache = ResolutionCache(ttl_seconds=60)
+    calls = []
+
+    def load() -> str:
+        calls.append(1)
+        time.sleep(0.1)
+        return "value"
+
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(cache.get_or_load("key", load))) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert results == ["value"] * 8
+    assert len(calls) == 1
+
+
+def test_load_racing_an_invalidation_is_not_cached() -> None:
+    cache = ResolutionCache(ttl_seconds=60)
+
+    def stale_load() -> None:
+        # The resource is created (and the key invalidated) while the lookup is in flight.
+        cache.invalidate("key")
+
+    assert cache.get_or_load("key", stale_load) is None
+    assert cache.get_or_load("key", lambda: "created") == "created"
+
+
+def test_key_locks_are_removed_once_loaded() -> None:
+    cache = ResolutionCache(ttl_seconds=60)
+    started, release = threading.Event(), threading.Event()
+
+    def load() -> str:
+        started.set()
+        release.wait()
+        return "value"
+
+    thread = threading.Thread(target=lambda: cache.get_or_load("key", load))
+    thread.start()
+    started.wait()
+    assert "key" in cache._key_locks
+    release.set()
+    thread.join()
+
+    for i in range(100):
+        cache.get_or_load(i, lambda: None)
+    assert cache._key_locks == {}
+
+
+@patch("galileo.projects.get_projects_projects_get")
+def test_project_lookups_by_name_return_their_own_project(get_projects_mock: MagicMock) -> None:
+    project_response = MagicMock()
+    project_response.name = "my-project"
+    get_projects_mock.sync_detailed.return_value = MagicMock(status_code=200, parsed=[project_response])
+
+    first = Projects().get(name="my-project")
+    first.name = "renamed locally"
+
+    assert Projects().get(name="my-project").name == "my-project"
+    get_projects_mock.sync_detailed.assert_called_once()
+
+
+@patch.object(LogStreams, "_list_all")
+def test_log_stream_lookups_by_name_return_their_own_log_stream(list_all_mock: MagicMock) -> None:
+    list_all_mock.return_value = [
+        LogStream(
+            log_stream=LogStreamResponse(
+                created_at=datetime.now(), id="1", name="first", project_id="project-1", updated_at=datetime.now()
+            )
+        )
+    ]
+
+    first = LogStreams().get(name="first", project_id="project-1")
+    first.name = "renamed locally"
+
+    assert LogStreams().get(name="first", project_id="project-1").name == "first"
+    list_all_mock.assert_called_once()
+
+
+@patch("galileo.projects.get_projects_projects_get")
+def test_project_lookup_by_name_is_cached_until_created(get_projects_mock: MagicMock) -> None:
+    get_projects_mock.sync_detailed.return_value = MagicMock(status_code=200, parsed=[])
+
+    assert Projects().get(name="my-project") is None
+    assert Projects().get(name="my-project") is None
+    get_projects_mock.sync_detailed.assert_called_once()
+
+    with patch("galileo.projects.create_project_projects_post") as create_mock:
+        create_mock.sync_detailed.return_value = MagicMock(status_code=200)
+        Projects().create(name="my-project")
+
+    Projects().get(name="my-project")
+    assert get_projects_mock.sync_detailed.call_count == 2
+
+
+@patch("galileo.log_streams.create_log_stream_projects_project_id_log_streams_post")
+@patch.object(LogStreams, "_list_all")
+def test_log_stream_lookups_by_name_share_one_listing(list_all_mock: MagicMock, create_mock: MagicMock) -> None:
+    first, second = MagicMock(), MagicMock()
+    first.name, second.name = "first", "second"
+    list_all_mock.return_value = [first, second]
+
+    assert LogStreams().get(name="first", project_id="project-1").name == "first"
+    assert LogStreams().get(name="second", project_id="project-1").name == "second"
+    list_all_mock.assert_called_once_with(project_id="project-1")
+
+    LogStreams().create(name="third", project_id="project-1")
+    LogStreams().get(name="first", project_id="project-1")
+    assert list_all_mock.call_count == 2
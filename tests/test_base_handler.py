@@ -1,3 +1,4 @@
+import sys
 import uuid
 from collections.abc import Generator
 from unittest.mock import Mock, patch
@@ -6,6 +7,7 @@ import pytest
 
 from galileo.handlers.base_handler import GalileoBaseHandler
 from galileo.logger.logger import GalileoLogger
+from galileo.utils.serialization import convert_to_string_dict
 from tests.testutils.setup import setup_mock_logstreams_client, setup_mock_projects_client, setup_mock_traces_client
 
 
@@ -137,3 +139,85 @@ class TestGalileoBaseHandler:
         # Then: neither flush nor terminate is called
         mock_logger.flush.assert_not_called()
         mock_logger.terminate.assert_not_called()
+
+    def test_log_node_tree_deeper_than_recursion_limit(self, handler: GalileoBaseHandler) -> None:
+        """Test that a node tree deeper than the interpreter's recursion limit is logged without error."""
+        # Given: a chain of nested chain nodes deeper than sys.getrecursionlimit()
+        depth = sys.getrecursionlimit() + 500
+        run_ids = [uuid.uuid4() for _ in range(depth)]
+        parent_id = None
+        for i, run_id in enumerate(run_ids):
+            handler.start_node(node_type="chain", parent_run_id=parent_id, run_id=run_id, name=f"node-{i}", input="in")
+            parent_id = run_id
+        root_node = handler.get_node(run_ids[0])
+        for run_id in reversed(run_ids[1:]):
+            handler.get_node(run_id).span_params["output"] = "out"
+        handler._galileo_logger.start_trace(input="in")
+
+        # When: logging the tree
+        handler.log_node_tree(root_node)
+
+        # Then: every node is logged with its nesting preserved, and all spans are concluded
+        span = handler._galileo_logger.traces[0].spans[0]
+        for i in range(1, depth):
+            assert len(span.spans) == 1
+            span = span.spans[0]
+            assert span.name == f"node-{i}"
+        assert span.spans == []
+        assert handler._galileo_logger.current_parent() is handler._galileo_logger.traces[0]
+
+    def test_log_node_tree_preserves_sibling_order_and_parent_output(self, handler: GalileoBaseHandler) -> None:
+        """Test that siblings are logged in order and a parent without output inherits its last child's output."""
+        # Given: a chain with an llm child and a nested chain child that itself has a tool child
+        root_id, llm_id, inner_id, tool_id = (uuid.uuid4() for _ in range(4))
+        handler.start_node(node_type="chain", parent_run_id=None, run_id=root_id, name="root", input="q")
+        handler.start_node(
+            node_type="llm", parent_run_id=root_id, run_id=llm_id, name="llm", input="q", output="a", model="gpt"
+        )
+        handler.start_node(node_type="chain", parent_run_id=root_id, run_id=inner_id, name="inner", input="a")
+        handler.start_node(
+            node_type="tool", parent_run_id=inner_id, run_id=tool_id, name="tool", input="a", output="tool-out"
+        )
+
+        # When: ending the root node
+        handler.end_node(root_id)
+
+        # Then: the tree structure is reproduced, and outputs propagate up from the last child
+        root_span = handler._galileo_logger.traces[0].spans[0]
+        assert [s.name for s in root_span.spans] == ["llm", "inner"]
+        inner_span = root_span.spans[1]
+        assert [s.name for s in inner_span.spans] == ["tool"]
+        assert inner_span.output == "tool-out"
+
+    def test_log_node_tree_memoizes_shared_metadata(self, handler: GalileoBaseHandler) -> None:
+        """Test that metadata shared by identity across nodes is converted only once per tree walk."""
+        # Given: a LangGraph-style tree where every node references the same metadata dict
+        shared_metadata = {"langgraph_step": 3, "config": {"nested": [1, 2, 3]}}
+        root_id = uuid.uuid4()
+        handler.start_node(
+            node_type="chain", parent_run_id=None, run_id=root_id, name="root", input="q", metadata=shared_metadata
+        )
+        for i in range(5):
+            handler.start_node(
+                node_type="llm",
+                parent_run_id=root_id,
+                run_id=uuid.uuid4(),
+                name=f"llm-{i}",
+                input="q",
+                output="a",
+                model="gpt",
+                metadata=shared_metadata,
+            )
+
+        # When: ending the root node
+        with patch(
+            "galileo.handlers.base_handler.convert_to_string_dict", wraps=convert_to_string_dict
+        ) as mock_convert:
+            handler.end_node(root_id)
+
+        # Then: conversion ran once, and every span received the converted metadata and step number
+        mock_convert.assert_called_once_with(shared_metadata)
+        root_span = handler._galileo_logger.traces[0].spans[0]
+        for span in [root_span, *root_span.spans]:
+            assert span.user_metadata == {"langgraph_step": "3", "config": '{"nested": [1, 2, 3]}'}
+            assert span.step_number == 3
@@ -0,0 +1,109 @@
+"""
+Benchmark of committing a large LangGraph-shaped node tree through the base handler.
+
+Wall-clock comparisons are too noisy for the default suite, so the benchmark only runs with
+``GALILEO_RUN_BENCHMARKS=1``.
+"""
+
+import os
+import statistics
+import time
+import uuid
+from collections.abc import Callable
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+
+from galileo.handlers.base_handler import GalileoBaseHandler
+from galileo.logger.logger import GalileoLogger
+from tests.testutils.setup import setup_mock_logstreams_client, setup_mock_projects_client, setup_mock_traces_client
+
+pytestmark = pytest.mark.skipif(
+    not os.environ.get("GALILEO_RUN_BENCHMARKS"), reason="Set GALILEO_RUN_BENCHMARKS=1 to run benchmarks"
+)
+
+RUNS = 5
+# One root chain plus 1,000 LangGraph steps of 5 nodes each.
+STEPS = 1000
+CHILD_NODE_TYPES = ("llm", "tool", "retriever", "chain")
+
+
+@pytest.fixture
+def galileo_logger() -> GalileoLogger:
+    with (
+        patch("galileo.logger.logger.LogStreams") as mock_logstreams_client,
+        patch("galileo.logger.logger.Projects") as mock_projects_client,
+        patch("galileo.logger.logger.Traces") as mock_traces_client,
+    ):
+        setup_mock_traces_client(mock_traces_client)
+        setup_mock_projects_client(mock_projects_client)
+        setup_mock_logstreams_client(mock_logstreams_client)
+        return GalileoLogger(project="my_project", log_stream="my_log_stream")
+
+
+def build_tree(handler: GalileoBaseHandler) -> uuid.UUID:
+    """Start a synthetic LangGraph run of 5,001 nodes whose steps share their metadata, as LangGraph's do."""
+    root_id = uuid.uuid4()
+    handler.start_node(node_type="chain", parent_run_id=None, run_id=root_id, name="LangGraph", input="question")
+    for step in range(STEPS):
+        metadata: dict[str, Any] = {
+            "langgraph_step": step,
+            "langgraph_node": f"node_{step % 7}",
+            "langgraph_triggers": [f"branch:to:node_{step % 7}"],
+            "langgraph_path": ["__pregel_pull", f"node_{step % 7}"],
+            "langgraph_checkpoint_ns": f"node_{step % 7}:{uuid.uuid4()}",
+            "checkpoint_ns": f"node_{step % 7}:{uuid.uuid4()}",
+            "ls_provider": "openai",
+            "ls_model_name": "gpt-4o",
+            "configurable": {"thread_id": "thread", "checkpoint": {"id": str(uuid.uuid4()), "ts": step}},
+        }
+        step_id = uuid.uuid4()
+        handler.start_node(
+            node_type="chain", parent_run_id=root_id, run_id=step_id, name=f"node_{step % 7}", metadata=metadata
+        )
+        for node_type in CHILD_NODE_TYPES:
+            handler.start_node(
+                node_type=node_type,
+                parent_run_id=step_id,
+                run_id=uuid.uuid4(),
+                name=node_type,
+                input=f"{node_type} input {step}",
+                output=f"{node_type} output {step}",
+                metadata=metadata,
+            )
+    return root_id
+
+
+def measure(galileo_logger: GalileoLogger, log_node_tree: Callable[[GalileoBaseHandler, Any], None]) -> list[float]:
+    """Return the durations of logging ``RUNS`` freshly built trees, in seconds."""
+    durations = []
+    for _ in range(RUNS):
+        handler = GalileoBaseHandler(galileo_logger=galileo_logger, flush_on_chain_end=False)
+        root_node = handler.get_node(build_tree(handler))
+        galileo_logger.start_trace(input="question")
+        start = time.perf_counter()
+        log_node_tree(handler, root_node)
+        durations.append(time.perf_counter() - start)
+        galileo_logger.conclude(output="answer")
+        galileo_logger.traces = []
+    return durations
+
+
+def summary(durations: list[float]) -> str:
+    return f"median={statistics.median(durations) * 1e3:.1f} ms, min={min(durations) * 1e3:.1f} ms"
+
+
+def test_log_node_tree_latency(galileo_logger: GalileoLogger) -> None:
+    convert_node_metadata = GalileoBaseHandler._convert_node_metadata
+
+    def convert_without_memoization(self: GalileoBaseHandler, metadata: Any, metadata_cache: dict) -> Any:
+        return convert_node_metadata(self, metadata, {})
+
+    memoized = measure(galileo_logger, GalileoBaseHandler.log_node_tree)
+    with patch.object(GalileoBaseHandler, "_convert_node_metadata", convert_without_memoization):
+        unmemoized = measure(galileo_logger, GalileoBaseHandler.log_node_tree)
+
+    assert statistics.median(memoized) < statistics.median(unmemoized), (
+        f"memoized metadata: {summary(memoized)}; converted per node: {summary(unmemoized)}"
+    )
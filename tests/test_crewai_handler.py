@@ -1274,3 +1274,163 @@ def test_tool_lifecycle_previous_event_id_with_error(crewai_callback) -> None:
         start_run_id = mock_start.call_args[1]["run_id"]
         end_run_id = mock_end.call_args[1]["run_id"]
         assert start_run_id == end_run_id
+
+
+def test_llm_call_lifecycle_without_call_id_uses_event_scope(crewai_callback) -> None:
+    """Test that LLM events without call_id are paired per agent without serializing the messages."""
+    # Given: started/completed events without call_id for a long conversation
+    source = MockSource()
+    agent_id = str(uuid.uuid4())
+    messages = [{"role": "user", "content": f"turn {i}"} for i in range(500)]
+    start_event = MockEvent(type="llm_call_started", agent_id=agent_id, messages=messages)
+    end_event = MockEvent(type="llm_call_completed", agent_id=agent_id, messages=messages, response="ok")
+
+    with (
+        patch.object(MockEvent, "to_json", side_effect=AssertionError("to_json should not be called")),
+        patch("galileo.handlers.crewai.handler.json.dumps") as mock_dumps,
+    ):
+        # When: generating run_ids for both events
+        run_id_start = crewai_callback._generate_run_id(source, start_event)
+        run_id_end = crewai_callback._generate_run_id(source, end_event)
+
+    # Then: they correlate, and the conversation was never serialized
+    assert run_id_start == run_id_end
+    mock_dumps.assert_not_called()
+    assert crewai_callback._llm_call_scopes == {}
+
+
+def test_llm_call_event_scope_pairs_nested_calls_per_agent(crewai_callback) -> None:
+    """Test that event scopes are closed innermost-first and kept separate per agent."""
+    # Given: two nested calls for one agent and one call for another agent
+    source = MockSource()
+    agent_a, agent_b = str(uuid.uuid4()), str(uuid.uuid4())
+    outer = crewai_callback._generate_run_id(source, MockEvent(type="llm_call_started", agent_id=agent_a))
+    other = crewai_callback._generate_run_id(source, MockEvent(type="llm_call_started", agent_id=agent_b))
+    inner = crewai_callback._generate_run_id(source, MockEvent(type="llm_call_started", agent_id=agent_a))
+
+    # When: the calls end
+    inner_end = crewai_callback._generate_run_id(source, MockEvent(type="llm_call_completed", agent_id=agent_a))
+    other_end = crewai_callback._generate_run_id(source, MockEvent(type="llm_call_failed", agent_id=agent_b))
+    outer_end = crewai_callback._generate_run_id(source, MockEvent(type="llm_call_completed", agent_id=agent_a))
+
+    # Then: each end event maps to its own start event
+    assert len({outer, other, inner}) == 3
+    assert (inner_end, other_end, outer_end) == (inner, other, outer)
+
+
+def test_lite_llm_usage_callback_finds_call_id_node_by_fingerprint(crewai_callback) -> None:
+    """Test that LiteLLM usage is attached to an LLM node keyed by call_id without hashing the conversation."""
+    # Given: an LLM call started with a call_id
+    source = MockSource()
+    messages = [{"role": "system", "content": "You are helpful"}, {"role": "user", "content": "hi"}]
+    start_event = MockEvent(call_id="call-789", model="gpt-4o", agent_id=None, messages=messages)
+    crewai_callback._handle_llm_call_started(source, start_event)
+    run_id = crewai_callback._hash_to_uuid("call_call-789")
+
+    mock_usage = Mock(prompt_tokens=10, completion_tokens=5, total_tokens=15)
+    mock_usage.model_dump.return_value = {"prompt_tokens": 10, "completion_tokens": 5, "total_tokens": 15}
+    mock_response = Mock(model_extra={"usage": mock_usage})
+
+    # When: LiteLLM reports usage for a copy of the same messages
+    with patch.object(crewai_callback, "_hash_messages") as mock_hash_messages:
+        crewai_callback.lite_llm_usage_callback(
+            kwargs={"messages": [dict(m) for m in messages]},
+            completion_response=mock_response,
+            start_time=datetime.now(),
+            end_time=datetime.now(),
+        )
+
+    # Then: usage lands on the call_id node and the full-message hash fallback was not needed
+    mock_hash_messages.assert_not_called()
+    node = crewai_callback._handler.get_node(run_id)
+    assert node.span_params["num_input_tokens"] == 10
+    assert node.span_params["num_output_tokens"] == 5
+    assert node.span_params["total_tokens"] == 15
+
+
+def test_llm_call_event_scope_keeps_concurrent_calls_of_different_sources_apart(crewai_callback) -> None:
+    """Test that concurrent LLM calls without an agent are paired by the LLM that emitted them."""
+    # Given: two calls without call_id or agent_id, started concurrently by different LLMs
+    first_source, second_source = MockSource(), MockSource()
+    first = crewai_callback._generate_run_id(first_source, MockEvent(type="llm_call_started", agent_id=None))
+    second = crewai_callback._generate_run_id(second_source, MockEvent(type="llm_call_started", agent_id=None))
+
+    # When: the first call completes before the second one
+    first_end = crewai_callback._generate_run_id(first_source, MockEvent(type="llm_call_completed", agent_id=None))
+    second_end = crewai_callback._generate_run_id(second_source, MockEvent(type="llm_call_completed", agent_id=None))
+
+    # Then: each end event maps to its own start event
+    assert first != second
+    assert (first_end, second_end) == (first, second)
+
+
+def test_llm_call_without_event_scope_falls_back_to_messages_hash(crewai_callback) -> None:
+    """Test that LLM events without a source are paired by their messages rather than a shared scope."""
+    messages = [{"role": "user", "content": "hi"}]
+    start_event = MockEvent(type="llm_call_started", agent_id=None, messages=messages)
+    end_event = MockEvent(type="llm_call_completed", agent_id=None, messages=messages)
+
+    run_id_start = crewai_callback._generate_run_id(None, start_event)
+    run_id_end = crewai_callback._generate_run_id(None, end_event)
+
+    assert run_id_start == run_id_end == crewai_callback._hash_messages(messages)
+    assert crewai_callback._llm_call_scopes == {}
+
+
+def test_llm_call_event_scopes_are_bounded(crewai_callback) -> None:
+    """Test that started LLM calls which never end are eventually dropped."""
+    # Given: more open calls than are tracked
+    sources = [MockSource() for _ in range(3)]
+    with patch("galileo.handlers.crewai.handler._MAX_TRACKED_LLM_CALLS", 2):
+        run_ids = [
+            crewai_callback._generate_run_id(source, MockEvent(type="llm_call_started", agent_id=None))
+            for source in sources
+        ]
+
+    # Then: the oldest call was dropped, and the others can still be closed
+    assert crewai_callback._open_scoped_llm_calls == 2
+    assert len(crewai_callback._llm_call_scopes) == 2
+    assert crewai_callback._scoped_llm_run_id(sources[0], MockEvent(type="llm_call_completed")) is None
+    assert crewai_callback._scoped_llm_run_id(sources[2], MockEvent(type="llm_call_completed")) == run_ids[2]
+
+
+def test_lite_llm_usage_of_calls_with_equal_messages_is_not_swapped(crewai_callback) -> None:
+    """Test that parallel LLM calls with equal messages each keep their own usage entry."""
+    # Given: two LLM calls with the same messages, e.g. fanned-out agents with the same prompt
+    messages = [{"role": "system", "content": "You are helpful"}, {"role": "user", "content": "hi"}]
+    source = MockSource()
+    for call_id in ("call-1", "call-2"):
+        crewai_callback._handle_llm_call_started(source, MockEvent(call_id=call_id, model="gpt-4o", messages=messages))
+    first, second = crewai_callback._hash_to_uuid("call_call-1"), crewai_callback._hash_to_uuid("call_call-2")
+
+    def report_usage(prompt_tokens: int) -> None:
+        usage = Mock(prompt_tokens=prompt_tokens, completion_tokens=1, total_tokens=prompt_tokens + 1)
+        usage.model_dump.return_value = {}
+        crewai_callback.lite_llm_usage_callback(
+            kwargs={"messages": messages},
+            completion_response=Mock(model_extra={"usage": usage}),
+            start_time=datetime.now(),
+            end_time=datetime.now(),
+        )
+
+    # When: LiteLLM reports the usage of both calls
+    report_usage(10)
+    report_usage(20)
+
+    # Then: each call got one usage report, and no entry is left behind
+    assert crewai_callback._handler.get_node(first).span_params["num_input_tokens"] == 10
+    assert crewai_callback._handler.get_node(second).span_params["num_input_tokens"] == 20
+    assert crewai_callback._llm_run_ids_by_fingerprint == {}
+
+
+def test_ended_llm_calls_are_not_matched_by_lite_llm_usage(crewai_callback) -> None:
+    """Test that the usage entry of an LLM call is dropped when the call ends."""
+    messages = [{"role": "user", "content": "hi"}]
+    source = MockSource()
+    crewai_callback._handle_llm_call_started(source, MockEvent(call_id="call-1", model="gpt-4o", messages=messages))
+
+    crewai_callback._handle_llm_call_completed(source, MockEvent(call_id="call-1", response="ok"))
+
+    assert crewai_callback._llm_run_ids_by_fingerprint == {}
+    assert crewai_callback._llm_call_fingerprints == {}
+    assert crewai_callback._lookup_llm_call(messages) is None
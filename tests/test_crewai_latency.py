@@ -0,0 +1,99 @@
+"""
+Benchmark of the run ID bookkeeping of CrewAI LLM events on long-context conversations.
+
+Wall-clock comparisons are too noisy for the default suite, so the benchmark only runs with
+``GALILEO_RUN_BENCHMARKS=1``.
+"""
+
+import os
+import statistics
+import sys
+import time
+from collections.abc import Callable
+from unittest.mock import patch
+
+import pytest
+
+from galileo.logger.logger import GalileoLogger
+
+pytestmark = [
+    pytest.mark.skipif(
+        not os.environ.get("GALILEO_RUN_BENCHMARKS"), reason="Set GALILEO_RUN_BENCHMARKS=1 to run benchmarks"
+    ),
+    pytest.mark.skipif(sys.version_info >= (3, 14), reason="crewai does not support Python 3.14+"),
+]
+
+from galileo.handlers.crewai.handler import CrewAIEventListener  # noqa: E402
+from tests.test_crewai_handler import MockEvent, MockSource  # noqa: E402
+from tests.testutils.setup import (  # noqa: E402
+    setup_mock_logstreams_client,
+    setup_mock_projects_client,
+    setup_mock_traces_client,
+)
+
+CALLS = 200
+WARMUP_CALLS = 20
+# About 400KB of conversation per LLM call.
+TURNS = 200
+TURN_LENGTH = 2000
+
+
+@pytest.fixture
+def listener() -> CrewAIEventListener:
+    with (
+        patch("galileo.logger.logger.LogStreams") as mock_logstreams,
+        patch("galileo.logger.logger.Projects") as mock_projects,
+        patch("galileo.logger.logger.Traces") as mock_traces_client,
+        patch("galileo.handlers.crewai.handler._crewai_imports_resolved", True),
+        patch("galileo.handlers.crewai.handler.CREWAI_AVAILABLE", False),
+        patch("galileo.handlers.crewai.handler.LITE_LLM_AVAILABLE", False),
+    ):
+        setup_mock_traces_client(mock_traces_client)
+        setup_mock_projects_client(mock_projects)
+        setup_mock_logstreams_client(mock_logstreams)
+        galileo_logger = GalileoLogger(project="test_project", log_stream="test_log_stream")
+        return CrewAIEventListener(galileo_logger=galileo_logger, flush_on_crew_completed=False)
+
+
+def measure(call: Callable[[list[dict]], None]) -> list[float]:
+    """Return the latencies of ``CALLS`` LLM calls of a conversation that grows by one turn per call, in seconds."""
+    messages = [{"role": "user", "content": f"{i}" * TURN_LENGTH} for i in range(TURNS)]
+    for _ in range(WARMUP_CALLS):
+        call(messages)
+    latencies = []
+    for i in range(CALLS):
+        messages = [*messages, {"role": "assistant", "content": f"turn {i}"}]
+        start = time.perf_counter()
+        call(messages)
+        latencies.append(time.perf_counter() - start)
+    return latencies
+
+
+def summary(latencies: list[float]) -> str:
+    percentiles = statistics.quantiles(latencies, n=100)
+    return f"p50={percentiles[49] * 1e3:.3f} ms, p99={percentiles[98] * 1e3:.3f} ms"
+
+
+def test_llm_event_run_ids_do_not_serialize_the_conversation(listener: CrewAIEventListener) -> None:
+    source = MockSource()
+
+    def scoped(messages: list[dict]) -> None:
+        # Started event, LiteLLM usage lookup, and completed event of one call without a call_id.
+        run_id = listener._generate_run_id(source, MockEvent(type="llm_call_started", messages=messages))
+        listener._remember_llm_call(messages, run_id)
+        listener._lookup_llm_call(messages)
+        end_run_id = listener._generate_run_id(source, MockEvent(type="llm_call_completed", messages=messages))
+        assert end_run_id == run_id
+
+    def hashed(messages: list[dict]) -> None:
+        # The same call correlated by hashing the full conversation for each of the three events.
+        for _ in range(3):
+            listener._hash_messages(messages)
+
+    with patch.object(MockEvent, "to_json", side_effect=AssertionError("to_json should not be called")):
+        fast = measure(scoped)
+    legacy = measure(hashed)
+
+    assert statistics.median(fast) < statistics.median(legacy), (
+        f"event scopes: {summary(fast)}; full-message hashes: {summary(legacy)}"
+    )
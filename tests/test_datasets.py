@@ -1,4 +1,5 @@
 import json
+import threading
 from http import HTTPStatus
 from unittest.mock import ANY, Mock, patch
 from uuid import uuid4
@@ -18,6 +19,8 @@ from galileo.datasets import (
     extend_dataset,
     get_dataset_version,
     get_dataset_version_history,
+    iter_dataset_content,
+    iter_dataset_records,
     list_dataset_projects,
 )
 from galileo.resources.models import (
@@ -438,7 +441,7 @@ def test__get_etag(get_dataset_content_by_id_patch: Mock) -> None:
 
     assert expected_etag == dataset._get_etag()
     get_dataset_content_by_id_patch.sync_detailed.assert_called_once_with(
-        client=dataset.config.api_client, dataset_id=dataset.dataset.id
+        client=dataset.config.api_client, dataset_id=dataset.dataset.id, limit=1
     )
 
 
@@ -470,6 +473,9 @@ def test_dataset_add_rows_success(
         if_match="test_etag",
     )
     etag_patch.assert_called_once()
+    # The content is only refreshed when it is accessed.
+    get_dataset_content_patch.sync.assert_not_called()
+    assert dataset.content is get_dataset_content_patch.sync.return_value
     get_dataset_content_patch.sync.assert_called_once()
 
 
@@ -494,6 +500,48 @@ def test_dataset_add_rows_failure(
     get_dataset_content_patch.sync.assert_not_called()
 
 
+@patch("galileo.datasets.ADD_ROWS_CHUNK_MAX_ROWS", 2)
+@patch("galileo.datasets.Dataset._get_etag", return_value="etag-0")
+@patch("galileo.datasets.get_dataset_content_datasets_dataset_id_content_get")
+@patch("galileo.datasets.update_dataset_content_datasets_dataset_id_content_patch")
+def test_dataset_add_rows_chunks_and_chains_etags(
+    update_dataset_patch: Mock, get_dataset_content_patch: Mock, etag_patch: Mock
+) -> None:
+    """Test that large appends are split into chunks, each sent with the ETag returned by the previous one."""
+    update_dataset_patch.sync_detailed.side_effect = [
+        Mock(status_code=204, headers={"ETag": "etag-1"}),
+        Mock(status_code=204, headers={"ETag": "etag-2"}),
+        Mock(status_code=204, headers={"ETag": "etag-3"}),
+    ]
+    dataset = Dataset(dataset_db=dataset_db())
+
+    dataset.add_rows([{"input": str(i)} for i in range(5)], refresh=False)
+
+    calls = update_dataset_patch.sync_detailed.call_args_list
+    assert [len(call.kwargs["body"].edits) for call in calls] == [2, 2, 1]
+    assert [call.kwargs["if_match"] for call in calls] == ["etag-0", "etag-1", "etag-2"]
+    etag_patch.assert_called_once()
+    assert dataset.content is None
+    get_dataset_content_patch.sync.assert_not_called()
+
+
+@patch("galileo.datasets.Dataset._get_etag", return_value="etag-0")
+@patch("galileo.datasets.update_dataset_content_datasets_dataset_id_content_patch")
+def test_dataset_add_rows_bounds_chunk_size(update_dataset_patch: Mock, etag_patch: Mock) -> None:
+    """Test that a chunk holds about max_chunk_bytes of rows, and a failed chunk reports the rows already added."""
+    update_dataset_patch.sync_detailed.side_effect = [
+        Mock(status_code=204, headers={"ETag": "etag-1"}),
+        Mock(status_code=409, content=b"Conflict"),
+    ]
+    dataset = Dataset(dataset_db=dataset_db())
+    rows = [{"input": "x" * 100} for _ in range(4)]
+
+    with pytest.raises(DatasetAPIException, match="after adding 2 rows"):
+        dataset.add_rows(rows, max_chunk_bytes=250)
+
+    assert [len(call.kwargs["body"].edits) for call in update_dataset_patch.sync_detailed.call_args_list] == [2, 2]
+
+
 def test_delete_dataset_validation_errors() -> None:
     with pytest.raises(ValueError) as exc_info:
         Datasets().delete()
@@ -1613,6 +1661,51 @@ def test_create_dataset_does_not_mutate_caller_dicts(create_dataset_datasets_pos
     assert row == {"input": "What is 2+2?", "ground_truth": "4"}, "Caller's dict should not be mutated"
 
 
+@patch("galileo.datasets.create_dataset_datasets_post")
+def test_create_dataset_streams_rows_from_generator(create_dataset_datasets_post_mock: Mock) -> None:
+    """Test that rows from a generator are encoded to JSONL as the upload is read, not ahead of it."""
+    from galileo.utils.datasets import JsonlRowReader
+
+    # Given: a generator of rows that records how many rows were consumed
+    consumed = []
+
+    def rows():
+        for i in range(3):
+            consumed.append(i)
+            yield {"input": f"Q{i}", "ground_truth": f"A{i}", "metadata": {"index": i}}
+
+    create_dataset_datasets_post_mock.sync_detailed.return_value = Response(
+        content=b"{}", status_code=HTTPStatus.OK, headers={}, parsed=dataset_db()
+    )
+
+    # When: creating the dataset
+    create_dataset(name="streamed-dataset", content=rows())
+
+    # Then: only the first row was read before the upload, and the payload streams the normalized rows as JSONL
+    assert consumed == [0]
+    call_args = create_dataset_datasets_post_mock.sync_detailed.call_args
+    assert call_args.kwargs["format_"] == DatasetFormat.JSONL
+    payload = call_args.kwargs["body"].file.payload
+    assert isinstance(payload, JsonlRowReader)
+    lines = payload.read().decode("utf-8").splitlines()
+    assert consumed == [0, 1, 2]
+    assert [json.loads(line) for line in lines] == [
+        {"input": f"Q{i}", "output": f"A{i}", "metadata": json.dumps({"index": i})} for i in range(3)
+    ]
+
+
+@patch("galileo.datasets.create_dataset_datasets_post")
+def test_create_dataset_with_empty_generator(create_dataset_datasets_post_mock: Mock) -> None:
+    create_dataset_datasets_post_mock.sync_detailed.return_value = Response(
+        content=b"{}", status_code=HTTPStatus.OK, headers={}, parsed=dataset_db()
+    )
+
+    create_dataset(name="empty-dataset", content=iter([]))
+
+    payload = create_dataset_datasets_post_mock.sync_detailed.call_args.kwargs["body"].file.payload
+    assert payload.read() == b"{}\n"
+
+
 # ---------------------------------------------------------------------------
 # normalize_dataset_rows unit tests
 # ---------------------------------------------------------------------------
@@ -1788,3 +1881,71 @@ def test_get_content_remaps_output_to_ground_truth(get_content_mock: Mock) -> No
     assert "ground_truth" in row_values
     assert "output" not in row_values
     assert row_values["ground_truth"] == "Europe"
+
+
+def _content_page(start: int, stop: int, next_starting_token=UNSET) -> DatasetContent:
+    rows = [
+        DatasetRow(
+            index=i,
+            values=[f"Q{i}", f"A{i}"],
+            metadata=None,
+            row_id=f"row-{i}",
+            values_dict=DatasetRowValuesDict.from_dict({"input": f"Q{i}", "output": f"A{i}"}),
+        )
+        for i in range(start, stop)
+    ]
+    return DatasetContent(column_names=["input", "output"], rows=rows, next_starting_token=next_starting_token)
+
+
+@pytest.mark.parametrize("prefetch", [0, 2])
+def test_iter_dataset_records_pages_through_content(prefetch: int) -> None:
+    """Test that iter_dataset_records streams every page, following server tokens and falling back to offsets."""
+    # Given: three pages, the first pointing at an explicit next token, the last one short
+    pages = {0: _content_page(0, 3, next_starting_token=10), 10: _content_page(3, 6), 13: _content_page(6, 7)}
+    dataset = Mock()
+    dataset.get_content.side_effect = lambda starting_token, limit: pages.get(starting_token)
+
+    # When: iterating over the records
+    records = list(iter_dataset_records(dataset, page_size=3, prefetch=prefetch))
+
+    # Then: all rows are converted in order and iteration stops after the short last page
+    assert [record.input for record in records] == [f"Q{i}" for i in range(7)]
+    assert [c.kwargs["starting_token"] for c in dataset.get_content.call_args_list] == [0, 10, 13]
+    assert {c.kwargs["limit"] for c in dataset.get_content.call_args_list} == {3}
+
+
+def test_iter_dataset_content_fetches_next_page_while_caller_processes() -> None:
+    """Test that the next page is requested before the caller is done with the current one."""
+    # Given: a dataset that signals when the second page is requested
+    second_page_requested = threading.Event()
+
+    def get_content(starting_token: int, limit: int) -> DatasetContent | None:
+        if starting_token == 0:
+            return _content_page(0, 2)
+        second_page_requested.set()
+        return None
+
+    dataset = Mock()
+    dataset.get_content.side_effect = get_content
+
+    # When: the caller is still holding the first page
+    pages = iter_dataset_content(dataset, page_size=2)
+    first_page = next(pages)
+
+    # Then: the second page has already been requested in the background
+    assert second_page_requested.wait(timeout=5)
+    assert len(first_page.rows) == 2
+    assert list(pages) == []
+
+
+def test_iter_dataset_content_raises_fetch_errors() -> None:
+    """Test that an error while prefetching is raised to the caller after the pages before it."""
+    # Given: the second page request fails
+    dataset = Mock()
+    dataset.get_content.side_effect = [_content_page(0, 2), DatasetAPIException("boom")]
+
+    # When/Then: the first page is delivered and the error surfaces on the next step
+    pages = iter_dataset_content(dataset, page_size=2)
+    assert len(next(pages).rows) == 2
+    with pytest.raises(DatasetAPIException, match="boom"):
+        next(pages)
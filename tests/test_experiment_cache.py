@@ -0,0 +1,124 @@
+"""Tests for the experiment function cache."""
+
+import gc
+import sqlite3
+import weakref
+from collections.abc import Callable
+
+import pytest
+
+from galileo.experiment_cache import ExperimentCache
+from galileo.schema.logged import LoggedTrace, LoggedWorkflowSpan
+
+
+def answer(input: str) -> str:
+    return f"answer to {input}"
+
+
+def other_answer(input: str) -> str:
+    return f"other answer to {input}"
+
+
+def _trace(output: str) -> LoggedTrace:
+    trace = LoggedTrace(input="question", output=output)
+    trace.spans.append(LoggedWorkflowSpan(input="question", output=output, name="answer"))
+    return trace
+
+
+def test_get_returns_cached_trace(tmp_path) -> None:
+    """Test that a cached trace is returned for the same function and input only."""
+    cache = ExperimentCache(path=tmp_path / "cache.sqlite3")
+    trace = _trace("answer")
+
+    cache.put(answer, "question", trace)
+
+    assert cache.get(answer, "question").model_dump() == trace.model_dump()
+    assert cache.get(answer, "another question") is None
+    assert cache.get(other_answer, "question") is None
+    assert ExperimentCache(path=tmp_path / "cache.sqlite3", version="v2").get(answer, "question") is None
+
+
+def test_entries_persist_across_instances(tmp_path) -> None:
+    """Test that the cache is stored on disk and survives reopening it."""
+    cache = ExperimentCache(path=tmp_path / "cache.sqlite3")
+    cache.put(answer, {"question": "q"}, _trace("answer"))
+    cache.close()
+
+    reopened = ExperimentCache(path=tmp_path / "cache.sqlite3")
+
+    assert reopened.get(answer, {"question": "q"}).output == "answer"
+    reopened.clear()
+    assert reopened.get(answer, {"question": "q"}) is None
+
+
+def test_put_evicts_least_recently_used_entries(tmp_path) -> None:
+    """Test that the cache stays within its size bound by evicting the least recently used entries."""
+    # Given: a cache with room for about two entries, holding two of them
+    entry_size = len(ExperimentCache(path=tmp_path / "probe.sqlite3")._compress(_trace("a" * 100)))
+    cache = ExperimentCache(path=tmp_path / "cache.sqlite3", max_size_bytes=2 * entry_size + entry_size // 2)
+    cache.put(answer, "first", _trace("a" * 100))
+    cache.put(answer, "second", _trace("b" * 100))
+
+    # When: the first entry is used and a third one is added
+    assert cache.get(answer, "first") is not None
+    cache.put(answer, "third", _trace("c" * 100))
+
+    # Then: the least recently used entry was evicted
+    assert cache.get(answer, "first") is not None
+    assert cache.get(answer, "second") is None
+    assert cache.get(answer, "third") is not None
+
+
+def test_rejects_non_positive_max_size(tmp_path) -> None:
+    with pytest.raises(ValueError, match="max_size_bytes must be a positive integer"):
+        ExperimentCache(path=tmp_path / "cache.sqlite3", max_size_bytes=0)
+
+
+def test_total_size_tracks_puts_replacements_and_deletes(tmp_path) -> None:
+    """Test that the stored total size follows the entries without summing the table on each put."""
+    # Given: a cache file written before the total size was tracked
+    path = tmp_path / "cache.sqlite3"
+    legacy = sqlite3.connect(path)
+    with legacy:
+        legacy.execute(
+            "CREATE TABLE entries (key TEXT PRIMARY KEY, value BLOB NOT NULL, size INTEGER NOT NULL, "
+            "last_used REAL NOT NULL)"
+        )
+        legacy.execute("INSERT INTO entries VALUES ('legacy', x'00', 7, 0)")
+    legacy.close()
+    cache = ExperimentCache(path=path)
+
+    def total_size() -> int:
+        (size,) = cache._connection.execute("SELECT size FROM total_size").fetchone()
+        (actual,) = cache._connection.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()
+        assert size == actual
+        return size
+
+    # When: entries are added, replaced and cleared
+    # Then: the total size matches the entries at every step
+    assert total_size() == 7
+    cache.put(answer, "question", _trace("short"))
+    first = total_size()
+    cache.put(answer, "question", _trace("a much longer answer " * 20))
+    assert total_size() > first
+    cache.clear()
+    assert total_size() == 0
+
+
+def test_function_identity_does_not_keep_functions_alive(tmp_path) -> None:
+    """Test that keying entries on a closure does not keep the closure alive."""
+    cache = ExperimentCache(path=tmp_path / "cache.sqlite3")
+
+    def make_function() -> Callable[[str], str]:
+        prefix = "closed over"
+        return lambda input: f"{prefix} {input}"
+
+    function = make_function()
+    reference = weakref.ref(function)
+    cache.put(function, "question", _trace("answer"))
+    assert cache.get(function, "question") is not None
+
+    del function
+    gc.collect()
+
+    assert reference() is None
@@ -1,10 +1,13 @@
+import asyncio
+import json
 import operator
 import os
+import threading
 from collections.abc import Callable
 from datetime import datetime
 from functools import reduce
 from statistics import mean
-from unittest.mock import ANY, MagicMock, Mock, patch
+from unittest.mock import ANY, AsyncMock, MagicMock, Mock, patch
 from unittest.mock import call as mock_call
 from uuid import UUID
 
@@ -15,6 +18,7 @@ import galileo.experiments
 import galileo.utils.datasets
 from galileo import galileo_context
 from galileo.decorator import SPAN_TYPE
+from galileo.experiment_cache import ExperimentCache
 from galileo.experiments import (
     Experiments,
     create_experiment,
@@ -48,6 +52,7 @@ from galileo.schema.experiment_group import ExperimentGroupResponse
 from galileo.schema.metrics import GalileoMetrics, LocalMetricConfig
 from galileo.utils.datasets import load_dataset_and_records
 from galileo.utils.exceptions import _format_http_validation_error
+from galileo.utils.singleton import GalileoLoggerSingleton
 from galileo_core.schemas.logging.span import Span, StepWithChildSpans
 from galileo_core.schemas.shared.metric import MetricValueType
 from tests.testutils.setup import setup_mock_logstreams_client, setup_mock_projects_client, setup_mock_traces_client
@@ -1147,9 +1152,9 @@ class TestExperiments:
         # Return dataset_content on first call (starting_token=0), then None to signal end of pagination
         mock_get_dataset_instance = mock_get_dataset.return_value
         mock_get_dataset_instance.get_content = MagicMock(
-            side_effect=lambda starting_token=0, limit=1000: dataset_content_with_question
-            if starting_token == 0
-            else None
+            side_effect=lambda starting_token=0, limit=1000: (
+                dataset_content_with_question if starting_token == 0 else None
+            )
         )
 
         def runner(input) -> str:
@@ -1613,6 +1618,606 @@ class TestExperiments:
         assert '{"input": "Which continent is Spain in?"}' in span_inputs[0]
         assert '{"input": "Which continent is Japan in?"}' in span_inputs[1]
 
+    @patch("galileo.logger.logger.LogStreams")
+    @patch("galileo.logger.logger.Projects")
+    @patch("galileo.logger.logger.Traces")
+    @patch.object(galileo.experiments.Experiments, "create", return_value=experiment_response())
+    @patch.object(galileo.experiments.Experiments, "get", return_value=experiment_response())
+    @patch.object(galileo.experiments.Projects, "get_with_env_fallbacks", return_value=project())
+    def test_run_experiment_with_function_and_max_workers(
+        self,
+        mock_get_project: Mock,
+        mock_get_experiment: Mock,
+        mock_create_experiment: Mock,
+        mock_traces_client: Mock,
+        mock_projects_client: Mock,
+        mock_logstreams_client: Mock,
+        reset_context,
+    ) -> None:
+        # Given: a function that only returns once three rows are running at the same time
+        mock_traces_client_instance = setup_mock_traces_client(mock_traces_client)
+        setup_mock_projects_client(mock_projects_client)
+        setup_mock_logstreams_client(mock_logstreams_client)
+        barrier = threading.Barrier(3, timeout=5)
+
+        def function(input: str) -> str:
+            barrier.wait()
+            return f"Processed: {input}"
+
+        dataset = [{"input": f"question {i}", "output": f"answer {i}"} for i in range(6)]
+
+        # When: the experiment runs with three workers
+        run_experiment(
+            experiment_name="test_experiment",
+            project="awesome-new-project",
+            dataset=dataset,
+            function=function,
+            max_workers=3,
+        )
+
+        # Then: every row gets its own trace with its own dataset record and output
+        traces = [trace for c in mock_traces_client_instance.ingest_traces.call_args_list for trace in c[0][0].traces]
+        assert len(traces) == len(dataset)
+        for trace in traces:
+            assert len(trace.spans) == 1
+            assert trace.output == f"Processed: {trace.dataset_input}"
+            assert trace.dataset_input in trace.spans[0].input
+
+        # Then: the per-worker loggers are not left behind in the singleton
+        assert not any(key[0].startswith("galileo-experiment") for key in GalileoLoggerSingleton().get_all_loggers())
+
+    @patch("galileo.logger.logger.LogStreams")
+    @patch("galileo.logger.logger.Projects")
+    @patch("galileo.logger.logger.Traces")
+    @patch.object(galileo.experiments.Experiments, "create", return_value=experiment_response())
+    @patch.object(galileo.experiments.Experiments, "get", return_value=experiment_response())
+    @patch.object(galileo.experiments.Projects, "get_with_env_fallbacks", return_value=project())
+    def test_run_experiment_with_async_function(
+        self,
+        mock_get_project: Mock,
+        mock_get_experiment: Mock,
+        mock_create_experiment: Mock,
+        mock_traces_client: Mock,
+        mock_projects_client: Mock,
+        mock_logstreams_client: Mock,
+        reset_context,
+    ) -> None:
+        # Given: an async function that tracks how many rows are in flight
+        mock_traces_client_instance = setup_mock_traces_client(mock_traces_client)
+        setup_mock_projects_client(mock_projects_client)
+        setup_mock_logstreams_client(mock_logstreams_client)
+        in_flight = []
+        max_in_flight = 0
+
+        async def function(input: str) -> str:
+            nonlocal max_in_flight
+            in_flight.append(input)
+            max_in_flight = max(max_in_flight, len(in_flight))
+            await asyncio.sleep(0.01)
+            in_flight.remove(input)
+            return f"Processed: {input}"
+
+        dataset = [{"input": f"question {i}"} for i in range(8)]
+
+        # When: the experiment runs with at most two concurrent rows
+        run_experiment(
+            experiment_name="test_experiment",
+            project="awesome-new-project",
+            dataset=dataset,
+            function=function,
+            max_workers=2,
+        )
+
+        # Then: the coroutine was awaited for every row, two at a time
+        assert max_in_flight == 2
+        traces = [trace for c in mock_traces_client_instance.ingest_traces.call_args_list for trace in c[0][0].traces]
+        assert sorted(trace.output for trace in traces) == sorted(f"Processed: question {i}" for i in range(8))
+
+    @patch("galileo.logger.logger.LogStreams")
+    @patch("galileo.logger.logger.Projects")
+    @patch("galileo.logger.logger.Traces")
+    @patch.object(galileo.experiments, "MAX_INGEST_BATCH_SIZE", 2)
+    @patch.object(galileo.experiments.Experiments, "create", return_value=experiment_response())
+    @patch.object(galileo.experiments.Experiments, "get", return_value=experiment_response())
+    @patch.object(galileo.experiments.Projects, "get_with_env_fallbacks", return_value=project())
+    def test_run_experiment_with_async_function_keeps_rows_in_flight_across_batches(
+        self,
+        mock_get_project: Mock,
+        mock_get_experiment: Mock,
+        mock_create_experiment: Mock,
+        mock_traces_client: Mock,
+        mock_projects_client: Mock,
+        mock_logstreams_client: Mock,
+        reset_context,
+    ) -> None:
+        # Given: an async function whose first row only returns once a row of a later batch has started
+        mock_traces_client_instance = setup_mock_traces_client(mock_traces_client)
+        setup_mock_projects_client(mock_projects_client)
+        setup_mock_logstreams_client(mock_logstreams_client)
+        started: dict[str, asyncio.Event] = {}
+
+        async def function(input: str) -> str:
+            started.setdefault(input, asyncio.Event()).set()
+            if input == "question 0":
+                await asyncio.wait_for(started.setdefault("question 5", asyncio.Event()).wait(), 5)
+            return f"Processed: {input}"
+
+        # When: the experiment runs with two concurrent rows and batches of two traces
+        with patch.object(galileo.experiments.http_pool, "aclose", new_callable=AsyncMock) as mock_aclose:
+            run_experiment(
+                experiment_name="test_experiment",
+                project="awesome-new-project",
+                dataset=[{"input": f"question {i}"} for i in range(8)],
+                function=function,
+                max_workers=2,
+            )
+
+        # Then: the other rows kept running and were uploaded while the first row was still in flight
+        batches = [
+            [trace.output for trace in c[0][0].traces] for c in mock_traces_client_instance.ingest_traces.call_args_list
+        ]
+        assert sorted(output for batch in batches for output in batch) == [f"Processed: question {i}" for i in range(8)]
+        assert all(len(batch) <= 2 for batch in batches)
+        assert "Processed: question 0" not in batches[0]
+        # Then: the run used one event loop, whose pooled clients were closed at the end
+        mock_aclose.assert_awaited_once()
+
+    @patch("galileo.logger.logger.LogStreams")
+    @patch("galileo.logger.logger.Projects")
+    @patch("galileo.logger.logger.Traces")
+    @patch.object(galileo.experiments.Experiments, "create", return_value=experiment_response())
+    @patch.object(galileo.experiments.Experiments, "get", return_value=None)
+    @patch.object(galileo.experiments.Projects, "get_with_env_fallbacks", return_value=project())
+    def test_run_experiment_cancels_async_rows_after_row_timeout(
+        self,
+        mock_get_project: Mock,
+        mock_get_experiment: Mock,
+        mock_create_experiment: Mock,
+        mock_traces_client: Mock,
+        mock_projects_client: Mock,
+        mock_logstreams_client: Mock,
+        reset_context,
+        tmp_path,
+    ) -> None:
+        # Given: an async function that hangs on one row
+        mock_traces_client_instance = setup_mock_traces_client(mock_traces_client)
+        setup_mock_projects_client(mock_projects_client)
+        setup_mock_logstreams_client(mock_logstreams_client)
+
+        async def function(input: str) -> str:
+            if input == "question 1":
+                await asyncio.sleep(60)
+            return f"Processed: {input}"
+
+        # When: the experiment runs with a row timeout
+        run_experiment(
+            experiment_name="test_experiment",
+            project="awesome-new-project",
+            dataset=[{"input": f"question {i}"} for i in range(3)],
+            function=function,
+            max_workers=2,
+            row_timeout=0.1,
+            resume=True,
+            checkpoint_dir=tmp_path,
+        )
+
+        # Then: the hanging row was cancelled and not checkpointed, and the other rows completed
+        traces = [trace for c in mock_traces_client_instance.ingest_traces.call_args_list for trace in c[0][0].traces]
+        assert sorted(trace.output for trace in traces if trace.output) == [
+            "Processed: question 0",
+            "Processed: question 2",
+        ]
+        checkpoint_file = tmp_path / f"{experiment_response().id}.jsonl"
+        completed = {row_id for line in checkpoint_file.read_text().splitlines() for row_id in json.loads(line)}
+        assert completed == {"0", "2"}
+
+    def test_run_experiment_rejects_non_positive_row_timeout(self) -> None:
+        with pytest.raises(ValueError, match="row_timeout must be positive"):
+            run_experiment(
+                experiment_name="test_experiment",
+                project="awesome-new-project",
+                dataset=[{"input": "question"}],
+                function=lambda x: x,
+                row_timeout=0,
+            )
+
+    @pytest.mark.parametrize(("max_workers", "is_async"), [(None, False), (2, False), (2, True)])
+    @patch("galileo.logger.logger.LogStreams")
+    @patch("galileo.logger.logger.Projects")
+    @patch("galileo.logger.logger.Traces")
+    @patch.object(galileo.experiments, "MAX_REQUEST_SIZE_BYTES", 5_000)
+    @patch.object(galileo.experiments.Experiments, "create", return_value=experiment_response())
+    @patch.object(galileo.experiments.Experiments, "get", return_value=experiment_response())
+    @patch.object(galileo.experiments.Projects, "get_with_env_fallbacks", return_value=project())
+    def test_run_experiment_flushes_on_buffered_size(
+        self,
+        mock_get_project: Mock,
+        mock_get_experiment: Mock,
+        mock_create_experiment: Mock,
+        mock_traces_client: Mock,
+        mock_projects_client: Mock,
+        mock_logstreams_client: Mock,
+        max_workers: int | None,
+        is_async: bool,
+        reset_context,
+    ) -> None:
+        # Given: rows whose outputs are large compared to the request size budget
+        mock_traces_client_instance = setup_mock_traces_client(mock_traces_client)
+        setup_mock_projects_client(mock_projects_client)
+        setup_mock_logstreams_client(mock_logstreams_client)
+        dataset = [{"input": f"question {i}"} for i in range(8)]
+
+        async def async_function(input: str) -> str:
+            return "x" * 3_000
+
+        # When: the experiment runs, well below the row-count batch limit
+        run_experiment(
+            experiment_name="test_experiment",
+            project="awesome-new-project",
+            dataset=dataset,
+            function=async_function if is_async else lambda x: "x" * 3_000,
+            max_workers=max_workers,
+        )
+
+        # Then: the logger was flushed as the buffered payload crossed the budget, without losing rows
+        payloads = [c[0][0] for c in mock_traces_client_instance.ingest_traces.call_args_list]
+        assert len(payloads) >= 3
+        assert sum(len(span.output) for payload in payloads for trace in payload.traces for span in trace.spans) == (
+            8 * 3_000
+        )
+
+    @patch("galileo.logger.logger.LogStreams")
+    @patch("galileo.logger.logger.Projects")
+    @patch("galileo.logger.logger.Traces")
+    @patch.object(galileo.experiments, "MAX_REQUEST_SIZE_BYTES", 5_000)
+    @patch.object(galileo.experiments.Experiments, "create", return_value=experiment_response())
+    @patch.object(galileo.experiments.Experiments, "get", return_value=experiment_response())
+    @patch.object(galileo.experiments.Projects, "get_with_env_fallbacks", return_value=project())
+    def test_run_experiment_reports_failed_background_flush(
+        self,
+        mock_get_project: Mock,
+        mock_get_experiment: Mock,
+        mock_create_experiment: Mock,
+        mock_traces_client: Mock,
+        mock_projects_client: Mock,
+        mock_logstreams_client: Mock,
+        reset_context,
+    ) -> None:
+        # Given: an ingestion endpoint that rejects the first batch
+        mock_traces_client_instance = setup_mock_traces_client(mock_traces_client)
+        setup_mock_projects_client(mock_projects_client)
+        setup_mock_logstreams_client(mock_logstreams_client)
+        error = Exception("ingestion failed")
+        mock_traces_client_instance.ingest_traces.side_effect = [error, {}, {}, {}, {}, {}, {}, {}, {}]
+        on_error = Mock()
+
+        # When: the experiment runs and flushes several batches in the background
+        run_experiment(
+            experiment_name="test_experiment",
+            project="awesome-new-project",
+            dataset=[{"input": f"question {i}"} for i in range(8)],
+            function=lambda x: "x" * 3_000,
+            on_error=on_error,
+        )
+
+        # Then: the run completed and the failed batch was reported once at the end of the run
+        assert mock_traces_client_instance.ingest_traces.call_count >= 3
+        on_error.assert_called_once_with(error)
+
+    @pytest.mark.parametrize("max_workers", [None, 2])
+    @patch("galileo.logger.logger.LogStreams")
+    @patch("galileo.logger.logger.Projects")
+    @patch("galileo.logger.logger.Traces")
+    @patch.object(galileo.experiments, "MAX_INGEST_BATCH_SIZE", 2)
+    @patch.object(galileo.experiments.Experiments, "create", return_value=experiment_response())
+    @patch.object(galileo.experiments.Experiments, "get", return_value=None)
+    @patch.object(galileo.experiments.Projects, "get_with_env_fallbacks", return_value=project())
+    def test_run_experiment_in_distributed_mode(
+        self,
+        mock_get_project: Mock,
+        mock_get_experiment: Mock,
+        mock_create_experiment: Mock,
+        mock_traces_client: Mock,
+        mock_projects_client: Mock,
+        mock_logstreams_client: Mock,
+        max_workers: int | None,
+        reset_context,
+        monkeypatch,
+        tmp_path,
+    ) -> None:
+        # Given: loggers in distributed mode, which send each trace as it is logged
+        monkeypatch.setenv("GALILEO_MODE", "distributed")
+        mock_traces_client_instance = setup_mock_traces_client(mock_traces_client)
+        setup_mock_projects_client(mock_projects_client)
+        setup_mock_logstreams_client(mock_logstreams_client)
+        on_error = Mock()
+
+        # When: a function experiment runs over several batches
+        result = run_experiment(
+            experiment_name="test_experiment",
+            project="awesome-new-project",
+            dataset=[{"input": f"question {i}"} for i in range(5)],
+            function=lambda x: f"Processed: {x}",
+            max_workers=max_workers,
+            on_error=on_error,
+            resume=True,
+            checkpoint_dir=tmp_path,
+        )
+
+        # Then: the run completed, every trace was sent, and the rows were checkpointed
+        assert result["experiment"].id == experiment_response().id
+        on_error.assert_not_called()
+        assert mock_traces_client_instance.ingest_traces.call_count == 5
+        checkpoint_file = tmp_path / f"{experiment_response().id}.jsonl"
+        assert sorted(row_id for line in checkpoint_file.read_text().splitlines() for row_id in json.loads(line)) == [
+            str(i) for i in range(5)
+        ]
+
+    @patch("galileo.logger.logger.LogStreams")
+    @patch("galileo.logger.logger.Projects")
+    @patch("galileo.logger.logger.Traces")
+    @patch.object(galileo.experiments, "MAX_INGEST_BATCH_SIZE", 2)
+    @patch.object(galileo.experiments.Experiments, "create", return_value=experiment_response())
+    @patch.object(galileo.experiments.Experiments, "get", return_value=None)
+    @patch.object(galileo.experiments.Projects, "get_with_env_fallbacks", return_value=project())
+    def test_run_experiment_resumes_from_checkpoint(
+        self,
+        mock_get_project: Mock,
+        mock_get_experiment: Mock,
+        mock_create_experiment: Mock,
+        mock_traces_client: Mock,
+        mock_projects_client: Mock,
+        mock_logstreams_client: Mock,
+        reset_context,
+        tmp_path,
+    ) -> None:
+        # Given: a resumable run that dies on its third row, after the first batch was flushed
+        mock_traces_client_instance = setup_mock_traces_client(mock_traces_client)
+        setup_mock_projects_client(mock_projects_client)
+        setup_mock_logstreams_client(mock_logstreams_client)
+        dataset = [{"input": f"question {i}"} for i in range(5)]
+
+        def crashing_function(input: str) -> str:
+            if input == "question 2":
+                raise KeyboardInterrupt
+            return f"Processed: {input}"
+
+        with pytest.raises(KeyboardInterrupt):
+            run_experiment(
+                experiment_name="test_experiment",
+                project="awesome-new-project",
+                dataset=dataset,
+                function=crashing_function,
+                resume=True,
+                checkpoint_dir=tmp_path,
+            )
+        checkpoint_file = tmp_path / f"{experiment_response().id}.jsonl"
+        assert checkpoint_file.read_text().splitlines() == ['["0", "1"]']
+
+        # When: the run is resumed against the existing experiment
+        mock_get_experiment.return_value = experiment_response()
+        mock_create_experiment.reset_mock()
+        processed: list[str] = []
+
+        def function(input: str) -> str:
+            processed.append(input)
+            return f"Processed: {input}"
+
+        run_experiment(
+            experiment_name="test_experiment",
+            project="awesome-new-project",
+            dataset=dataset,
+            function=function,
+            resume=True,
+            checkpoint_dir=tmp_path,
+        )
+
+        # Then: only the remaining rows ran, into the same experiment, and they are checkpointed too
+        mock_create_experiment.assert_not_called()
+        assert processed == ["question 2", "question 3", "question 4"]
+        traces = [trace for c in mock_traces_client_instance.ingest_traces.call_args_list for trace in c[0][0].traces]
+        # (the trace left open by the crashed row is flushed without output when the logger is reset)
+        assert sorted(trace.output for trace in traces if trace.output) == [
+            f"Processed: question {i}" for i in range(5)
+        ]
+        assert checkpoint_file.read_text().splitlines() == ['["0", "1"]', '["2", "3"]', '["4"]']
+
+    @patch("galileo.logger.logger.LogStreams")
+    @patch("galileo.logger.logger.Projects")
+    @patch("galileo.logger.logger.Traces")
+    @patch.object(galileo.experiments.Experiments, "create", return_value=experiment_response())
+    @patch.object(galileo.experiments.Experiments, "get", return_value=experiment_response())
+    @patch.object(galileo.experiments.Projects, "get_with_env_fallbacks", return_value=project())
+    def test_run_experiment_does_not_resume_experiment_without_checkpoint(
+        self,
+        mock_get_project: Mock,
+        mock_get_experiment: Mock,
+        mock_create_experiment: Mock,
+        mock_traces_client: Mock,
+        mock_projects_client: Mock,
+        mock_logstreams_client: Mock,
+        reset_context,
+        tmp_path,
+    ) -> None:
+        # Given: an experiment with the same name that this machine has no checkpoint for
+        setup_mock_traces_client(mock_traces_client)
+        setup_mock_projects_client(mock_projects_client)
+        setup_mock_logstreams_client(mock_logstreams_client)
+        processed: list[str] = []
+
+        def function(input: str) -> str:
+            processed.append(input)
+            return f"Processed: {input}"
+
+        # When: a resumable run is started
+        with patch("galileo.experiments._logger") as mock_logger:
+            run_experiment(
+                experiment_name="test_experiment",
+                project="awesome-new-project",
+                dataset=[{"input": f"question {i}"} for i in range(3)],
+                function=function,
+                resume=True,
+                checkpoint_dir=tmp_path,
+            )
+
+        # Then: a new timestamped experiment is created and every row runs
+        mock_create_experiment.assert_called_once()
+        experiment_name = mock_create_experiment.call_args[0][1]
+        assert experiment_name.startswith(f"{experiment_response().name} ")
+        assert processed == [f"question {i}" for i in range(3)]
+        mock_logger.warning.assert_any_call(
+            f"No checkpoint of experiment {experiment_response().name} found in {tmp_path}, "
+            "starting a new experiment instead of resuming it"
+        )
+
+    @pytest.mark.parametrize(("max_workers", "is_async"), [(None, False), (2, False), (2, True)])
+    @patch("galileo.logger.logger.LogStreams")
+    @patch("galileo.logger.logger.Projects")
+    @patch("galileo.logger.logger.Traces")
+    @patch.object(galileo.experiments.Experiments, "create", return_value=experiment_response())
+    @patch.object(galileo.experiments.Experiments, "get", return_value=None)
+    @patch.object(galileo.experiments.Projects, "get_with_env_fallbacks", return_value=project())
+    def test_run_experiment_retries_failed_rows_on_resume(
+        self,
+        mock_get_project: Mock,
+        mock_get_experiment: Mock,
+        mock_create_experiment: Mock,
+        mock_traces_client: Mock,
+        mock_projects_client: Mock,
+        mock_logstreams_client: Mock,
+        max_workers: int | None,
+        is_async: bool,
+        reset_context,
+        tmp_path,
+    ) -> None:
+        # Given: a resumable run whose function raises on one row
+        setup_mock_traces_client(mock_traces_client)
+        setup_mock_projects_client(mock_projects_client)
+        setup_mock_logstreams_client(mock_logstreams_client)
+        dataset = [{"input": f"question {i}"} for i in range(3)]
+        processed: list[str] = []
+
+        def process(input: str, failing: str | None) -> str:
+            processed.append(input)
+            if input == failing:
+                raise ValueError("flaky")
+            return f"Processed: {input}"
+
+        def run(failing: str | None) -> None:
+            if is_async:
+
+                async def function(input: str) -> str:
+                    return process(input, failing)
+
+            else:
+
+                def function(input: str) -> str:
+                    return process(input, failing)
+
+            run_experiment(
+                experiment_name="test_experiment",
+                project="awesome-new-project",
+                dataset=dataset,
+                function=function,
+                max_workers=max_workers,
+                resume=True,
+                checkpoint_dir=tmp_path,
+            )
+
+        run(failing="question 1")
+        checkpoint_file = tmp_path / f"{experiment_response().id}.jsonl"
+        completed = {row_id for line in checkpoint_file.read_text().splitlines() for row_id in json.loads(line)}
+        assert completed == {"0", "2"}
+
+        # When: the run is resumed and the function no longer fails
+        mock_get_experiment.return_value = experiment_response()
+        processed.clear()
+        run(failing=None)
+
+        # Then: only the failed row ran again, and it is now checkpointed
+        assert processed == ["question 1"]
+        completed = {row_id for line in checkpoint_file.read_text().splitlines() for row_id in json.loads(line)}
+        assert completed == {"0", "1", "2"}
+
+    @pytest.mark.parametrize("max_workers", [None, 2])
+    @patch("galileo.logger.logger.LogStreams")
+    @patch("galileo.logger.logger.Projects")
+    @patch("galileo.logger.logger.Traces")
+    @patch.object(galileo.experiments.Experiments, "create", return_value=experiment_response())
+    @patch.object(galileo.experiments.Experiments, "get", return_value=None)
+    @patch.object(galileo.experiments.Projects, "get_with_env_fallbacks", return_value=project())
+    def test_run_experiment_replays_cached_rows(
+        self,
+        mock_get_project: Mock,
+        mock_get_experiment: Mock,
+        mock_create_experiment: Mock,
+        mock_traces_client: Mock,
+        mock_projects_client: Mock,
+        mock_logstreams_client: Mock,
+        max_workers: int | None,
+        reset_context,
+        tmp_path,
+    ) -> None:
+        # Given: a cache warmed by a run over part of the dataset
+        mock_traces_client_instance = setup_mock_traces_client(mock_traces_client)
+        setup_mock_projects_client(mock_projects_client)
+        setup_mock_logstreams_client(mock_logstreams_client)
+        cache = ExperimentCache(path=tmp_path / "cache.sqlite3")
+        calls: list[str] = []
+
+        def function(input: str) -> str:
+            calls.append(input)
+            return f"Processed: {input}"
+
+        first = run_experiment(
+            experiment_name="test_experiment",
+            project="awesome-new-project",
+            dataset=[{"input": "question 0"}, {"input": "question 1"}],
+            function=function,
+            cache=cache,
+            max_workers=max_workers,
+        )
+        first_traces = mock_traces_client_instance.ingest_traces.call_args[0][0].traces
+        mock_traces_client_instance.ingest_traces.reset_mock()
+
+        # When: the experiment is re-run with updated ground truth and an extra row
+        second = run_experiment(
+            experiment_name="test_experiment",
+            project="awesome-new-project",
+            dataset=[
+                {"input": "question 0", "output": "answer 0"},
+                {"input": "question 1", "output": "answer 1"},
+                {"input": "question 2", "output": "answer 2"},
+            ],
+            function=function,
+            cache=cache,
+            max_workers=max_workers,
+        )
+
+        # Then: only the new row called the function, and the cached rows replayed their span tree as new traces
+        assert sorted(calls) == ["question 0", "question 1", "question 2"]
+        assert (first["cache_hits"], first["cache_misses"]) == (0, 2)
+        assert (second["cache_hits"], second["cache_misses"]) == (2, 1)
+        traces = [trace for c in mock_traces_client_instance.ingest_traces.call_args_list for trace in c[0][0].traces]
+        assert sorted(trace.output for trace in traces) == [f"Processed: question {i}" for i in range(3)]
+        assert sorted(trace.dataset_output for trace in traces) == ["answer 0", "answer 1", "answer 2"]
+        for trace in traces:
+            assert len(trace.spans) == 1
+            assert trace.spans[0].output == trace.output
+        assert not {trace.id for trace in traces} & {trace.id for trace in first_traces}
+        assert not {trace.spans[0].id for trace in traces} & {trace.spans[0].id for trace in first_traces}
+
+    @patch.object(galileo.experiments.Projects, "get_with_env_fallbacks", return_value=project())
+    def test_run_experiment_rejects_non_positive_max_workers(self, mock_get_project: Mock, local_dataset) -> None:
+        with pytest.raises(ValueError, match="max_workers must be a positive integer"):
+            run_experiment(
+                experiment_name="test_experiment",
+                project="awesome-new-project",
+                dataset=local_dataset,
+                function=lambda x: x,
+                max_workers=0,
+            )
+
     @patch("galileo.logger.logger.LogStreams")
     @patch("galileo.logger.logger.Projects")
     @patch("galileo.logger.logger.Traces")
@@ -1685,11 +2290,11 @@ class TestExperiments:
         )
 
         # Verify get_content was called with correct pagination tokens
-        assert mock_get_dataset_instance.get_content.call_count == 3
+        # The second page is shorter than the page size, so it is the last one.
+        assert mock_get_dataset_instance.get_content.call_count == 2
         call_args_list = [call[1] for call in mock_get_dataset_instance.get_content.call_args_list]
         assert {"starting_token": 0, "limit": 1000} in call_args_list
         assert {"starting_token": 1000, "limit": 1000} in call_args_list
-        assert {"starting_token": 1500, "limit": 1000} in call_args_list
 
         # Verify all 1500 rows were processed
         total_traces = 0
@@ -1,11 +1,13 @@
+import gzip
 import json
+import threading
 from datetime import datetime, timedelta
 from unittest.mock import patch
 from uuid import uuid4
 
 import pytest
 
-from galileo.export import export_records
+from galileo.export import ExportClient, ExportShard, export_records, export_to_file
 from galileo.log_streams import LogStream
 from galileo.resources.errors import UnexpectedStatus
 from galileo.resources.models import (
@@ -329,3 +331,227 @@ def test_export_records_include_code_metric_metadata_opt_in(mock_export_records_
     request_body = mock_export_records_stream.call_args.kwargs["body"]
     assert request_body.include_code_metric_metadata is True
     assert request_body.to_dict()["include_code_metric_metadata"] is True
+
+
+@patch("galileo.export.export_records_stream")
+def test_export_client_to_arrow(mock_export_records_stream):
+    pyarrow = pytest.importorskip("pyarrow")
+    records_data = [
+        {"id": "1", "name": "llm", "metrics": {"duration_ns": 10}},
+        {"id": "2", "name": "llm", "metrics": {"duration_ns": 20}},
+    ]
+    mock_export_records_stream.return_value = (json.dumps(d) for d in records_data)
+
+    table = ExportClient().to_arrow(
+        project_id=str(uuid4()), log_stream_id=str(uuid4()), columns=["name", "metrics_duration_ns"]
+    )
+
+    assert table.column_names == ["name", "metrics_duration_ns"]
+    assert pyarrow.types.is_dictionary(table.schema.field("name").type)
+    assert table.column("metrics_duration_ns").to_pylist() == [10, 20]
+    assert mock_export_records_stream.call_args.kwargs["body"].log_stream_id is not None
+
+
+def _sharded_stream(records_by_day: dict[int, list[dict]]):
+    """Fake export stream that returns the records of the day selected by the request's created_at filters."""
+
+    def stream(client, project_id, body):
+        start = next(f.value for f in body.filters if f.column_id == "created_at" and f.operator == "gte")
+        return (json.dumps(record) for record in records_by_day.get(start.day, []))
+
+    return stream
+
+
+@pytest.mark.parametrize("ordered", [True, False])
+@patch("galileo.export.export_records_stream")
+def test_sharded_records(mock_export_records_stream, ordered):
+    records_by_day = {day: [{"id": f"{day}-{i}"} for i in range(3)] for day in (1, 2, 3)}
+    mock_export_records_stream.side_effect = _sharded_stream(records_by_day)
+    completed: list[ExportShard] = []
+
+    records = list(
+        ExportClient().sharded_records(
+            project_id=str(uuid4()),
+            start=datetime(2024, 1, 1),
+            end=datetime(2024, 1, 4),
+            log_stream_id=str(uuid4()),
+            max_workers=2,
+            ordered=ordered,
+            on_shard_complete=completed.append,
+        )
+    )
+
+    expected = [f"{day}-{i}" for day in (3, 2, 1) for i in range(3)]
+    if ordered:
+        assert [r["id"] for r in records] == expected
+    else:
+        assert sorted(r["id"] for r in records) == sorted(expected)
+    assert sorted(shard.start.day for shard in completed) == [1, 2, 3]
+    assert mock_export_records_stream.call_count == 3
+    windows = set()
+    for call in mock_export_records_stream.call_args_list:
+        gte, lt = call.kwargs["body"].filters
+        assert (gte.column_id, gte.operator, lt.column_id, lt.operator) == ("created_at", "gte", "created_at", "lt")
+        windows.add((gte.value, lt.value))
+    assert windows == {(datetime(2024, 1, day), datetime(2024, 1, day + 1)) for day in (1, 2, 3)}
+
+
+@patch("galileo.export._SHARD_BUFFERED_BATCHES", 1)
+@patch("galileo.export._SHARD_BATCH_SIZE", 2)
+@patch("galileo.export.export_records_stream")
+def test_sharded_records_reads_shards_ahead_to_the_end_while_the_caller_is_slow(mock_export_records_stream):
+    # Given: a shard exported ahead of the one being yielded, with more batches than its queue holds
+    records_by_day = {3: [{"id": "3-0"}, {"id": "3-1"}], 2: [{"id": f"2-{i}"} for i in range(10)]}
+    ahead_read = threading.Event()
+    stream = _sharded_stream(records_by_day)
+
+    def tracked_stream(client, project_id, body):
+        yield from stream(client, project_id, body)
+        if body.filters[0].value.day == 2:
+            ahead_read.set()
+
+    mock_export_records_stream.side_effect = tracked_stream
+    records = ExportClient().sharded_records(
+        project_id=str(uuid4()), start=datetime(2024, 1, 2), end=datetime(2024, 1, 4), max_workers=2
+    )
+
+    # When: the caller holds on to the first record of the first shard
+    first = next(records)
+
+    # Then: the shard ahead was read to the end, and every record is still yielded in order
+    assert ahead_read.wait(timeout=5)
+    assert [first["id"], *(record["id"] for record in records)] == ["3-0", "3-1", *(f"2-{i}" for i in range(10))]
+
+
+@patch("galileo.export.export_records_stream")
+def test_sharded_records_resumes_after_completed_shards(mock_export_records_stream):
+    records_by_day = {day: [{"id": str(day)}] for day in (1, 2, 3)}
+    mock_export_records_stream.side_effect = _sharded_stream(records_by_day)
+    completed = [ExportShard(start=datetime(2024, 1, 3), end=datetime(2024, 1, 4))]
+
+    records = list(
+        ExportClient().sharded_records(
+            project_id=str(uuid4()),
+            start=datetime(2024, 1, 1),
+            end=datetime(2024, 1, 4),
+            log_stream_id=str(uuid4()),
+            completed_shards=completed,
+        )
+    )
+
+    assert [r["id"] for r in records] == ["2", "1"]
+    assert mock_export_records_stream.call_count == 2
+
+
+@patch("galileo.export.export_records_stream")
+def test_sharded_records_propagates_shard_errors(mock_export_records_stream):
+    mock_export_records_stream.side_effect = UnexpectedStatus(500, b"boom")
+
+    with pytest.raises(UnexpectedStatus):
+        list(
+            ExportClient().sharded_records(
+                project_id=str(uuid4()), start=datetime(2024, 1, 1), end=datetime(2024, 1, 3), ordered=False
+            )
+        )
+
+
+def test_sharded_records_requires_created_at_sort_when_ordered():
+    with pytest.raises(ValueError, match="sorted by created_at"):
+        next(
+            ExportClient().sharded_records(
+                project_id=str(uuid4()),
+                start=datetime(2024, 1, 1),
+                end=datetime(2024, 1, 3),
+                sort=LogRecordsSortClause(column_id="name", ascending=True),
+            )
+        )
+
+
+@pytest.mark.parametrize(("file_name", "compressed"), [("traces.jsonl", False), ("traces.jsonl.gz", True)])
+@patch("galileo.export.export_records_stream")
+@patch("galileo.export._export_records_bytes")
+def test_export_to_file_streams_raw_bytes(
+    mock_export_records_bytes, mock_export_records_stream, tmp_path, file_name, compressed
+):
+    content = b'{"id": "1", "input": "a"}\n{"id": "2", "input": "b"}\n'
+    mock_export_records_bytes.return_value = iter([content[:10], content[10:]])
+
+    path = export_to_file(tmp_path / file_name, project_id=str(uuid4()), log_stream_id=str(uuid4()), chunk_size=10)
+
+    assert path == tmp_path / file_name
+    assert (gzip.decompress(path.read_bytes()) if compressed else path.read_bytes()) == content
+    assert list(tmp_path.iterdir()) == [path]
+    assert mock_export_records_bytes.call_args.kwargs["chunk_size"] == 10
+    assert mock_export_records_bytes.call_args.kwargs["body"].export_format == LLMExportFormat.JSONL
+    # The records are written as they come and never parsed.
+    mock_export_records_stream.assert_not_called()
+
+
+@patch("galileo.export._export_records_bytes")
+def test_export_to_file_leaves_no_partial_file_on_failure(mock_export_records_bytes, tmp_path):
+    def failing_stream():
+        yield b'{"id": "1"}\n'
+        raise UnexpectedStatus(500, b"export failed")
+
+    mock_export_records_bytes.return_value = failing_stream()
+
+    with pytest.raises(UnexpectedStatus):
+        export_to_file(tmp_path / "traces.jsonl", project_id=str(uuid4()), log_stream_id=str(uuid4()))
+
+    assert list(tmp_path.iterdir()) == []
+
+
+@patch("galileo.export.export_records_stream")
+def test_export_to_file_writes_parquet_row_groups(mock_export_records_stream, tmp_path):
+    parquet = pytest.importorskip("pyarrow.parquet")
+    records_data = [
+        {"id": "1", "name": "llm", "metrics": {"duration_ns": 10}},
+        {"id": "2", "name": "llm", "metrics": {"duration_ns": 20}, "tags": None},
+        {"id": "3", "name": "tool", "metrics": {"duration_ns": 30.5}, "extra": "late"},
+    ]
+    mock_export_records_stream.return_value = (json.dumps(d) for d in records_data)
+
+    path = export_to_file(
+        tmp_path / "traces.parquet", project_id=str(uuid4()), log_stream_id=str(uuid4()), row_group_size=2
+    )
+
+    parquet_file = parquet.ParquetFile(path)
+    assert parquet_file.metadata.num_row_groups == 2
+    table = parquet_file.read()
+    assert table.column_names == ["id", "name", "metrics_duration_ns", "tags", "extra"]
+    assert table.column("name").to_pylist() == ["llm", "llm", "tool"]
+    assert table.column("metrics_duration_ns").to_pylist() == [10.0, 20.0, 30.5]
+    assert table.column("extra").to_pylist() == [None, None, "late"]
+    assert [p.name for p in tmp_path.iterdir()] == ["traces.parquet"]
+
+
+@patch("galileo.export.export_records_stream")
+def test_export_to_file_keeps_parquet_integers_exact(mock_export_records_stream, tmp_path):
+    parquet = pytest.importorskip("pyarrow.parquet")
+    records_data = [{"id": "1", "token_count": 2**53 + 1}, {"id": "2", "token_count": 7}]
+    mock_export_records_stream.return_value = (json.dumps(d) for d in records_data)
+
+    path = export_to_file(
+        tmp_path / "traces.parquet", project_id=str(uuid4()), log_stream_id=str(uuid4()), row_group_size=1
+    )
+
+    assert parquet.read_table(path).column("token_count").to_pylist() == [2**53 + 1, 7]
+
+
+@patch("galileo.export.export_records_stream")
+def test_export_to_file_rejects_lossy_parquet_columns(mock_export_records_stream, tmp_path):
+    pytest.importorskip("pyarrow.parquet")
+    records_data = [{"id": "1", "score": 2**53 + 1}, {"id": "2", "score": 0.5}]
+    mock_export_records_stream.return_value = (json.dumps(d) for d in records_data)
+
+    with pytest.raises(ValueError, match="'score' cannot be written as double"):
+        export_to_file(
+            tmp_path / "traces.parquet", project_id=str(uuid4()), log_stream_id=str(uuid4()), row_group_size=1
+        )
+
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_export_to_file_rejects_gzip_parquet(tmp_path):
+    with pytest.raises(ValueError, match="cannot be gzip-compressed"):
+        ExportClient().to_file(tmp_path / "traces.parquet", project_id=str(uuid4()), compress=True)
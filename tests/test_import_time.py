@@ -0,0 +1,67 @@
+"""Regression checks for the cost of importing galileo, based on the modules `python -X importtime` reports."""
+
+import subprocess
+import sys
+
+import pytest
+
+import galileo
+from galileo import tracing_lite
+from galileo.resources import models
+
+# Generated model modules imported by `from galileo import log`, out of the 1,100+ in the package.
+LOG_DECORATOR_MODEL_MODULES_BUDGET = 400
+# Modules that `galileo.tracing_lite` keeps out of the import graph of the logger and the `log` decorator.
+TRACING_LITE_EXCLUDED_MODULES = (
+    "galileo.experiments",
+    "galileo.log_streams",
+    "galileo.projects",
+    "galileo.resources.api",
+    "galileo.scorers",
+)
+
+
+def _import_times(statement: str) -> dict[str, int]:
+    """Run ``statement`` with ``-X importtime`` and return the cumulative import time of each module, in us."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement], capture_output=True, text=True, check=True
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, module = line.removeprefix("import time:").split("|")
+        times[module.strip()] = int(cumulative)
+    return times
+
+
+def test_import_galileo_is_lazy() -> None:
+    # `import galileo` only sets up the lazily imported public API, so neither the logger nor the generated client
+    # is imported yet.
+    times = _import_times("import galileo")
+
+    assert "galileo.logger.logger" not in times
+    assert "galileo.resources.models" not in times
+
+
+def test_log_decorator_imports_few_generated_models() -> None:
+    times = _import_times("from galileo import log")
+
+    model_modules = [module for module in times if module.startswith("galileo.resources.models.")]
+    assert len(model_modules) < LOG_DECORATOR_MODEL_MODULES_BUDGET
+
+
+def test_tracing_lite_imports_only_the_logger() -> None:
+    times = _import_times("from galileo.tracing_lite import GalileoLogger, galileo_context, log")
+
+    assert not [module for module in times if module.startswith(TRACING_LITE_EXCLUDED_MODULES)]
+
+
+@pytest.mark.parametrize(
+    "package", [galileo, models, tracing_lite], ids=["galileo", "galileo.resources.models", "galileo.tracing_lite"]
+)
+def test_every_public_name_resolves(package) -> None:
+    missing = [name for name in package.__all__ if getattr(package, name, None) is None]
+
+    assert not missing
+    assert set(package.__all__) <= set(dir(package))
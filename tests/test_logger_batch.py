@@ -1,6 +1,8 @@
+import contextvars
 import datetime
 import json
 import logging
+import threading
 import uuid
 from collections import deque
 from unittest.mock import AsyncMock, Mock, patch
@@ -2477,3 +2479,206 @@ def test_ingest_traces_reuses_existing_client(
 
     # Then: no additional Traces client was created (reuses the existing one)
     assert mock_traces_cls.call_count == call_count_before
+
+
+@patch("galileo.logger.logger.LogStreams")
+@patch("galileo.logger.logger.Projects")
+@patch("galileo.logger.logger.Traces")
+def test_defer_init_resolves_project_and_log_stream_on_first_flush(
+    mock_traces_cls: Mock, mock_projects_client: Mock, mock_logstreams_client: Mock, monkeypatch
+) -> None:
+    """Test that a deferred logger makes no requests until its first flush, then reuses the client."""
+    # Given: a logger created with deferred initialization from the environment
+    monkeypatch.setenv("GALILEO_DEFER_INIT", "true")
+    mock_traces_instance = setup_mock_traces_client(mock_traces_cls)
+    setup_mock_projects_client(mock_projects_client)
+    setup_mock_logstreams_client(mock_logstreams_client)
+    logger = GalileoLogger(project="my_project", log_stream="my_log_stream")
+
+    # When: traces are logged but not flushed
+    logger.start_trace(input="first")
+    logger.conclude(output="first output")
+
+    # Then: nothing has been resolved yet
+    mock_projects_client.assert_not_called()
+    mock_logstreams_client.assert_not_called()
+    mock_traces_cls.assert_not_called()
+    assert logger.project_id is None
+
+    # When: the logger is flushed twice
+    logger.flush()
+    logger.start_trace(input="second")
+    logger.conclude(output="second output")
+    logger.flush()
+
+    # Then: the project and log stream were resolved once, by the first flush
+    assert logger.project_id == "6c4e3f7e-4a9a-4e7e-8c1f-3a9a3a9a3a9a"
+    assert logger.log_stream_id == "6c4e3f7e-4a9a-4e7e-8c1f-3a9a3a9a3a9b"
+    mock_traces_cls.assert_called_once()
+    assert mock_traces_instance.ingest_traces.call_count == 2
+
+
+@patch("galileo.logger.logger.LogStreams")
+@patch("galileo.logger.logger.Projects")
+@patch("galileo.logger.logger.Traces")
+def test_background_init_buffers_traces_while_resolving(
+    mock_traces_cls: Mock, mock_projects_client: Mock, mock_logstreams_client: Mock
+) -> None:
+    """Test that a logger initialized in the background accepts traces before the project is resolved."""
+    # Given: a project lookup that blocks until released
+    mock_traces_instance = setup_mock_traces_client(mock_traces_cls)
+    mock_projects_instance = setup_mock_projects_client(mock_projects_client)
+    setup_mock_logstreams_client(mock_logstreams_client)
+    release = threading.Event()
+    project = mock_projects_instance.get.return_value
+    mock_projects_instance.get.side_effect = lambda **kwargs: release.wait(timeout=5) and project
+
+    # When: the logger is created and a trace is logged while the lookup is in flight
+    logger = GalileoLogger(project="my_project", log_stream="my_log_stream", background_init=True)
+    logger.start_trace(input="input")
+    logger.conclude(output="output")
+
+    # Then: the trace is buffered without waiting for the project
+    assert logger.project_id is None
+    assert len(logger.traces) == 1
+
+    # When: the lookup completes and the logger is flushed
+    release.set()
+    logger.flush()
+
+    # Then: the flush waited for the background initialization and sent the trace
+    assert logger.project_id == "6c4e3f7e-4a9a-4e7e-8c1f-3a9a3a9a3a9a"
+    assert logger.log_stream_id == "6c4e3f7e-4a9a-4e7e-8c1f-3a9a3a9a3a9b"
+    mock_traces_cls.assert_called_once()
+    mock_traces_instance.ingest_traces.assert_called_once()
+
+
+@patch("galileo.logger.logger.LogStreams")
+@patch("galileo.logger.logger.Projects")
+@patch("galileo.logger.logger.Traces")
+def test_background_init_failure_is_retried_on_flush(
+    mock_traces_cls: Mock, mock_projects_client: Mock, mock_logstreams_client: Mock, caplog, enable_galileo_logging
+) -> None:
+    """Test that a failed background initialization is retried by the flush instead of dropping traces."""
+    # Given: a project lookup that fails once
+    mock_traces_instance = setup_mock_traces_client(mock_traces_cls)
+    mock_projects_instance = setup_mock_projects_client(mock_projects_client)
+    setup_mock_logstreams_client(mock_logstreams_client)
+    mock_projects_instance.get.side_effect = [RuntimeError("unavailable"), mock_projects_instance.get.return_value]
+
+    # When: a trace is logged and flushed
+    logger = GalileoLogger(project="my_project", log_stream="my_log_stream", background_init=True)
+    logger.start_trace(input="input")
+    logger.conclude(output="output")
+    with caplog.at_level(logging.WARNING):
+        logger.flush()
+
+    # Then: the failure was logged, and the flush resolved the project itself and sent the trace
+    assert "Background initialization of the logger failed, retrying: unavailable" in caplog.text
+    assert mock_projects_instance.get.call_count == 2
+    mock_traces_instance.ingest_traces.assert_called_once()
+    assert logger.traces == []
+
+
+def test_defer_init_and_background_init_are_exclusive() -> None:
+    with pytest.raises(Exception) as exc_info:
+        GalileoLogger(project="my_project", log_stream="my_log_stream", defer_init=True, background_init=True)
+    assert str(exc_info.value) == "defer_init and background_init cannot both be enabled."
+
+
+@patch("galileo.logger.logger.LogStreams")
+@patch("galileo.logger.logger.Projects")
+@patch("galileo.logger.logger.Traces")
+def test_buffered_size_bytes_tracks_buffered_traces(
+    mock_traces_client: Mock, mock_projects_client: Mock, mock_logstreams_client: Mock
+) -> None:
+    """Test that the buffered size estimate grows with span content, tracks the payload and resets on flush."""
+    # Given: a logger with an empty buffer
+    mock_traces_client_instance = setup_mock_traces_client(mock_traces_client)
+    setup_mock_projects_client(mock_projects_client)
+    setup_mock_logstreams_client(mock_logstreams_client)
+    logger = GalileoLogger(project="my_project", log_stream="my_log_stream")
+    assert logger.buffered_size_bytes == 0
+
+    # When: a trace with a large LLM span and a large conclusion is buffered
+    logger.start_trace(input="input")
+    after_trace = logger.buffered_size_bytes
+    logger.add_llm_span(input="prompt", output="x" * 50_000, model="gpt4o")
+    after_span = logger.buffered_size_bytes
+    logger.conclude(output="y" * 20_000)
+
+    # Then: every step adds to the estimate, which stays close to the encoded payload
+    assert 0 < after_trace < after_span
+    assert after_span - after_trace >= 50_000
+    encoded_size = len(logger.traces[0].model_dump_json())
+    assert 0.8 * encoded_size <= logger.buffered_size_bytes <= 1.2 * encoded_size
+
+    # When: the logger is flushed
+    logger.flush()
+
+    # Then: the estimate is reset with the buffer
+    mock_traces_client_instance.ingest_traces.assert_called_once()
+    assert logger.buffered_size_bytes == 0
+
+
+@patch("galileo.logger.logger.LogStreams")
+@patch("galileo.logger.logger.Projects")
+def test_flush_in_background_detaches_buffered_traces(mock_projects_client: Mock, mock_logstreams_client: Mock) -> None:
+    """Test that a background flush returns while the batch uploads, leaving the logger free for new traces."""
+    # Given: a logger whose ingestion blocks until released, with one concluded trace buffered
+    setup_mock_projects_client(mock_projects_client)
+    setup_mock_logstreams_client(mock_logstreams_client)
+    release = threading.Event()
+    payloads: list[TracesIngestRequest] = []
+
+    def ingestion_hook(request: TracesIngestRequest) -> None:
+        release.wait(timeout=5)
+        payloads.append(request)
+
+    logger = GalileoLogger(project="my_project", log_stream="my_log_stream", ingestion_hook=ingestion_hook)
+    logger.start_trace(input="first")
+    logger.conclude(output="first output")
+
+    # When: the batch is flushed in the background and another trace is logged during the upload
+    future = logger.flush_in_background()
+    assert logger.traces == []
+    assert logger.buffered_size_bytes == 0
+    logger.start_trace(input="second")
+    logger.conclude(output="second output")
+    assert not future.done()
+    release.set()
+
+    # Then: only the detached batch was uploaded, and the new trace stays buffered
+    assert [trace.input for trace in future.result(timeout=5)] == ["first"]
+    assert [trace.input for payload in payloads for trace in payload.traces] == ["first"]
+    assert [trace.input for trace in logger.traces] == ["second"]
+    logger.flush_in_background().result(timeout=5)
+    assert logger.flush_in_background() is None
+
+
+@patch("galileo.logger.logger.LogStreams")
+@patch("galileo.logger.logger.Projects")
+def test_flush_in_background_uploads_only_the_given_traces(
+    mock_projects_client: Mock, mock_logstreams_client: Mock
+) -> None:
+    """Test that a background flush of given traces leaves the other buffered traces, open or not, in place."""
+    # Given: a concluded trace, and a trace still being logged in another context
+    setup_mock_projects_client(mock_projects_client)
+    setup_mock_logstreams_client(mock_logstreams_client)
+    payloads: list[TracesIngestRequest] = []
+    logger = GalileoLogger(project="my_project", log_stream="my_log_stream", ingestion_hook=payloads.append)
+    concluded = logger.start_trace(input="concluded")
+    logger.conclude(output="output")
+    open_context = contextvars.copy_context()
+    open_context.run(logger.start_trace, input="open")
+    open_size = logger.buffered_size_bytes
+
+    # When: only the concluded trace is flushed
+    logger.flush_in_background(traces=[concluded]).result(timeout=5)
+
+    # Then: the open trace stays buffered and can still be concluded
+    assert [trace.input for payload in payloads for trace in payload.traces] == ["concluded"]
+    assert [trace.input for trace in logger.traces] == ["open"]
+    assert 0 < logger.buffered_size_bytes < open_size
+    open_context.run(logger.conclude, output="output")
+    assert logger.flush_in_background(traces=[concluded]) is None
@@ -1,4 +1,7 @@
+import asyncio
 import os
+import threading
+from datetime import datetime, timezone
 from unittest.mock import MagicMock, Mock, patch
 
 import httpx
@@ -14,7 +17,7 @@ from agents import (
     Runner,
     set_trace_processors,
 )
-from agents.tracing import ResponseSpanData
+from agents.tracing import FunctionSpanData, ResponseSpanData
 from pydantic import BaseModel
 from pytest import MonkeyPatch, mark
 
@@ -404,3 +407,106 @@ async def test_token_details_extraction() -> None:
     assert extracted_data_no_usage.get("num_total_tokens") is None
     assert "input_tokens_details" not in extracted_data_no_usage["metadata"]
     assert "output_tokens_details" not in extracted_data_no_usage["metadata"]
+
+
+def _make_trace(trace_id: str, name: str) -> Mock:
+    return Mock(trace_id=trace_id, metadata={}, **{"name": name})
+
+
+def _make_function_span(trace_id: str, span_id: str, name: str, input: str, output: str) -> Mock:
+    now = datetime.now(timezone.utc).isoformat()
+    return Mock(
+        trace_id=trace_id,
+        span_id=span_id,
+        parent_id=None,
+        span_data=FunctionSpanData(name=name, input=input, output=output),
+        started_at=now,
+        ended_at=now,
+        error=None,
+    )
+
+
+@patch("galileo.logger.logger.LogStreams")
+@patch("galileo.logger.logger.Projects")
+@patch("galileo.logger.logger.Traces")
+def test_interleaved_traces_keep_separate_state(
+    mock_traces_client: Mock, mock_projects_client: Mock, mock_logstreams_client: Mock
+) -> None:
+    """Spans from concurrently running traces are attributed to their own trace."""
+    setup_mock_traces_client(mock_traces_client)
+    setup_mock_projects_client(mock_projects_client)
+    setup_mock_logstreams_client(mock_logstreams_client)
+    galileo_logger = GalileoLogger(project="test", log_stream="test")
+    gp = GalileoTracingProcessor(galileo_logger=galileo_logger, flush_on_trace_end=False)
+
+    # Given: two traces whose spans are interleaved on the same processor
+    trace_a, trace_b = _make_trace("trace_a", "A"), _make_trace("trace_b", "B")
+    span_a = _make_function_span("trace_a", "span_a", "tool_a", "in_a", "out_a")
+    span_b = _make_function_span("trace_b", "span_b", "tool_b", "in_b", "out_b")
+    gp.on_trace_start(trace_a)
+    gp.on_trace_start(trace_b)
+    gp.on_span_start(span_a)
+    gp.on_span_start(span_b)
+    gp.on_span_end(span_b)
+    gp.on_span_end(span_a)
+
+    # When: the traces end in the opposite order they started
+    gp.on_trace_end(trace_b)
+    gp.on_trace_end(trace_a)
+
+    # Then: each trace contains only its own span and per-trace state is released
+    traces = galileo_logger.traces
+    assert len(traces) == 2
+    assert [span.name for span in traces[0].spans] == ["tool_b"]
+    assert [span.name for span in traces[1].spans] == ["tool_a"]
+    assert gp._traces == {}
+
+
+@patch("galileo.logger.logger.LogStreams")
+@patch("galileo.logger.logger.Projects")
+@patch("galileo.logger.logger.Traces")
+def test_flush_on_trace_end_runs_in_background_and_force_flush_drains(
+    mock_traces_client: Mock, mock_projects_client: Mock, mock_logstreams_client: Mock
+) -> None:
+    """Flushes triggered by trace end run on a background thread and force_flush waits for them."""
+    mock_traces_client_instance = setup_mock_traces_client(mock_traces_client)
+    setup_mock_projects_client(mock_projects_client)
+    setup_mock_logstreams_client(mock_logstreams_client)
+    galileo_logger = GalileoLogger(project="test", log_stream="test")
+    gp = GalileoTracingProcessor(galileo_logger=galileo_logger, flush_on_trace_end=True)
+
+    # Given: an upload that blocks until released
+    upload_started, release_upload = threading.Event(), threading.Event()
+
+    async def blocking_ingest(*args, **kwargs):
+        upload_started.set()
+        await asyncio.to_thread(release_upload.wait, 10)
+        return {}
+
+    mock_traces_client_instance.ingest_traces.side_effect = blocking_ingest
+
+    def run_trace(trace_id: str) -> None:
+        trace = _make_trace(trace_id, trace_id)
+        span = _make_function_span(trace_id, f"span_{trace_id}", "tool", "in", "out")
+        gp.on_trace_start(trace)
+        gp.on_span_start(span)
+        gp.on_span_end(span)
+        gp.on_trace_end(trace)
+
+    # When: a trace ends, and another one ends while the first one is being uploaded
+    run_trace("trace_1")
+    assert upload_started.wait(timeout=10)
+    second_trace = threading.Thread(target=run_trace, args=("trace_2",))
+    second_trace.start()
+    second_trace.join(timeout=5)
+
+    # Then: committing the second trace did not wait for the upload of the first one
+    assert not second_trace.is_alive()
+    assert not release_upload.is_set()
+
+    # And: shutdown drains the pending flushes
+    release_upload.set()
+    gp.shutdown()
+
+    assert [len(call.args[0].traces) for call in mock_traces_client_instance.ingest_traces.call_args_list] == [1, 1]
+    assert galileo_logger.traces == []
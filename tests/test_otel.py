@@ -28,6 +28,9 @@ from galileo.otel import (
 from galileo_core.schemas.logging.span import ToolSpan
 
 if OTEL_AVAILABLE:
+    from opentelemetry.sdk.resources import Resource
+    from opentelemetry.sdk.trace.export import SpanExportResult
+
     from galileo.otel import _set_workflow_span_attributes, start_galileo_span
     from galileo_core.schemas.logging.llm import Message, MessageRole
     from galileo_core.schemas.logging.span import WorkflowSpan
@@ -493,6 +496,77 @@ class TestOTelContextIntegration:
         mock_span2.resource.merge.assert_not_called()
         mock_parent_export.assert_called_once_with([mock_span2])
 
+    @staticmethod
+    def _make_exporter() -> GalileoOTLPExporter:
+        with (
+            patch("galileo.otel.OTLPSpanExporter.__init__", return_value=None),
+            patch("galileo.otel.GalileoPythonConfig.get") as mock_config_get,
+        ):
+            config = Mock()
+            config.api_url = "https://api.galileo.ai"
+            config.api_key = SecretStr("test-key")
+            mock_config_get.return_value = config
+
+            exporter = GalileoOTLPExporter(project="test-project", logstream="test-logstream")
+            exporter._session = Mock()
+            exporter._session.headers = {}
+        return exporter
+
+    @pytest.mark.skipif(not OTEL_AVAILABLE, reason="OpenTelemetry not available")
+    @patch("galileo.otel.OTLPSpanExporter.export")
+    def test_exporter_export_sends_one_request_per_destination(self, mock_parent_export):
+        """Test a batch mixing projects, log streams and experiments is split with the right headers per request."""
+        # Given: spans for two log streams and an experiment, interleaved, sharing one provider resource
+        exporter = self._make_exporter()
+        shared_resource = Resource({"service.name": "svc"})
+
+        def make_span(**attributes):
+            span = Mock()
+            span.attributes = attributes
+            span.resource = shared_resource
+            return span
+
+        stream_a = [make_span(**{"galileo.project.name": "p1", "galileo.logstream.name": "a"}) for _ in range(3)]
+        stream_b = [make_span(**{"galileo.project.name": "p2", "galileo.logstream.name": "b"}) for _ in range(2)]
+        experiment = [make_span(**{"galileo.project.name": "p1", "galileo.experiment.id": "exp-1"})]
+        batch = [stream_a[0], stream_b[0], experiment[0], stream_a[1], stream_b[1], stream_a[2]]
+
+        sent = []
+        mock_parent_export.side_effect = lambda spans: sent.append((list(spans), dict(exporter._session.headers)))
+
+        # When: the batch is exported
+        exporter.export(batch)
+
+        # Then: one request per destination, in first-seen order, each with its own routing headers
+        assert sent == [
+            (stream_a, {"project": "p1", "logstream": "a"}),
+            (stream_b, {"project": "p2", "logstream": "b"}),
+            (experiment, {"project": "p1", "experimentid": "exp-1"}),
+        ]
+
+        # Then: spans with the same Galileo attributes share a single merged resource
+        assert len({id(span._resource) for span in stream_a}) == 1
+        assert stream_a[0]._resource is not stream_b[0]._resource
+        assert stream_a[0]._resource.attributes["service.name"] == "svc"
+        assert stream_a[0]._resource.attributes["galileo.logstream.name"] == "a"
+
+    @pytest.mark.skipif(not OTEL_AVAILABLE, reason="OpenTelemetry not available")
+    @patch("galileo.otel.OTLPSpanExporter.export")
+    def test_exporter_export_reports_failed_group(self, mock_parent_export):
+        """Test a failure for one destination is reported even if later groups succeed."""
+        # Given: the first destination's request fails and the second succeeds
+        exporter = self._make_exporter()
+        spans = []
+        for logstream in ("a", "b"):
+            span = Mock()
+            span.attributes = {"galileo.project.name": "p", "galileo.logstream.name": logstream}
+            spans.append(span)
+        mock_parent_export.side_effect = [SpanExportResult.FAILURE, SpanExportResult.SUCCESS]
+
+        # When/Then: both groups are attempted and the failure is surfaced
+        assert exporter.export(spans) == SpanExportResult.FAILURE
+        assert mock_parent_export.call_count == 2
+
 
 class TestSetToolSpanAttributes:
     """Test suite for _set_tool_span_attributes function."""
@@ -1,15 +1,23 @@
+import asyncio
+import json
+from collections.abc import Callable
 from unittest.mock import ANY, AsyncMock, Mock, patch
 from uuid import uuid4
 
-from pytest import mark
+import httpx
+from pydantic import ValidationError as PydanticValidationError
+from pytest import mark, raises
 
+from galileo.constants.protect import TIMEOUT_SECS
+from galileo.exceptions import ServerError
 from galileo.handlers.langchain.tool import ProtectTool
-from galileo.protect import Protect, ainvoke_protect, invoke_protect
+from galileo.protect import Protect, ProtectBatchResult, ProtectClient, ainvoke_protect, invoke_protect
 from galileo.resources.models.execution_status import ExecutionStatus as APIExecutionStatus
 from galileo.resources.models.http_validation_error import HTTPValidationError
 from galileo.resources.models.protect_request import ProtectRequest as APIRequest
 from galileo.resources.models.protect_response import ProtectResponse as APIResponse
 from galileo.resources.models.validation_error import ValidationError
+from galileo_core.constants.request_method import RequestMethod
 from galileo_core.schemas.protect.execution_status import ExecutionStatus
 from galileo_core.schemas.protect.payload import Payload
 from galileo_core.schemas.protect.request import Request
@@ -318,6 +326,7 @@ class TestInvoke:
                 timeout=DEFAULT_TIMEOUT,
                 metadata=DEFAULT_METADATA,
                 headers=DEFAULT_HEADERS,
+                cache=None,
             )
 
     @patch("galileo.protect.invoke_protect_invoke_post.asyncio", new_callable=AsyncMock)
@@ -523,3 +532,129 @@ def test_string_http_validation_error() -> None:
     assert detail_item.loc == ["api"]
     assert detail_item.msg == error_message
     assert detail_item.type_ == "string"
+
+
+@mark.parametrize("payload", [Payload(input=A_PROTECT_INPUT), Payload(input='say "hi"', output="caf\u00e9\n")])
+@mark.parametrize("metadata", [None, {"key": "value"}])
+def test_protect_client_encodes_the_same_body_as_ainvoke(payload: Payload, metadata: dict | None) -> None:
+    rulesets = [Ruleset(rules=[Rule(metric="m1", operator=RuleOperator.eq, target_value="v1")])]
+    stage_id = uuid4()
+
+    client = ProtectClient(prioritized_rulesets=rulesets, stage_id=stage_id, stage_version=2, metadata=metadata)
+
+    request_dict = Request(
+        payload=payload,
+        prioritized_rulesets=rulesets,
+        stage_id=str(stage_id),
+        stage_version=2,
+        timeout=TIMEOUT_SECS,
+        metadata=metadata,
+    ).model_dump(mode="json")
+    request_dict["prioritized_rulesets"] = request_dict.pop("rulesets", [])
+    assert json.loads(client.encode(payload)) == APIRequest.from_dict(request_dict).to_dict()
+
+
+def test_protect_client_validates_the_stage_once() -> None:
+    with raises(ValueError, match="stage_id or stage_name"):
+        ProtectClient(project_name=A_PROJECT_NAME)
+
+
+def test_protect_client_invoke(mock_request: Callable) -> None:
+    route = mock_request(RequestMethod.POST, "/protect/invoke", json=invoke_response_data())
+    client = ProtectClient(stage_id=uuid4())
+
+    result = client.invoke(Payload(input=A_PROTECT_INPUT))
+
+    assert isinstance(result, Response)
+    assert result.text == invoke_response_data()["text"]
+    assert result.model_extra["ruleset_results"] == invoke_response_data()["ruleset_results"]
+    assert json.loads(route.calls.last.request.content)["payload"] == {"input": A_PROTECT_INPUT, "output": None}
+
+
+def test_protect_client_converts_responses_parsed_by_the_generated_client(mock_request: Callable) -> None:
+    # Given: a 200 response that the fast path does not parse, so the generated client parses it instead
+    mock_request(RequestMethod.POST, "/protect/invoke", json=invoke_response_data())
+    not_parsed = PydanticValidationError.from_exception_data("Response", [])
+
+    with patch.object(Response, "model_validate_json", side_effect=not_parsed):
+        result = ProtectClient(stage_id=uuid4()).invoke(Payload(input=A_PROTECT_INPUT))
+
+    # Then: the result has the same type as Protect.ainvoke's
+    assert isinstance(result, Response)
+    assert result.text == invoke_response_data()["text"]
+
+
+def test_protect_client_returns_validation_errors(mock_request: Callable) -> None:
+    error_detail_item = {"loc": ["body", "payload", "input"], "msg": "Field required", "type": "missing"}
+    mock_request(RequestMethod.POST, "/protect/invoke", status_code=422, json={"detail": [error_detail_item]})
+
+    result = ProtectClient(stage_id=uuid4()).invoke(Payload(input=A_PROTECT_INPUT))
+
+    assert isinstance(result, HTTPValidationError)
+    assert result.detail[0].msg == "Field required"
+
+
+def test_protect_client_raises_api_errors(mock_request: Callable) -> None:
+    mock_request(RequestMethod.POST, "/protect/invoke", status_code=500, text="Internal Server Error")
+
+    with raises(ServerError):
+        ProtectClient(stage_id=uuid4()).invoke(Payload(input=A_PROTECT_INPUT))
+
+
+def test_invoke_many_returns_results_in_order_with_partial_failures(mock_request: Callable) -> None:
+    # Given: a Protect endpoint that echoes the input, and fails for one of them
+    def respond(request):
+        text = json.loads(request.content)["payload"]["input"]
+        if text == "fail":
+            return httpx.Response(500, text="Internal Server Error")
+        return httpx.Response(200, json={**invoke_response_data(), "text": text})
+
+    mock_request(RequestMethod.POST, "/protect/invoke").mock(side_effect=respond)
+    payloads = [Payload(input=text) for text in ["first", "fail", "third", "fourth"]]
+
+    # When: the payloads are invoked as a batch
+    batch = Protect().invoke_many(payloads, stage_id=uuid4(), max_concurrency=2)
+
+    # Then: the results are in input order, and the failure is reported without failing the batch
+    assert isinstance(batch, ProtectBatchResult)
+    assert not batch.ok
+    assert [result.text if result else None for result in batch.results] == ["first", None, "third", "fourth"]
+    assert list(batch.errors) == [1]
+    assert isinstance(batch.errors[1], ServerError)
+
+
+@mark.asyncio
+async def test_ainvoke_many_limits_concurrency_and_times_out_calls() -> None:
+    # Given: invocations that take longer for one payload
+    in_flight, max_in_flight = 0, 0
+
+    async def slow_ainvoke(payload: Payload) -> Response:
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(1 if payload.input == "slow" else 0.01)
+        in_flight -= 1
+        return Response.model_validate({**invoke_response_data(), "text": payload.input})
+
+    client = ProtectClient(stage_id=uuid4())
+    payloads = [Payload(input="slow")] + [Payload(input=str(i)) for i in range(8)]
+
+    # When: they are invoked with a concurrency limit and a per-call timeout
+    with patch.object(client, "ainvoke", side_effect=slow_ainvoke):
+        batch = await client.ainvoke_many(payloads, max_concurrency=3, call_timeout=0.2)
+
+    # Then: the slow call timed out, the others completed, and no more than 3 ran at once
+    assert max_in_flight == 3
+    assert isinstance(batch.errors[0], TimeoutError)
+    assert [result.text for result in batch.results[1:]] == [str(i) for i in range(8)]
+
+
+def test_invoke_many_logs_protect_spans(mock_request: Callable) -> None:
+    mock_request(RequestMethod.POST, "/protect/invoke", json=invoke_response_data())
+    logger = Mock()
+    payloads = [Payload(input="first"), Payload(input="second")]
+
+    ProtectClient(stage_id=uuid4()).invoke_many(payloads, logger=logger)
+
+    assert [call.kwargs["payload"] for call in logger.add_protect_span.call_args_list] == payloads
+    assert all(call.kwargs["status_code"] == 200 for call in logger.add_protect_span.call_args_list)
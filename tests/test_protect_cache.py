@@ -0,0 +1,198 @@
+"""Tests for the Protect response cache."""
+
+import asyncio
+import json
+import time
+from collections.abc import Callable
+from uuid import uuid4
+
+import httpx
+import pytest
+
+from galileo.protect import Protect, ProtectClient, invoke_protect
+from galileo.protect_cache import ProtectCache
+from galileo_core.constants.request_method import RequestMethod
+from galileo_core.helpers.execution import async_run
+from galileo_core.schemas.protect.action import OverrideAction
+from galileo_core.schemas.protect.payload import Payload
+from galileo_core.schemas.protect.response import Response
+from galileo_core.schemas.protect.rule import Rule, RuleOperator
+from galileo_core.schemas.protect.ruleset import Ruleset
+from galileo_core.schemas.protect.subscription_config import SubscriptionConfig
+from tests.test_protect import invoke_response_data
+
+
+def response(text: str = "text", **extra) -> Response:
+    return Response.model_validate({**invoke_response_data(), "text": text, **extra})
+
+
+def rulesets(action=None) -> list[Ruleset]:
+    rules = [Rule(metric="toxicity", operator=RuleOperator.gt, target_value=0.5)]
+    return [Ruleset(rules=rules, action=action) if action else Ruleset(rules=rules)]
+
+
+@pytest.fixture
+def protect_route(mock_request: Callable):
+    """Mock the Protect endpoint, echoing the input of each payload as the response text."""
+
+    def respond(request: httpx.Request) -> httpx.Response:
+        text = json.loads(request.content)["payload"]["input"]
+        return httpx.Response(200, json={**invoke_response_data(), "text": text})
+
+    return mock_request(RequestMethod.POST, "/protect/invoke").mock(side_effect=respond)
+
+
+def test_repeated_invocations_are_answered_from_the_cache(protect_route) -> None:
+    cache = ProtectCache()
+    stage_id = uuid4()
+
+    first = invoke_protect(payload=Payload(input="hello"), stage_id=stage_id, cache=cache)
+    second = invoke_protect(payload=Payload(input="hello"), stage_id=stage_id, cache=cache)
+    other = invoke_protect(payload=Payload(input="bye"), stage_id=stage_id, cache=cache)
+
+    assert (first.text, second.text, other.text) == ("hello", "hello", "bye")
+    assert protect_route.call_count == 2
+    stats = cache.stats()
+    assert (stats.hits, stats.misses, stats.size) == (1, 2, 2)
+    assert stats.hit_rate == pytest.approx(1 / 3)
+
+
+def test_protect_client_and_invoke_protect_share_cache_keys(protect_route) -> None:
+    cache = ProtectCache()
+    stage_id = uuid4()
+
+    ProtectClient(prioritized_rulesets=rulesets(), stage_id=stage_id, cache=cache).invoke(Payload(input="hello"))
+    invoke_protect(payload=Payload(input="hello"), prioritized_rulesets=rulesets(), stage_id=stage_id, cache=cache)
+    invoke_protect(
+        payload=Payload(input="hello"), prioritized_rulesets=rulesets(), stage_version=2, stage_id=stage_id, cache=cache
+    )
+
+    # The second invocation was a hit, and the third used another stage version.
+    assert protect_route.call_count == 2
+
+
+@pytest.mark.parametrize(
+    "action",
+    [
+        OverrideAction(choices=["Sorry, I can't help with that.", "Let's talk about something else."]),
+        OverrideAction(choices=["Blocked."], subscriptions=[SubscriptionConfig(url="https://example.com/hook")]),
+    ],
+)
+def test_non_deterministic_rulesets_are_not_cached(protect_route, action) -> None:
+    cache = ProtectCache()
+    client = ProtectClient(prioritized_rulesets=rulesets(action), stage_id=uuid4(), cache=cache)
+
+    client.invoke(Payload(input="hello"))
+    client.invoke(Payload(input="hello"))
+
+    assert protect_route.call_count == 2
+    assert cache.stats().misses == 0
+
+
+def test_overridden_central_stage_responses_are_not_cached() -> None:
+    cache = ProtectCache()
+    invoke = lambda: asyncio.sleep(0, response(action_result={"type": "OVERRIDE", "value": "Blocked."}))  # noqa: E731
+
+    for _ in range(2):
+        async_run(cache.get_or_invoke("key", invoke, central_stage=True))
+    async_run(cache.get_or_invoke("key", invoke))
+
+    assert cache.stats().misses == 3
+    assert cache.stats().size == 1
+
+
+def test_entries_expire_and_least_recently_used_are_evicted() -> None:
+    cache = ProtectCache(max_entries=2, ttl_seconds=0.2)
+
+    async def invoke() -> Response:
+        return response()
+
+    async def get(key: str) -> Response:
+        return await cache.get_or_invoke(key, invoke)
+
+    for key in ["a", "b", "a", "c"]:
+        async_run(get(key))
+    # "b" was the least recently used entry when "c" was added.
+    async_run(get("b"))
+    assert cache.stats().evictions == 2
+    assert cache.stats().misses == 4
+
+    time.sleep(0.25)
+    async_run(get("b"))
+    assert cache.stats().misses == 5
+
+
+def test_concurrent_identical_invocations_share_one_request() -> None:
+    # Given: a slow Protect invocation
+    cache = ProtectCache()
+    calls = []
+
+    async def invoke() -> Response:
+        calls.append(1)
+        await asyncio.sleep(0.1)
+        return response()
+
+    # When: the same request is made concurrently from several event loops
+    futures = [async_run(cache.get_or_invoke("key", invoke), wait_for_result=False) for _ in range(8)]
+    results = [future.result() for future in futures]
+
+    # Then: only one invocation was sent, and every caller got its response
+    assert len(calls) == 1
+    assert all(result.text == "text" for result in results)
+    stats = cache.stats()
+    assert (stats.misses, stats.deduplicated) == (1, 7)
+
+
+def test_waiting_callers_take_over_when_the_sending_caller_is_cancelled() -> None:
+    # Given: a slow Protect invocation
+    cache = ProtectCache()
+    calls = []
+
+    async def invoke() -> Response:
+        calls.append(1)
+        await asyncio.sleep(0.2)
+        return response()
+
+    async def run() -> tuple[BaseException | Response, BaseException | Response]:
+        # When: the caller that sends the request times out while another one waits for the same key
+        sender = asyncio.create_task(asyncio.wait_for(cache.get_or_invoke("key", invoke), 0.05))
+        await asyncio.sleep(0)
+        waiter = asyncio.create_task(cache.get_or_invoke("key", invoke))
+        return tuple(await asyncio.gather(sender, waiter, return_exceptions=True))
+
+    sender_result, waiter_result = async_run(run())
+
+    # Then: only the sender failed, and the waiter sent the request again and got its response
+    assert isinstance(sender_result, asyncio.TimeoutError)
+    assert isinstance(waiter_result, Response)
+    assert len(calls) == 2
+    stats = cache.stats()
+    assert (stats.misses, stats.deduplicated, stats.size) == (2, 0, 1)
+
+
+def test_errors_are_not_cached_and_reach_waiting_callers() -> None:
+    cache = ProtectCache()
+
+    async def fail() -> Response:
+        await asyncio.sleep(0.05)
+        raise RuntimeError("unavailable")
+
+    futures = [async_run(cache.get_or_invoke("key", fail), wait_for_result=False) for _ in range(3)]
+    for future in futures:
+        with pytest.raises(RuntimeError, match="unavailable"):
+            future.result()
+
+    assert cache.stats().size == 0
+    assert async_run(cache.get_or_invoke("key", lambda: asyncio.sleep(0, response()))).text == "text"
+
+
+def test_cached_responses_are_copies(protect_route) -> None:
+    cache = ProtectCache()
+    protect = Protect()
+    stage_id = uuid4()
+
+    first = async_run(protect.ainvoke(payload=Payload(input="hello"), stage_id=stage_id, cache=cache))
+    first.text = "changed"
+    second = async_run(protect.ainvoke(payload=Payload(input="hello"), stage_id=stage_id, cache=cache))
+
+    assert second.text == "hello"
@@ -0,0 +1,108 @@
+"""
+Latency benchmark of the Protect invocation paths against a local stub server.
+
+Wall-clock comparisons are too noisy for the default suite, so the benchmark only runs with
+``GALILEO_RUN_BENCHMARKS=1``.
+"""
+
+import json
+import os
+import statistics
+import threading
+import time
+from collections.abc import Awaitable, Callable, Generator
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import PropertyMock, patch
+from uuid import uuid4
+
+import pytest
+from respx import MockRouter
+
+from galileo.config import GalileoPythonConfig
+from galileo.protect import Protect, ProtectClient
+from galileo.shared.http_pool import PooledApiClient
+from galileo_core.helpers.execution import async_run
+from galileo_core.schemas.protect.payload import Payload
+from galileo_core.schemas.protect.response import Response
+from galileo_core.schemas.protect.rule import Rule, RuleOperator
+from galileo_core.schemas.protect.ruleset import Ruleset
+from tests.test_protect import invoke_response_data
+
+pytestmark = pytest.mark.skipif(
+    not os.environ.get("GALILEO_RUN_BENCHMARKS"), reason="Set GALILEO_RUN_BENCHMARKS=1 to run benchmarks"
+)
+
+CALLS = 300
+WARMUP_CALLS = 20
+# The fast path must not be slower than `Protect.ainvoke`. The margin absorbs noise on busy CI machines.
+MEDIAN_LATENCY_MARGIN = 1.25
+
+
+class StubProtectHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # Without this, delayed ACKs would dominate the latency of every keep-alive request.
+    disable_nagle_algorithm = True
+    body = json.dumps(invoke_response_data()).encode()
+
+    def do_POST(self) -> None:
+        self.rfile.read(int(self.headers["Content-Length"]))
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(self.body)))
+        self.end_headers()
+        self.wfile.write(self.body)
+
+    def log_message(self, format: str, *args: object) -> None:
+        pass
+
+
+@pytest.fixture
+def stub_api_client(respx_mock: MockRouter) -> Generator[PooledApiClient, None, None]:
+    """Serve Protect responses from a local server, and point the configured API client at it."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubProtectHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    respx_mock.route(host="127.0.0.1").pass_through()
+    api_client = PooledApiClient(host=f"http://127.0.0.1:{server.server_port}", jwt_token="token")
+    with patch.object(GalileoPythonConfig, "api_client", new_callable=PropertyMock, return_value=api_client):
+        yield api_client
+    server.shutdown()
+    server.server_close()
+
+
+def measure(invoke: Callable[[], Awaitable]) -> list[float]:
+    """Return the latencies of ``CALLS`` sequential invocations on one event loop, in seconds."""
+
+    async def run() -> list[float]:
+        for _ in range(WARMUP_CALLS):
+            await invoke()
+        latencies = []
+        for _ in range(CALLS):
+            start = time.perf_counter()
+            result = await invoke()
+            latencies.append(time.perf_counter() - start)
+            assert isinstance(result, Response)
+        return latencies
+
+    return async_run(run())
+
+
+def summary(latencies: list[float]) -> str:
+    percentiles = statistics.quantiles(latencies, n=100)
+    return f"p50={percentiles[49] * 1e3:.3f} ms, p99={percentiles[98] * 1e3:.3f} ms"
+
+
+def test_protect_client_latency(stub_api_client: PooledApiClient) -> None:
+    rulesets = [
+        Ruleset(rules=[Rule(metric=f"metric_{i}", operator=RuleOperator.gt, target_value=0.5) for i in range(5)])
+    ]
+    stage_id = uuid4()
+    payload = Payload(input="What is the capital of France?", output="Paris is the capital of France.")
+    client = ProtectClient(prioritized_rulesets=rulesets, stage_id=stage_id)
+    protect = Protect()
+
+    fast = measure(lambda: client.ainvoke(payload))
+    legacy = measure(lambda: protect.ainvoke(payload=payload, prioritized_rulesets=rulesets, stage_id=stage_id))
+
+    assert statistics.median(fast) <= statistics.median(legacy) * MEDIAN_LATENCY_MARGIN, (
+        f"ProtectClient.ainvoke: {summary(fast)}; Protect.ainvoke: {summary(legacy)}"
+    )
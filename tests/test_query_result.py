@@ -1,3 +1,4 @@
+import time
 from unittest.mock import MagicMock
 
 import pytest
@@ -168,3 +169,113 @@ def test_next_page_extends_results():
     result.next_page()
     assert len(result) == 6
     assert [r["id"] for r in result] == ["0", "1", "2", "3", "4", "5"]
+
+
+def _pages(*page_ids: list[str]) -> list[MagicMock]:
+    responses = []
+    for index, ids in enumerate(page_ids):
+        records = [MagicMock(to_dict=MagicMock(return_value={"id": i, "metrics": {"score": 1.0}})) for i in ids]
+        next_token = (index + 1) * 10 if index + 1 < len(page_ids) else None
+        responses.append(
+            MagicMock(spec=LogRecordsQueryResponse, limit=2, next_starting_token=next_token, records=records)
+        )
+    return responses
+
+
+@pytest.mark.parametrize("prefetch", [True, False])
+def test_iter_all_streams_every_page(prefetch):
+    """Test iter_all yields the records of all pages without accumulating them in the result."""
+    first, *rest = _pages(["1", "2"], ["3", "4"], ["5"])
+    query_fn = MagicMock(side_effect=rest)
+    result = QueryResult(first, query_fn, RecordType.SPAN, None, None)
+
+    records = list(result.iter_all(prefetch=prefetch))
+
+    assert [r["id"] for r in records] == ["1", "2", "3", "4", "5"]
+    assert records[0]["metrics_score"] == 1.0
+    assert [c.kwargs["starting_token"] for c in query_fn.call_args_list] == [10, 20]
+    assert len(result) == 2
+
+
+def test_iter_all_projects_columns():
+    """Test iter_all keeps only the requested flattened columns, including for already loaded pages."""
+    first, second = _pages(["1"], ["2"])
+    result = QueryResult(first, MagicMock(return_value=second), RecordType.SPAN, None, None)
+    assert len(result) == 1
+
+    assert list(result.iter_all(columns=["id", "missing"])) == [{"id": "1"}, {"id": "2"}]
+
+
+def test_iter_all_prefetches_next_page():
+    """Test the next page is requested before the records of the current page are consumed."""
+    first, second = _pages(["1", "2"], ["3"])
+    query_fn = MagicMock(return_value=second)
+    result = QueryResult(first, query_fn, RecordType.SPAN, None, None)
+
+    records = result.iter_all()
+    assert next(records)["id"] == "1"
+    for _ in range(100):
+        if query_fn.called:
+            break
+        time.sleep(0.01)
+
+    query_fn.assert_called_once()
+    assert [r["id"] for r in records] == ["2", "3"]
+
+
+def _span_records() -> list[MagicMock]:
+    rows = [
+        {"id": "1", "name": "llm", "model": "gpt-4o", "metrics": {"duration_ns": 10, "cost": 0.5}},
+        {"id": "2", "name": "llm", "model": "gpt-4o", "metrics": {"duration_ns": 20}},
+        {"id": "3", "name": "tool", "metrics": {"duration_ns": 30, "cost": 1.5}, "tags": ["a"]},
+    ]
+    return [MagicMock(to_dict=MagicMock(return_value=row)) for row in rows]
+
+
+def test_to_columns_builds_typed_columns():
+    """Test to_columns returns typed NumPy columns for numbers and shared string values."""
+    numpy = pytest.importorskip("numpy")
+    mock_response = MagicMock(spec=LogRecordsQueryResponse, records=_span_records())
+    result = QueryResult(mock_response, MagicMock(), RecordType.SPAN, None, None)
+
+    columns = result.to_columns()
+
+    assert columns["metrics_duration_ns"].dtype == numpy.int64
+    assert columns["metrics_duration_ns"].tolist() == [10, 20, 30]
+    assert columns["metrics_cost"].dtype == numpy.float64
+    assert numpy.isnan(columns["metrics_cost"][1])
+    assert columns["model"].tolist() == ["gpt-4o", "gpt-4o", None]
+    assert columns["model"][0] is columns["model"][1]
+    assert columns["tags"].tolist() == [None, None, ["a"]]
+    assert list(result.to_columns(columns=["id", "name"])) == ["id", "name"]
+
+
+def test_to_arrow_keeps_large_integers_exact():
+    """Test to_arrow keeps integers beyond 2**53 exact, and integers beyond 64 bits as strings."""
+    pyarrow = pytest.importorskip("pyarrow")
+    rows = [{"id": "1", "tokens": 2**53 + 1, "seed": 2**70}, {"id": "2", "tokens": None, "seed": 1}]
+    records = [MagicMock(to_dict=MagicMock(return_value=row)) for row in rows]
+    result = QueryResult(
+        MagicMock(spec=LogRecordsQueryResponse, records=records), MagicMock(), RecordType.SPAN, None, None
+    )
+
+    table = result.to_arrow()
+
+    assert table.column("tokens").type == pyarrow.int64()
+    assert table.column("tokens").to_pylist() == [2**53 + 1, None]
+    assert table.column("seed").to_pylist() == [str(2**70), "1"]
+
+
+def test_to_arrow_dictionary_encodes_strings_across_pages():
+    """Test to_arrow builds a table with dictionary-encoded strings, optionally over every page."""
+    pyarrow = pytest.importorskip("pyarrow")
+    first, second = _pages(["1"], ["2"])
+    result = QueryResult(first, MagicMock(return_value=second), RecordType.SPAN, None, None)
+
+    table = result.to_arrow(all_pages=True)
+
+    assert table.num_rows == 2
+    assert pyarrow.types.is_dictionary(table.schema.field("id").type)
+    assert table.column("id").to_pylist() == ["1", "2"]
+    assert table.column("metrics_score").type == pyarrow.float64()
+    assert result.to_arrow().num_rows == 1
@@ -109,6 +109,50 @@ def test_get_records_for_dataset_no_content() -> None:
         get_records_for_dataset(mock_dataset)
 
 
+def test_get_records_for_dataset_empty_dataset() -> None:
+    """Test _get_records_for_dataset function when the dataset exists but has no rows."""
+    # Setup
+    mock_dataset = Mock()
+    mock_dataset.get_content.return_value = DatasetContent(column_names=["input"], rows=[])
+
+    # Execute
+    records = get_records_for_dataset(mock_dataset)
+
+    # Assert
+    assert records == []
+    mock_dataset.get_content.assert_called_once()
+
+
+@patch("galileo.datasets.MAX_DATASET_ROWS", 2)
+def test_get_records_for_dataset_pages_through_large_datasets() -> None:
+    """Test _get_records_for_dataset function when the dataset spans several pages."""
+
+    # Setup
+    def page(start: int, stop: int, next_starting_token) -> DatasetContent:
+        rows = [
+            DatasetRow(
+                index=i,
+                values=[f"input {i}"],
+                values_dict=DatasetRowValuesDict.from_dict({"input": f"input {i}"}),
+                row_id=f"row-{i}",
+                metadata=None,
+            )
+            for i in range(start, stop)
+        ]
+        return DatasetContent(column_names=["input"], rows=rows, next_starting_token=next_starting_token)
+
+    pages = {0: page(0, 2, 2), 2: page(2, 4, None)}
+    mock_dataset = Mock()
+    mock_dataset.get_content.side_effect = lambda starting_token, limit: pages[starting_token]
+
+    # Execute
+    records = get_records_for_dataset(mock_dataset)
+
+    # Assert: the page with a None token is the last one
+    assert [record.input for record in records] == ["input 0", "input 1", "input 2", "input 3"]
+    assert mock_dataset.get_content.call_count == 2
+
+
 @patch("galileo.utils.datasets.DatasetRecord")
 def test_create_rows_from_records_with_input_field(mock_dataset_record) -> None:
     """Test create_rows_from_records function with records containing 'input' field."""